@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+"""
+Hiring Execution & Talent Efficiency Audit
+Airtable Sync Client v1.0
+
+Batched Airtable writer for the tables described in docs/deployment_guide.md.
+Records are sent in groups of 10 (Airtable's per-request limit) over pooled
+keep-alive connections, scheduled by a sliding-window limiter at 5 requests
+per rolling second, and retried with jittered backoff on 429 and 5xx
+responses. Connection errors are retried only for PATCH requests (updates
+and upserts); a POST that may have reached Airtable is never resent, since
+that could create duplicate records. Pooled connections the server closed
+while idle are replaced before (or, if the send fails, instead of) being
+used, so routine keep-alive expiry does not fail a batch create.
+
+A local stub server (AirtableStubServer) implements the same endpoints and
+limits so throughput and correctness can be tested offline.
+"""
+
+import http.client
+import json
+import queue
+import random
+import select
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Any, Iterable
+from urllib.parse import urlsplit, quote
+
+
+AIRTABLE_API_URL = 'https://api.airtable.com'
+AIRTABLE_MAX_RECORDS_PER_REQUEST = 10
+AIRTABLE_REQUESTS_PER_SECOND = 5
+# Slack added to the client's window so network jitter cannot squeeze one
+# request too many into the server's rolling second
+RATE_WINDOW_MARGIN = 0.05
+
+
+class AirtableError(Exception):
+    """Non-retryable Airtable API error"""
+
+    def __init__(self, status, body):
+        super().__init__(f"Airtable API error {status}: {body}")
+        self.status = status
+        self.body = body
+
+
+class RequestNotSentError(ConnectionError):
+    """Connecting or sending failed, so the server never got the request; safe to resend"""
+
+
+# ============================================================================
+# SCHEDULING & CONNECTIONS
+# ============================================================================
+
+class SlidingWindowLimiter:
+    """
+    Thread-safe limiter allowing at most `limit` acquisitions in any rolling
+    `window` seconds; acquire() blocks until a slot frees up
+
+    Mirrors how Airtable (and AirtableStubServer) count requests, so a full
+    burst is allowed but never a sixth request inside the same second.
+    """
+
+    def __init__(self, limit: int, window: float = 1.0):
+        self.limit = max(1, int(limit))
+        self.window = window
+        self._sent = deque()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def per_second(cls, rate: float, margin: float = RATE_WINDOW_MARGIN):
+        """Limiter for `rate` requests/second, padded by `margin` seconds"""
+        limit = max(1, int(rate))
+        return cls(limit, limit / rate + margin)
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._sent and now - self._sent[0] >= self.window:
+                    self._sent.popleft()
+                if len(self._sent) < self.limit:
+                    self._sent.append(now)
+                    return
+                wait = self.window - (now - self._sent[0])
+            time.sleep(wait)
+
+
+class ConnectionPool:
+    """Fixed-size pool of keep-alive HTTP(S) connections to one host"""
+
+    def __init__(self, base_url: str, size: int = 4, timeout: float = 30):
+        parts = urlsplit(base_url)
+        self.scheme = parts.scheme
+        self.host = parts.hostname
+        self.port = parts.port
+        self.timeout = timeout
+        self._pool = queue.LifoQueue()
+        for _ in range(size):
+            self._pool.put(None)  # connections are opened lazily
+
+    def _connect(self):
+        cls = http.client.HTTPSConnection if self.scheme == 'https' else http.client.HTTPConnection
+        return cls(self.host, self.port, timeout=self.timeout)
+
+    @staticmethod
+    def _dropped(conn) -> bool:
+        """An idle keep-alive socket that is readable has been closed by the server"""
+        try:
+            return bool(select.select([conn.sock], [], [], 0)[0])
+        except (OSError, ValueError):
+            return True
+
+    def request(self, method: str, path: str, body: bytes, headers: Dict[str, str]):
+        """
+        Send one request; returns (status, headers, body bytes)
+
+        A reused connection found closed, or failing while the request is
+        sent, is replaced once: nothing was delivered, so this is safe even
+        for POST. If connecting or sending still fails, RequestNotSentError
+        is raised; failures after the request was written raise as they are.
+        """
+        conn = self._pool.get() or self._connect()
+        reused = conn.sock is not None
+        if reused and self._dropped(conn):
+            conn.close()   # http.client reconnects on the next request
+            reused = False
+        try:
+            try:
+                conn.request(method, path, body=body, headers=headers)
+            except (http.client.HTTPException, OSError) as e:
+                if not reused:
+                    raise RequestNotSentError(f'{type(e).__name__}: {e}') from e
+                conn.close()
+                try:
+                    conn.request(method, path, body=body, headers=headers)
+                except (http.client.HTTPException, OSError) as e:
+                    raise RequestNotSentError(f'{type(e).__name__}: {e}') from e
+            resp = conn.getresponse()
+            data = resp.read()
+            result = (resp.status, dict(resp.getheaders()), data)
+        except (http.client.HTTPException, OSError):
+            conn.close()
+            conn = None
+            raise
+        finally:
+            self._pool.put(conn)
+        return result
+
+    def close(self):
+        while not self._pool.empty():
+            conn = self._pool.get_nowait()
+            if conn:
+                conn.close()
+
+
+# ============================================================================
+# CLIENT
+# ============================================================================
+
+class AirtableClient:
+    """Batched, rate-limited Airtable client"""
+
+    def __init__(self, api_key: str, base_id: str, api_url: str = AIRTABLE_API_URL,
+                 requests_per_second: float = AIRTABLE_REQUESTS_PER_SECOND, pool_size: int = 4,
+                 max_retries: int = 5, backoff: float = 0.5):
+        """
+        Args:
+            api_key: Airtable personal access token
+            base_id: Airtable base id (AIRTABLE_BASE_ID)
+            api_url: API root; point at AirtableStubServer.url for offline tests
+            requests_per_second: rolling-window limit shared by all requests
+            pool_size: keep-alive connections, also the number of in-flight requests
+            max_retries: attempts after a 429/5xx (or a PATCH connection error) before giving up
+            backoff: base delay in seconds for exponential backoff
+        """
+        self.api_key = api_key
+        self.base_id = base_id
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.limiter = SlidingWindowLimiter.per_second(requests_per_second)
+        self.pool = ConnectionPool(api_url, size=pool_size)
+        self._executor = ThreadPoolExecutor(max_workers=pool_size)
+        self._stats_lock = threading.Lock()
+        self.stats = {'requests': 0, 'retries': 0, 'records': 0}
+
+    def create_records(self, table: str, records: Iterable[Dict[str, Any]], typecast: bool = True) -> List[Dict]:
+        """Create records from a list of field dicts"""
+        bodies = [{'records': [{'fields': f} for f in chunk], 'typecast': typecast}
+                  for chunk in _chunks(records, AIRTABLE_MAX_RECORDS_PER_REQUEST)]
+        return self._send_batches('POST', table, bodies)
+
+    def update_records(self, table: str, records: Iterable[Dict[str, Any]], typecast: bool = True) -> List[Dict]:
+        """Patch records given as {'id': ..., 'fields': {...}}"""
+        bodies = [{'records': chunk, 'typecast': typecast}
+                  for chunk in _chunks(records, AIRTABLE_MAX_RECORDS_PER_REQUEST)]
+        return self._send_batches('PATCH', table, bodies)
+
+    def upsert_records(self, table: str, records: Iterable[Dict[str, Any]],
+                       merge_on: List[str], typecast: bool = True) -> List[Dict]:
+        """Create or update records matched on merge_on fields (e.g. ['audit_id'])"""
+        bodies = [{'performUpsert': {'fieldsToMergeOn': merge_on},
+                   'records': [{'fields': f} for f in chunk], 'typecast': typecast}
+                  for chunk in _chunks(records, AIRTABLE_MAX_RECORDS_PER_REQUEST)]
+        return self._send_batches('PATCH', table, bodies)
+
+    def _send_batches(self, method, table, bodies):
+        path = f"/v0/{quote(self.base_id)}/{quote(table)}"
+        futures = [self._executor.submit(self._request, method, path, body) for body in bodies]
+        created = []
+        for future in futures:
+            created.extend(future.result().get('records', []))
+        return created
+
+    def _request(self, method, path, body):
+        payload = json.dumps(body).encode('utf-8')
+        headers = {
+            'Authorization': f'Bearer {self.api_key}',
+            'Content-Type': 'application/json',
+            'Connection': 'keep-alive'
+        }
+
+        for attempt in range(self.max_retries + 1):
+            self.limiter.acquire()
+            try:
+                status, resp_headers, data = self.pool.request(method, path, payload, headers)
+            except (http.client.HTTPException, OSError):
+                # The POST may have been applied before the connection dropped
+                if method == 'POST' or attempt == self.max_retries:
+                    raise
+                status, resp_headers, data = None, {}, b''
+
+            self._count('requests')
+            if status is not None and 200 <= status < 300:
+                self._count('records', len(body.get('records', [])))
+                return json.loads(data or b'{}')
+            if status is not None and status != 429 and status < 500:
+                raise AirtableError(status, data.decode('utf-8', 'replace'))
+            if attempt == self.max_retries:
+                raise AirtableError(status, data.decode('utf-8', 'replace'))
+
+            self._count('retries')
+            retry_after = resp_headers.get('Retry-After')
+            delay = float(retry_after) if retry_after else self.backoff * (2 ** attempt)
+            time.sleep(delay + random.uniform(0, delay / 2))
+
+    def _count(self, key, n=1):
+        with self._stats_lock:
+            self.stats[key] += n
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        self.pool.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def result_to_fields(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a scoring result to the Airtable 'Results' table fields"""
+    return {
+        'audit_id': result['audit_id'],
+        'block_statuses': json.dumps(result.get('block_statuses', {})),
+        'block_scores': json.dumps(result.get('block_scores', {})),
+        'overall_status': result.get('overall_status'),
+        'confidence_score': result.get('confidence_score'),
+        'gate_failures': json.dumps(result.get('gate_failures', [])),
+        'contradictions': json.dumps(result.get('contradictions', [])),
+        'recommendations': json.dumps(result.get('selected_recommendations', result.get('recommendations', []))),
+        'calculated_at': result.get('timestamp') or datetime.now(timezone.utc).isoformat()
+    }
+
+
+def _chunks(items, size):
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+# ============================================================================
+# LOCAL STUB SERVER
+# ============================================================================
+
+class AirtableStubServer:
+    """
+    In-memory Airtable API stand-in
+
+    Enforces the 10-records-per-request limit (422) and a requests-per-second
+    limit (429 with Retry-After), and keeps created records per table.
+    """
+
+    def __init__(self, requests_per_second: float = AIRTABLE_REQUESTS_PER_SECOND, port: int = 0,
+                 drop_idle: bool = False):
+        """
+        Args:
+            drop_idle: close every connection after its response without
+                       announcing it, like a server expiring idle keep-alives
+        """
+        self.requests_per_second = requests_per_second
+        self.drop_idle = drop_idle
+        self.tables = {}
+        self.request_log = []
+        self.rejected = 0
+        self._lock = threading.Lock()
+        self._window = []
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                stub._handle(self, 'POST')
+
+            def do_PATCH(self):
+                stub._handle(self, 'PATCH')
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', port), Handler)
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address
+        return f'http://{host}:{port}'
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def _rate_limited(self):
+        now = time.monotonic()
+        with self._lock:
+            self._window = [t for t in self._window if now - t < 1.0]
+            if len(self._window) >= self.requests_per_second:
+                self.rejected += 1
+                return True
+            self._window.append(now)
+            return False
+
+    def _handle(self, handler, method):
+        length = int(handler.headers.get('Content-Length', 0))
+        body = json.loads(handler.rfile.read(length) or b'{}')
+        table = handler.path.rstrip('/').split('/')[-1]
+
+        if self._rate_limited():
+            return self._reply(handler, 429, {'errors': [{'error': 'RATE_LIMIT_REACHED'}]},
+                               {'Retry-After': '0.2'})
+
+        records = body.get('records', [])
+        if len(records) > AIRTABLE_MAX_RECORDS_PER_REQUEST:
+            return self._reply(handler, 422, {'error': {'type': 'INVALID_RECORDS'}})
+
+        with self._lock:
+            self.request_log.append((method, table, len(records)))
+            rows = self.tables.setdefault(table, {})
+            out = []
+            merge_on = (body.get('performUpsert') or {}).get('fieldsToMergeOn')
+            for rec in records:
+                rec_id = rec.get('id')
+                if merge_on:
+                    key = tuple(rec['fields'].get(f) for f in merge_on)
+                    rec_id = next((rid for rid, r in rows.items()
+                                   if tuple(r['fields'].get(f) for f in merge_on) == key), None)
+                if rec_id and rec_id in rows:
+                    rows[rec_id]['fields'].update(rec['fields'])
+                else:
+                    rec_id = 'rec' + uuid.uuid4().hex[:14]
+                    rows[rec_id] = {'id': rec_id, 'fields': dict(rec['fields']),
+                                    'createdTime': datetime.now(timezone.utc).isoformat()}
+                out.append(rows[rec_id])
+
+        return self._reply(handler, 200, {'records': out})
+
+    def _reply(self, handler, status, payload, headers=None):
+        data = json.dumps(payload).encode('utf-8')
+        handler.send_response(status)
+        handler.send_header('Content-Type', 'application/json')
+        handler.send_header('Content-Length', str(len(data)))
+        for key, value in (headers or {}).items():
+            handler.send_header(key, value)
+        handler.end_headers()
+        handler.wfile.write(data)
+        if self.drop_idle:
+            handler.close_connection = True
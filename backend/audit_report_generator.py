@@ -6,9 +6,15 @@ PDF Report Generator v1.0
 Generates Level 1, 2, and 3 audit reports from JSON input data.
 """
 
+import copy
 import json
 import os
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
 from datetime import datetime
+from types import MappingProxyType, ModuleType, FunctionType, MethodType, BuiltinFunctionType
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4, letter
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -16,13 +22,32 @@ from reportlab.lib.units import inch, mm
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT, TA_JUSTIFY
 from reportlab.platypus import (
     SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
-    PageBreak, Image, HRFlowable, KeepTogether, ListFlowable, ListItem
+    PageBreak, HRFlowable, KeepTogether, ListFlowable, ListItem
 )
 from reportlab.graphics.shapes import Drawing, Rect, String, Circle, Line
 from reportlab.graphics.charts.barcharts import VerticalBarChart
 from reportlab.graphics.charts.piecharts import Pie
 from reportlab.pdfgen import canvas
 
+from report_fonts import HELVETICA
+from report_images import IMAGE_CACHE, COVER_LOGO_BOX, ImageFlowable
+
+
+BLOCK_IDS = [f'block{i}' for i in range(1, 8)]
+
+LEVEL_NAMES = {1: 'Diagnostic Report', 2: 'Diagnostic + Design Report', 3: 'Full Assessment Report'}
+
+BLOCK_INFO = {
+    'block1': {'name': 'Block 1: Executive Ownership', 'role': 'GATEKEEPER'},
+    'block2': {'name': 'Block 2: TA Leadership', 'role': 'EXECUTION BRAIN'},
+    'block3': {'name': 'Block 3: Delivery Leadership', 'role': 'DEMAND INTEGRITY'},
+    'block4': {'name': 'Block 4: Financial Governance', 'role': 'COST CONTROL'},
+    'block5': {'name': 'Block 5: Technical Interviewing', 'role': 'BOTTLENECK LAYER'},
+    'block6': {'name': 'Block 6: Recruitment Operations', 'role': 'STABILITY FOUNDATION'},
+    'block7': {'name': 'Block 7: Reporting & AI', 'role': 'SYSTEMIC MULTIPLIER'}
+}
+
+STATUS_TEXT = {'green': '● HEALTHY', 'yellow': '● AT RISK', 'red': '● CRITICAL', 'gray': '○ PENDING'}
 
 # ============================================================================
 # COLOR SCHEME
@@ -50,8 +75,8 @@ class AuditColors:
 # CUSTOM STYLES
 # ============================================================================
 
-def get_custom_styles():
-    """Create custom paragraph styles for the report"""
+def get_custom_styles(fonts=HELVETICA):
+    """Create custom paragraph styles for the report, drawn with `fonts` (report_fonts.FontFamily)"""
     styles = getSampleStyleSheet()
     
     # Title styles
@@ -157,7 +182,7 @@ def get_custom_styles():
         fontName='Helvetica-Bold'
     ))
     
-    return styles
+    return fonts.apply(styles)
 
 
 # ============================================================================
@@ -236,6 +261,342 @@ def create_score_indicator(score, max_score=100, width=200, height=30):
     return d
 
 
+# ============================================================================
+# CHARTS
+# ============================================================================
+
+STATUS_COLORS = {
+    'green': AuditColors.GREEN,
+    'yellow': AuditColors.YELLOW,
+    'red': AuditColors.RED,
+    'gray': AuditColors.GRAY
+}
+
+# Per-answer heatmap colors (3 = strong ... 0 = failing, -1 = not relevant)
+HEATMAP_COLORS = {
+    3: AuditColors.GREEN,
+    2: colors.HexColor('#A7F3D0'),
+    1: AuditColors.YELLOW,
+    0: AuditColors.RED,
+    -1: colors.HexColor('#e5e7eb')
+}
+
+
+def build_score_matrix(responses):
+    """
+    Arrange answers as a block x question matrix for the heatmap
+    
+    Returns a tuple of rows (one per block, Q1..Qn columns) so it can be
+    used directly as a cache signature.
+    """
+    width = 0
+    by_block = {block_id: {} for block_id in BLOCK_IDS}
+    for question_id, value in responses.items():
+        if not question_id.startswith('b') or '_q' not in question_id:
+            continue
+        block_num, q_num = question_id[1:].split('_q', 1)
+        block_id = f'block{block_num}'
+        if block_id in by_block and q_num.isdigit():
+            by_block[block_id][int(q_num)] = value
+            width = max(width, int(q_num))
+    return tuple(tuple(by_block[b].get(q) for q in range(1, width + 1)) for b in BLOCK_IDS)
+
+
+def create_block_score_chart(block_scores, block_statuses, width=480, height=180, fonts=HELVETICA,
+                             thresholds=None):
+    """
+    Vertical bar chart of block averages (0-3) colored by block status
+
+    thresholds: (yellow, green) averages of the ruleset the blocks were
+    scored with, drawn as dashed lines; omitted when None
+    """
+    d = Drawing(width, height)
+    
+    chart = VerticalBarChart()
+    chart.x = 40
+    chart.y = 25
+    chart.width = width - 60
+    chart.height = height - 45
+    chart.data = [[block_scores.get(b) or 0 for b in BLOCK_IDS]]
+    chart.valueAxis.valueMin = 0
+    chart.valueAxis.valueMax = 3
+    chart.valueAxis.valueStep = 0.5
+    chart.valueAxis.labels.fontName = fonts.regular
+    chart.valueAxis.labels.fontSize = 8
+    chart.categoryAxis.categoryNames = [f'B{i}' for i in range(1, 8)]
+    chart.categoryAxis.labels.fontName = fonts.regular
+    chart.categoryAxis.labels.fontSize = 8
+    chart.bars.strokeColor = None
+    for i, block_id in enumerate(BLOCK_IDS):
+        chart.bars[(0, i)].fillColor = STATUS_COLORS.get(block_statuses.get(block_id, 'gray'), AuditColors.GRAY)
+    d.add(chart)
+    
+    # Status thresholds
+    for threshold, color in zip(thresholds or (), (AuditColors.RED, AuditColors.GREEN)):
+        y = chart.y + chart.height * threshold / 3
+        line = Line(chart.x, y, chart.x + chart.width, y)
+        line.strokeColor = color
+        line.strokeWidth = 0.5
+        line.strokeDashArray = [3, 2]
+        d.add(line)
+        label = String(chart.x + chart.width + 3, y - 3, f"{threshold}")
+        label.fontName = fonts.regular
+        label.fontSize = 7
+        label.fillColor = color
+        d.add(label)
+    
+    return d
+
+
+def create_status_heatmap(matrix, cell_width=28, cell_height=16, fonts=HELVETICA):
+    """Block x question heatmap drawn from a precomputed score matrix"""
+    columns = max((len(row) for row in matrix), default=0)
+    label_width = 50
+    width = label_width + columns * cell_width
+    height = (len(matrix) + 1) * cell_height + 4
+    d = Drawing(width, height)
+    
+    for col in range(columns):
+        header = String(label_width + col * cell_width + cell_width / 2, height - cell_height + 4, f"Q{col + 1}")
+        header.textAnchor = 'middle'
+        header.fontName = fonts.regular
+        header.fontSize = 7
+        header.fillColor = AuditColors.TEXT_SECONDARY
+        d.add(header)
+    
+    for row_index, row in enumerate(matrix):
+        y = height - (row_index + 2) * cell_height
+        label = String(0, y + 5, f"Block {row_index + 1}")
+        label.fontName = fonts.regular
+        label.fontSize = 8
+        label.fillColor = AuditColors.TEXT_PRIMARY
+        d.add(label)
+        
+        for col, value in enumerate(row):
+            cell = Rect(label_width + col * cell_width, y, cell_width - 2, cell_height - 2)
+            cell.fillColor = HEATMAP_COLORS.get(value, AuditColors.WHITE)
+            cell.strokeColor = colors.HexColor('#e5e7eb')
+            cell.strokeWidth = 0.5
+            d.add(cell)
+            if value is not None:
+                text = String(label_width + col * cell_width + cell_width / 2 - 1, y + 4,
+                              'N/A' if value == -1 else str(value))
+                text.textAnchor = 'middle'
+                text.fontName = fonts.regular
+                text.fontSize = 7
+                text.fillColor = AuditColors.WHITE if value in (0, 3) else AuditColors.TEXT_PRIMARY
+                d.add(text)
+    
+    return d
+
+
+# ============================================================================
+# RENDER DEADLINE
+# ============================================================================
+
+# p95 PDF generation target from docs/deployment_guide.md
+RENDER_SLA_SECONDS = 5.0
+
+# Render modes, cheapest last. 'reduced' once the projected finish overshoots
+# the deadline, 'minimal' once the deadline has passed; modes never relax
+# within one report.
+RENDER_MODES = ('full', 'reduced', 'minimal')
+
+# Level 3 sections that are dropped in 'minimal' mode
+OPTIONAL_SECTIONS = frozenset(['implementation_roadmap', 'appendices', 'sensitivity_appendix'])
+
+
+# ============================================================================
+# FRAGMENT CACHE
+# ============================================================================
+
+# Bump when the static section text (methodology, disclaimer, block details,
+# risk wording) changes so cached fragments built from the old text are dropped
+FRAGMENT_TEMPLATE_VERSION = '1.0'
+
+
+def styles_fingerprint(styles):
+    """Stable fingerprint of a stylesheet, used to key cached fragments"""
+    parts = []
+    for name, style in sorted(styles.byName.items()):
+        attrs = sorted((k, repr(v)) for k, v in style.__dict__.items() if k != 'parent')
+        parts.append((name, tuple(attrs)))
+    return hash(tuple(parts))
+
+
+# Shared program objects reachable from flowables; never part of an entry's size
+_UNSIZED_TYPES = (type, ModuleType, FunctionType, MethodType, BuiltinFunctionType)
+
+
+def approx_size(root):
+    """Rough deep size in bytes of a flowable graph (objects, dicts, sequences, strings)"""
+    seen = set()
+    stack = [root]
+    total = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, _UNSIZED_TYPES):
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif hasattr(obj, '__dict__'):
+            stack.append(obj.__dict__)
+    return total
+
+
+class FragmentCache:
+    """
+    Memoizes parsed flowables per (section, key, style) across reports
+
+    Paragraph markup parsing dominates small sections whose content depends
+    only on a block status; a worker keeps one cache and every report gets
+    shallow copies of the cached prototypes, so layout state is never shared.
+
+    With max_bytes set, entries are also measured (approx_size) and evicted
+    to stay under that many bytes; used for per-audit drawings, whose keys
+    rarely repeat.
+    """
+    
+    def __init__(self, max_entries=1024, template_version=FRAGMENT_TEMPLATE_VERSION, max_bytes=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.template_version = template_version
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.build_seconds = 0.0
+        self.saved_seconds = 0.0
+    
+    def get(self, section, key, style_key, build):
+        """Return copies of the flowables for a fragment, building them on a miss"""
+        cache_key = (section, key, style_key)
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None:
+                self._entries.move_to_end(cache_key)
+                self.hits += 1
+                self.saved_seconds += entry[1]
+        
+        if entry is None:
+            start = time.perf_counter()
+            flowables = build()
+            cost = time.perf_counter() - start
+            size = approx_size(flowables) if self.max_bytes is not None else 0
+            entry = (flowables, cost, size)
+            with self._lock:
+                self.misses += 1
+                self.build_seconds += cost
+                if self.max_bytes is None or size <= self.max_bytes:
+                    old = self._entries.pop(cache_key, None)
+                    self._bytes += size - (old[2] if old else 0)
+                    self._entries[cache_key] = entry
+                while len(self._entries) > self.max_entries or \
+                        (self.max_bytes is not None and self._bytes > self.max_bytes):
+                    self._bytes -= self._entries.popitem(last=False)[1][2]
+        
+        return [copy.copy(f) for f in entry[0]]
+    
+    def peek(self, section, key, style_key):
+        """Copies of a cached fragment, or None without building it"""
+        cache_key = (section, key, style_key)
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(cache_key)
+            self.hits += 1
+            self.saved_seconds += entry[1]
+        return [copy.copy(f) for f in entry[0]]
+    
+    def check_version(self, template_version=FRAGMENT_TEMPLATE_VERSION):
+        """Drop every fragment if the template version changed"""
+        if template_version != self.template_version:
+            self.invalidate(template_version)
+    
+    def invalidate(self, template_version=None):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            if template_version is not None:
+                self.template_version = template_version
+    
+    def metrics(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'build_ms': round(self.build_seconds * 1000, 3),
+                'time_saved_ms': round(self.saved_seconds * 1000, 3),
+                'template_version': self.template_version
+            }
+    
+    def reset_metrics(self):
+        with self._lock:
+            self.hits = self.misses = 0
+            self.build_seconds = self.saved_seconds = 0.0
+
+
+# Shared by every generator in the worker process
+FRAGMENT_CACHE = FragmentCache()
+
+# Charts and heatmaps are keyed on per-audit scores and answers, so they get a
+# small byte-bounded cache of their own instead of evicting static fragments
+DRAWING_CACHE = FragmentCache(max_entries=64, max_bytes=4 * 1024 * 1024)
+
+
+# ============================================================================
+# SECTION STREAM
+# ============================================================================
+
+class SectionStream(list):
+    """
+    Flowable list that refills itself from a section iterator
+
+    BaseDocTemplate.build consumes its story from the front and checks
+    len() on every step; keeping only the rest of the current section and
+    `lookahead` whole sections after it buffered means a report never holds
+    all of its flowables at once. One section of lookahead (the default) is
+    enough for keepWithNext chains to cross a section boundary.
+    """
+    
+    def __init__(self, sections, lookahead=1):
+        super().__init__()
+        self._sections = iter(sections)
+        self._lookahead = lookahead
+        self._ahead = deque()  # flowable counts of the buffered sections after the current one
+    
+    def _fill(self):
+        # Whatever precedes the buffered sections is left of the current one;
+        # a keepWithNext merge may have eaten into the next section as well
+        current = list.__len__(self) - sum(self._ahead)
+        while self._ahead and current <= 0:
+            current += self._ahead.popleft()
+        while self._sections is not None and (current <= 0 or len(self._ahead) < self._lookahead):
+            section = next(self._sections, None)
+            if section is None:
+                self._sections = None
+            elif section:
+                self.extend(section)
+                if current <= 0:
+                    current += len(section)
+                else:
+                    self._ahead.append(len(section))
+    
+    def __len__(self):
+        self._fill()
+        return list.__len__(self)
+
+
 # ============================================================================
 # HEADER/FOOTER
 # ============================================================================
@@ -243,10 +604,11 @@ def create_score_indicator(score, max_score=100, width=200, height=30):
 class AuditReportTemplate:
     """Custom page template with header and footer"""
     
-    def __init__(self, company_name, report_date, audit_level):
+    def __init__(self, company_name, report_date, audit_level, fonts=HELVETICA):
         self.company_name = company_name
         self.report_date = report_date
         self.audit_level = audit_level
+        self.fonts = fonts
     
     def header_footer(self, canvas, doc):
         canvas.saveState()
@@ -256,15 +618,15 @@ class AuditReportTemplate:
         canvas.rect(0, doc.height + doc.topMargin + 20, doc.width + doc.leftMargin + doc.rightMargin, 40, fill=1, stroke=0)
         
         canvas.setFillColor(AuditColors.WHITE)
-        canvas.setFont('Helvetica-Bold', 10)
+        canvas.setFont(self.fonts.bold, 10)
         canvas.drawString(doc.leftMargin, doc.height + doc.topMargin + 35, "HIRING EXECUTION AUDIT")
         
-        canvas.setFont('Helvetica', 9)
+        canvas.setFont(self.fonts.regular, 9)
         canvas.drawRightString(doc.width + doc.leftMargin, doc.height + doc.topMargin + 35, self.company_name)
         
         # Footer
         canvas.setFillColor(AuditColors.TEXT_SECONDARY)
-        canvas.setFont('Helvetica', 8)
+        canvas.setFont(self.fonts.regular, 8)
         canvas.drawString(doc.leftMargin, 25, f"Level {self.audit_level} Report | {self.report_date}")
         canvas.drawRightString(doc.width + doc.leftMargin, 25, f"Page {doc.page}")
         
@@ -275,6 +637,225 @@ class AuditReportTemplate:
         canvas.restoreState()
 
 
+# ============================================================================
+# AUDIT VIEW
+# ============================================================================
+
+# Short block names used in key findings
+BLOCK_SHORT_NAMES = {
+    'block1': 'Executive Ownership',
+    'block2': 'TA Leadership',
+    'block3': 'Delivery Leadership',
+    'block4': 'Financial Governance',
+    'block5': 'Technical Interviewing',
+    'block6': 'Recruitment Operations',
+    'block7': 'Reporting & AI'
+}
+
+BLOCK_SIGNALS = {
+    'block1': 'Governance clarity',
+    'block2': 'Capacity alignment',
+    'block3': 'Feedback discipline',
+    'block4': 'Budget transparency',
+    'block5': 'Evaluation standards',
+    'block6': 'Process stability',
+    'block7': 'Data reliability'
+}
+
+# Detailed findings per block; the risk is listed unless the block is GREEN
+BLOCK_DETAIL_TEXT = {
+    'block1': ('Block 1: Executive Ownership & Governance',
+               ('Hiring ownership clarity assessed', 'Planning discipline evaluated',
+                'Executive visibility reviewed'),
+               'Ownership gap may cause accountability vacuum'),
+    'block2': ('Block 2: TA Leadership & Capacity',
+               ('TA operating model assessed', 'Capacity planning maturity evaluated',
+                'SLA discipline reviewed'),
+               'Capacity blindness may cause overload'),
+    'block3': ('Block 3: Delivery & Hiring Leadership',
+               ('Interview capacity assessed', 'Feedback timeliness evaluated',
+                'Requirement stability reviewed'),
+               'Interview bottleneck may slow hiring'),
+    'block4': ('Block 4: Financial Governance',
+               ('TA budget ownership assessed', 'Cost visibility evaluated',
+                'Budget-plan alignment reviewed'),
+               'Financial opacity may cause cost overruns'),
+    'block5': ('Block 5: Technical Interviewing',
+               ('Interviewer pool structure assessed', 'Evaluation criteria standardization evaluated',
+                'Feedback quality reviewed'),
+               'Evaluation inconsistency may cause false negatives'),
+    'block6': ('Block 6: Recruitment Operations',
+               ('Process documentation assessed', 'ATS discipline evaluated',
+                'Operational resilience reviewed'),
+               'Key-person dependency creates fragility'),
+    'block7': ('Block 7: Reporting, Data & AI',
+               ('Reporting maturity assessed', 'Data integrity evaluated',
+                'AI governance reviewed'),
+               'Data unreliability undermines all metrics')
+}
+
+# (block, risk name, impact); Data Blindness only applies when block 7 is RED
+PRIORITY_RISKS = (
+    ('block1', 'Ownership Gap', 'No clear accountability for hiring outcomes'),
+    ('block3', 'Interview Bottleneck', 'Delivery capacity constraints slow hiring'),
+    ('block6', 'Operational Fragility', 'Hero-based execution creates key-person risk')
+)
+
+GATE_FAILURE_TEXT = (
+    ('block1', "GATE 0 FAILURE: Executive ownership absent - overall system compromised"),
+    ('block2', "GATE 1 FAILURE: TA Leadership ungoverned - execution will fail"),
+    ('block4', "GATE 1 FAILURE: Financial governance broken - costs uncontrolled")
+)
+
+STATUS_SCORE = {'green': 90, 'yellow': 60, 'red': 30, 'gray': 50}
+
+# Default recommendations
+QUICK_WINS = tuple(MappingProxyType(r) for r in [
+    {'text': 'Designate interim hiring owner (CEO/COO) for 90 days', 'owner': 'CEO', 'effort': '1 day'},
+    {'text': 'Add hiring status to weekly leadership agenda', 'owner': 'COO/EA', 'effort': '2 hours'},
+    {'text': 'Count active roles per recruiter and set max threshold', 'owner': 'TA Lead', 'effort': '4 hours'},
+    {'text': 'Block 4 interview slots per week for key interviewers', 'owner': 'Delivery', 'effort': '1 day'},
+    {'text': 'Set 24-hour feedback SLA with automated reminders', 'owner': 'TA Ops', 'effort': '2 hours'}
+])
+
+STRUCTURAL_CHANGES = tuple(MappingProxyType(r) for r in [
+    {'text': 'Define RACI matrix for hiring decisions', 'owner': 'HR + Business', 'effort': '1 week'},
+    {'text': 'Build capacity model by role complexity', 'owner': 'TA Ops', 'effort': '2 weeks'},
+    {'text': 'Implement SLA dashboard visible to all stakeholders', 'owner': 'TA + IT', 'effort': '2 weeks'},
+    {'text': 'Create standardized evaluation scorecard template', 'owner': 'Engineering', 'effort': '4 hours'},
+    {'text': 'Establish monthly Hiring Governance Forum', 'owner': 'COO', 'effort': '2 weeks'}
+])
+
+
+class AuditView:
+    """
+    Derived report data for one audit, computed once and read-only
+
+    Shared by every section of a report and by other renderers (HTML
+    preview, portfolio exports). Mappings are read-only proxies and
+    sequences are tuples.
+    """
+
+    __slots__ = ('company_name', 'report_date', 'block_statuses', 'overall_status', 'overall_score',
+                 'red_count', 'yellow_count', 'green_count', 'key_findings', 'priority_risks',
+                 'gate_failures', 'block_details', 'quick_wins', 'structural_changes')
+
+    def __init__(self, audit_data):
+        statuses = dict(audit_data.get('block_statuses', {}))
+        counts = {'red': 0, 'yellow': 0, 'green': 0}
+        for status in statuses.values():
+            if status in counts:
+                counts[status] += 1
+
+        setattr_ = object.__setattr__
+        setattr_(self, 'company_name', audit_data.get('company_name', 'Company Name'))
+        setattr_(self, 'report_date', audit_data.get('report_date', datetime.now().strftime('%Y-%m-%d')))
+        setattr_(self, 'block_statuses', MappingProxyType(statuses))
+        setattr_(self, 'red_count', counts['red'])
+        setattr_(self, 'yellow_count', counts['yellow'])
+        setattr_(self, 'green_count', counts['green'])
+        setattr_(self, 'overall_status', self._overall_status(statuses))
+        setattr_(self, 'overall_score', self._overall_score(statuses, len(audit_data.get('contradictions', []))))
+        setattr_(self, 'key_findings', self._key_findings(statuses))
+        setattr_(self, 'priority_risks', self._priority_risks(statuses))
+        setattr_(self, 'gate_failures', tuple(text for block_id, text in GATE_FAILURE_TEXT
+                                               if statuses.get(block_id) == 'red'))
+        setattr_(self, 'block_details', MappingProxyType({
+            block_id: MappingProxyType({
+                'name': name,
+                'findings': findings,
+                'risks': (risk,) if statuses.get(block_id) != 'green' else ()
+            })
+            for block_id, (name, findings, risk) in BLOCK_DETAIL_TEXT.items()
+        }))
+        setattr_(self, 'quick_wins', QUICK_WINS)
+        setattr_(self, 'structural_changes', STRUCTURAL_CHANGES)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"AuditView is read-only (cannot set '{name}')")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"AuditView is read-only (cannot delete '{name}')")
+
+    @staticmethod
+    def _overall_status(statuses):
+        """Overall audit status based on gate logic"""
+        # Gate 0 (block 1), Gate 1 (blocks 2, 4) and the execution blocks (3, 5, 6) force RED
+        if any(statuses.get(block_id) == 'red' for block_id in BLOCK_IDS[:6]):
+            return 'red'
+        if sum(1 for s in statuses.values() if s == 'yellow') >= 2:
+            return 'yellow'
+        if sum(1 for s in statuses.values() if s == 'green') >= 5:
+            return 'green'
+        return 'yellow'
+
+    @staticmethod
+    def _overall_score(statuses, contradiction_count):
+        """Numerical confidence score"""
+        scores = [STATUS_SCORE.get(s, 50) for s in statuses.values()]
+        if not scores:
+            return 50
+        base_score = sum(scores) / len(scores)
+        # Deductions for contradictions
+        base_score -= contradiction_count * 2
+        # Block 7 modifier
+        if statuses.get('block7') == 'red':
+            base_score *= 0.8
+        return max(0, min(100, int(base_score)))
+
+    @staticmethod
+    def _key_findings(statuses):
+        findings = []
+        for block_id, status in statuses.items():
+            name = BLOCK_SHORT_NAMES.get(block_id, block_id)
+            if status == 'red':
+                findings.append(f"Critical failure in {name} requires immediate attention")
+            elif status == 'yellow':
+                findings.append(f"{name} shows inconsistent execution with improvement potential")
+            elif status == 'green':
+                findings.append(f"{name} demonstrates healthy operational maturity")
+        return tuple(findings)
+
+    @staticmethod
+    def _priority_risks(statuses):
+        """Risks ordered by severity (RED first)"""
+        risks = [{'name': name, 'severity': statuses.get(block_id), 'impact': impact}
+                 for block_id, name, impact in PRIORITY_RISKS
+                 if statuses.get(block_id) in ('red', 'yellow')]
+        if statuses.get('block7') == 'red':
+            risks.append({'name': 'Data Blindness', 'severity': 'red',
+                          'impact': 'Unreliable data undermines all decisions'})
+        severity_order = {'red': 0, 'yellow': 1, 'green': 2}
+        risks.sort(key=lambda x: severity_order.get(x['severity'], 3))
+        return tuple(MappingProxyType(r) for r in risks)
+
+    def block_signal(self, block_id):
+        """Primary signal for a block"""
+        return BLOCK_SIGNALS.get(block_id, 'Assessment pending')
+
+
+def executive_summary_text(view):
+    """Executive summary paragraph markup (<b> only) for an AuditView; shared with the HTML preview"""
+    if view.overall_status == 'red':
+        summary = f"""
+        The audit identified <b>critical structural issues</b> in {view.company_name}'s hiring execution system. 
+        {view.red_count} out of 7 audit blocks show RED status, indicating systemic failures that require immediate attention.
+        Without intervention, hiring outcomes will remain unpredictable and costly.
+        """
+    elif view.overall_status == 'yellow':
+        summary = f"""
+        The audit identified <b>moderate risks</b> in {view.company_name}'s hiring execution system.
+        While foundational elements exist, {view.yellow_count} blocks show AT RISK status with inconsistent execution.
+        Targeted improvements can significantly enhance hiring efficiency within 90 days.
+        """
+    else:
+        summary = f"""
+        {view.company_name}'s hiring execution system demonstrates <b>healthy fundamentals</b> across most dimensions.
+        Continue monitoring key metrics and address minor gaps identified in this report to maintain performance.
+        """
+    return summary
+
+
 # ============================================================================
 # REPORT GENERATOR CLASS
 # ============================================================================
@@ -282,7 +863,8 @@ class AuditReportTemplate:
 class HiringAuditReportGenerator:
     """Main class for generating audit reports"""
     
-    def __init__(self, audit_data, output_path, level=1):
+    def __init__(self, audit_data, output_path, level=1, fragment_cache=None, fonts=None, image_cache=None,
+                 drawing_cache=None):
         """
         Initialize the report generator
         
@@ -290,12 +872,29 @@ class HiringAuditReportGenerator:
             audit_data: dict with audit results
             output_path: path for the output PDF
             level: 1, 2, or 3 for report depth
+            fragment_cache: FragmentCache for static sections (defaults to FRAGMENT_CACHE)
+            fonts: report_fonts.FontFamily to draw with (defaults to built-in Helvetica)
+            image_cache: report_images.ImageCache for logos (defaults to IMAGE_CACHE)
+            drawing_cache: byte-bounded FragmentCache for charts (defaults to DRAWING_CACHE)
         """
+        self.fonts = fonts or HELVETICA
+        self.styles = get_custom_styles(self.fonts)
+        self.elements = []
+        self.fragment_cache = fragment_cache or FRAGMENT_CACHE
+        self.image_cache = image_cache or IMAGE_CACHE
+        self.drawing_cache = drawing_cache or DRAWING_CACHE
+        self._styles_key = styles_fingerprint(self.styles)
+        self.reset(audit_data, output_path, level)
+    
+    def reset(self, audit_data, output_path=None, level=None):
+        """Load a new audit into this generator, keeping styles and caches"""
         self.data = audit_data
-        self.output_path = output_path
-        self.level = level
-        self.styles = get_custom_styles()
+        if output_path is not None:
+            self.output_path = output_path
+        if level is not None:
+            self.level = level
         self.elements = []
+        self.fragment_cache.check_version()
         
         # Extract key data
         self.company_name = audit_data.get('company_name', 'Company Name')
@@ -303,10 +902,44 @@ class HiringAuditReportGenerator:
         self.block_statuses = audit_data.get('block_statuses', {})
         self.responses = audit_data.get('responses', {})
         self.contradictions = audit_data.get('contradictions', [])
+        self.auto_flags = audit_data.get('auto_flags', [])
         self.recommendations = audit_data.get('recommendations', [])
+        self.view = AuditView(audit_data)
+        self._ruleset = None
+        self._deadline_at = None
+        self.render_mode = 'full'
+        self.render_stats = None
+        return self
     
-    def generate(self):
-        """Generate the complete PDF report"""
+    def release(self):
+        """Drop per-report state so a pooled generator holds no audit data between jobs"""
+        self.data = None
+        self.output_path = None
+        self.elements = []
+        self.company_name = self.report_date = None
+        self.block_statuses = {}
+        self.responses = {}
+        self.contradictions = []
+        self.auto_flags = []
+        self.recommendations = []
+        self.view = None
+        self._ruleset = None
+    
+    def generate(self, deadline=None):
+        """
+        Generate the complete PDF report
+        
+        Args:
+            deadline: optional time budget in seconds (e.g. RENDER_SLA_SECONDS
+                      minus time spent queued). When the budget is at risk,
+                      later sections switch to cheaper variants; what was
+                      degraded is recorded in self.render_stats.
+        """
+        if self.data is None:
+            raise ValueError("No audit loaded; call reset() with audit data first")
+        
+        self._start_render(deadline)
+        
         # Create document
         doc = SimpleDocTemplate(
             self.output_path,
@@ -314,34 +947,117 @@ class HiringAuditReportGenerator:
             rightMargin=50,
             leftMargin=50,
             topMargin=70,
-            bottomMargin=50
+            bottomMargin=50,
+            initialFontName=None if self.fonts.builtin else self.fonts.regular
         )
         
-        template = AuditReportTemplate(self.company_name, self.report_date, self.level)
+        template = AuditReportTemplate(self.company_name, self.report_date, self.level, self.fonts)
         
-        # Build content
-        self._add_cover_page()
-        self._add_executive_summary()
-        self._add_block_overview()
+        # Build PDF; sections are constructed as the builder reaches them
+        doc.build(SectionStream(self.iter_sections()),
+                  onFirstPage=template.header_footer, onLaterPages=template.header_footer)
+        
+        self._finish_render()
+        return self.output_path
+    
+    def _section_plan(self):
+        """Section builders for the current level, in document order"""
+        sections = [self._add_cover_page, self._add_executive_summary, self._add_block_overview]
         
         if self.level >= 2:
-            self._add_detailed_findings()
-            self._add_recommendations()
+            sections += [self._add_detailed_findings, self._add_recommendations]
         
         if self.level >= 3:
-            self._add_implementation_roadmap()
-            self._add_appendices()
+            sections += [self._add_implementation_roadmap, self._add_appendices,
+                         self._add_sensitivity_appendix]
         
-        self._add_disclaimer()
-        
-        # Build PDF
-        doc.build(self.elements, onFirstPage=template.header_footer, onLaterPages=template.header_footer)
-        
-        return self.output_path
+        sections.append(self._add_disclaimer)
+        return sections
+    
+    def iter_sections(self):
+        """Yield the flowables of each section, building one section at a time"""
+        plan = self._section_plan()
+        for index, add_section in enumerate(plan):
+            name = add_section.__name__[len('_add_'):]
+            if self._deadline_at is not None:
+                self._update_render_mode(len(plan) - index)
+                if self.render_mode == 'minimal' and name in OPTIONAL_SECTIONS:
+                    self._degrade(name, 'skip_section')
+                    continue
+            
+            started = time.perf_counter()
+            self.elements = []
+            add_section()
+            elements, self.elements = self.elements, []
+            if self.render_stats is not None:
+                self.render_stats['sections'].append({
+                    'section': name,
+                    'mode': self.render_mode,
+                    'started_ms': round((started - self._render_started) * 1000, 3),
+                    'build_ms': round((time.perf_counter() - started) * 1000, 3)
+                })
+            yield elements
+    
+    # ========================================================================
+    # DEADLINE TRACKING
+    # ========================================================================
+    
+    def _start_render(self, deadline):
+        self._render_started = time.perf_counter()
+        self._deadline_at = None if deadline is None else self._render_started + deadline
+        self.render_mode = 'full'
+        self.render_stats = {
+            'deadline_ms': None if deadline is None else round(deadline * 1000, 3),
+            'sections': [],
+            'degradations': []
+        }
+    
+    def _finish_render(self):
+        stats = self.render_stats
+        now = time.perf_counter()
+        stats['elapsed_ms'] = round((now - self._render_started) * 1000, 3)
+        stats['mode'] = self.render_mode
+        stats['met_deadline'] = self._deadline_at is None or now <= self._deadline_at
+        self._deadline_at = None
+    
+    def _update_render_mode(self, sections_left):
+        """Escalate the render mode from elapsed time and the pace so far"""
+        now = time.perf_counter()
+        remaining = self._deadline_at - now
+        done = len(self.render_stats['sections'])
+        # Time between section starts includes layout of the sections already streamed
+        pace = (now - self._render_started) / done if done else 0.0
+        if remaining <= 0:
+            mode = 'minimal'
+        elif pace * sections_left > remaining:
+            mode = 'reduced'
+        else:
+            mode = 'full'
+        if RENDER_MODES.index(mode) > RENDER_MODES.index(self.render_mode):
+            self.render_mode = mode
+    
+    def _degraded(self):
+        return self.render_mode != 'full'
+    
+    def _degrade(self, section, action):
+        """Record a cheaper variant chosen for a section"""
+        if self.render_stats is not None:
+            self.render_stats['degradations'].append({
+                'section': section,
+                'action': action,
+                'mode': self.render_mode,
+                'at_ms': round((time.perf_counter() - self._render_started) * 1000, 3)
+            })
     
     def _add_cover_page(self):
         """Add the cover page"""
-        self.elements.append(Spacer(1, 100))
+        logo = self._cover_logo()
+        if logo is None:
+            self.elements.append(Spacer(1, 100))
+        else:
+            self.elements.append(Spacer(1, 30))
+            self.elements.append(ImageFlowable(logo))
+            self.elements.append(Spacer(1, 70 - logo.height))
         
         # Main title
         self.elements.append(Paragraph(
@@ -360,9 +1076,8 @@ class HiringAuditReportGenerator:
         self.elements.append(Spacer(1, 10))
         
         # Report level and date
-        level_names = {1: 'Diagnostic Report', 2: 'Diagnostic + Design Report', 3: 'Full Assessment Report'}
         self.elements.append(Paragraph(
-            f"Level {self.level}: {level_names.get(self.level, 'Report')}",
+            f"Level {self.level}: {LEVEL_NAMES.get(self.level, 'Report')}",
             self.styles['ReportSubtitle']
         ))
         
@@ -374,21 +1089,19 @@ class HiringAuditReportGenerator:
         self.elements.append(Spacer(1, 60))
         
         # Overall health indicator
-        overall_status = self._calculate_overall_status()
-        overall_score = self._calculate_overall_score()
-        
         # Status table
         status_data = [
             ['OVERALL HIRING HEALTH', ''],
             ['Status', ''],
-            ['Confidence Score', f'{overall_score}/100']
+            ['Confidence Score', f'{self.view.overall_score}/100']
         ]
         
         status_table = Table(status_data, colWidths=[200, 150])
         status_table.setStyle(TableStyle([
             ('BACKGROUND', (0, 0), (-1, 0), AuditColors.PRIMARY),
             ('TEXTCOLOR', (0, 0), (-1, 0), AuditColors.WHITE),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTNAME', (0, 0), (-1, -1), self.fonts.regular),
+            ('FONTNAME', (0, 0), (-1, 0), self.fonts.bold),
             ('FONTSIZE', (0, 0), (-1, 0), 12),
             ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
             ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
@@ -408,27 +1121,8 @@ class HiringAuditReportGenerator:
         self.elements.append(Spacer(1, 15))
         
         # Summary text
-        overall_status = self._calculate_overall_status()
-        red_count = sum(1 for s in self.block_statuses.values() if s == 'red')
-        yellow_count = sum(1 for s in self.block_statuses.values() if s == 'yellow')
-        
-        if overall_status == 'red':
-            summary = f"""
-            The audit identified <b>critical structural issues</b> in {self.company_name}'s hiring execution system. 
-            {red_count} out of 7 audit blocks show RED status, indicating systemic failures that require immediate attention.
-            Without intervention, hiring outcomes will remain unpredictable and costly.
-            """
-        elif overall_status == 'yellow':
-            summary = f"""
-            The audit identified <b>moderate risks</b> in {self.company_name}'s hiring execution system.
-            While foundational elements exist, {yellow_count} blocks show AT RISK status with inconsistent execution.
-            Targeted improvements can significantly enhance hiring efficiency within 90 days.
-            """
-        else:
-            summary = f"""
-            {self.company_name}'s hiring execution system demonstrates <b>healthy fundamentals</b> across most dimensions.
-            Continue monitoring key metrics and address minor gaps identified in this report to maintain performance.
-            """
+        view = self.view
+        summary = executive_summary_text(view)
         
         self.elements.append(Paragraph(summary, self.styles['AuditBodyText']))
         self.elements.append(Spacer(1, 20))
@@ -436,8 +1130,7 @@ class HiringAuditReportGenerator:
         # Key findings
         self.elements.append(Paragraph("Key Findings", self.styles['SubsectionHeader']))
         
-        findings = self._generate_key_findings()
-        for finding in findings[:5]:  # Top 5 findings
+        for finding in view.key_findings[:5]:  # Top 5 findings
             bullet = f"• {finding}"
             self.elements.append(Paragraph(bullet, self.styles['AuditBodyText']))
         
@@ -446,11 +1139,12 @@ class HiringAuditReportGenerator:
         # Top risks
         self.elements.append(Paragraph("Priority Risks", self.styles['SubsectionHeader']))
         
-        risks = self._get_priority_risks()
-        for risk in risks[:3]:  # Top 3 risks
+        for risk in view.priority_risks[:3]:  # Top 3 risks
             risk_style = self.styles['CriticalRisk'] if risk['severity'] == 'red' else self.styles['WarningRisk']
-            self.elements.append(Paragraph(f"⚠ {risk['name']}: {risk['impact']}", risk_style))
-            self.elements.append(Spacer(1, 5))
+            self.elements.extend(self._fragment('priority_risk', (risk['name'], risk['severity']), lambda: [
+                Paragraph(f"⚠ {risk['name']}: {risk['impact']}", risk_style),
+                Spacer(1, 5)
+            ]))
         
         self.elements.append(PageBreak())
     
@@ -460,23 +1154,13 @@ class HiringAuditReportGenerator:
         self.elements.append(HRFlowable(width="100%", thickness=2, color=AuditColors.PRIMARY))
         self.elements.append(Spacer(1, 15))
         
-        block_info = {
-            'block1': {'name': 'Block 1: Executive Ownership', 'role': 'GATEKEEPER'},
-            'block2': {'name': 'Block 2: TA Leadership', 'role': 'EXECUTION BRAIN'},
-            'block3': {'name': 'Block 3: Delivery Leadership', 'role': 'DEMAND INTEGRITY'},
-            'block4': {'name': 'Block 4: Financial Governance', 'role': 'COST CONTROL'},
-            'block5': {'name': 'Block 5: Technical Interviewing', 'role': 'BOTTLENECK LAYER'},
-            'block6': {'name': 'Block 6: Recruitment Operations', 'role': 'STABILITY FOUNDATION'},
-            'block7': {'name': 'Block 7: Reporting & AI', 'role': 'SYSTEMIC MULTIPLIER'}
-        }
-        
         # Status table
         table_data = [['Block', 'Function', 'Status', 'Key Signal']]
         
-        for block_id, info in block_info.items():
+        for block_id, info in BLOCK_INFO.items():
             status = self.block_statuses.get(block_id, 'gray')
-            status_text = {'green': '● HEALTHY', 'yellow': '● AT RISK', 'red': '● CRITICAL', 'gray': '○ PENDING'}.get(status, '○')
-            signal = self._get_block_signal(block_id)
+            status_text = STATUS_TEXT.get(status, '○')
+            signal = self.view.block_signal(block_id)
             table_data.append([info['name'], info['role'], status_text, signal])
         
         table = Table(table_data, colWidths=[150, 120, 80, 130])
@@ -485,7 +1169,8 @@ class HiringAuditReportGenerator:
         style_commands = [
             ('BACKGROUND', (0, 0), (-1, 0), AuditColors.PRIMARY),
             ('TEXTCOLOR', (0, 0), (-1, 0), AuditColors.WHITE),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTNAME', (0, 0), (-1, -1), self.fonts.regular),
+            ('FONTNAME', (0, 0), (-1, 0), self.fonts.bold),
             ('FONTSIZE', (0, 0), (-1, -1), 9),
             ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
             ('ALIGN', (2, 0), (2, -1), 'CENTER'),
@@ -497,7 +1182,7 @@ class HiringAuditReportGenerator:
         ]
         
         # Add row colors based on status
-        for i, block_id in enumerate(block_info.keys(), 1):
+        for i, block_id in enumerate(BLOCK_INFO.keys(), 1):
             status = self.block_statuses.get(block_id, 'gray')
             if status == 'red':
                 style_commands.append(('TEXTCOLOR', (2, i), (2, i), AuditColors.RED))
@@ -511,11 +1196,31 @@ class HiringAuditReportGenerator:
         
         self.elements.append(Spacer(1, 20))
         
+        # Charts are cached by the exact values they plot
+        block_scores = self.data.get('block_scores')
+        if self._degraded() and (block_scores or self.responses):
+            self._degrade('block_overview', 'skip_charts')
+        elif block_scores:
+            thresholds = self._status_thresholds()
+            signature = (thresholds,) + tuple(
+                (b, block_scores.get(b), self.block_statuses.get(b, 'gray')) for b in BLOCK_IDS)
+            self.elements.append(Paragraph("Block Scores", self.styles['SubsectionHeader']))
+            self.elements.extend(self._drawing('block_score_chart', signature, lambda: [
+                create_block_score_chart(block_scores, self.block_statuses, fonts=self.fonts,
+                                         thresholds=thresholds)]))
+            self.elements.append(Spacer(1, 10))
+        
+        if self.responses and not self._degraded():
+            matrix = build_score_matrix(self.responses)
+            self.elements.append(Paragraph("Answer Heatmap", self.styles['SubsectionHeader']))
+            self.elements.extend(self._drawing('status_heatmap', matrix, lambda: [
+                create_status_heatmap(matrix, fonts=self.fonts)]))
+            self.elements.append(Spacer(1, 20))
+        
         # Gate failures explanation
-        gate_failures = self._check_gate_failures()
-        if gate_failures:
+        if self.view.gate_failures:
             self.elements.append(Paragraph("⚠ Gate Failures Detected", self.styles['SubsectionHeader']))
-            for failure in gate_failures:
+            for failure in self.view.gate_failures:
                 self.elements.append(Paragraph(f"• {failure}", self.styles['CriticalRisk']))
             self.elements.append(Spacer(1, 10))
         
@@ -525,6 +1230,13 @@ class HiringAuditReportGenerator:
             for contradiction in self.contradictions[:5]:
                 self.elements.append(Paragraph(f"• {contradiction}", self.styles['WarningRisk']))
         
+        # Auto-Flags from the question bank
+        if self.auto_flags:
+            self.elements.append(Paragraph("Auto-Flags", self.styles['SubsectionHeader']))
+            for auto_flag in self.auto_flags[:5]:
+                self.elements.append(Paragraph(
+                    f"• {auto_flag['flag']} ({auto_flag['question'].upper()})", self.styles['WarningRisk']))
+        
         self.elements.append(PageBreak())
     
     def _add_detailed_findings(self):
@@ -533,34 +1245,55 @@ class HiringAuditReportGenerator:
         self.elements.append(HRFlowable(width="100%", thickness=2, color=AuditColors.PRIMARY))
         self.elements.append(Spacer(1, 15))
         
-        block_details = self._get_block_details()
-        
-        for block_id, details in block_details.items():
-            # Block header
+        for block_id in BLOCK_IDS:
             status = self.block_statuses.get(block_id, 'gray')
-            status_color = {'green': AuditColors.GREEN, 'yellow': AuditColors.YELLOW, 'red': AuditColors.RED}.get(status, AuditColors.GRAY)
-            
-            self.elements.append(Paragraph(details['name'], self.styles['BlockTitle']))
-            
-            # Status badge inline
-            status_text = {'green': 'HEALTHY', 'yellow': 'AT RISK', 'red': 'CRITICAL'}.get(status, 'PENDING')
-            self.elements.append(Paragraph(f"<font color='{status_color}'><b>Status: {status_text}</b></font>", self.styles['AuditBodyText']))
-            
-            # Findings
-            self.elements.append(Paragraph("<b>Findings:</b>", self.styles['AuditBodyText']))
-            for finding in details.get('findings', [])[:3]:
-                self.elements.append(Paragraph(f"  • {finding}", self.styles['RiskText']))
-            
-            # Risks
-            if details.get('risks'):
-                self.elements.append(Paragraph("<b>Risks Identified:</b>", self.styles['AuditBodyText']))
-                for risk in details.get('risks', [])[:2]:
-                    self.elements.append(Paragraph(f"  ⚠ {risk}", self.styles['RiskText']))
-            
-            self.elements.append(Spacer(1, 15))
+            if self._degraded():
+                # Cached detail if this worker has rendered it before, else a one-line summary
+                cached = self.fragment_cache.peek('block_detail', (block_id, status), self._styles_key)
+                if cached is None:
+                    self._degrade('detailed_findings', f'compact_{block_id}')
+                    cached = self._build_compact_block_detail(block_id, status)
+                self.elements.extend(cached)
+                continue
+            self.elements.extend(self._fragment('block_detail', (block_id, status), lambda: self._build_block_detail(
+                self.view.block_details[block_id], status)))
         
         self.elements.append(PageBreak())
     
+    def _build_block_detail(self, details, status):
+        """Flowables for one block in the detailed findings section"""
+        elements = []
+        status_color = {'green': AuditColors.GREEN, 'yellow': AuditColors.YELLOW, 'red': AuditColors.RED}.get(status, AuditColors.GRAY)
+        
+        elements.append(Paragraph(details['name'], self.styles['BlockTitle']))
+        
+        # Status badge inline
+        status_text = {'green': 'HEALTHY', 'yellow': 'AT RISK', 'red': 'CRITICAL'}.get(status, 'PENDING')
+        elements.append(Paragraph(f"<font color='{status_color}'><b>Status: {status_text}</b></font>", self.styles['AuditBodyText']))
+        
+        # Findings
+        elements.append(Paragraph("<b>Findings:</b>", self.styles['AuditBodyText']))
+        for finding in details.get('findings', [])[:3]:
+            elements.append(Paragraph(f"  • {finding}", self.styles['RiskText']))
+        
+        # Risks
+        if details.get('risks'):
+            elements.append(Paragraph("<b>Risks Identified:</b>", self.styles['AuditBodyText']))
+            for risk in details.get('risks', [])[:2]:
+                elements.append(Paragraph(f"  ⚠ {risk}", self.styles['RiskText']))
+        
+        elements.append(Spacer(1, 15))
+        return elements
+    
+    def _build_compact_block_detail(self, block_id, status):
+        """Status line for one block when there is no time to build its full detail"""
+        status_text = {'green': 'HEALTHY', 'yellow': 'AT RISK', 'red': 'CRITICAL'}.get(status, 'PENDING')
+        return [
+            Paragraph(BLOCK_INFO[block_id]['name'], self.styles['BlockTitle']),
+            Paragraph(f"<b>Status: {status_text}</b> | {self.view.block_signal(block_id)}", self.styles['AuditBodyText']),
+            Spacer(1, 10)
+        ]
+    
     def _add_recommendations(self):
         """Add recommendations section (Level 2+)"""
         self.elements.append(Paragraph("Recommendations", self.styles['SectionHeader']))
@@ -569,8 +1302,7 @@ class HiringAuditReportGenerator:
         
         # Quick wins
         self.elements.append(Paragraph("Quick Wins (Week 1-2)", self.styles['SubsectionHeader']))
-        quick_wins = self._get_recommendations_by_type('quick_win')
-        for rec in quick_wins[:5]:
+        for rec in self.view.quick_wins[:5]:
             self.elements.append(Paragraph(f"✓ {rec['text']}", self.styles['RecommendationText']))
             self.elements.append(Paragraph(f"   <i>Owner: {rec['owner']} | Effort: {rec['effort']}</i>", self.styles['RiskText']))
         
@@ -578,8 +1310,7 @@ class HiringAuditReportGenerator:
         
         # Structural changes
         self.elements.append(Paragraph("Structural Changes (Month 1-3)", self.styles['SubsectionHeader']))
-        structural = self._get_recommendations_by_type('structural')
-        for rec in structural[:5]:
+        for rec in self.view.structural_changes[:5]:
             self.elements.append(Paragraph(f"→ {rec['text']}", self.styles['RecommendationText']))
             self.elements.append(Paragraph(f"   <i>Owner: {rec['owner']} | Effort: {rec['effort']}</i>", self.styles['RiskText']))
         
@@ -604,7 +1335,8 @@ class HiringAuditReportGenerator:
         table.setStyle(TableStyle([
             ('BACKGROUND', (0, 0), (-1, 0), AuditColors.PRIMARY),
             ('TEXTCOLOR', (0, 0), (-1, 0), AuditColors.WHITE),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTNAME', (0, 0), (-1, -1), self.fonts.regular),
+            ('FONTNAME', (0, 0), (-1, 0), self.fonts.bold),
             ('FONTSIZE', (0, 0), (-1, -1), 9),
             ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
             ('VALIGN', (0, 0), (-1, -1), 'TOP'),
@@ -636,16 +1368,26 @@ class HiringAuditReportGenerator:
         self.elements.append(HRFlowable(width="100%", thickness=2, color=AuditColors.PRIMARY))
         self.elements.append(Spacer(1, 15))
         
-        methodology_text = """
+        thresholds = self._status_thresholds()
+        if thresholds:
+            yellow, green = thresholds
+            bands = (f"GREEN (≥{green:g} average, no critical RED)",
+                     f"YELLOW ({yellow:g}-{green - 0.01:.2f} average)",
+                     f"RED (<{yellow:g} average or critical domain failure)")
+        else:
+            bands = ("GREEN (high average, no critical RED)", "YELLOW (middle average)",
+                     "RED (low average or critical domain failure)")
+        
+        methodology_text = f"""
         This audit uses a cross-validation methodology designed to surface systemic contradictions 
         and misaligned ownership. Each of the 7 audit blocks evaluates a specific dimension of 
         hiring execution, with responses validated across multiple roles to detect political 
         distortions and self-report bias.
         
         <b>Scoring Logic:</b>
-        • GREEN (≥2.3 average, no critical RED): Structured, disciplined, predictable
-        • YELLOW (1.5-2.29 average): Processes exist but inconsistently enforced
-        • RED (<1.5 average or critical domain failure): Systemic dysfunction
+        • {bands[0]}: Structured, disciplined, predictable
+        • {bands[1]}: Processes exist but inconsistently enforced
+        • {bands[2]}: Systemic dysfunction
         
         <b>Gate Rules:</b>
         • Block 1 RED → Overall system cannot exceed YELLOW
@@ -657,7 +1399,70 @@ class HiringAuditReportGenerator:
         escalate severity regardless of local scores.
         """
         
-        self.elements.append(Paragraph(methodology_text, self.styles['AuditBodyText']))
+        self.elements.extend(self._fragment('methodology', thresholds, lambda: [
+            Paragraph(methodology_text, self.styles['AuditBodyText'])]))
+        self.elements.append(PageBreak())
+    
+    def _add_sensitivity_appendix(self, max_rows=30):
+        """Add the single-answer flip map (Level 3)"""
+        analysis = self.data.get('sensitivity')
+        if analysis is None and self.responses:
+            if self._degraded():
+                self._degrade('sensitivity_appendix', 'skip_analysis')
+                return
+            ruleset = self._scoring_ruleset()
+            if ruleset is None:
+                # Flips under other rules would contradict the scores on the page
+                return
+            from sensitivity_analyzer import analyze_sensitivity
+            analysis = analyze_sensitivity(self.responses, ruleset=ruleset)
+        if not analysis or not analysis['flips']:
+            return
+        if self._degraded() and len(analysis['flips']) > 10:
+            self._degrade('sensitivity_appendix', 'simplified_table')
+            max_rows = 10
+        
+        self.elements.append(Paragraph("Appendix: Answer Sensitivity", self.styles['SectionHeader']))
+        self.elements.append(HRFlowable(width="100%", thickness=2, color=AuditColors.PRIMARY))
+        self.elements.append(Spacer(1, 15))
+        self.elements.append(Paragraph(
+            "Single answers that would change a block status or the overall audit status if "
+            "answered differently. Overall-status changes are listed first.",
+            self.styles['AuditBodyText']))
+        self.elements.append(Spacer(1, 10))
+        
+        def fmt(value):
+            if value is None:
+                return 'Unanswered'
+            return 'N/A' if value == -1 else str(value)
+        
+        # Flips arrive in (block, question number) order; the sort is stable
+        flips = sorted(analysis['flips'], key=lambda f: f['overall_to'] == f['overall_from'])
+        table_data = [['Question', 'Answer', 'Block Status', 'Overall Status']]
+        for flip in flips[:max_rows]:
+            block_change = '—' if flip['block_status_to'] == flip['block_status_from'] else \
+                f"{flip['block_status_from'].upper()} → {flip['block_status_to'].upper()}"
+            overall_change = '—' if flip['overall_to'] == flip['overall_from'] else \
+                f"{flip['overall_from'].upper()} → {flip['overall_to'].upper()}"
+            table_data.append([flip['question'], f"{fmt(flip['from_value'])} → {fmt(flip['to_value'])}",
+                               block_change, overall_change])
+        
+        table = Table(table_data, colWidths=[90, 90, 150, 150])
+        table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), AuditColors.PRIMARY),
+            ('TEXTCOLOR', (0, 0), (-1, 0), AuditColors.WHITE),
+            ('FONTNAME', (0, 0), (-1, -1), self.fonts.regular),
+            ('FONTNAME', (0, 0), (-1, 0), self.fonts.bold),
+            ('FONTSIZE', (0, 0), (-1, -1), 8),
+            ('GRID', (0, 0), (-1, -1), 0.5, AuditColors.GRAY),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [AuditColors.WHITE, AuditColors.BACKGROUND]),
+        ]))
+        self.elements.append(table)
+        
+        if len(flips) > max_rows:
+            self.elements.append(Spacer(1, 6))
+            self.elements.append(Paragraph(
+                f"{len(flips) - max_rows} further changes omitted.", self.styles['FooterText']))
         self.elements.append(PageBreak())
     
     def _add_disclaimer(self):
@@ -674,244 +1479,50 @@ class HiringAuditReportGenerator:
         remain the responsibility of the organization's leadership.
         """
         
-        self.elements.append(Paragraph(disclaimer, self.styles['FooterText']))
+        self.elements.extend(self._fragment('disclaimer', None, lambda: [
+            Paragraph(disclaimer, self.styles['FooterText'])]))
     
     # ========================================================================
     # HELPER METHODS
     # ========================================================================
     
-    def _calculate_overall_status(self):
-        """Calculate overall audit status based on gate logic"""
-        statuses = list(self.block_statuses.values())
-        
-        # Gate 0: Block 1 RED → Overall RED
-        if self.block_statuses.get('block1') == 'red':
-            return 'red'
-        
-        # Gate 1: Block 2 or 4 RED → Overall RED
-        if self.block_statuses.get('block2') == 'red' or self.block_statuses.get('block4') == 'red':
-            return 'red'
-        
-        # Any execution block RED → Overall RED
-        if any(self.block_statuses.get(f'block{i}') == 'red' for i in [3, 5, 6]):
-            return 'red'
-        
-        # Multiple yellows → Yellow
-        yellow_count = sum(1 for s in statuses if s == 'yellow')
-        if yellow_count >= 2:
-            return 'yellow'
-        
-        # All green or mostly green
-        green_count = sum(1 for s in statuses if s == 'green')
-        if green_count >= 5:
-            return 'green'
-        
-        return 'yellow'
+    def _cover_logo(self):
+        """Client logo (upload bytes or file path in audit_data['logo']) sized for the cover"""
+        source = self.data.get('logo')
+        if not source:
+            return None
+        try:
+            return self.image_cache.get(source, COVER_LOGO_BOX)
+        except (ValueError, OSError):
+            # A broken upload should not cost the client their report
+            self._degrade('cover_page', 'skip_logo')
+            return None
     
-    def _calculate_overall_score(self):
-        """Calculate numerical confidence score"""
-        score_map = {'green': 90, 'yellow': 60, 'red': 30, 'gray': 50}
-        scores = [score_map.get(s, 50) for s in self.block_statuses.values()]
-        
-        if not scores:
-            return 50
-        
-        base_score = sum(scores) / len(scores)
-        
-        # Deductions for contradictions
-        base_score -= len(self.contradictions) * 2
-        
-        # Block 7 modifier
-        if self.block_statuses.get('block7') == 'red':
-            base_score *= 0.8
-        
-        return max(0, min(100, int(base_score)))
+    def _scoring_ruleset(self):
+        """Ruleset snapshot the audit was scored with (its ruleset_version stamp); None if unknown"""
+        if self._ruleset is None:
+            from scoring_engine import ruleset_for
+            try:
+                self._ruleset = ruleset_for(self.data.get('ruleset_version'))
+            except ValueError:
+                self._ruleset = False
+        return self._ruleset or None
     
-    def _generate_key_findings(self):
-        """Generate key findings based on data"""
-        findings = []
-        
-        for block_id, status in self.block_statuses.items():
-            block_names = {
-                'block1': 'Executive Ownership',
-                'block2': 'TA Leadership',
-                'block3': 'Delivery Leadership',
-                'block4': 'Financial Governance',
-                'block5': 'Technical Interviewing',
-                'block6': 'Recruitment Operations',
-                'block7': 'Reporting & AI'
-            }
-            
-            if status == 'red':
-                findings.append(f"Critical failure in {block_names.get(block_id, block_id)} requires immediate attention")
-            elif status == 'yellow':
-                findings.append(f"{block_names.get(block_id, block_id)} shows inconsistent execution with improvement potential")
-            elif status == 'green':
-                findings.append(f"{block_names.get(block_id, block_id)} demonstrates healthy operational maturity")
-        
-        return findings
+    def _status_thresholds(self):
+        """(yellow, green) block-average thresholds of the scoring ruleset; None if unknown"""
+        ruleset = self._scoring_ruleset()
+        if ruleset is None:
+            return None
+        return ruleset.config['YELLOW_THRESHOLD'], ruleset.config['GREEN_THRESHOLD']
+    
+    def _fragment(self, section, key, build):
+        """Cached flowables for a section fragment that depends only on `key`"""
+        return self.fragment_cache.get(section, key, self._styles_key, build)
+    
+    def _drawing(self, section, key, build):
+        """Cached chart flowables keyed on the values they plot"""
+        return self.drawing_cache.get(section, key, self._styles_key, build)
     
-    def _get_priority_risks(self):
-        """Get prioritized list of risks"""
-        risks = []
-        
-        if self.block_statuses.get('block1') in ['red', 'yellow']:
-            risks.append({
-                'name': 'Ownership Gap',
-                'severity': self.block_statuses.get('block1'),
-                'impact': 'No clear accountability for hiring outcomes'
-            })
-        
-        if self.block_statuses.get('block3') in ['red', 'yellow']:
-            risks.append({
-                'name': 'Interview Bottleneck',
-                'severity': self.block_statuses.get('block3'),
-                'impact': 'Delivery capacity constraints slow hiring'
-            })
-        
-        if self.block_statuses.get('block6') in ['red', 'yellow']:
-            risks.append({
-                'name': 'Operational Fragility',
-                'severity': self.block_statuses.get('block6'),
-                'impact': 'Hero-based execution creates key-person risk'
-            })
-        
-        if self.block_statuses.get('block7') == 'red':
-            risks.append({
-                'name': 'Data Blindness',
-                'severity': 'red',
-                'impact': 'Unreliable data undermines all decisions'
-            })
-        
-        # Sort by severity
-        severity_order = {'red': 0, 'yellow': 1, 'green': 2}
-        risks.sort(key=lambda x: severity_order.get(x['severity'], 3))
-        
-        return risks
-    
-    def _get_block_signal(self, block_id):
-        """Get the primary signal for a block"""
-        signals = {
-            'block1': 'Governance clarity',
-            'block2': 'Capacity alignment',
-            'block3': 'Feedback discipline',
-            'block4': 'Budget transparency',
-            'block5': 'Evaluation standards',
-            'block6': 'Process stability',
-            'block7': 'Data reliability'
-        }
-        return signals.get(block_id, 'Assessment pending')
-    
-    def _check_gate_failures(self):
-        """Check for gate failures"""
-        failures = []
-        
-        if self.block_statuses.get('block1') == 'red':
-            failures.append("GATE 0 FAILURE: Executive ownership absent - overall system compromised")
-        
-        if self.block_statuses.get('block2') == 'red':
-            failures.append("GATE 1 FAILURE: TA Leadership ungoverned - execution will fail")
-        
-        if self.block_statuses.get('block4') == 'red':
-            failures.append("GATE 1 FAILURE: Financial governance broken - costs uncontrolled")
-        
-        return failures
-    
-    def _get_block_details(self):
-        """Get detailed information for each block"""
-        details = {
-            'block1': {
-                'name': 'Block 1: Executive Ownership & Governance',
-                'findings': [
-                    'Hiring ownership clarity assessed',
-                    'Planning discipline evaluated',
-                    'Executive visibility reviewed'
-                ],
-                'risks': ['Ownership gap may cause accountability vacuum'] if self.block_statuses.get('block1') != 'green' else []
-            },
-            'block2': {
-                'name': 'Block 2: TA Leadership & Capacity',
-                'findings': [
-                    'TA operating model assessed',
-                    'Capacity planning maturity evaluated',
-                    'SLA discipline reviewed'
-                ],
-                'risks': ['Capacity blindness may cause overload'] if self.block_statuses.get('block2') != 'green' else []
-            },
-            'block3': {
-                'name': 'Block 3: Delivery & Hiring Leadership',
-                'findings': [
-                    'Interview capacity assessed',
-                    'Feedback timeliness evaluated',
-                    'Requirement stability reviewed'
-                ],
-                'risks': ['Interview bottleneck may slow hiring'] if self.block_statuses.get('block3') != 'green' else []
-            },
-            'block4': {
-                'name': 'Block 4: Financial Governance',
-                'findings': [
-                    'TA budget ownership assessed',
-                    'Cost visibility evaluated',
-                    'Budget-plan alignment reviewed'
-                ],
-                'risks': ['Financial opacity may cause cost overruns'] if self.block_statuses.get('block4') != 'green' else []
-            },
-            'block5': {
-                'name': 'Block 5: Technical Interviewing',
-                'findings': [
-                    'Interviewer pool structure assessed',
-                    'Evaluation criteria standardization evaluated',
-                    'Feedback quality reviewed'
-                ],
-                'risks': ['Evaluation inconsistency may cause false negatives'] if self.block_statuses.get('block5') != 'green' else []
-            },
-            'block6': {
-                'name': 'Block 6: Recruitment Operations',
-                'findings': [
-                    'Process documentation assessed',
-                    'ATS discipline evaluated',
-                    'Operational resilience reviewed'
-                ],
-                'risks': ['Key-person dependency creates fragility'] if self.block_statuses.get('block6') != 'green' else []
-            },
-            'block7': {
-                'name': 'Block 7: Reporting, Data & AI',
-                'findings': [
-                    'Reporting maturity assessed',
-                    'Data integrity evaluated',
-                    'AI governance reviewed'
-                ],
-                'risks': ['Data unreliability undermines all metrics'] if self.block_statuses.get('block7') != 'green' else []
-            }
-        }
-        return details
-    
-    def _get_recommendations_by_type(self, rec_type):
-        """Get recommendations filtered by type"""
-        # Default recommendations based on status
-        quick_wins = [
-            {'text': 'Designate interim hiring owner (CEO/COO) for 90 days', 'owner': 'CEO', 'effort': '1 day'},
-            {'text': 'Add hiring status to weekly leadership agenda', 'owner': 'COO/EA', 'effort': '2 hours'},
-            {'text': 'Count active roles per recruiter and set max threshold', 'owner': 'TA Lead', 'effort': '4 hours'},
-            {'text': 'Block 4 interview slots per week for key interviewers', 'owner': 'Delivery', 'effort': '1 day'},
-            {'text': 'Set 24-hour feedback SLA with automated reminders', 'owner': 'TA Ops', 'effort': '2 hours'}
-        ]
-        
-        structural = [
-            {'text': 'Define RACI matrix for hiring decisions', 'owner': 'HR + Business', 'effort': '1 week'},
-            {'text': 'Build capacity model by role complexity', 'owner': 'TA Ops', 'effort': '2 weeks'},
-            {'text': 'Implement SLA dashboard visible to all stakeholders', 'owner': 'TA + IT', 'effort': '2 weeks'},
-            {'text': 'Create standardized evaluation scorecard template', 'owner': 'Engineering', 'effort': '4 hours'},
-            {'text': 'Establish monthly Hiring Governance Forum', 'owner': 'COO', 'effort': '2 weeks'}
-        ]
-        
-        if rec_type == 'quick_win':
-            return quick_wins
-        elif rec_type == 'structural':
-            return structural
-        
-        return []
-
 
 # ============================================================================
 # MAIN EXECUTION
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+Hiring Execution & Talent Efficiency Audit
+Audit Store v1.0
+
+Embedded SQLite storage for audits, responses, scoring results and report
+artifacts. Mirrors the Airtable tables from docs/deployment_guide.md (6.2) so
+lookups and dashboards run against a local file instead of the Airtable API.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, List, Any, Iterable, Optional
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS audits (
+    audit_id         TEXT PRIMARY KEY,
+    company_name     TEXT,
+    company_size     TEXT,
+    company_type     TEXT,
+    audit_tier       TEXT,
+    buyer_email      TEXT,
+    status           TEXT NOT NULL DEFAULT 'pending',
+    blocks_completed TEXT NOT NULL DEFAULT '[]',
+    created_at       TEXT NOT NULL,
+    completed_at     TEXT,
+    report_url       TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_audits_created ON audits (created_at);
+CREATE INDEX IF NOT EXISTS idx_audits_segment ON audits (company_size, company_type);
+
+CREATE TABLE IF NOT EXISTS responses (
+    response_id      TEXT PRIMARY KEY,
+    audit_id         TEXT NOT NULL REFERENCES audits (audit_id),
+    block_id         TEXT,
+    respondent_email TEXT,
+    responses        TEXT NOT NULL,
+    submitted_at     TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_audit ON responses (audit_id, block_id);
+
+CREATE TABLE IF NOT EXISTS results (
+    audit_id         TEXT PRIMARY KEY REFERENCES audits (audit_id),
+    block_statuses   TEXT NOT NULL,
+    block_scores     TEXT NOT NULL,
+    overall_status   TEXT NOT NULL,
+    confidence_score INTEGER NOT NULL,
+    gate_failures    TEXT NOT NULL,
+    contradictions   TEXT NOT NULL,
+    recommendations  TEXT NOT NULL,
+    calculated_at    TEXT NOT NULL,
+    ruleset_version  TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_results_status ON results (overall_status, calculated_at);
+
+CREATE TABLE IF NOT EXISTS report_artifacts (
+    audit_id    TEXT NOT NULL REFERENCES audits (audit_id),
+    level       INTEGER NOT NULL,
+    path        TEXT NOT NULL,
+    size_bytes  INTEGER,
+    sha256      TEXT,
+    created_at  TEXT NOT NULL,
+    PRIMARY KEY (audit_id, level)
+);
+"""
+
+# Statements are module constants so sqlite3's statement cache reuses the
+# prepared form for every execute/executemany call.
+UPSERT_AUDIT = """
+INSERT INTO audits (audit_id, company_name, company_size, company_type, audit_tier,
+                    buyer_email, status, blocks_completed, created_at, completed_at, report_url)
+VALUES (:audit_id, :company_name, :company_size, :company_type, :audit_tier,
+        :buyer_email, :status, :blocks_completed, :created_at, :completed_at, :report_url)
+ON CONFLICT (audit_id) DO UPDATE SET
+    company_name = COALESCE(excluded.company_name, company_name),
+    company_size = COALESCE(excluded.company_size, company_size),
+    company_type = COALESCE(excluded.company_type, company_type),
+    audit_tier = COALESCE(excluded.audit_tier, audit_tier),
+    buyer_email = COALESCE(excluded.buyer_email, buyer_email),
+    status = excluded.status,
+    blocks_completed = excluded.blocks_completed,
+    completed_at = COALESCE(excluded.completed_at, completed_at),
+    report_url = COALESCE(excluded.report_url, report_url)
+"""
+
+UPSERT_RESPONSE = """
+INSERT INTO responses (response_id, audit_id, block_id, respondent_email, responses, submitted_at)
+VALUES (:response_id, :audit_id, :block_id, :respondent_email, :responses, :submitted_at)
+ON CONFLICT (response_id) DO UPDATE SET
+    responses = excluded.responses,
+    submitted_at = excluded.submitted_at
+"""
+
+UPSERT_RESULT = """
+INSERT INTO results (audit_id, block_statuses, block_scores, overall_status, confidence_score,
+                     gate_failures, contradictions, recommendations, calculated_at, ruleset_version)
+VALUES (:audit_id, :block_statuses, :block_scores, :overall_status, :confidence_score,
+        :gate_failures, :contradictions, :recommendations, :calculated_at, :ruleset_version)
+ON CONFLICT (audit_id) DO UPDATE SET
+    block_statuses = excluded.block_statuses,
+    block_scores = excluded.block_scores,
+    overall_status = excluded.overall_status,
+    confidence_score = excluded.confidence_score,
+    gate_failures = excluded.gate_failures,
+    contradictions = excluded.contradictions,
+    recommendations = excluded.recommendations,
+    calculated_at = excluded.calculated_at,
+    ruleset_version = excluded.ruleset_version
+"""
+
+# Scored audits without an audits row yet get a placeholder so the FK holds
+ENSURE_AUDIT = """
+INSERT INTO audits (audit_id, status, created_at, completed_at) VALUES (?, 'completed', ?, ?)
+ON CONFLICT (audit_id) DO UPDATE SET
+    status = 'completed',
+    completed_at = COALESCE(completed_at, excluded.completed_at)
+"""
+
+UPSERT_ARTIFACT = """
+INSERT INTO report_artifacts (audit_id, level, path, size_bytes, sha256, created_at)
+VALUES (:audit_id, :level, :path, :size_bytes, :sha256, :created_at)
+ON CONFLICT (audit_id, level) DO UPDATE SET
+    path = excluded.path,
+    size_bytes = excluded.size_bytes,
+    sha256 = excluded.sha256,
+    created_at = excluded.created_at
+"""
+
+JSON_RESULT_FIELDS = ('block_statuses', 'block_scores', 'gate_failures', 'contradictions', 'recommendations')
+
+
+def _now():
+    return datetime.now().isoformat()
+
+
+def _dumps(value):
+    return json.dumps(value, separators=(',', ':'))
+
+
+class AuditStore:
+    """SQLite-backed store for audit data"""
+
+    def __init__(self, db_path: str):
+        """
+        Args:
+            db_path: path of the SQLite database file (':memory:' for tests)
+        """
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, cached_statements=256)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute('PRAGMA foreign_keys=ON')
+        self._conn.executescript(SCHEMA)
+        columns = {row[1] for row in self._conn.execute('PRAGMA table_info(results)')}
+        if 'ruleset_version' not in columns:
+            # Databases created before versioned rulesets; their results stay unstamped
+            self._conn.execute('ALTER TABLE results ADD COLUMN ruleset_version TEXT')
+
+    @classmethod
+    def from_env(cls, default_path: str = 'hiring_audit.db'):
+        """Open the store named by DATABASE_URL (sqlite:///path), or default_path if unset"""
+        url = os.environ.get('DATABASE_URL', '')
+        if not url:
+            return cls(default_path)
+        if not url.startswith('sqlite:///'):
+            raise ValueError(f"AuditStore only supports sqlite:/// URLs, got '{url.split(':', 1)[0]}'")
+        return cls(url[len('sqlite:///'):])
+
+    # ========================================================================
+    # WRITES
+    # ========================================================================
+
+    def upsert_audits(self, audits: Iterable[Dict[str, Any]]):
+        """Insert or update audit rows (Airtable 'Audits' table fields)"""
+        rows = []
+        for audit in audits:
+            rows.append({
+                'audit_id': audit['audit_id'],
+                'company_name': audit.get('company_name'),
+                'company_size': audit.get('company_size'),
+                'company_type': audit.get('company_type'),
+                'audit_tier': audit.get('audit_tier'),
+                'buyer_email': audit.get('buyer_email'),
+                'status': audit.get('status', 'pending'),
+                'blocks_completed': _dumps(audit.get('blocks_completed', [])),
+                'created_at': audit.get('created_at') or _now(),
+                'completed_at': audit.get('completed_at'),
+                'report_url': audit.get('report_url'),
+            })
+        with self._lock, self._conn:
+            self._conn.executemany(UPSERT_AUDIT, rows)
+
+    def upsert_responses(self, responses: Iterable[Dict[str, Any]]):
+        """Insert or update response rows; response_id defaults to '<audit_id>:<block_id>'"""
+        rows = []
+        for resp in responses:
+            rows.append({
+                'response_id': resp.get('response_id') or f"{resp['audit_id']}:{resp.get('block_id')}",
+                'audit_id': resp['audit_id'],
+                'block_id': resp.get('block_id'),
+                'respondent_email': resp.get('respondent_email'),
+                'responses': _dumps(resp.get('responses', {})),
+                'submitted_at': resp.get('submitted_at') or _now(),
+            })
+        with self._lock, self._conn:
+            self._conn.executemany(UPSERT_RESPONSE, rows)
+
+    def upsert_results(self, results: Iterable[Dict[str, Any]]):
+        """Bulk upsert a batch of scoring results in one transaction"""
+        rows = []
+        now = _now()
+        for result in results:
+            rows.append({
+                'audit_id': result['audit_id'],
+                'block_statuses': _dumps(result.get('block_statuses', {})),
+                'block_scores': _dumps(result.get('block_scores', {})),
+                'overall_status': result['overall_status'],
+                'confidence_score': result.get('confidence_score', 0),
+                'gate_failures': _dumps(result.get('gate_failures', [])),
+                'contradictions': _dumps(result.get('contradictions', [])),
+                'recommendations': _dumps(result.get('selected_recommendations',
+                                                     result.get('recommendations', []))),
+                'calculated_at': result.get('timestamp') or now,
+                'ruleset_version': result.get('ruleset_version'),
+            })
+        with self._lock, self._conn:
+            self._conn.executemany(ENSURE_AUDIT, [(r['audit_id'], now, now) for r in rows])
+            self._conn.executemany(UPSERT_RESULT, rows)
+
+    def record_artifact(self, audit_id: str, level: int, path: str,
+                        size_bytes: int = None, sha256: str = None):
+        """Record a generated report file"""
+        with self._lock, self._conn:
+            self._conn.execute(UPSERT_ARTIFACT, {
+                'audit_id': audit_id, 'level': level, 'path': path,
+                'size_bytes': size_bytes, 'sha256': sha256, 'created_at': _now()
+            })
+
+    # ========================================================================
+    # READS
+    # ========================================================================
+
+    def get_audit(self, audit_id: str) -> Optional[Dict[str, Any]]:
+        row = self._query_one('SELECT * FROM audits WHERE audit_id = ?', (audit_id,))
+        if row:
+            row['blocks_completed'] = json.loads(row['blocks_completed'])
+        return row
+
+    def get_responses(self, audit_id: str) -> List[Dict[str, Any]]:
+        rows = self._query('SELECT * FROM responses WHERE audit_id = ? ORDER BY block_id', (audit_id,))
+        for row in rows:
+            row['responses'] = json.loads(row['responses'])
+        return rows
+
+    def get_result(self, audit_id: str) -> Optional[Dict[str, Any]]:
+        row = self._query_one('SELECT * FROM results WHERE audit_id = ?', (audit_id,))
+        return self._decode_result(row) if row else None
+
+    def get_artifacts(self, audit_id: str) -> List[Dict[str, Any]]:
+        return self._query('SELECT * FROM report_artifacts WHERE audit_id = ? ORDER BY level', (audit_id,))
+
+    def results_by_status(self, overall_status: str, since: str = None,
+                          limit: int = 100) -> List[Dict[str, Any]]:
+        """Results with the given overall status, newest first"""
+        if since:
+            rows = self._query(
+                'SELECT * FROM results WHERE overall_status = ? AND calculated_at >= ? '
+                'ORDER BY calculated_at DESC LIMIT ?',
+                (overall_status, since, limit)
+            )
+        else:
+            rows = self._query(
+                'SELECT * FROM results WHERE overall_status = ? ORDER BY calculated_at DESC LIMIT ?',
+                (overall_status, limit)
+            )
+        return [self._decode_result(r) for r in rows]
+
+    def audits_created_between(self, start: str, end: str) -> List[Dict[str, Any]]:
+        return self._query(
+            'SELECT * FROM audits WHERE created_at >= ? AND created_at < ? ORDER BY created_at',
+            (start, end)
+        )
+
+    def status_counts_by_segment(self, company_size: str = None,
+                                 company_type: str = None) -> Dict[str, int]:
+        """Dashboard query: overall status counts, optionally filtered by Config segment"""
+        sql = ('SELECT r.overall_status, COUNT(*) AS n FROM results r '
+               'JOIN audits a ON a.audit_id = r.audit_id WHERE 1 = 1')
+        params = []
+        if company_size:
+            sql += ' AND a.company_size = ?'
+            params.append(company_size)
+        if company_type:
+            sql += ' AND a.company_type = ?'
+            params.append(company_type)
+        sql += ' GROUP BY r.overall_status'
+        return {row['overall_status']: row['n'] for row in self._query(sql, params)}
+
+    def _decode_result(self, row):
+        for field in JSON_RESULT_FIELDS:
+            row[field] = json.loads(row[field])
+        return row
+
+    def _query(self, sql, params=()):
+        with self._lock:
+            return [dict(r) for r in self._conn.execute(sql, params).fetchall()]
+
+    def _query_one(self, sql, params=()):
+        rows = self._query(sql, params)
+        return rows[0] if rows else None
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
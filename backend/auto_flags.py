@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Hiring Execution & Talent Efficiency Audit
+Auto-Flag Engine v1.0
+
+Compiles the Auto-Flag column of docs/all_blocks_questions_csv.csv into
+closures once, then evaluates every flag for an audit in a single pass over
+a fixed variable context built from the Config answers.
+
+Expression grammar (as used in the CSV):
+    expr   := clause ('|' clause)*        clause := term ('&' term)*
+    term   := NAME | NAME OP NUMBER['%'] | NAME ('=' | '!=') WORD
+    OP     := '=' | '!=' | '<' | '<=' | '>' | '>='
+    label  := expr '→' text               (optional flag label)
+    CV:<ref>                              cross-validation link, not a flag
+
+Variables: value (the question's answer; a "Not relevant" answer (-1)
+only satisfies a flag that tests value=-1 explicitly), size (headcount), volume (hires
+per month), company_type, agency_use (% of hires), demand_high, AI_used,
+GDPR. Banded Config answers map to the band midpoint (open bands to their
+bound).
+"""
+
+import csv
+import operator
+import os
+import re
+from typing import Dict, List, Any, Callable, Optional
+
+
+DEFAULT_QUESTIONS_CSV = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'docs', 'all_blocks_questions_csv.csv')
+
+
+class AutoFlagSyntaxError(ValueError):
+    """Raised when an Auto-Flag expression cannot be compiled"""
+
+
+# ============================================================================
+# VARIABLE CONTEXT
+# ============================================================================
+
+SIZE_BANDS = {
+    '1-50 employees': 25, '51-200 employees': 125, '201-500 employees': 350,
+    '501-1000 employees': 750, '1001-5000 employees': 3000, '5000+ employees': 5000
+}
+VOLUME_BANDS = {
+    '1-5 per month': 3, '6-15 per month': 10, '16-30 per month': 23,
+    '31-50 per month': 40, '50+ per month': 50
+}
+AGENCY_BANDS = {
+    'Never': 0, 'Sometimes (<20% of hires)': 10, 'Often (20-50% of hires)': 35, 'Heavily (>50% of hires)': 50
+}
+COMPANY_TYPES = {
+    'IT Product Company': 'product', 'IT Services / Outsourcing': 'services',
+    'Recruitment Agency / RPO': 'rpo', 'Non-IT Company': 'non_it', 'Mixed / Hybrid': 'mixed'
+}
+
+DEMAND_HIGH_VOLUME = 31
+
+NOT_RELEVANT = -1
+
+VARIABLES = frozenset(['value', 'size', 'volume', 'company_type', 'agency_use',
+                       'demand_high', 'AI_used', 'GDPR'])
+
+
+def build_context(config: Dict[str, Any], responses: Dict[str, Any]) -> Dict[str, Any]:
+    """Audit-level variables shared by every flag; 'value' is set per question"""
+    config = config or {}
+    volume = VOLUME_BANDS.get(config.get('monthly_volume'))
+    ai_answer = responses.get('b7_q5')
+    return {
+        'value': None,
+        'size': SIZE_BANDS.get(config.get('company_size')),
+        'volume': volume,
+        'company_type': COMPANY_TYPES.get(config.get('company_type')),
+        'agency_use': AGENCY_BANDS.get(config.get('agency_usage')),
+        'demand_high': volume is not None and volume >= DEMAND_HIGH_VOLUME,
+        # b7_q5: 0 = no AI in use, -1 = not relevant
+        'AI_used': ai_answer is not None and ai_answer >= 1,
+        # Candidate data crosses borders as soon as hiring is not single-country
+        'GDPR': bool(config.get('gdpr')) or config.get('hiring_geography') not in (None, 'Single country')
+    }
+
+
+# ============================================================================
+# COMPILER
+# ============================================================================
+
+_OPERATORS = {
+    '=': operator.eq, '!=': operator.ne, '<': operator.lt,
+    '<=': operator.le, '>': operator.gt, '>=': operator.ge
+}
+_COMPARISON = re.compile(r'^([A-Za-z_]+)\s*(<=|>=|!=|=|<|>)\s*(-?\d+(?:\.\d+)?%?|[A-Za-z_]+)$')
+_NAME = re.compile(r'^[A-Za-z_]+$')
+_CV_REF = re.compile(r'^B(\d)_Q(\d+)$', re.IGNORECASE)
+_TESTS_NOT_RELEVANT = re.compile(r'\bvalue\s*=\s*-1(?![\d.])')
+
+
+def _check_name(name, expression):
+    if name not in VARIABLES:
+        raise AutoFlagSyntaxError(f"Unknown variable '{name}' in {expression!r}")
+
+
+def _compile_term(term: str, expression: str) -> Callable[[Dict], bool]:
+    if _NAME.match(term):
+        _check_name(term, expression)
+        return lambda ctx: bool(ctx[term])
+
+    match = _COMPARISON.match(term)
+    if not match:
+        raise AutoFlagSyntaxError(f"Cannot parse term {term!r} in {expression!r}")
+    name, op_symbol, literal = match.groups()
+    _check_name(name, expression)
+    op = _OPERATORS[op_symbol]
+
+    if literal[0].isalpha() or literal[0] == '_':
+        if op_symbol not in ('=', '!='):
+            raise AutoFlagSyntaxError(f"Only = and != apply to words in {expression!r}")
+        target = literal.lower()
+    else:
+        target = float(literal.rstrip('%'))
+
+    def test(ctx):
+        current = ctx[name]
+        return current is not None and op(current, target)
+    return test
+
+
+def _all_of(tests):
+    if len(tests) == 1:
+        return tests[0]
+    if len(tests) == 2:
+        first, second = tests
+        return lambda ctx: first(ctx) and second(ctx)
+    return lambda ctx: all(t(ctx) for t in tests)
+
+
+def _any_of(tests):
+    if len(tests) == 1:
+        return tests[0]
+    return lambda ctx: any(t(ctx) for t in tests)
+
+
+def compile_expression(expression: str) -> Callable[[Dict], bool]:
+    """Compile one boolean expression (without label) into a closure over a context dict"""
+    clauses = []
+    for clause in expression.split('|'):
+        terms = [t.strip() for t in clause.split('&')]
+        if not all(terms):
+            raise AutoFlagSyntaxError(f"Empty term in {expression!r}")
+        clauses.append(_all_of([_compile_term(t, expression) for t in terms]))
+    return _any_of(clauses)
+
+
+class CompiledFlag:
+    """One question's Auto-Flag, compiled"""
+
+    __slots__ = ('question', 'expression', 'label', 'test', 'accepts_not_relevant')
+
+    def __init__(self, question: str, expression: str, label: str, test: Callable[[Dict], bool]):
+        self.question = question
+        self.expression = expression
+        self.label = label
+        self.test = test
+        # "Not relevant" answers are skipped unless the flag is about them
+        self.accepts_not_relevant = bool(_TESTS_NOT_RELEVANT.search(expression))
+
+
+# ============================================================================
+# ENGINE
+# ============================================================================
+
+def read_auto_flag_column(csv_path: str = DEFAULT_QUESTIONS_CSV) -> List[Dict[str, str]]:
+    """
+    Read (question, signal, expression) rows from the questions CSV
+
+    Rows are ragged (unused option columns are dropped), so the Auto-Flag is
+    the last cell when it is not a score.
+    """
+    rows = []
+    with open(csv_path, newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        qid_col, signal_col = header.index('Question ID'), header.index('Signal')
+        for row in reader:
+            if len(row) <= signal_col + 1:
+                continue
+            cell = row[-1].strip()
+            if cell and re.search(r'[A-Za-z]', cell):
+                rows.append({'question': row[qid_col], 'signal': row[signal_col], 'expression': cell})
+    return rows
+
+
+def _parse_cv_ref(ref):
+    """'B7_Q2' -> question link, 'B6_backlog' / 'B3' -> block (+ topic) link"""
+    match = _CV_REF.match(ref)
+    if match:
+        return {'target_question': f'b{match.group(1)}_q{match.group(2)}'}
+    match = re.match(r'^B(\d)(?:_(\w+))?$', ref, re.IGNORECASE)
+    if match:
+        return {'target_block': f'block{match.group(1)}', 'topic': match.group(2)}
+    return {'topic': ref}
+
+
+class AutoFlagEngine:
+    """Compiled Auto-Flags and cross-validation links for all questions"""
+
+    def __init__(self, rows: List[Dict[str, str]] = None):
+        self.flags = []
+        self.cv_links = {}
+        for row in (rows if rows is not None else read_auto_flag_column()):
+            self.add(row['question'], row['expression'], row.get('signal'))
+
+    def add(self, question: str, expression: str, signal: Optional[str] = None):
+        if expression.upper().startswith('CV:'):
+            self.cv_links.setdefault(question, []).append(_parse_cv_ref(expression[3:].strip()))
+            return
+
+        condition, _, label = expression.partition('→')
+        condition = condition.strip()
+        label = label.strip() or (f"{signal} flag" if signal else f"{question} flag")
+        self.flags.append(CompiledFlag(question, condition, label, compile_expression(condition)))
+
+    def evaluate(self, responses: Dict[str, Any], config: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+        """Evaluate every flag against one audit in a single pass"""
+        ctx = build_context(config, responses)
+        fired = []
+        for flag in self.flags:
+            value = responses.get(flag.question)
+            if value is None or (value == NOT_RELEVANT and not flag.accepts_not_relevant):
+                continue
+            ctx['value'] = value
+            if flag.test(ctx):
+                fired.append({
+                    'question': flag.question,
+                    'flag': flag.label,
+                    'expression': flag.expression,
+                    'value': value
+                })
+        return fired
+
+
+_default_engine = None
+
+
+def default_engine() -> AutoFlagEngine:
+    """Engine compiled from the bundled questions CSV, built on first use"""
+    global _default_engine
+    if _default_engine is None:
+        _default_engine = AutoFlagEngine()
+    return _default_engine
+
+
+def evaluate_auto_flags(responses: Dict[str, Any], config: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+    return default_engine().evaluate(responses, config)
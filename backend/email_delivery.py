@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+Hiring Execution & Talent Efficiency Audit
+Report Email Delivery v1.0
+
+Asynchronous replacement for the email_sender.py snippet in
+docs/deployment_guide.md (6.5). A report PDF is read and base64-encoded once
+and the encoded JSON fragment is reused for every recipient (buyer plus
+stakeholders). Messages go to the SendGrid v3 API over pooled keep-alive
+connections with a bounded number in flight; 429/5xx responses and
+connections that failed before the request was sent go to a retry queue
+with backoff. A connection lost after the request was sent is final
+(status 'failed'): SendGrid may already have accepted the message, and
+resending could deliver the report twice. Other 4xx responses are final
+(status 'rejected'), and any unexpected error is recorded on its message
+without stopping delivery of the rest.
+
+SendGridStubServer accepts the same requests locally for tests.
+"""
+
+import asyncio
+import base64
+import http.client
+import json
+import os
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Any, Iterable, Optional
+
+from airtable_client import ConnectionPool, RequestNotSentError
+from tracing import NOOP_TRACER, SPAN_KIND_CLIENT
+
+
+SENDGRID_API_URL = 'https://api.sendgrid.com'
+SENDGRID_SEND_PATH = '/v3/mail/send'
+
+# Send outcomes; EmailMessage.status ends as SEND_OK, SEND_REJECTED or SEND_FAILED
+SEND_OK = 'sent'
+SEND_RETRY = 'retry'
+SEND_REJECTED = 'rejected'
+SEND_FAILED = 'failed'
+
+
+# ============================================================================
+# MESSAGES
+# ============================================================================
+
+class ReportAttachment:
+    """A PDF attachment encoded once and shared by every message that carries it"""
+
+    def __init__(self, content: bytes, filename: str, mime_type: str = 'application/pdf'):
+        self.filename = filename
+        self.size = len(content)
+        # Pre-serialized SendGrid attachment object, spliced into each request body
+        self.json_fragment = json.dumps({
+            'content': base64.b64encode(content).decode('ascii'),
+            'filename': filename,
+            'type': mime_type,
+            'disposition': 'attachment'
+        }).encode('utf-8')
+
+    @classmethod
+    def from_file(cls, path: str, filename: str = None):
+        with open(path, 'rb') as f:
+            return cls(f.read(), filename or os.path.basename(path))
+
+
+class EmailMessage:
+    """One outgoing message"""
+
+    def __init__(self, to_email: str, subject: str, html: str,
+                 attachment: Optional[ReportAttachment] = None):
+        self.to_email = to_email
+        self.subject = subject
+        self.html = html
+        self.attachment = attachment
+        self.attempts = 0
+        self.last_error = None
+        self.status = None
+
+    def to_request_body(self, from_email: str) -> bytes:
+        body = json.dumps({
+            'personalizations': [{'to': [{'email': self.to_email}]}],
+            'from': {'email': from_email},
+            'subject': self.subject,
+            'content': [{'type': 'text/html', 'value': self.html}]
+        }).encode('utf-8')
+        if self.attachment is None:
+            return body
+        return body[:-1] + b', "attachments": [' + self.attachment.json_fragment + b']}'
+
+
+def report_messages(pdf_path: str, company_name: str, recipients: Iterable[str],
+                    report_url: str = '') -> List[EmailMessage]:
+    """Build one message per recipient sharing a single encoded attachment"""
+    attachment = ReportAttachment.from_file(pdf_path, f'Hiring_Audit_{company_name}.pdf')
+    subject = f'Your Hiring Audit Report - {company_name}'
+    html = f'''
+        <h2>Your Hiring Audit Report is Ready</h2>
+        <p>Dear {escape(company_name)} team,</p>
+        <p>Your Hiring Execution &amp; Talent Efficiency Audit report has been generated.</p>
+        <p><a href="{escape(report_url)}">Download Report</a></p>
+        <p>If you have questions about your results, please contact us.</p>
+        '''
+    return [EmailMessage(to, subject, html, attachment) for to in dict.fromkeys(recipients)]
+
+
+# ============================================================================
+# SENDER
+# ============================================================================
+
+class AsyncEmailSender:
+    """Concurrent SendGrid sender with bounded in-flight requests and a retry queue"""
+
+    def __init__(self, api_key: str, from_email: str, api_url: str = SENDGRID_API_URL,
+                 max_in_flight: int = 8, max_retries: int = 3, backoff: float = 1.0, tracer=None):
+        """
+        Args:
+            api_key: SendGrid API key (SENDGRID_API_KEY)
+            from_email: sender address (EMAIL_FROM)
+            api_url: API root; point at SendGridStubServer.url for tests
+            max_in_flight: concurrent requests and pooled connections
+            max_retries: retry attempts per message after the first send
+            backoff: base retry delay in seconds
+            tracer: optional tracing.Tracer; one 'email.send' span per attempt
+                    under the caller's current span
+        """
+        self.api_key = api_key
+        self.tracer = tracer or NOOP_TRACER
+        self.from_email = from_email
+        self.max_in_flight = max_in_flight
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.pool = ConnectionPool(api_url, size=max_in_flight)
+        self._executor = ThreadPoolExecutor(max_workers=max_in_flight)
+        self.stats = {'sent': 0, 'retried': 0, 'failed': 0}
+
+    async def send_all(self, messages: Iterable[EmailMessage]) -> Dict[str, List[EmailMessage]]:
+        """
+        Send every message; returns {'sent': [...], 'failed': [...]}
+
+        'failed' holds rejected messages, messages out of retries and
+        messages whose send raised; each keeps its last_error.
+        """
+        pending = asyncio.Queue()
+        retry_tasks = set()
+        outcome = {'sent': [], 'failed': []}
+        for message in messages:
+            pending.put_nowait(message)
+
+        async def schedule_retry(message, delay):
+            await asyncio.sleep(delay)
+            pending.put_nowait(message)
+
+        async def worker():
+            while True:
+                message = await pending.get()
+                try:
+                    try:
+                        result, retry_after = await self._send_once(message)
+                    except Exception as e:
+                        # Record it and keep the worker alive; a dead worker would hang join()
+                        message.last_error = f'{type(e).__name__}: {e}'
+                        result, retry_after = SEND_REJECTED, None
+                    if result == SEND_OK:
+                        message.status = SEND_OK
+                        outcome['sent'].append(message)
+                        self.stats['sent'] += 1
+                    elif result != SEND_RETRY or message.attempts > self.max_retries:
+                        message.status = SEND_REJECTED if result == SEND_REJECTED else SEND_FAILED
+                        outcome['failed'].append(message)
+                        self.stats['failed'] += 1
+                    else:
+                        self.stats['retried'] += 1
+                        delay = retry_after or self.backoff * (2 ** (message.attempts - 1))
+                        task = asyncio.ensure_future(
+                            schedule_retry(message, delay + random.uniform(0, delay / 2)))
+                        retry_tasks.add(task)
+                        task.add_done_callback(retry_tasks.discard)
+                finally:
+                    pending.task_done()
+
+        workers = [asyncio.ensure_future(worker()) for _ in range(self.max_in_flight)]
+        while True:
+            await pending.join()
+            if not retry_tasks:
+                break
+            await asyncio.wait(list(retry_tasks))
+        for w in workers:
+            w.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        return outcome
+
+    async def _send_once(self, message: EmailMessage):
+        """
+        Returns (result, retry_after): result is SEND_OK, SEND_RETRY,
+        SEND_REJECTED or SEND_FAILED; retry_after is the server's delay
+        (0 = use backoff)
+        """
+        message.attempts += 1
+        with self.tracer.start_span('email.send', {'email.attempt': message.attempts},
+                                    kind=SPAN_KIND_CLIENT) as span:
+            result, retry_after = await self._post(message)
+            if result != SEND_OK:
+                span.set_error(message.last_error)
+        return result, retry_after
+
+    async def _post(self, message: EmailMessage):
+        body = message.to_request_body(self.from_email)
+        headers = {
+            'Authorization': f'Bearer {self.api_key}',
+            'Content-Type': 'application/json',
+            'Connection': 'keep-alive'
+        }
+        loop = asyncio.get_running_loop()
+        try:
+            status, resp_headers, data = await loop.run_in_executor(
+                self._executor, self.pool.request, 'POST', SENDGRID_SEND_PATH, body, headers)
+        except RequestNotSentError as e:
+            message.last_error = str(e)
+            return SEND_RETRY, 0
+        except (http.client.HTTPException, OSError) as e:
+            # The request went out; SendGrid may have accepted it, so never resend
+            message.last_error = f'delivery unknown, not resent: {type(e).__name__}: {e}'
+            return SEND_FAILED, None
+
+        if 200 <= status < 300:
+            return SEND_OK, None
+        message.last_error = f'{status}: {data[:200].decode("utf-8", "replace")}'
+        if status == 429 or status >= 500:
+            return SEND_RETRY, float(resp_headers.get('Retry-After') or 0)
+        # Other 4xx responses will not succeed on retry
+        return SEND_REJECTED, None
+
+    async def send_report(self, pdf_path: str, company_name: str, buyer_email: str,
+                          stakeholders: Iterable[str] = (), report_url: str = ''):
+        """Deliver one report to the buyer and stakeholders"""
+        with self.tracer.start_span('email.send_report', {'email.company': company_name}) as span:
+            messages = report_messages(pdf_path, company_name, [buyer_email, *stakeholders], report_url)
+            outcome = await self.send_all(messages)
+            span.set_attributes({'email.sent': len(outcome['sent']), 'email.failed': len(outcome['failed'])})
+            if outcome['failed']:
+                span.set_error(f"{len(outcome['failed'])} of {len(messages)} messages failed")
+        return outcome
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        self.pool.close()
+
+
+# ============================================================================
+# LOCAL STUB SERVER
+# ============================================================================
+
+class SendGridStubServer:
+    """
+    In-memory SendGrid /v3/mail/send stand-in
+
+    Records every accepted message; `fail_first` makes the first N requests
+    return 503 so retry handling can be exercised, messages to any address
+    in `reject` get a 400, and messages to any address in `hang_up` are
+    accepted but the connection is closed before the response.
+    """
+
+    def __init__(self, fail_first: int = 0, reject: Iterable[str] = (), hang_up: Iterable[str] = (),
+                 port: int = 0):
+        self.messages = []
+        self.fail_first = fail_first
+        self.reject = set(reject)
+        self.hang_up = set(hang_up)
+        self.requests = 0
+        self._lock = threading.Lock()
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length', 0))
+                body = json.loads(self.rfile.read(length) or b'{}')
+                to_email = body['personalizations'][0]['to'][0]['email']
+                rejected = to_email in stub.reject
+                with stub._lock:
+                    stub.requests += 1
+                    failing = stub.requests <= stub.fail_first
+                    if not failing and not rejected:
+                        stub.messages.append(body)
+                if not failing and to_email in stub.hang_up:
+                    self.close_connection = True
+                    return
+                status = 503 if failing else 400 if rejected else 202
+                self.send_response(status)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', port), Handler)
+
+    @property
+    def url(self):
+        host, port = self._server.server_address
+        return f'http://{host}:{port}'
+
+    def start(self):
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+"""
+Hiring Execution & Talent Efficiency Audit
+Webhook Ingestion Queue v1.0
+
+Durable local queue for form webhooks, backed by a SQLite journal in WAL mode.
+Webhooks are acknowledged as soon as the row is committed; n8n/Tally retries
+are deduplicated by (audit_id, form_id); the config form and the seven block
+forms of an audit are coalesced into one scoring payload; ready audits are
+handed to the scorer in batches.
+
+Claimed audits hold a lease; if a worker dies, its audits become claimable
+again once the lease expires, so several workers can share one journal.
+drain() renews the leases it still holds while it isolates a failed batch.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Any, Iterable, Callable, Tuple
+
+from tracing import NOOP_TRACER, SPAN_KIND_SERVER
+
+
+# Forms that make up one audit (formId values from docs/audit_forms_spec_complete.json)
+CONFIG_FORM_ID = 'config'
+BLOCK_FORM_IDS = [f'block{i}' for i in range(1, 8)]
+REQUIRED_FORM_IDS = frozenset([CONFIG_FORM_ID] + BLOCK_FORM_IDS)
+
+# Single-form submissions carry every answer at once (see simulate_form_submission)
+COMBINED_FORM_IDS = frozenset(['hiring_audit_v1'])
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS submissions (
+    audit_id    TEXT NOT NULL,
+    form_id     TEXT NOT NULL,
+    received_at REAL NOT NULL,
+    payload     TEXT NOT NULL,
+    PRIMARY KEY (audit_id, form_id)
+);
+CREATE TABLE IF NOT EXISTS audits (
+    audit_id    TEXT PRIMARY KEY,
+    status      TEXT NOT NULL DEFAULT 'collecting',
+    forms       TEXT NOT NULL DEFAULT '',
+    attempts    INTEGER NOT NULL DEFAULT 0,
+    last_error  TEXT,
+    updated_at  REAL NOT NULL,
+    lease_until REAL
+);
+CREATE INDEX IF NOT EXISTS idx_audits_status ON audits (status, updated_at);
+"""
+
+
+class IngestionQueue:
+    """SQLite-backed webhook journal with dedup and per-audit coalescing"""
+
+    def __init__(self, db_path: str, required_forms: Iterable[str] = REQUIRED_FORM_IDS,
+                 max_attempts: int = 3, validator=None, tracer=None, lease_seconds: float = 300.0):
+        """
+        Args:
+            db_path: path of the SQLite journal file
+            required_forms: form ids that must all arrive before an audit is ready
+            max_attempts: failed scoring attempts before an audit is parked as 'failed'
+            lease_seconds: how long a claim holds an audit before another
+                           worker may take it over (the claimer is presumed dead)
+            validator: optional payload_validator.PayloadValidator; in 'reject'
+                       mode invalid webhooks are not journaled, in 'annotate'
+                       mode they are journaled without the bad answers
+            tracer: optional tracing.Tracer; each webhook gets a 'webhook'
+                    span whose traceparent is journaled with the payload
+                    and carried into the coalesced scoring payload
+        """
+        self.db_path = db_path
+        self.validator = validator
+        self.tracer = tracer or NOOP_TRACER
+        self.required_forms = frozenset(required_forms)
+        self.max_attempts = max_attempts
+        self.lease_seconds = lease_seconds
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(SCHEMA)
+        columns = {row[1] for row in self._conn.execute('PRAGMA table_info(audits)')}
+        if 'lease_until' not in columns:
+            # Journals created before claim leases; their in-flight rows count as expired
+            self._conn.execute('ALTER TABLE audits ADD COLUMN lease_until REAL')
+
+    # ========================================================================
+    # WEBHOOK SIDE
+    # ========================================================================
+
+    def enqueue(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Journal one webhook payload and return the acknowledgement"""
+        return self.enqueue_many([payload])[0]
+
+    def enqueue_many(self, payloads: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Journal several payloads in a single transaction"""
+        acks = []
+        now = time.time()
+        with self._lock:
+            cur = self._conn.cursor()
+            cur.execute('BEGIN IMMEDIATE')
+            try:
+                for payload in payloads:
+                    acks.append(self._insert(cur, payload, now))
+                cur.execute('COMMIT')
+            except Exception:
+                cur.execute('ROLLBACK')
+                raise
+        return acks
+
+    def _insert(self, cur, payload, now):
+        audit_id = payload.get('audit_id')
+        form_id = payload.get('form_id')
+        with self.tracer.start_span('webhook', {'audit.id': audit_id, 'form.id': form_id},
+                                    parent=payload.get('traceparent'), kind=SPAN_KIND_SERVER) as span:
+            if span.sampled and 'traceparent' not in payload:
+                payload = dict(payload, traceparent=span.traceparent)
+            ack = self._journal(cur, payload, audit_id, form_id, now)
+            span.set_attribute('webhook.status', ack['status'])
+        return ack
+
+    def _journal(self, cur, payload, audit_id, form_id, now):
+        if not audit_id or not form_id:
+            return {'status': 'rejected', 'audit_id': audit_id, 'form_id': form_id,
+                    'error': 'audit_id and form_id are required'}
+        if self.validator is not None:
+            issues = self.validator.validate(payload)
+            if issues and self.validator.mode == 'reject':
+                return {'status': 'rejected', 'audit_id': audit_id, 'form_id': form_id,
+                        'error': 'invalid answers', 'issues': issues}
+            if issues:
+                payload = self.validator.annotate(payload, issues)
+
+        cur.execute(
+            'INSERT OR IGNORE INTO submissions (audit_id, form_id, received_at, payload) VALUES (?, ?, ?, ?)',
+            (audit_id, form_id, now, json.dumps(payload, separators=(',', ':')))
+        )
+        if cur.rowcount == 0:
+            return {'status': 'duplicate', 'audit_id': audit_id, 'form_id': form_id}
+
+        row = cur.execute('SELECT forms, status FROM audits WHERE audit_id = ?', (audit_id,)).fetchone()
+        forms = set(row[0].split(',')) - {''} if row else set()
+        forms.add(form_id)
+
+        status = row[1] if row else 'collecting'
+        if status == 'collecting' and (forms >= self.required_forms or forms & COMBINED_FORM_IDS):
+            status = 'ready'
+
+        cur.execute(
+            'INSERT INTO audits (audit_id, status, forms, updated_at) VALUES (?, ?, ?, ?) '
+            'ON CONFLICT(audit_id) DO UPDATE SET status = excluded.status, forms = excluded.forms, '
+            'updated_at = excluded.updated_at',
+            (audit_id, status, ','.join(sorted(forms)), now)
+        )
+        return {'status': 'accepted', 'audit_id': audit_id, 'form_id': form_id, 'audit_status': status}
+
+    # ========================================================================
+    # SCORER SIDE
+    # ========================================================================
+
+    def claim_batch(self, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        Lease up to `limit` audits and return their coalesced payloads
+
+        Claims ready audits and audits whose previous claim's lease expired.
+        """
+        return self._claim(limit)[1]
+
+    def _claim(self, limit: int) -> Tuple[float, List[Dict[str, Any]]]:
+        """(lease_until, payloads); the lease value identifies this claim when renewing it"""
+        now = time.time()
+        lease_until = now + self.lease_seconds
+        with self._lock:
+            cur = self._conn.cursor()
+            cur.execute('BEGIN IMMEDIATE')
+            try:
+                self._expire_leases(cur, now)
+                audit_ids = [r[0] for r in cur.execute(
+                    "SELECT audit_id FROM audits WHERE status = 'ready' ORDER BY updated_at LIMIT ?",
+                    (limit,)
+                )]
+                if not audit_ids:
+                    cur.execute('COMMIT')
+                    return lease_until, []
+                placeholders = ','.join('?' * len(audit_ids))
+                cur.execute(
+                    f"UPDATE audits SET status = 'processing', attempts = attempts + 1, updated_at = ?, "
+                    f"lease_until = ? WHERE audit_id IN ({placeholders})",
+                    [now, lease_until] + audit_ids
+                )
+                rows = cur.execute(
+                    f'SELECT audit_id, payload FROM submissions WHERE audit_id IN ({placeholders}) '
+                    f'ORDER BY received_at',
+                    audit_ids
+                ).fetchall()
+                cur.execute('COMMIT')
+            except Exception:
+                cur.execute('ROLLBACK')
+                raise
+
+        grouped = {audit_id: [] for audit_id in audit_ids}
+        for audit_id, payload in rows:
+            grouped[audit_id].append(json.loads(payload))
+        return lease_until, [coalesce_submissions(audit_id, subs) for audit_id, subs in grouped.items()]
+
+    def _renew_leases(self, leases: Dict[str, float]) -> Dict[str, float]:
+        """
+        Extend claims this worker still holds
+
+        Args:
+            leases: {audit_id: lease_until handed out with the claim}
+
+        Returns:
+            {audit_id: new lease_until} for the claims renewed; an audit whose
+            lease expired and was requeued or claimed again is left out
+        """
+        now = time.time()
+        lease_until = now + self.lease_seconds
+        renewed = {}
+        with self._lock:
+            cur = self._conn.cursor()
+            cur.execute('BEGIN IMMEDIATE')
+            try:
+                for audit_id, held in leases.items():
+                    cur.execute(
+                        "UPDATE audits SET lease_until = ?, updated_at = ? "
+                        "WHERE audit_id = ? AND status = 'processing' AND lease_until = ?",
+                        (lease_until, now, audit_id, held)
+                    )
+                    if cur.rowcount:
+                        renewed[audit_id] = lease_until
+                cur.execute('COMMIT')
+            except Exception:
+                cur.execute('ROLLBACK')
+                raise
+        return renewed
+
+    def mark_done(self, audit_ids: Iterable[str]):
+        self._set_status(audit_ids, 'done')
+
+    def mark_failed(self, audit_ids: Iterable[str], error: str = None):
+        """Return audits to the ready queue, or park them once max_attempts is reached"""
+        audit_ids = list(audit_ids)
+        if not audit_ids:
+            return
+        placeholders = ','.join('?' * len(audit_ids))
+        with self._lock:
+            self._conn.execute(
+                f"UPDATE audits SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'ready' END, "
+                f"last_error = ?, updated_at = ?, lease_until = NULL WHERE audit_id IN ({placeholders})",
+                [self.max_attempts, error, time.time()] + audit_ids
+            )
+
+    def _set_status(self, audit_ids, status):
+        audit_ids = list(audit_ids)
+        if not audit_ids:
+            return
+        placeholders = ','.join('?' * len(audit_ids))
+        with self._lock:
+            self._conn.execute(
+                f'UPDATE audits SET status = ?, updated_at = ?, lease_until = NULL '
+                f'WHERE audit_id IN ({placeholders})',
+                [status, time.time()] + audit_ids
+            )
+
+    def _expire_leases(self, cur, now) -> int:
+        """Requeue (or park, once out of attempts) audits whose claimer stopped renewing"""
+        cur.execute(
+            "UPDATE audits SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'ready' END, "
+            "last_error = 'claim lease expired', lease_until = NULL, updated_at = ? "
+            "WHERE status = 'processing' AND (lease_until IS NULL OR lease_until < ?)",
+            (self.max_attempts, now, now)
+        )
+        return cur.rowcount
+
+    def recover(self) -> int:
+        """Requeue audits left in 'processing' by a worker whose lease has expired"""
+        with self._lock:
+            return self._expire_leases(self._conn.cursor(), time.time())
+
+    def drain(self, score_batch: Callable[[List[Dict]], List[Dict]], batch_size: int = 100) -> List[Dict]:
+        """
+        Feed every ready audit to the scorer in batches
+
+        If a batch raises, its audits are scored one at a time so only the
+        ones that fail use up an attempt. The leases of the audits still
+        waiting are renewed before each one, so a slow isolation pass is not
+        taken over by another worker; an audit whose lease was lost anyway
+        is left to its new claimer.
+
+        Args:
+            score_batch: callable taking a list of payloads, e.g. ScoringPipeline.run_batch
+            batch_size: audits claimed per call
+
+        Returns:
+            results of the audits scored successfully
+        """
+        results = []
+        while True:
+            lease_until, batch = self._claim(batch_size)
+            if not batch:
+                return results
+            try:
+                results.extend(score_batch(batch))
+                self.mark_done([p['audit_id'] for p in batch])
+                continue
+            except Exception:
+                pass
+            leases = {p['audit_id']: lease_until for p in batch}
+            for payload in batch:
+                audit_id = payload['audit_id']
+                leases = self._renew_leases(leases)
+                if leases.pop(audit_id, None) is None:
+                    continue
+                try:
+                    results.extend(score_batch([payload]))
+                    self.mark_done([audit_id])
+                except Exception as e:
+                    self.mark_failed([audit_id], f'{type(e).__name__}: {e}')
+
+    def stats(self) -> Dict[str, int]:
+        """Count audits per status"""
+        with self._lock:
+            rows = self._conn.execute('SELECT status, COUNT(*) FROM audits GROUP BY status').fetchall()
+        return dict(rows)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def coalesce_submissions(audit_id: str, submissions: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Merge the config form and block forms of one audit into a scoring payload
+
+    Respondent records from several forms are concatenated; records sharing
+    a respondent_id are merged into one respondent.
+    """
+    metadata = {}
+    config = {}
+    responses = {}
+    respondents = []
+    by_respondent = {}
+    issues = []
+    traceparent = None
+    for sub in submissions:
+        # The first webhook of the audit starts its trace
+        traceparent = traceparent or sub.get('traceparent')
+        metadata.update(sub.get('metadata') or {})
+        issues.extend((sub.get('validation') or {}).get('issues', []))
+        if sub.get('form_id') == CONFIG_FORM_ID:
+            config.update(sub.get('responses') or {})
+        else:
+            responses.update(sub.get('responses') or {})
+        for record in sub.get('respondents') or []:
+            respondent_id = record.get('respondent_id')
+            merged = by_respondent.get(respondent_id) if respondent_id is not None else None
+            if merged is None:
+                merged = dict(record, responses=dict(record.get('responses') or {}))
+                respondents.append(merged)
+                if respondent_id is not None:
+                    by_respondent[respondent_id] = merged
+            else:
+                merged['responses'].update(record.get('responses') or {})
+                if not merged.get('role'):
+                    merged['role'] = record.get('role')
+
+    payload = {
+        'audit_id': audit_id,
+        'form_ids': [sub.get('form_id') for sub in submissions],
+        'metadata': metadata,
+        'config': config,
+        'responses': responses
+    }
+    if respondents:
+        payload['respondents'] = respondents
+    if issues:
+        payload['validation'] = {'valid': False, 'issues': issues}
+    if traceparent:
+        payload['traceparent'] = traceparent
+    return payload
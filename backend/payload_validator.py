@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Hiring Execution & Talent Efficiency Audit
+Payload Validator v1.0
+
+Checks webhook and scoring payloads against the question bank before they
+reach the scorer, so malformed answers cannot silently turn blocks gray.
+The form spec (docs/audit_forms_spec_complete.json) and the question CSV
+(Required column, option scores) are compiled once into per-question
+allowed-value sets and per-form required sets; a check is then only set
+lookups over the answers. The spec is the authority for every question it
+defines (ids, required flags, option labels); the CSV fills in the rest,
+with its older question ids mapped onto the spec's.
+
+Issue codes:
+    unknown_question  id not in any form
+    wrong_form        id belongs to another form than the submission
+    invalid_value     score / option not allowed for the question
+    missing_required  required question not answered
+"""
+
+import csv
+import json
+import os
+from typing import Dict, List, Any, Iterable
+
+
+DOCS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'docs')
+DEFAULT_SPEC_PATH = os.path.join(DOCS_DIR, 'audit_forms_spec_complete.json')
+DEFAULT_QUESTIONS_CSV = os.path.join(DOCS_DIR, 'all_blocks_questions_csv.csv')
+
+CONFIG_FORM_ID = 'config'
+BLOCK_FORM_IDS = tuple(f'block{i}' for i in range(1, 8))
+
+MODES = ('reject', 'annotate')
+
+# CSV question ids that the form spec renamed
+CSV_QUESTION_IDS = {'ta_function': 'ta_function_exists'}
+
+
+class PayloadValidationError(ValueError):
+    """Raised in reject mode; carries the list of issues"""
+
+    def __init__(self, issues: List[Dict[str, Any]]):
+        self.issues = issues
+        summary = ', '.join(f"{i['code']}:{i['question']}" for i in issues[:5])
+        more = f" (+{len(issues) - 5} more)" if len(issues) > 5 else ''
+        super().__init__(f"Invalid payload: {summary}{more}")
+
+
+class _TextValue:
+    """Allowed-value 'set' for free-text and email questions"""
+
+    __slots__ = ('email',)
+
+    def __init__(self, email=False):
+        self.email = email
+
+    def __contains__(self, value):
+        return isinstance(value, str) and bool(value.strip()) and (not self.email or '@' in value)
+
+
+# ============================================================================
+# SPEC LOADING
+# ============================================================================
+
+def _form_of(question_id, block):
+    if question_id.startswith('b') and '_q' in question_id:
+        return f"block{question_id[1:question_id.index('_')]}"
+    return CONFIG_FORM_ID if block == 'Config' else block
+
+
+def read_question_csv(csv_path: str = DEFAULT_QUESTIONS_CSV) -> List[Dict[str, Any]]:
+    """
+    Question rules from the CSV: form, required flag and allowed values
+
+    Option/score columns are ragged, so pairs are read until the first empty
+    option; Config options have '-' scores and are matched by label. Ids
+    are reported under their form spec names (CSV_QUESTION_IDS).
+    """
+    rules = []
+    with open(csv_path, newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        qid_col, block_col = header.index('Question ID'), header.index('Block')
+        required_col, first_option = header.index('Required'), header.index('Option 1')
+        for row in reader:
+            values = []
+            for i in range(first_option, len(row) - 1, 2):
+                option, score = row[i].strip(), row[i + 1].strip()
+                if not option:
+                    break
+                values.append(option if score in ('', '-') else int(score))
+            rules.append({
+                'question': CSV_QUESTION_IDS.get(row[qid_col], row[qid_col]),
+                'form': _form_of(row[qid_col], row[block_col]),
+                'required': row[required_col].strip().upper() == 'TRUE',
+                'values': values
+            })
+    return rules
+
+
+def read_form_spec(spec_path: str = DEFAULT_SPEC_PATH) -> List[Dict[str, Any]]:
+    """Question rules from the form spec (forms with flat questions or sections)"""
+    with open(spec_path, encoding='utf-8') as f:
+        spec = json.load(f)
+    rules = []
+    for form in spec['forms'].values():
+        questions = form.get('questions') or [q for s in form.get('sections', []) for q in s['questions']]
+        for q in questions:
+            if q['type'] in ('text', 'email'):
+                values = _TextValue(email=q['type'] == 'email')
+            else:
+                values = [o if isinstance(o, str) else o.get('value', o.get('label'))
+                          for o in q.get('options', [])]
+            rules.append({'question': q['id'], 'form': form['formId'],
+                          'required': bool(q.get('required')), 'values': values})
+    return rules
+
+
+# ============================================================================
+# VALIDATOR
+# ============================================================================
+
+class PayloadValidator:
+    """Compiled question bank; validates, rejects or annotates payloads"""
+
+    def __init__(self, rules: Iterable[Dict[str, Any]], mode: str = 'reject'):
+        """
+        Args:
+            rules: question rules (question, form, required, values); a later
+                   rule for the same question replaces the earlier one
+            mode: 'reject' raises PayloadValidationError, 'annotate' strips
+                  invalid answers and attaches a 'validation' summary
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown validation mode: {mode}")
+        self.mode = mode
+
+        merged = {rule['question']: rule for rule in rules}
+
+        self.allowed = {q: v['values'] if isinstance(v['values'], _TextValue) else frozenset(v['values'])
+                        for q, v in merged.items()}
+        self.form_of = {q: v['form'] for q, v in merged.items()}
+        required = {}
+        for q, v in merged.items():
+            if v['required']:
+                required.setdefault(v['form'], set()).add(q)
+        self.required = {form: frozenset(qs) for form, qs in required.items()}
+        # Scoring payloads (coalesced or single-form 'hiring_audit_v1') need every block
+        self.required_all_blocks = frozenset().union(*(self.required.get(b, ()) for b in BLOCK_FORM_IDS))
+
+    @classmethod
+    def from_spec(cls, spec_path: str = DEFAULT_SPEC_PATH, csv_path: str = DEFAULT_QUESTIONS_CSV,
+                  mode: str = 'reject') -> 'PayloadValidator':
+        """CSV covers every block; the form spec is authoritative for the questions it defines"""
+        return cls(read_question_csv(csv_path) + read_form_spec(spec_path), mode=mode)
+
+    # -- checks -------------------------------------------------------------
+
+    def _check_answers(self, answers, form_id, issues):
+        allowed, form_of = self.allowed, self.form_of
+        for question_id, value in answers.items():
+            values = allowed.get(question_id)
+            if values is None:
+                issues.append({'code': 'unknown_question', 'question': question_id, 'value': value})
+                continue
+            if form_id is not None and form_of[question_id] != form_id:
+                issues.append({'code': 'wrong_form', 'question': question_id, 'value': value})
+                continue
+            try:
+                ok = value in values
+            except TypeError:
+                ok = False
+            if not ok:
+                issues.append({'code': 'invalid_value', 'question': question_id, 'value': value})
+
+    def validate(self, payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Issues for one payload (empty list when valid)
+
+        A payload with a config/block form_id is checked against that form
+        only; any other payload is a scoring payload and must answer every
+        block. Respondent lists are checked per respondent; one-shot
+        iterators are left for the scorer to consume.
+        """
+        issues = []
+        form_id = payload.get('form_id')
+        if form_id != CONFIG_FORM_ID and form_id not in BLOCK_FORM_IDS:
+            form_id = None
+        responses = payload.get('responses') or {}
+        self._check_answers(responses, form_id, issues)
+
+        answered = responses.keys()
+        respondents = payload.get('respondents')
+        if isinstance(respondents, (list, tuple)):
+            answered = set(answered)
+            for respondent in respondents:
+                answers = respondent.get('responses') or {}
+                self._check_answers(answers, form_id, issues)
+                answered.update(answers)
+        elif respondents is not None:
+            return issues
+
+        config = payload.get('config')
+        if config:
+            self._check_answers(config, CONFIG_FORM_ID, issues)
+
+        required = self.required.get(form_id, frozenset()) if form_id else self.required_all_blocks
+        for question_id in sorted(required - answered):
+            issues.append({'code': 'missing_required', 'question': question_id, 'value': None})
+        return issues
+
+    def is_valid(self, payload: Dict[str, Any]) -> bool:
+        return not self.validate(payload)
+
+    def _answer_ok(self, question_id, value, form_id):
+        values = self.allowed.get(question_id)
+        if values is None or (form_id is not None and self.form_of[question_id] != form_id):
+            return False
+        try:
+            return value in values
+        except TypeError:
+            return False
+
+    def annotate(self, payload: Dict[str, Any], issues: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Copy of the payload without rejected answers, plus a 'validation' summary"""
+        form_id = payload.get('form_id')
+        if form_id != CONFIG_FORM_ID and form_id not in BLOCK_FORM_IDS:
+            form_id = None
+
+        def keep(answers, form):
+            return {q: v for q, v in answers.items() if self._answer_ok(q, v, form)}
+
+        annotated = dict(payload)
+        if payload.get('responses'):
+            annotated['responses'] = keep(payload['responses'], form_id)
+        if payload.get('config'):
+            annotated['config'] = keep(payload['config'], CONFIG_FORM_ID)
+        if isinstance(payload.get('respondents'), (list, tuple)):
+            annotated['respondents'] = [dict(r, responses=keep(r.get('responses') or {}, form_id))
+                                        for r in payload['respondents']]
+        annotated['validation'] = {'valid': False, 'issues': issues}
+        return annotated
+
+    def check(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate and apply the mode: return the payload, raise, or annotate"""
+        issues = self.validate(payload)
+        if not issues:
+            return payload
+        if self.mode == 'reject':
+            raise PayloadValidationError(issues)
+        return self.annotate(payload, issues)
+
+
+_default_validator = None
+
+
+def default_validator() -> PayloadValidator:
+    """Validator compiled from the bundled spec and CSV, built on first use"""
+    global _default_validator
+    if _default_validator is None:
+        _default_validator = PayloadValidator.from_spec()
+    return _default_validator
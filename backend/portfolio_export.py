@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Hiring Execution & Talent Efficiency Audit
+Portfolio Export v1.0
+
+Delivers the reports of many client companies (e.g. for an RPO / agency
+partner) in one piece, either as a ZIP of per-company PDFs or as a single
+merged PDF with a table of contents and bookmarks.
+
+A single HiringAuditReportGenerator is reset for each audit, so styles and
+the fragment cache are shared, and sections are streamed into the builder
+one at a time. In the merged PDF the static header/footer chrome is one
+Form XObject drawn on every page, and each font is embedded once.
+The table of contents pages are reserved up front and filled in as forms
+once every report's start page is known, so the portfolio is laid out in a
+single pass.
+
+reportlab keeps every page of a document in memory until it is saved, so a
+merged PDF is capped at MAX_MERGED_REPORTS audits; larger portfolios should
+be exported as a ZIP (or split into several merged exports).
+"""
+
+import json
+import math
+import re
+import zipfile
+from typing import Dict, List, Any, Sequence
+
+from reportlab.lib.pagesizes import A4
+from reportlab.pdfgen import canvas
+from reportlab.platypus import Spacer, PageBreak
+from reportlab.platypus.doctemplate import (
+    BaseDocTemplate, PageTemplate, NextPageTemplate, ActionFlowable
+)
+from reportlab.platypus.flowables import Flowable
+from reportlab.platypus.frames import Frame
+
+from audit_report_generator import (
+    HiringAuditReportGenerator, AuditColors, SectionStream
+)
+from report_fonts import HELVETICA
+
+
+TOC_ROWS_PER_PAGE = 30
+TOC_ROW_HEIGHT = 20
+# Merged exports are built in memory; peak use is about 11 MB per 100 Level 3 reports
+MAX_MERGED_REPORTS = 200
+
+CHROME_FORM = 'portfolio_chrome'
+STATUS_LABELS = {'green': 'HEALTHY', 'yellow': 'AT RISK', 'red': 'CRITICAL', 'gray': 'PENDING'}
+STATUS_COLORS = {'green': AuditColors.GREEN, 'yellow': AuditColors.YELLOW,
+                 'red': AuditColors.RED, 'gray': AuditColors.GRAY}
+
+
+def report_filename(index: int, company_name: str) -> str:
+    slug = re.sub(r'[^A-Za-z0-9]+', '_', company_name or 'company').strip('_') or 'company'
+    return f"{index + 1:03d}_Hiring_Audit_{slug}.pdf"
+
+
+# ============================================================================
+# ZIP EXPORT
+# ============================================================================
+
+def export_zip(audits, out, level: int = 1, fonts=None) -> List[Dict[str, Any]]:
+    """
+    Write one PDF per audit into a ZIP archive
+
+    Each report is rendered straight into its archive member, so only one
+    report is in memory at a time; `out` may be a path or a non-seekable
+    stream (e.g. an HTTP response). An index.json manifest is appended.
+    `fonts` is a report_fonts.FontFamily (defaults to built-in Helvetica).
+
+    Returns:
+        manifest entries (file, company_name, overall_status)
+    """
+    manifest = []
+    generator = None
+    with zipfile.ZipFile(out, 'w', compression=zipfile.ZIP_STORED) as archive:
+        for index, audit in enumerate(audits):
+            if generator is None:
+                generator = HiringAuditReportGenerator(audit, None, level=level, fonts=fonts)
+            else:
+                generator.reset(audit, level=level)
+
+            name = report_filename(index, generator.company_name)
+            # PDF streams are already compressed; deflating them again only costs CPU
+            with archive.open(name, 'w', force_zip64=True) as member:
+                generator.output_path = member
+                generator.generate()
+            manifest.append({
+                'file': name,
+                'company_name': generator.company_name,
+                'overall_status': generator.view.overall_status
+            })
+            generator.release()
+
+        archive.writestr('index.json', json.dumps({'level': level, 'reports': manifest}, indent=2))
+    return manifest
+
+
+# ============================================================================
+# MERGED PDF EXPORT
+# ============================================================================
+
+class _SetAudit(ActionFlowable):
+    """Switches the running header to the next audit before its first page break"""
+
+    def __init__(self, entry):
+        ActionFlowable.__init__(self)
+        self.entry = entry
+
+    def apply(self, doc):
+        doc.current_entry = self.entry
+
+
+class _AuditAnchor(Flowable):
+    """Zero-size marker on an audit's first page; the doc records its page"""
+
+    def __init__(self, entry):
+        Flowable.__init__(self)
+        self.entry = entry
+
+    def wrap(self, availWidth, availHeight):
+        return 0, 0
+
+    def draw(self):
+        pass
+
+
+class PortfolioDocTemplate(BaseDocTemplate):
+    """Single-pass merged portfolio document with a forward-filled table of contents"""
+
+    def __init__(self, filename, audit_count, level, fonts=None, **kw):
+        self.fonts = fonts or HELVETICA
+        if not self.fonts.builtin:
+            kw.setdefault('initialFontName', self.fonts.regular)
+        BaseDocTemplate.__init__(self, filename, pagesize=A4, rightMargin=50, leftMargin=50,
+                                 topMargin=70, bottomMargin=50, **kw)
+        self.level = level
+        self.audit_count = audit_count
+        self.toc_pages = max(1, math.ceil(audit_count / TOC_ROWS_PER_PAGE))
+        self.entries = []
+        self.current_entry = None
+        frame = Frame(self.leftMargin, self.bottomMargin, self.width, self.height, id='normal')
+        self.addPageTemplates([
+            PageTemplate(id='toc', frames=frame, onPage=self._draw_toc_page),
+            PageTemplate(id='report', frames=frame, onPage=self._draw_report_page)
+        ])
+
+    # -- shared page chrome -------------------------------------------------
+
+    def _startBuild(self, filename=None, canvasmaker=canvas.Canvas):
+        BaseDocTemplate._startBuild(self, filename, canvasmaker)
+        canv = self.canv
+        page_width, page_height = self.pagesize
+        canv.beginForm(CHROME_FORM)
+        canv.setFillColor(AuditColors.PRIMARY)
+        canv.rect(0, self.height + self.topMargin + 20, page_width, 40, fill=1, stroke=0)
+        canv.setFillColor(AuditColors.WHITE)
+        canv.setFont(self.fonts.bold, 10)
+        canv.drawString(self.leftMargin, self.height + self.topMargin + 35, "HIRING EXECUTION AUDIT")
+        canv.setStrokeColor(AuditColors.GRAY)
+        canv.line(self.leftMargin, 35, self.width + self.leftMargin, 35)
+        canv.endForm()
+
+    def _draw_chrome(self, canv, header_right, footer_left):
+        canv.saveState()
+        canv.doForm(CHROME_FORM)
+        canv.setFillColor(AuditColors.WHITE)
+        canv.setFont(self.fonts.regular, 9)
+        canv.drawRightString(self.width + self.leftMargin, self.height + self.topMargin + 35, header_right)
+        canv.setFillColor(AuditColors.TEXT_SECONDARY)
+        canv.setFont(self.fonts.regular, 8)
+        canv.drawString(self.leftMargin, 25, footer_left)
+        canv.drawRightString(self.width + self.leftMargin, 25, f"Page {self.page}")
+        canv.restoreState()
+
+    def _draw_report_page(self, canv, doc):
+        entry = self.current_entry
+        self._draw_chrome(canv, entry['company_name'],
+                          f"Level {self.level} Report | {entry['report_date']}")
+
+    def _draw_toc_page(self, canv, doc):
+        self._draw_chrome(canv, 'Portfolio', f"Level {self.level} Portfolio")
+        toc_page = self.page - 1
+        # Content is defined at the end of the build, once start pages are known
+        canv.doForm(f'portfolio_toc_{toc_page}')
+        first = toc_page * TOC_ROWS_PER_PAGE
+        for row in range(TOC_ROWS_PER_PAGE):
+            if first + row >= self.audit_count:
+                break
+            y = self._toc_row_y(row)
+            canv.linkRect('', f'audit_{first + row}',
+                          (self.leftMargin, y - 6, self.leftMargin + self.width, y + TOC_ROW_HEIGHT - 6),
+                          relative=0)
+
+    # -- table of contents --------------------------------------------------
+
+    def _toc_row_y(self, row):
+        return self.bottomMargin + self.height - 60 - row * TOC_ROW_HEIGHT
+
+    def afterFlowable(self, flowable):
+        if isinstance(flowable, _AuditAnchor):
+            entry = flowable.entry
+            entry['page'] = self.page
+            key = f"audit_{entry['index']}"
+            self.canv.bookmarkPage(key)
+            self.canv.addOutlineEntry(entry['company_name'], key, level=0)
+
+    def _endBuild(self):
+        self._doSave = 0
+        BaseDocTemplate._endBuild(self)
+        for toc_page in range(self.toc_pages):
+            self._define_toc_form(toc_page)
+        self.canv.save()
+
+    def _define_toc_form(self, toc_page):
+        canv = self.canv
+        left, right = self.leftMargin, self.leftMargin + self.width
+        canv.beginForm(f'portfolio_toc_{toc_page}')
+        canv.setFillColor(AuditColors.PRIMARY)
+        canv.setFont(self.fonts.bold, 18)
+        title = "Portfolio Contents" if toc_page == 0 else "Portfolio Contents (continued)"
+        canv.drawString(left, self.bottomMargin + self.height - 20, title)
+
+        first = toc_page * TOC_ROWS_PER_PAGE
+        for row, entry in enumerate(self.entries[first:first + TOC_ROWS_PER_PAGE]):
+            y = self._toc_row_y(row)
+            canv.setFillColor(AuditColors.TEXT_PRIMARY)
+            canv.setFont(self.fonts.regular, 10)
+            canv.drawString(left, y, f"{entry['index'] + 1}. {entry['company_name']}")
+            canv.setFillColor(STATUS_COLORS.get(entry['overall_status'], AuditColors.GRAY))
+            canv.setFont(self.fonts.bold, 9)
+            canv.drawString(left + 300, y, STATUS_LABELS.get(entry['overall_status'], 'PENDING'))
+            canv.setFillColor(AuditColors.TEXT_SECONDARY)
+            canv.setFont(self.fonts.regular, 10)
+            canv.drawRightString(right, y, str(entry.get('page', '')))
+            canv.setStrokeColor(AuditColors.BACKGROUND)
+            canv.line(left, y - 6, right, y - 6)
+        canv.endForm()
+
+    def build_portfolio(self, audits: Sequence[Dict[str, Any]], generator=None):
+        """Lay out every audit after the reserved table of contents pages"""
+        generator = generator or HiringAuditReportGenerator({}, None, level=self.level, fonts=self.fonts)
+
+        def story():
+            toc = [Spacer(1, 1), PageBreak()] * self.toc_pages
+            yield toc[:-1] + [NextPageTemplate('report')]
+
+            for index, audit in enumerate(audits):
+                generator.reset(audit, level=self.level)
+                entry = {
+                    'index': index,
+                    'company_name': generator.company_name,
+                    'report_date': generator.report_date,
+                    'overall_status': generator.view.overall_status
+                }
+                self.entries.append(entry)
+                yield [_SetAudit(entry), PageBreak(), _AuditAnchor(entry)]
+                yield from generator.iter_sections()
+            generator.release()
+
+        self.build(SectionStream(story()))
+
+
+def export_merged_pdf(audits: Sequence[Dict[str, Any]], out, level: int = 1,
+                      fonts=None) -> List[Dict[str, Any]]:
+    """
+    Render all audits into one PDF with a table of contents
+
+    The whole document is held in memory until it is written, so at most
+    MAX_MERGED_REPORTS audits are accepted; use export_zip for more.
+
+    Args:
+        audits: sequence of report data dicts (len() is needed to size the TOC)
+        out: path or writable binary stream
+        level: report level for every audit
+        fonts: report_fonts.FontFamily for reports, TOC and chrome (defaults to Helvetica)
+
+    Returns:
+        table of contents entries (index, company_name, overall_status, page)
+
+    Raises:
+        ValueError: more than MAX_MERGED_REPORTS audits
+    """
+    if len(audits) > MAX_MERGED_REPORTS:
+        raise ValueError(f"Merged export is limited to {MAX_MERGED_REPORTS} reports, got {len(audits)}; "
+                         "use export_zip or split the portfolio")
+    doc = PortfolioDocTemplate(out, len(audits), level=level, fonts=fonts,
+                               title='Hiring Audit Portfolio', author='Hiring Execution Audit')
+    doc.build_portfolio(audits)
+    return doc.entries
@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Hiring Execution & Talent Efficiency Audit
+Render Job Scheduler v1.0
+
+Queues report render jobs in front of the PDF generator:
+
+- one priority class per report level (L3 custom > L2 > L1); a class
+  whose oldest job has waited longer than `max_wait` takes the next
+  dispatch ahead of higher classes, so L1 buyers are never starved by
+  higher levels. When several classes are overdue (the top one
+  included) they take turns, oldest job first, so an overdue backlog in
+  one class cannot starve another. Aging only moves work across classes:
+  which job of the class runs is still decided by its fair queue
+- within a class, customers are served by start-time fair queuing on
+  estimated render cost, so one agency submitting a large batch gets the
+  same share as a single buyer, backlog or not
+- a customer's own jobs, and customers with equal share, go shortest job
+  first by a cost estimate from level, block count and contradictions
+
+Workers reuse one HiringAuditReportGenerator each and pass the time left
+of the render SLA as generate() deadline. Everything runs in-process;
+next_job() can also be driven by hand for deterministic tests.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from typing import Callable, Dict, Any, Optional
+
+
+# Lower value = served first
+LEVEL_PRIORITY = {3: 0, 2: 1, 1: 2}
+
+# Render cost model (ms), fitted to single-worker renders of the test scenarios
+LEVEL_BASE_COST_MS = {1: 25.0, 2: 40.0, 3: 60.0}
+BLOCK_COST_MS = {1: 1.0, 2: 2.5, 3: 3.0}
+CONTRADICTION_COST_MS = 1.5
+SENSITIVITY_COST_MS = 15.0
+
+
+def estimate_cost(audit_data: Dict[str, Any], level: int) -> float:
+    """Estimated render time in ms for one report"""
+    blocks = sum(1 for s in (audit_data.get('block_statuses') or {}).values() if s != 'gray') or 7
+    cost = LEVEL_BASE_COST_MS.get(level, LEVEL_BASE_COST_MS[3]) + blocks * BLOCK_COST_MS.get(level, 3.0)
+    cost += len(audit_data.get('contradictions') or []) * CONTRADICTION_COST_MS
+    if level >= 3 and audit_data.get('responses') and audit_data.get('sensitivity') is None:
+        cost += SENSITIVITY_COST_MS
+    return cost
+
+
+class RenderJob:
+    """One queued report render"""
+
+    __slots__ = ('job_id', 'customer_id', 'level', 'audit_data', 'output', 'cost_ms', 'seq',
+                 'submitted_at', 'started_at', 'finished_at', 'result', 'error')
+
+    def __init__(self, job_id, customer_id, level, audit_data, output, cost_ms, seq, submitted_at):
+        self.job_id = job_id
+        self.customer_id = customer_id
+        self.level = level
+        self.audit_data = audit_data
+        self.output = output
+        self.cost_ms = cost_ms
+        self.seq = seq
+        self.submitted_at = submitted_at
+        self.started_at = None
+        self.finished_at = None
+        self.result = None
+        self.error = None
+
+    @property
+    def wait_s(self):
+        return None if self.started_at is None else self.started_at - self.submitted_at
+
+
+class _PriorityClass:
+    """Fair-queued customers of one report level"""
+
+    def __init__(self):
+        self.queues = {}          # customer -> heap of (cost, seq, job)
+        self.vtime = {}           # customer -> virtual finish time
+        self.clock = 0.0          # virtual time of the last dispatched job
+        self.by_age = []          # heap of (submitted_at, seq, job), lazily pruned
+        self.size = 0
+
+    def push(self, job):
+        queue = self.queues.get(job.customer_id)
+        if queue is None:
+            queue = self.queues[job.customer_id] = []
+            # An idle customer re-enters at the current virtual time, without banked credit
+            self.vtime[job.customer_id] = max(self.vtime.get(job.customer_id, 0.0), self.clock)
+        heapq.heappush(queue, (job.cost_ms, job.seq, job))
+        heapq.heappush(self.by_age, (job.submitted_at, job.seq, job))
+        self.size += 1
+
+    def oldest(self):
+        while self.by_age and self.by_age[0][2].started_at is not None:
+            heapq.heappop(self.by_age)
+        return self.by_age[0][2] if self.by_age else None
+
+    def pop_fair(self):
+        customer = min(self.queues, key=lambda c: (self.vtime[c], self.queues[c][0][0], self.queues[c][0][1]))
+        return self._take(customer, heapq.heappop(self.queues[customer])[2])
+
+    def _take(self, customer, job):
+        self.clock = self.vtime[customer]
+        self.vtime[customer] += job.cost_ms
+        if not self.queues[customer]:
+            del self.queues[customer]
+        self.size -= 1
+        return job
+
+
+def _percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+# ============================================================================
+# SCHEDULER
+# ============================================================================
+
+class RenderScheduler:
+    """Priority classes + per-customer fair queuing + SJF for report renders"""
+
+    def __init__(self, max_wait: float = None, sla_seconds: float = None,
+                 clock: Callable[[], float] = time.monotonic, history: int = 10000):
+        """
+        Args:
+            max_wait: seconds after which a queued job's class is served
+                      before higher classes (default: half the render SLA)
+            sla_seconds: end-to-end target per job; workers pass the time
+                         left as generate() deadline (default RENDER_SLA_SECONDS)
+            clock: time source (injectable for tests)
+            history: finished jobs kept for wait/run metrics
+        """
+        from audit_report_generator import RENDER_SLA_SECONDS
+
+        self.sla_seconds = sla_seconds if sla_seconds is not None else RENDER_SLA_SECONDS
+        self.max_wait = max_wait if max_wait is not None else self.sla_seconds / 2
+        self.clock = clock
+        self.history = history
+        self._classes = {level: _PriorityClass() for level in LEVEL_PRIORITY}
+        self._seq = itertools.count()
+        self._turns = itertools.count(1)
+        self._aged_turn = {level: 0 for level in LEVEL_PRIORITY}   # level -> last overdue dispatch
+        self._lock = threading.Lock()
+        self._ready = threading.Condition(self._lock)
+        self._finished = []
+        self._counters = {'submitted': 0, 'started': 0, 'completed': 0, 'failed': 0, 'promoted': 0}
+        self._served_cost = {}
+        self._workers = []
+        self._stopping = False
+
+    def __len__(self):
+        with self._lock:
+            return sum(c.size for c in self._classes.values())
+
+    # -- queueing -----------------------------------------------------------
+
+    def submit(self, customer_id: str, audit_data: Dict[str, Any], level: int = 1,
+               output=None, job_id: str = None) -> RenderJob:
+        """Queue one render; `output` is a path or writable stream for the PDF"""
+        if level not in self._classes:
+            raise ValueError(f"Unknown report level: {level}")
+        with self._lock:
+            seq = next(self._seq)
+            job = RenderJob(job_id or f'job-{seq}', customer_id, level, audit_data, output,
+                            estimate_cost(audit_data, level), seq, self.clock())
+            self._classes[level].push(job)
+            self._counters['submitted'] += 1
+            self._ready.notify()
+        return job
+
+    def next_job(self, block: bool = False, timeout: float = None) -> Optional[RenderJob]:
+        """Dispatch the next job, or None if the queue is empty (or stopping)"""
+        with self._lock:
+            if block:
+                self._ready.wait_for(lambda: self._stopping or any(c.size for c in self._classes.values()),
+                                     timeout)
+            return self._dispatch()
+
+    def _dispatch(self):
+        now = self.clock()
+        waiting = [level for level in sorted(self._classes, key=LEVEL_PRIORITY.get) if self._classes[level].size]
+        if not waiting:
+            return None
+        # Anti-starvation across classes: overdue classes, the top one included,
+        # take turns (oldest job first) ahead of priority; inside the chosen
+        # class, fair queuing still decides
+        level = waiting[0]
+        overdue = [j for j in (self._classes[lvl].oldest() for lvl in waiting)
+                   if now - j.submitted_at >= self.max_wait]
+        if overdue:
+            level = min(overdue, key=lambda j: (self._aged_turn[j.level], j.submitted_at, j.seq)).level
+            self._aged_turn[level] = next(self._turns)
+            if level != waiting[0]:
+                self._counters['promoted'] += 1
+        job = self._classes[level].pop_fair()
+        job.started_at = now
+        self._counters['started'] += 1
+        return job
+
+    def complete(self, job: RenderJob, result: Any = None, error: BaseException = None):
+        """Record a finished job (called by workers, or by hand when driving next_job())"""
+        with self._lock:
+            job.finished_at = self.clock()
+            job.result = result
+            job.error = error
+            job.audit_data = None
+            self._counters['failed' if error else 'completed'] += 1
+            self._served_cost[job.customer_id] = self._served_cost.get(job.customer_id, 0.0) + job.cost_ms
+            self._finished.append(job)
+            if len(self._finished) > self.history:
+                del self._finished[:len(self._finished) - self.history]
+
+    # -- workers ------------------------------------------------------------
+
+    def start(self, workers: int = 2, render: Callable = None, fonts=None):
+        """
+        Start worker threads
+
+        Args:
+            workers: number of render threads
+            render: callable(generator, job, deadline) -> result; defaults to
+                    render_job (one generator per worker, reused across jobs)
+            fonts: report_fonts.FontFamily for the workers' generators, e.g.
+                   report_fonts.default_font_family() (default Helvetica)
+        """
+        render = render or render_job
+        self._stopping = False
+
+        def work():
+            from audit_report_generator import HiringAuditReportGenerator
+
+            generator = HiringAuditReportGenerator({}, None, fonts=fonts)
+            while True:
+                job = self.next_job(block=True)
+                if job is None:
+                    if self._stopping:
+                        return
+                    continue
+                deadline = max(0.0, self.sla_seconds - job.wait_s)
+                try:
+                    self.complete(job, result=render(generator, job, deadline))
+                except Exception as e:
+                    self.complete(job, error=e)
+
+        for _ in range(workers):
+            thread = threading.Thread(target=work, daemon=True)
+            thread.start()
+            self._workers.append(thread)
+
+    def stop(self, drain: bool = True, timeout: float = None):
+        """Stop the workers; with drain=True queued jobs are rendered first"""
+        if drain:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while len(self) and (deadline is None or time.monotonic() < deadline):
+                time.sleep(0.005)
+        with self._lock:
+            self._stopping = True
+            self._ready.notify_all()
+        for thread in self._workers:
+            thread.join(timeout)
+        self._workers = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop(drain=exc_type is None)
+
+    # -- metrics ------------------------------------------------------------
+
+    def metrics(self) -> Dict[str, Any]:
+        """Queue depth, wait/run times per level and fairness across customers"""
+        with self._lock:
+            finished = list(self._finished)
+            queued = {level: c.size for level, c in self._classes.items()}
+            customers_waiting = {level: len(c.queues) for level, c in self._classes.items()}
+            counters = dict(self._counters)
+            served = dict(self._served_cost)
+
+        per_level = {}
+        for level in sorted(queued):
+            jobs = [j for j in finished if j.level == level]
+            waits = [j.wait_s * 1000 for j in jobs]
+            runs = [(j.finished_at - j.started_at) * 1000 for j in jobs]
+            per_level[f'L{level}'] = {
+                'queued': queued[level],
+                'customers_waiting': customers_waiting[level],
+                'finished': len(jobs),
+                'wait_ms_avg': round(sum(waits) / len(waits), 3) if waits else 0.0,
+                'wait_ms_p95': round(_percentile(waits, 95), 3),
+                'wait_ms_max': round(max(waits), 3) if waits else 0.0,
+                'run_ms_avg': round(sum(runs) / len(runs), 3) if runs else 0.0,
+                'estimate_ratio': round(sum(runs) / sum(j.cost_ms for j in jobs), 3) if jobs else None
+            }
+
+        within_sla = sum(1 for j in finished if j.finished_at - j.submitted_at <= self.sla_seconds)
+        return {
+            **counters,
+            'queued': sum(queued.values()),
+            'levels': per_level,
+            'served_cost_ms': {c: round(v, 3) for c, v in served.items()},
+            'sla_met_rate': round(within_sla / len(finished), 4) if finished else None
+        }
+
+
+def render_job(generator, job: RenderJob, deadline: float) -> Dict[str, Any]:
+    """Default worker render: reuse the worker's generator, honour the SLA deadline"""
+    generator.reset(job.audit_data, job.output, level=job.level)
+    try:
+        generator.generate(deadline=deadline)
+        return generator.render_stats
+    finally:
+        generator.release()
@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+"""
+Hiring Execution & Talent Efficiency Audit
+Report Fonts v1.0
+
+Unicode TrueType fonts for the PDF reports. The built-in Helvetica only
+covers WinAnsi, so the report symbols (⚠ ✓ → ● ○) come out as blanks; a
+TTF family such as DejaVu Sans covers them.
+
+Fonts are registered with reportlab once per process. The parsed font
+(tables, cmap, metrics) is pickled to a cache directory keyed by file path,
+size and mtime, so a worker start loads it instead of parsing the TTF
+again. ReportLab embeds TTFs as per-document subsets; the fonts here skip
+the ASCII block reportlab reserves in every subset by default, so a
+subset holds only the glyphs the document drew. The embedded glyph count
+is tracked per font.
+
+compare_with_helvetica() renders the same report with both families and
+reports the time and size difference.
+"""
+
+import hashlib
+import io
+import os
+import pickle
+import sys
+import tempfile
+import threading
+import time
+from fnmatch import fnmatch
+from typing import Dict, List, Any, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+import reportlab
+from reportlab.rl_config import unShapedFontGlob
+from reportlab.lib.fonts import addMapping
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont, TTFontFace, TTEncoding
+
+
+# Characters the report templates use outside plain ASCII
+REPORT_SYMBOLS = '⚠✓→●○•—≥'
+
+# Bump when the pickled face layout changes
+FONT_CACHE_VERSION = 1
+
+DEFAULT_CACHE_DIR = os.environ.get(
+    'HIRING_AUDIT_FONT_CACHE', os.path.join(os.path.expanduser('~'), '.cache', 'hiring-audit', 'fonts'))
+
+# Searched in order; HIRING_AUDIT_FONT_DIR goes first when set
+FONT_DIRS = [
+    '/usr/share/fonts/truetype/dejavu',
+    '/usr/share/fonts/dejavu',
+    '/usr/share/fonts/TTF',
+    '/usr/share/fonts/truetype/freefont',
+    '/usr/local/share/fonts',
+    '/Library/Fonts',
+    os.path.join(os.path.expanduser('~'), 'Library', 'Fonts'),
+    'C:\\Windows\\Fonts'
+]
+
+# (regular, bold) file names, preferred first
+FONT_CANDIDATES = [
+    ('DejaVuSans.ttf', 'DejaVuSans-Bold.ttf'),
+    ('FreeSans.ttf', 'FreeSansBold.ttf'),
+    ('seguisym.ttf', None)
+]
+
+# Built-in names mapped onto a TTF family; Courier (code samples) is kept
+_BUILTIN_STYLE_FONTS = {
+    'Helvetica': 'regular',
+    'Helvetica-Oblique': 'regular',
+    'Helvetica-Bold': 'bold',
+    'Helvetica-BoldOblique': 'bold'
+}
+
+
+# ============================================================================
+# PARSED FONT CACHE
+# ============================================================================
+
+def _cache_path(font_path, cache_dir):
+    stat = os.stat(font_path)
+    key = f'{FONT_CACHE_VERSION}:{reportlab.Version}:{os.path.realpath(font_path)}:{stat.st_size}:{stat.st_mtime_ns}'
+    return os.path.join(cache_dir, hashlib.sha256(key.encode('utf-8')).hexdigest()[:32] + '.pickle')
+
+
+class _PdfScale:
+    """Picklable stand-in for the lambda reportlab keeps on a parsed face"""
+
+    def __init__(self, units_per_em):
+        self.factor = 1000 / units_per_em
+
+    def __call__(self, value):
+        return value if self.factor == 1 else value * self.factor
+
+
+def load_face(font_path: str, cache_dir: Optional[str] = DEFAULT_CACHE_DIR) -> Tuple[TTFontFace, str]:
+    """
+    Parsed TTF face, from the pickle cache when possible
+
+    Returns:
+        (face, source) with source 'cache' or 'parsed'
+    """
+    path = _cache_path(font_path, cache_dir) if cache_dir else None
+    if path and os.path.exists(path):
+        try:
+            with open(path, 'rb') as f:
+                state = pickle.load(f)
+            face = TTFontFace.__new__(TTFontFace)
+            face.__dict__.update(state)
+            face._pdfScale = _PdfScale(face.unitsPerEm)
+            return face, 'cache'
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            pass
+
+    face = TTFontFace(font_path)
+    if path:
+        state = {k: v for k, v in face.__dict__.items() if k != '_pdfScale'}
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            # Workers start concurrently: write aside and rename into place
+            fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except OSError:
+            pass
+    return face, 'parsed'
+
+
+class _CachedTTFont(TTFont):
+    """TTFont built from an already parsed face; counts embedded subset glyphs"""
+
+    def __init__(self, name, face):
+        self.fontName = name
+        self.face = face
+        self.encoding = TTEncoding()
+        self.state = WeakKeyDictionary()
+        # Only used glyphs in the subset (content streams are not ASCII-readable)
+        self._asciiReadable = False
+        self.shapable = not any(fnmatch(name, pattern) for pattern in unShapedFontGlob)
+        self._stats_lock = threading.Lock()
+        self.documents = 0
+        self.glyphs_embedded = 0
+
+    def addObjects(self, doc):
+        state = self.state.get(doc)
+        # Assignments map each drawn character to its subset slot; slot 0 is .notdef
+        glyphs = len(state.assignments) - 1 if state is not None else 0
+        with self._stats_lock:
+            self.documents += 1
+            self.glyphs_embedded += glyphs
+        super().addObjects(doc)
+
+
+# ============================================================================
+# FONT FAMILIES
+# ============================================================================
+
+class FontFamily:
+    """Regular and bold font names the report generator draws with"""
+
+    __slots__ = ('regular', 'bold', 'fonts', 'load_ms', 'sources')
+
+    def __init__(self, regular: str, bold: str, fonts: List[_CachedTTFont] = None,
+                 load_ms: float = 0.0, sources: Dict[str, str] = None):
+        self.regular = regular
+        self.bold = bold
+        self.fonts = fonts or []
+        self.load_ms = load_ms
+        self.sources = sources or {}
+
+    @property
+    def builtin(self) -> bool:
+        return not self.fonts
+
+    def missing_glyphs(self, text: str = REPORT_SYMBOLS) -> List[str]:
+        """Characters of `text` the regular face cannot draw"""
+        missing = set()
+        for char in set(text):
+            if ord(char) < 32:
+                continue
+            if self.builtin:
+                # Built-in fonts are WinAnsi encoded (cp1252)
+                try:
+                    char.encode('cp1252')
+                except UnicodeEncodeError:
+                    missing.add(char)
+            elif ord(char) not in self.fonts[0].face.charToGlyph:
+                missing.add(char)
+        return sorted(missing)
+
+    def apply(self, styles):
+        """Point every Helvetica style of a stylesheet at this family"""
+        if self.builtin:
+            return styles
+        for style in styles.byName.values():
+            for attr in ('fontName', 'bulletFontName'):
+                weight = _BUILTIN_STYLE_FONTS.get(getattr(style, attr, None))
+                if weight:
+                    setattr(style, attr, getattr(self, weight))
+        return styles
+
+    def stats(self) -> Dict[str, Any]:
+        """Documents and glyphs embedded per font so far in this process"""
+        return {
+            font.fontName: {'documents': font.documents, 'glyphs_embedded': font.glyphs_embedded}
+            for font in self.fonts
+        }
+
+    def __repr__(self):
+        return f'FontFamily({self.regular!r}, {self.bold!r})'
+
+
+HELVETICA = FontFamily('Helvetica', 'Helvetica-Bold')
+
+_families = {}
+_families_lock = threading.Lock()
+
+
+def register_font_family(regular_path: str, bold_path: str = None, name: str = 'AuditSans',
+                         cache_dir: Optional[str] = DEFAULT_CACHE_DIR) -> FontFamily:
+    """
+    Register a TTF family with reportlab, once per process
+
+    Args:
+        regular_path: TTF file of the regular weight
+        bold_path: TTF file of the bold weight (defaults to the regular one)
+        name: family name; faces are registered as `name` and `name`-Bold
+        cache_dir: pickle cache of parsed faces (None parses every time)
+
+    Returns:
+        the FontFamily; later calls with the same name return it unchanged
+    """
+    bold_path = bold_path or regular_path
+    with _families_lock:
+        family = _families.get(name)
+        if family is not None:
+            paths = (family.fonts[0].face.filename, family.fonts[-1].face.filename)
+            if paths != (regular_path, bold_path):
+                raise ValueError(f"Font family '{name}' is already registered from {paths}")
+            return family
+
+        start = time.perf_counter()
+        fonts, sources = [], {}
+        for font_name, path in ((name, regular_path), (f'{name}-Bold', bold_path)):
+            face, source = load_face(path, cache_dir)
+            font = _CachedTTFont(font_name, face)
+            pdfmetrics.registerFont(font)
+            fonts.append(font)
+            sources[font_name] = source
+        # <b>/<i> markup inside paragraphs resolves through the family mapping
+        for bold, italic, font_name in ((0, 0, name), (0, 1, name), (1, 0, f'{name}-Bold'), (1, 1, f'{name}-Bold')):
+            addMapping(name, bold, italic, font_name)
+
+        family = FontFamily(name, f'{name}-Bold', fonts, round((time.perf_counter() - start) * 1000, 3), sources)
+        _families[name] = family
+        return family
+
+
+def find_font_files(font_dirs: List[str] = None) -> Optional[Tuple[str, Optional[str]]]:
+    """(regular, bold) paths of the first installed candidate family, or None"""
+    dirs = list(font_dirs or FONT_DIRS)
+    if not font_dirs and os.environ.get('HIRING_AUDIT_FONT_DIR'):
+        dirs.insert(0, os.environ['HIRING_AUDIT_FONT_DIR'])
+    for regular, bold in FONT_CANDIDATES:
+        for directory in dirs:
+            regular_path = os.path.join(directory, regular)
+            if os.path.isfile(regular_path):
+                bold_path = os.path.join(directory, bold) if bold else None
+                return regular_path, bold_path if bold_path and os.path.isfile(bold_path) else None
+    return None
+
+
+def default_font_family(font_dirs: List[str] = None, cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+                        symbols: str = REPORT_SYMBOLS) -> FontFamily:
+    """
+    Installed TTF family covering the report symbols, else Helvetica
+
+    Meant for worker start-up: the first call registers the family, later
+    calls in the same process return it.
+    """
+    files = find_font_files(font_dirs)
+    if files is None:
+        return HELVETICA
+    family = register_font_family(files[0], files[1], cache_dir=cache_dir)
+    return HELVETICA if family.missing_glyphs(symbols) else family
+
+
+# ============================================================================
+# COMPARISON WITH HELVETICA
+# ============================================================================
+
+def _render(audit_data, level, fonts, repeat):
+    from audit_report_generator import HiringAuditReportGenerator, FragmentCache
+
+    timings, size = [], 0
+    generator = HiringAuditReportGenerator(audit_data, None, level=level, fragment_cache=FragmentCache(),
+                                           fonts=fonts)
+    for i in range(repeat + 1):
+        buffer = io.BytesIO()
+        generator.reset(audit_data, buffer, level=level)
+        start = time.perf_counter()
+        generator.generate()
+        if i:  # the first render warms the fragment cache
+            timings.append((time.perf_counter() - start) * 1000)
+        size = len(buffer.getvalue())
+    return sorted(timings)[len(timings) // 2], size
+
+
+def compare_with_helvetica(audit_data: Dict[str, Any], fonts: FontFamily, level: int = 3,
+                           repeat: int = 5) -> Dict[str, Any]:
+    """
+    Render one report with Helvetica and with `fonts`
+
+    Returns:
+        median render ms and PDF bytes for both, their differences, the
+        report symbols each family cannot draw and the glyphs embedded per
+        document with the TTF family
+    """
+    before = {name: s['glyphs_embedded'] for name, s in fonts.stats().items()}
+    base_ms, base_size = _render(audit_data, level, HELVETICA, repeat)
+    ttf_ms, ttf_size = _render(audit_data, level, fonts, repeat)
+    documents = repeat + 1
+    return {
+        'level': level,
+        'helvetica': {'render_ms': round(base_ms, 3), 'pdf_bytes': base_size,
+                      'missing_glyphs': HELVETICA.missing_glyphs()},
+        'ttf': {'family': fonts.regular, 'render_ms': round(ttf_ms, 3), 'pdf_bytes': ttf_size,
+                'missing_glyphs': fonts.missing_glyphs(), 'load_ms': fonts.load_ms, 'sources': fonts.sources,
+                'glyphs_per_document': {name: (s['glyphs_embedded'] - before.get(name, 0)) // documents
+                                        for name, s in fonts.stats().items()}},
+        'render_ms_delta': round(ttf_ms - base_ms, 3),
+        'pdf_bytes_delta': ttf_size - base_size
+    }
+
+
+def main(argv=None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Compare report rendering with a TTF family vs Helvetica')
+    parser.add_argument('--regular', help='regular TTF (default: first installed candidate)')
+    parser.add_argument('--bold', help='bold TTF')
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR)
+    parser.add_argument('--level', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    files = (args.regular, args.bold) if args.regular else find_font_files()
+    if files is None:
+        print('No TTF font found; set HIRING_AUDIT_FONT_DIR or pass --regular')
+        return 1
+    fonts = register_font_family(files[0], files[1], cache_dir=args.cache_dir)
+    audit_data = {
+        'company_name': 'Font Check Ltd',
+        'block_statuses': {'block1': 'red', 'block2': 'yellow', 'block3': 'green', 'block4': 'yellow',
+                           'block5': 'red', 'block6': 'green', 'block7': 'gray'},
+        'contradictions': ['Budget ownership unclear']
+    }
+    report = compare_with_helvetica(audit_data, fonts, level=args.level)
+
+    print(f"Font {files[0]} ({fonts.sources}, {fonts.load_ms:.1f}ms to register)")
+    for key in ('helvetica', 'ttf'):
+        row = report[key]
+        print(f"   {key:<10} {row['render_ms']:>8.1f}ms {row['pdf_bytes']:>9,d} bytes   "
+              f"missing: {' '.join(row['missing_glyphs']) or '-'}")
+    print(f"   delta      {report['render_ms_delta']:>+8.1f}ms {report['pdf_bytes_delta']:>+9,d} bytes   "
+          f"glyphs embedded: {report['ttf']['glyphs_per_document']}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
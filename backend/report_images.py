@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+Hiring Execution & Talent Efficiency Audit
+Report Images v1.0
+
+Prepares client logos (and other uploaded images) for the PDF reports.
+Uploads are often multi-megabyte PNGs at many times the printed size, so
+each image is
+
+- normalized: EXIF orientation applied, flattened onto white, metadata dropped
+- downsampled to the printed box at PRINT_DPI (never upscaled)
+- stored as JPEG when it is photographic, else as lossless PNG
+
+Processed images are cached per process by the sha256 of the upload, the
+printed box and the DPI, so a logo shared by many reports is processed
+once. In a document the image is one Form XObject named by that hash:
+drawing it again, on later pages or in later reports of a merged
+portfolio, only references it.
+"""
+
+import hashlib
+import io
+import struct
+import threading
+import warnings
+from collections import OrderedDict
+from typing import Dict, Any, Tuple, Union
+
+from PIL import Image as PILImage, ImageOps, UnidentifiedImageError
+from reportlab.lib.utils import ImageReader
+from reportlab.platypus.flowables import Flowable
+
+
+# Printed logo box on the cover page (points, 72 per inch)
+COVER_LOGO_BOX = (160, 60)
+
+# Resolution images are downsampled to; enough for office printing of logos
+PRINT_DPI = 200
+
+# Uploads larger than this are refused rather than decoded; checked from the
+# file header first, well below Pillow's own decompression bomb limit
+MAX_SOURCE_PIXELS = 40_000_000
+
+# JPEG start-of-frame markers (SOF0-SOF15 without DHT, JPG and DAC)
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+# Above this many distinct colors an image is treated as a photo (JPEG)
+PALETTE_COLORS = 256
+JPEG_QUALITY = 85
+
+FORM_PREFIX = 'report_image_'
+
+EXIF_ORIENTATION = 0x0112
+
+
+class ProcessedImage:
+    """An image normalized and sized for one printed box"""
+
+    __slots__ = ('digest', 'data', 'format', 'width_px', 'height_px', 'width', 'height', 'source_bytes')
+
+    def __init__(self, digest, data, format, width_px, height_px, width, height, source_bytes):
+        self.digest = digest
+        self.data = data
+        self.format = format
+        self.width_px = width_px
+        self.height_px = height_px
+        self.width = width        # printed size in points
+        self.height = height
+        self.source_bytes = source_bytes
+
+    @property
+    def form_name(self) -> str:
+        return FORM_PREFIX + self.digest[:24]
+
+    def reader(self) -> ImageReader:
+        return ImageReader(io.BytesIO(self.data))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'digest': self.digest,
+            'format': self.format,
+            'pixels': [self.width_px, self.height_px],
+            'printed_pt': [round(self.width, 2), round(self.height, 2)],
+            'source_bytes': self.source_bytes,
+            'bytes': len(self.data)
+        }
+
+
+def _read_source(source):
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return bytes(source)
+    if hasattr(source, 'read'):
+        return source.read()
+    with open(source, 'rb') as f:
+        return f.read()
+
+
+def header_size(data: bytes):
+    """
+    (width, height) declared by a PNG, GIF or JPEG header without decoding
+    anything, or None for other or truncated formats
+    """
+    if data[:8] == b'\x89PNG\r\n\x1a\n' and data[12:16] == b'IHDR' and len(data) >= 24:
+        return struct.unpack('>II', data[16:24])
+    if data[:6] in (b'GIF87a', b'GIF89a') and len(data) >= 10:
+        return struct.unpack('<HH', data[6:10])
+    if data[:2] == b'\xff\xd8':
+        i = 2
+        while i + 4 <= len(data):
+            if data[i] != 0xFF:
+                return None
+            marker = data[i + 1]
+            if marker == 0xFF:  # fill byte
+                i += 1
+                continue
+            if marker in (0x01, 0xD8) or 0xD0 <= marker <= 0xD7:
+                i += 2
+                continue
+            if marker in _JPEG_SOF_MARKERS:
+                if i + 9 > len(data):
+                    return None
+                height, width = struct.unpack('>HH', data[i + 5:i + 9])
+                return width, height
+            if marker in (0xD9, 0xDA):  # end of image / start of scan before any frame
+                return None
+            i += 2 + struct.unpack('>H', data[i + 2:i + 4])[0]
+    return None
+
+
+def _check_pixels(width, height):
+    if width * height > MAX_SOURCE_PIXELS:
+        raise ValueError(f"Image of {width}x{height} pixels exceeds {MAX_SOURCE_PIXELS:,d}")
+
+
+def process_image(data: bytes, box: Tuple[float, float] = COVER_LOGO_BOX, dpi: int = PRINT_DPI,
+                  digest: str = None) -> ProcessedImage:
+    """
+    Normalize and downsample an uploaded image to fit `box`
+
+    Args:
+        data: the uploaded file's bytes
+        box: (width, height) in points the image must fit, aspect kept
+        dpi: target print resolution
+
+    Raises:
+        ValueError: not a readable image, or too large to decode (including
+            Pillow decompression bombs)
+    """
+    declared = header_size(data)
+    if declared is not None:
+        _check_pixels(*declared)
+    try:
+        # Formats without a header check still must not warn or raise past us
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', PILImage.DecompressionBombWarning)
+            image = PILImage.open(io.BytesIO(data))
+    except (PILImage.DecompressionBombError, PILImage.DecompressionBombWarning) as e:
+        raise ValueError(f"Image too large to decode: {e}")
+    except (UnidentifiedImageError, OSError) as e:
+        raise ValueError(f"Unreadable image: {e}")
+    _check_pixels(image.width, image.height)
+
+    try:
+        # Camera photos may be stored sideways with an EXIF orientation tag
+        rotated = image.getexif().get(EXIF_ORIENTATION, 1) in (5, 6, 7, 8)
+        width, height = (image.height, image.width) if rotated else image.size
+
+        # Largest size fitting the box at print resolution; thumbnail() lets the
+        # JPEG decoder skip straight to a reduced scale before resampling
+        scale = min(box[0] / width, box[1] / height)
+        width_pt, height_pt = width * scale, height * scale
+        target = (max(1, round(width_pt * dpi / 72)), max(1, round(height_pt * dpi / 72)))
+        image.thumbnail(target[::-1] if rotated else target, PILImage.LANCZOS)
+        image = ImageOps.exif_transpose(image)
+    except (OSError, SyntaxError) as e:
+        raise ValueError(f"Corrupt image: {e}")
+
+    if image.mode in ('RGBA', 'LA', 'PA') or (image.mode == 'P' and 'transparency' in image.info):
+        image = image.convert('RGBA')
+        background = PILImage.new('RGB', image.size, 'white')
+        background.paste(image, mask=image.getchannel('A'))
+        image = background
+    elif image.mode not in ('RGB', 'L'):
+        image = image.convert('RGB')
+
+    out = io.BytesIO()
+    if image.getcolors(PALETTE_COLORS) is None:
+        image.save(out, 'JPEG', quality=JPEG_QUALITY, optimize=True)
+        format = 'JPEG'
+    else:
+        image.save(out, 'PNG', optimize=True)
+        format = 'PNG'
+
+    return ProcessedImage(digest or hashlib.sha256(data).hexdigest(), out.getvalue(), format,
+                          image.width, image.height, width_pt, height_pt, len(data))
+
+
+# ============================================================================
+# CACHE
+# ============================================================================
+
+class ImageCache:
+    """LRU of processed images keyed by upload content hash, box and DPI"""
+
+    def __init__(self, max_entries: int = 128, max_bytes: int = 32 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, source: Union[bytes, str, Any], box: Tuple[float, float] = COVER_LOGO_BOX,
+            dpi: int = PRINT_DPI) -> ProcessedImage:
+        """
+        Processed image for an upload (bytes, file path or binary stream)
+
+        Raises:
+            ValueError: the upload is not a usable image
+        """
+        data = _read_source(source)
+        digest = hashlib.sha256(data).hexdigest()
+        key = (digest, tuple(box), dpi)
+        with self._lock:
+            image = self._entries.get(key)
+            if image is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return image
+            self.misses += 1
+
+        # Processed outside the lock; two workers racing on one logo both compute it
+        image = process_image(data, box, dpi, digest)
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = image
+                self._bytes += len(image.data)
+                while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                    _, evicted = self._entries.popitem(last=False)
+                    self._bytes -= len(evicted.data)
+        return image
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0
+            }
+
+
+# Shared by every generator in the process
+IMAGE_CACHE = ImageCache()
+
+
+# ============================================================================
+# DRAWING
+# ============================================================================
+
+def draw_image(canv, image: ProcessedImage, x: float, y: float, width: float = None, height: float = None):
+    """Draw `image` at (x, y); its pixels are embedded once per document"""
+    if not canv.hasForm(image.form_name):
+        # A unit-square form, scaled at each use
+        canv.beginForm(image.form_name, 0, 0, 1, 1)
+        canv.drawImage(image.reader(), 0, 0, 1, 1)
+        canv.endForm()
+    canv.saveState()
+    canv.translate(x, y)
+    canv.scale(width or image.width, height or image.height)
+    canv.doForm(image.form_name)
+    canv.restoreState()
+
+
+class ImageFlowable(Flowable):
+    """Platypus flowable for a processed image at its printed size"""
+
+    def __init__(self, image: ProcessedImage, hAlign: str = 'CENTER'):
+        super().__init__()
+        self.image = image
+        self.width = image.width
+        self.height = image.height
+        self.hAlign = hAlign
+
+    def wrap(self, availWidth, availHeight):
+        return self.width, self.height
+
+    def draw(self):
+        draw_image(self.canv, self.image, 0, 0, self.width, self.height)
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Hiring Execution & Talent Efficiency Audit
+Report Preview Renderer v1.0
+
+Renders the same sections as the PDF report (cover status, executive
+summary, block overview, findings, recommendations) as structured JSON or a
+self-contained HTML page. Section content comes from the same AuditView and
+executive_summary_text() the PDF generator uses, so the browser preview and
+the PDF produced later agree; no generator, stylesheet, flowables or layout
+are involved, so a preview takes about a millisecond.
+"""
+
+import json
+from html import escape
+from typing import Dict, Any
+
+from audit_report_generator import (
+    AuditView, BLOCK_IDS, BLOCK_INFO, LEVEL_NAMES, STATUS_TEXT, executive_summary_text
+)
+
+
+STATUS_LABELS = {'green': 'HEALTHY', 'yellow': 'AT RISK', 'red': 'CRITICAL', 'gray': 'PENDING'}
+
+
+# ============================================================================
+# REPORT MODEL
+# ============================================================================
+
+def build_report_model(audit_data: Dict[str, Any], level: int = 1) -> Dict[str, Any]:
+    """
+    Derive the report sections for one audit
+
+    Args:
+        audit_data: same dict the PDF generator takes
+        level: 1, 2, or 3; Level 2+ adds findings and recommendations
+
+    Returns:
+        JSON-serializable dict with one key per section
+    """
+    view = AuditView(audit_data)
+    statuses = view.block_statuses
+
+    model = {
+        'level': level,
+        'cover': {
+            'company_name': view.company_name,
+            'report_date': view.report_date,
+            'level_name': LEVEL_NAMES.get(level, 'Report'),
+            'overall_status': view.overall_status,
+            'confidence_score': view.overall_score
+        },
+        'executive_summary': {
+            # ReportLab paragraph markup (<b> only); company name is escaped for HTML
+            'summary': ' '.join(executive_summary_text(view).split()),
+            'key_findings': list(view.key_findings[:5]),
+            'priority_risks': [dict(risk) for risk in view.priority_risks[:3]]
+        },
+        'block_overview': {
+            'blocks': [{
+                'block_id': block_id,
+                'name': BLOCK_INFO[block_id]['name'],
+                'role': BLOCK_INFO[block_id]['role'],
+                'status': statuses.get(block_id, 'gray'),
+                'status_text': STATUS_TEXT.get(statuses.get(block_id, 'gray'), '○'),
+                'score': (audit_data.get('block_scores') or {}).get(block_id),
+                'signal': view.block_signal(block_id)
+            } for block_id in BLOCK_IDS],
+            'gate_failures': list(view.gate_failures),
+            'contradictions': [str(c) for c in audit_data.get('contradictions', [])[:5]],
+            'auto_flags': [{'question': f['question'], 'flag': f['flag']}
+                           for f in audit_data.get('auto_flags', [])[:5]]
+        }
+    }
+
+    if level >= 2:
+        details = view.block_details
+        model['findings'] = [{
+            'block_id': block_id,
+            'name': details[block_id]['name'],
+            'status': statuses.get(block_id, 'gray'),
+            'findings': list(details[block_id]['findings'][:3]),
+            'risks': list(details[block_id]['risks'][:2])
+        } for block_id in BLOCK_IDS]
+        model['recommendations'] = {
+            'quick_wins': [dict(rec) for rec in view.quick_wins[:5]],
+            'structural': [dict(rec) for rec in view.structural_changes[:5]]
+        }
+
+    return model
+
+
+# ============================================================================
+# RENDERERS
+# ============================================================================
+
+def render_json(model: Dict[str, Any]) -> str:
+    return json.dumps(model, ensure_ascii=False)
+
+
+_HTML_STYLE = """
+body{font-family:Helvetica,Arial,sans-serif;color:#1f2937;max-width:860px;margin:0 auto;padding:24px}
+h1{color:#1e3a5f}h2{color:#1e3a5f;border-bottom:2px solid #1e3a5f;padding-bottom:4px}
+table{border-collapse:collapse;width:100%}th{background:#1e3a5f;color:#fff;text-align:left}
+th,td{border:1px solid #6B7280;padding:6px;font-size:14px}
+.green{color:#10B981}.yellow{color:#F59E0B}.red{color:#EF4444}.gray{color:#6B7280}
+.risk{font-weight:bold}
+"""
+
+
+def _summary_html(model):
+    # The generator's markup only uses <b>; escape everything else
+    summary = escape(model['executive_summary']['summary'])
+    return summary.replace('&lt;b&gt;', '<b>').replace('&lt;/b&gt;', '</b>')
+
+
+def render_html(model: Dict[str, Any]) -> str:
+    """Self-contained HTML page for the browser preview"""
+    cover = model['cover']
+    # Statuses come from the audit data, so they are escaped like every other field
+    status = escape(cover['overall_status'], quote=True)
+    parts = [
+        '<!DOCTYPE html><html><head><meta charset="utf-8">',
+        f'<title>Hiring Audit Preview - {escape(cover["company_name"])}</title>',
+        f'<style>{_HTML_STYLE}</style></head><body>',
+        '<h1>Hiring Execution &amp; Talent Efficiency Audit</h1>',
+        f'<p>{escape(cover["company_name"])} &middot; Level {model["level"]}: '
+        f'{escape(cover["level_name"])} &middot; {escape(cover["report_date"])}</p>',
+        f'<p>Overall hiring health: <b class="{status}">{STATUS_LABELS.get(cover["overall_status"], status)}</b>'
+        f' &middot; Confidence score {cover["confidence_score"]}/100</p>',
+        '<h2>Executive Summary</h2>',
+        f'<p>{_summary_html(model)}</p>',
+        '<h3>Key Findings</h3><ul>'
+    ]
+    parts += [f'<li>{escape(f)}</li>' for f in model['executive_summary']['key_findings']]
+    parts.append('</ul><h3>Priority Risks</h3><ul>')
+    parts += [f'<li class="risk {escape(r["severity"], quote=True)}">'
+              f'&#9888; {escape(r["name"])}: {escape(r["impact"])}</li>'
+              for r in model['executive_summary']['priority_risks']]
+    parts.append('</ul>')
+
+    overview = model['block_overview']
+    parts.append('<h2>Audit Block Overview</h2><table>'
+                 '<tr><th>Block</th><th>Function</th><th>Status</th><th>Key Signal</th></tr>')
+    parts += [f'<tr><td>{escape(b["name"])}</td><td>{escape(b["role"])}</td>'
+              f'<td class="{escape(b["status"], quote=True)}">{escape(b["status_text"])}</td>'
+              f'<td>{escape(b["signal"])}</td></tr>'
+              for b in overview['blocks']]
+    parts.append('</table>')
+    if overview['gate_failures']:
+        parts.append('<h3>&#9888; Gate Failures Detected</h3><ul>')
+        parts += [f'<li class="risk red">{escape(f)}</li>' for f in overview['gate_failures']]
+        parts.append('</ul>')
+    if overview['contradictions']:
+        parts.append('<h3>Cross-Validation Contradictions</h3><ul>')
+        parts += [f'<li class="risk yellow">{escape(c)}</li>' for c in overview['contradictions']]
+        parts.append('</ul>')
+    if overview['auto_flags']:
+        parts.append('<h3>Auto-Flags</h3><ul>')
+        parts += [f'<li class="risk yellow">{escape(f["flag"])} ({escape(f["question"].upper())})</li>'
+                  for f in overview['auto_flags']]
+        parts.append('</ul>')
+
+    if 'findings' in model:
+        parts.append('<h2>Detailed Block Findings</h2>')
+        for block in model['findings']:
+            block_status = escape(block['status'], quote=True)
+            parts.append(f'<h3>{escape(block["name"])}</h3>'
+                         f'<p class="{block_status}"><b>Status: {STATUS_LABELS.get(block["status"], block_status)}</b>'
+                         '</p><ul>')
+            parts += [f'<li>{escape(f)}</li>' for f in block['findings']]
+            parts += [f'<li>&#9888; {escape(r)}</li>' for r in block['risks']]
+            parts.append('</ul>')
+
+        recs = model['recommendations']
+        parts.append('<h2>Recommendations</h2><h3>Quick Wins (Week 1-2)</h3><ul>')
+        parts += [f'<li>&#10003; {escape(r["text"])} <i>Owner: {escape(r["owner"])} | '
+                  f'Effort: {escape(r["effort"])}</i></li>' for r in recs['quick_wins']]
+        parts.append('</ul><h3>Structural Changes (Month 1-3)</h3><ul>')
+        parts += [f'<li>&rarr; {escape(r["text"])} <i>Owner: {escape(r["owner"])} | '
+                  f'Effort: {escape(r["effort"])}</i></li>' for r in recs['structural']]
+        parts.append('</ul>')
+
+    parts.append('</body></html>')
+    return ''.join(parts)
+
+
+def render_preview(audit_data: Dict[str, Any], level: int = 1, fmt: str = 'html') -> str:
+    """Render an audit preview as 'html' or 'json'"""
+    model = build_report_model(audit_data, level)
+    if fmt == 'json':
+        return render_json(model)
+    if fmt == 'html':
+        return render_html(model)
+    raise ValueError(f"Unknown preview format: {fmt}")
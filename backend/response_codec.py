@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Hiring Execution & Talent Efficiency Audit
+Response Codec & Audit Archive v1.0
+
+Compact binary form of a response set: every block question of the question
+bank, in bank order, takes 3 bits (0 = unanswered, 1..5 = score -1..3), and
+each encoded record starts with a one-byte schema version. The 74 block
+questions fit in 29 bytes instead of ~900 bytes of JSON.
+
+AuditArchive appends fixed-size records to a single file and keeps an
+append-only offset index next to it (<archive>.idx). Records are read
+through a read-only memory map; bulk decoding views the mapped records as a
+NumPy array without copying them and unpacks all answers in a few vectorized
+operations. NumPy is only needed for the bulk path.
+"""
+
+import mmap
+import os
+import struct
+import zlib
+from typing import Dict, List, Any, Iterable, Optional, Sequence, Tuple
+
+from payload_validator import read_question_csv, BLOCK_FORM_IDS
+
+
+SCHEMA_VERSION = 1
+BITS_PER_ANSWER = 3
+MISSING = -2                     # decoded value of an unanswered question
+MIN_SCORE, MAX_SCORE = -1, 3
+
+ARCHIVE_MAGIC = b'HAAR'
+# magic, schema version, question count, registry checksum, record size
+ARCHIVE_HEADER = struct.Struct('<4sBHIH')
+ARCHIVE_HEADER_SIZE = 16
+
+
+class CodecError(ValueError):
+    """Raised for answers that cannot be packed or records from another schema"""
+
+
+def question_registry() -> List[str]:
+    """Block question ids in question bank order (the packing order of schema 1)"""
+    return [r['question'] for r in read_question_csv() if r['form'] in BLOCK_FORM_IDS]
+
+
+# ============================================================================
+# CODEC
+# ============================================================================
+
+class ResponseCodec:
+    """Packs {question_id: score} dicts into fixed-size versioned records"""
+
+    def __init__(self, question_ids: Sequence[str] = None, version: int = SCHEMA_VERSION):
+        self.question_ids = list(question_ids if question_ids is not None else question_registry())
+        self.version = version
+        self.index = {q: i for i, q in enumerate(self.question_ids)}
+        self.payload_size = (len(self.question_ids) * BITS_PER_ANSWER + 7) // 8
+        self.record_size = 1 + self.payload_size
+        self.checksum = zlib.crc32(','.join(self.question_ids).encode('utf-8'))
+
+    def encode(self, responses: Dict[str, Any]) -> bytes:
+        """
+        Encode one response set
+
+        Raises:
+            CodecError: for unknown question ids or non-integer / out-of-range
+                scores (e.g. averaged multi-respondent answers)
+        """
+        packed = 0
+        index = self.index
+        for question_id, score in responses.items():
+            if score is None:
+                continue
+            position = index.get(question_id)
+            if position is None:
+                raise CodecError(f"Question '{question_id}' is not in schema {self.version}")
+            if type(score) is not int or not MIN_SCORE <= score <= MAX_SCORE:
+                raise CodecError(f"Cannot pack score {score!r} for '{question_id}'")
+            packed |= (score - MISSING) << (position * BITS_PER_ANSWER)
+        return bytes((self.version,)) + packed.to_bytes(self.payload_size, 'little')
+
+    def decode(self, record: bytes) -> Dict[str, int]:
+        """Decode one record back into a response dict (unanswered questions omitted)"""
+        if len(record) != self.record_size or record[0] != self.version:
+            raise CodecError(f"Record is not a schema {self.version} record of {self.record_size} bytes")
+        packed = int.from_bytes(record[1:], 'little')
+        responses = {}
+        for question_id in self.question_ids:
+            code = packed & 0b111
+            if code:
+                responses[question_id] = code + MISSING
+            packed >>= BITS_PER_ANSWER
+        return responses
+
+    def decode_array(self, records):
+        """
+        Decode records in bulk
+
+        Args:
+            records: uint8 array of shape (n, record_size), or a buffer of n
+                     concatenated records (viewed, not copied)
+
+        Returns:
+            int8 array of shape (n, question_count); MISSING for unanswered
+        """
+        import numpy as np
+
+        records = np.frombuffer(records, dtype=np.uint8) if not isinstance(records, np.ndarray) else records
+        records = records.reshape(-1, self.record_size)
+        if records.size and not (records[:, 0] == self.version).all():
+            raise CodecError(f"Buffer contains records that are not schema {self.version}")
+
+        count = len(self.question_ids)
+        bits = np.unpackbits(records[:, 1:], axis=1, bitorder='little')[:, :count * BITS_PER_ANSWER]
+        bits = bits.reshape(-1, count, BITS_PER_ANSWER)
+        codes = bits[:, :, 0] | (bits[:, :, 1] << 1) | (bits[:, :, 2] << 2)
+        return codes.astype(np.int8) + np.int8(MISSING)
+
+    def to_responses(self, row) -> Dict[str, int]:
+        """One decoded array row back into a response dict for the scorer"""
+        return {q: int(v) for q, v in zip(self.question_ids, row) if v != MISSING}
+
+
+# ============================================================================
+# ARCHIVE
+# ============================================================================
+
+class AuditArchive:
+    """Append-only file of encoded response sets with an audit id -> offset index"""
+
+    def __init__(self, path: str, codec: ResponseCodec = None):
+        self.path = path
+        self.index_path = path + '.idx'
+        self.codec = codec or ResponseCodec()
+        self.offsets = {}
+        self._mmap = None
+        self._mapped_size = 0
+
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            with open(path, 'wb') as f:
+                f.write(self._header().ljust(ARCHIVE_HEADER_SIZE, b'\0'))
+            open(self.index_path, 'w').close()
+        else:
+            with open(path, 'rb') as f:
+                header = f.read(ARCHIVE_HEADER_SIZE)
+            if header[:ARCHIVE_HEADER.size] != self._header():
+                raise CodecError(f"{path} was written with a different schema or question registry")
+            self._load_index()
+        self._file = open(path, 'ab')
+        self._index_file = open(self.index_path, 'a', encoding='utf-8')
+
+    def _header(self):
+        codec = self.codec
+        return ARCHIVE_HEADER.pack(ARCHIVE_MAGIC, codec.version, len(codec.question_ids),
+                                   codec.checksum, codec.record_size)
+
+    def _load_index(self):
+        data_size = os.path.getsize(self.path) - ARCHIVE_HEADER_SIZE
+        complete = data_size - data_size % self.codec.record_size
+        if complete != data_size:
+            # Drop a record torn by a crash so later appends stay aligned
+            os.truncate(self.path, ARCHIVE_HEADER_SIZE + complete)
+        with open(self.index_path, encoding='utf-8') as f:
+            for line in f:
+                audit_id, _, offset = line.rstrip('\n').rpartition('\t')
+                # Entries for records cut short by a crash are ignored
+                if audit_id and int(offset) + self.codec.record_size <= ARCHIVE_HEADER_SIZE + complete:
+                    self.offsets[audit_id] = int(offset)
+
+    def __len__(self):
+        return (self._data_end() - ARCHIVE_HEADER_SIZE) // self.codec.record_size
+
+    def _data_end(self):
+        self._file.flush()
+        return os.path.getsize(self.path)
+
+    # -- writing ------------------------------------------------------------
+
+    def append(self, audit_id: str, responses: Dict[str, Any]) -> int:
+        """Append one audit; a later append for the same id supersedes it in the index"""
+        return self.append_many([(audit_id, responses)])[0]
+
+    def append_many(self, items: Iterable[Tuple[str, Dict[str, Any]]]) -> List[int]:
+        """
+        Append several audits with one write to each file; returns record offsets
+
+        The whole batch is encoded before anything is written, and the
+        in-memory index only changes once both writes succeeded, so a
+        CodecError leaves the archive as it was.
+        """
+        offset = self._data_end()
+        records, lines, entries = [], [], []
+        for audit_id, responses in items:
+            records.append(self.codec.encode(responses))
+            lines.append(f"{audit_id}\t{offset}\n")
+            entries.append((audit_id, offset))
+            offset += self.codec.record_size
+        # Records first: an index line never points past the data on disk
+        self._file.write(b''.join(records))
+        self._file.flush()
+        self._index_file.write(''.join(lines))
+        self._index_file.flush()
+        self.offsets.update(entries)
+        return [offset for _, offset in entries]
+
+    # -- reading ------------------------------------------------------------
+
+    def _view(self):
+        end = self._data_end()
+        if self._mmap is None or self._mapped_size != end:
+            # Arrays handed out earlier keep the old map alive until they are dropped
+            with open(self.path, 'rb') as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._mapped_size = end
+        return self._mmap
+
+    def get(self, audit_id: str) -> Optional[Dict[str, int]]:
+        offset = self.offsets.get(audit_id)
+        if offset is None:
+            return None
+        view = self._view()
+        return self.codec.decode(view[offset:offset + self.codec.record_size])
+
+    def records(self):
+        """Zero-copy uint8 view (n, record_size) over every record in the file"""
+        import numpy as np
+
+        count = len(self)
+        return np.frombuffer(self._view(), dtype=np.uint8, count=count * self.codec.record_size,
+                             offset=ARCHIVE_HEADER_SIZE).reshape(count, self.codec.record_size)
+
+    def scores(self, audit_ids: Iterable[str] = None):
+        """
+        Decoded answers as an int8 array (audits x questions)
+
+        Args:
+            audit_ids: rows to return, in order; default is every record in
+                       file order (superseded records included)
+        """
+        records = self.records()
+        if audit_ids is not None:
+            rows = [(self.offsets[a] - ARCHIVE_HEADER_SIZE) // self.codec.record_size for a in audit_ids]
+            records = records[rows]
+        return self.codec.decode_array(records)
+
+    def close(self):
+        self._file.close()
+        self._index_file.close()
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                pass  # still viewed by a caller's array; released with it
+            self._mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
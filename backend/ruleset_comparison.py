@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+"""
+Hiring Execution & Talent Efficiency Audit
+Ruleset Comparison v1.0
+
+Scores audits under several ruleset versions at once, for calibrating a
+proposed ruleset against the current one. Running run_audit_scoring once
+per version repeats everything; here the versions are compared once when
+the comparison is built and each audit is then scored in one pass:
+
+- responses are resolved and grouped into blocks once; block sums and
+  averages do not depend on the rules
+- block statuses are computed once per distinct (thresholds, critical
+  questions) combination
+- each distinct gate rule list, cross-validation rule and recommendation
+  trigger is evaluated once, however many versions contain it
+- only escalation, DTC, confidence and the result itself are built per
+  version, with scoring_engine.build_result like every other scorer
+
+Results are identical to run_audit_scoring(payload, ruleset) apart from
+the timestamp. Versions sharing an outcome share its objects, so treat
+results as read-only.
+
+Usage:
+    python ruleset_comparison.py config/rulesets 2025.1 2025.2 --input audits.jsonl
+"""
+
+import argparse
+import json
+import sys
+import time
+from datetime import datetime
+from typing import Dict, Any, Iterable, Sequence
+
+from rulesets import Ruleset, RulesetStore, thaw
+from scoring_engine import (
+    block_id_for, block_status, is_critical_red, apply_gate_rules, check_cross_validation_rule,
+    build_result, payload_auto_flags, resolve_responses
+)
+
+
+def _key(value) -> str:
+    """Canonical form of a rule section, to spot sections shared between versions"""
+    return json.dumps(thaw(value), sort_keys=True, separators=(',', ':'))
+
+
+def _intern(registry: Dict[str, int], value) -> int:
+    return registry.setdefault(_key(value), len(registry))
+
+
+class RulesetComparison:
+    """Scores audits under several rulesets, sharing work between them"""
+
+    def __init__(self, rulesets: Sequence[Ruleset]):
+        """
+        Args:
+            rulesets: versions to compare; the first is the baseline for diffs
+
+        Raises:
+            ValueError: no rulesets, or a version given twice
+        """
+        self.rulesets = list(rulesets)
+        if not self.rulesets:
+            raise ValueError("Need at least one ruleset to compare")
+        versions = [r.version for r in self.rulesets]
+        if len(set(versions)) != len(versions):
+            raise ValueError(f"Duplicate ruleset versions: {versions}")
+        self.baseline = self.rulesets[0]
+
+        status_groups, gate_groups, disagreement_groups, cv_rules, triggers = {}, {}, {}, {}, {}
+        self._status_reps = []      # status group -> ruleset it is computed with
+        self._gate_reps = []
+        self._disagreement_configs = []
+        self._cv_rules = []
+        self._conditions = []
+        self._plans = []
+        for ruleset in self.rulesets:
+            config = ruleset.config
+            status_group = _intern(status_groups, (
+                config['GREEN_THRESHOLD'], config['YELLOW_THRESHOLD'], config['CRITICAL_RED_BELOW'],
+                ruleset.critical_questions))
+            if status_group == len(self._status_reps):
+                self._status_reps.append(ruleset)
+            gate_group = _intern(gate_groups, ruleset.gate_rules)
+            if gate_group == len(self._gate_reps):
+                self._gate_reps.append(ruleset)
+            disagreement_group = _intern(disagreement_groups, (
+                config['DISAGREEMENT_STDEV'], config['DISAGREEMENT_BLOCK_SHARE']))
+            if disagreement_group == len(self._disagreement_configs):
+                self._disagreement_configs.append(config)
+
+            rule_ids = []
+            for rule in ruleset.cross_validation_rules:
+                index = _intern(cv_rules, rule)
+                if index == len(self._cv_rules):
+                    self._cv_rules.append(rule)
+                rule_ids.append(index)
+
+            trigger_plan = []
+            for rec_id, trigger in ruleset.recommendation_triggers.items():
+                index = _intern(triggers, trigger['when'])
+                if index == len(self._conditions):
+                    self._conditions.append(ruleset.conditions[rec_id])
+                trigger_plan.append((rec_id, trigger['risk_name'], trigger['priority'], index))
+
+            self._plans.append((ruleset, status_group, gate_group, disagreement_group,
+                                tuple(rule_ids), tuple(trigger_plan)))
+
+    def describe(self) -> Dict[str, Any]:
+        """How much of the rule evaluation is shared between the versions"""
+        return {
+            'versions': [r.version for r in self.rulesets],
+            'status_groups': len(self._status_reps),
+            'gate_groups': len(self._gate_reps),
+            'cv_rules': {'unique': len(self._cv_rules),
+                         'total': sum(len(r.cross_validation_rules) for r in self.rulesets)},
+            'triggers': {'unique': len(self._conditions),
+                         'total': sum(len(r.recommendation_triggers) for r in self.rulesets)}
+        }
+
+    # ========================================================================
+    # SINGLE AUDIT
+    # ========================================================================
+
+    def score(self, payload: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """{version: scoring result} for one payload, in ruleset order"""
+        responses, aggregator = resolve_responses(payload, self.baseline)
+        timestamp = datetime.now().isoformat()
+
+        # Shared pass: per-block answers, sums and scores
+        block_responses = {}
+        for question_id, score in responses.items():
+            block_id = block_id_for(question_id)
+            if block_id:
+                block_responses.setdefault(block_id, {})[question_id] = score
+        blocks = {}
+        block_scores = {}
+        for block_id, block_data in block_responses.items():
+            valid_scores = [v for v in block_data.values() if v is not None and v != -1]
+            total = sum(valid_scores)
+            blocks[block_id] = (total, len(valid_scores), block_data)
+            block_scores[block_id] = round(total / len(valid_scores), 2) if valid_scores else None
+
+        status_outcomes = [self._block_statuses(ruleset, blocks) for ruleset in self._status_reps]
+        cv_outcomes = [check_cross_validation_rule(rule, responses) for rule in self._cv_rules]
+        disagreements = [aggregator.disagreement_contradictions(config) if aggregator else []
+                         for config in self._disagreement_configs]
+        auto_flags = payload_auto_flags(payload, responses)
+        gate_outcomes = {}
+        trigger_outcomes = {}
+
+        results = {}
+        for ruleset, status_group, gate_group, disagreement_group, rule_ids, trigger_plan in self._plans:
+            block_statuses, block_details = status_outcomes[status_group]
+
+            gates = gate_outcomes.get((gate_group, status_group))
+            if gates is None:
+                gates = gate_outcomes[(gate_group, status_group)] = \
+                    apply_gate_rules(block_statuses, self._gate_reps[gate_group])
+            gate_failures, gate_status = gates
+
+            contradictions = [cv_outcomes[i] for i in rule_ids if cv_outcomes[i]]
+            flags = [c['name'] for c in contradictions]
+            if aggregator:
+                contradictions += disagreements[disagreement_group]
+                flags += [c['name'] for c in disagreements[disagreement_group][:1]]
+
+            flag_key = tuple(flags)
+            recommendations = []
+            for rec_id, risk_name, priority, index in trigger_plan:
+                fired = trigger_outcomes.get((index, status_group, flag_key))
+                if fired is None:
+                    try:
+                        fired = bool(self._conditions[index](block_statuses, block_scores, flags, responses))
+                    except (TypeError, KeyError):
+                        fired = False
+                    trigger_outcomes[(index, status_group, flag_key)] = fired
+                if fired:
+                    recommendations.append({'id': rec_id, 'name': risk_name, 'priority': priority})
+            recommendations.sort(key=lambda r: r['priority'])
+
+            results[ruleset.version] = build_result(
+                payload, ruleset, responses, aggregator,
+                block_scores=block_scores, block_statuses=block_statuses, block_details=block_details,
+                gate_failures=gate_failures, gate_status=gate_status,
+                contradictions=contradictions, flags=flags, auto_flags=auto_flags,
+                recommendations=recommendations, timestamp=timestamp
+            )
+        return results
+
+    @staticmethod
+    def _block_statuses(ruleset: Ruleset, blocks: Dict[str, tuple]):
+        """Block statuses and details under one (thresholds, critical questions) combination"""
+        statuses = {}
+        details = {}
+        for block_id, (total, count, block_data) in blocks.items():
+            if not count:
+                statuses[block_id] = 'gray'
+                details[block_id] = {'status': 'incomplete', 'question_count': 0}
+                continue
+            critical_hits = [q for q in ruleset.critical_questions.get(block_id, ())
+                             if is_critical_red(block_data.get(q), ruleset.config)]
+            statuses[block_id] = block_status(total, count, bool(critical_hits), ruleset)
+            details[block_id] = {
+                'average': total / count,
+                'question_count': count,
+                'total_questions': len(block_data),
+                'has_critical_red': bool(critical_hits),
+                'critical_questions': critical_hits
+            }
+        return statuses, details
+
+    def compare(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Side-by-side results for one payload plus each version's diff against the baseline"""
+        results = self.score(payload)
+        base = results[self.baseline.version]
+        return {
+            'audit_id': payload.get('audit_id'),
+            'results': results,
+            'diff': {version: diff_results(base, result)
+                     for version, result in results.items() if version != self.baseline.version}
+        }
+
+    # ========================================================================
+    # BATCHES
+    # ========================================================================
+
+    def compare_batch(self, payloads: Iterable[Dict[str, Any]], keep_results: bool = False) -> Dict[str, Any]:
+        """
+        Compare a batch without holding every result
+
+        Args:
+            payloads: webhook payloads, consumed once
+            keep_results: also return the side-by-side results of changed audits
+
+        Returns:
+            dict with the batch summary and the audits whose outcome changed
+            under at least one version
+        """
+        start = time.perf_counter()
+        summary = ComparisonSummary(self.baseline.version, [r.version for r in self.rulesets[1:]])
+        changed = []
+        for payload in payloads:
+            comparison = self.compare(payload)
+            summary.add(comparison)
+            if any(d['changed'] for d in comparison['diff'].values()):
+                if not keep_results:
+                    comparison = {'audit_id': comparison['audit_id'], 'diff': comparison['diff']}
+                changed.append(comparison)
+        report = summary.to_dict()
+        report['elapsed_ms'] = round((time.perf_counter() - start) * 1000, 3)
+        report['shared'] = self.describe()
+        return {'summary': report, 'changed': changed}
+
+
+# ============================================================================
+# DIFFS
+# ============================================================================
+
+def diff_results(base: Dict[str, Any], other: Dict[str, Any]) -> Dict[str, Any]:
+    """What changes from `base` to `other` (two results for the same audit)"""
+    blocks = {b: [s, other['block_statuses'].get(b)] for b, s in base['block_statuses'].items()
+              if other['block_statuses'].get(b) != s}
+    base_recs = [r['id'] for r in base['selected_recommendations']]
+    other_recs = [r['id'] for r in other['selected_recommendations']]
+    base_cv = [c['rule_id'] for c in base['contradictions']]
+    other_cv = [c['rule_id'] for c in other['contradictions']]
+    diff = {
+        'overall_status': ([base['overall_status'], other['overall_status']]
+                           if base['overall_status'] != other['overall_status'] else None),
+        'block_statuses': blocks,
+        'confidence_delta': other['confidence_score'] - base['confidence_score'],
+        'recommendations_added': [r for r in other_recs if r not in base_recs],
+        'recommendations_removed': [r for r in base_recs if r not in other_recs],
+        'contradictions_added': [c for c in other_cv if c not in base_cv],
+        'contradictions_removed': [c for c in base_cv if c not in other_cv]
+    }
+    diff['changed'] = bool(diff['overall_status'] or blocks or diff['confidence_delta'] or
+                           diff['recommendations_added'] or diff['recommendations_removed'] or
+                           diff['contradictions_added'] or diff['contradictions_removed'])
+    return diff
+
+
+class ComparisonSummary:
+    """Running per-version counts of how outcomes differ from the baseline"""
+
+    def __init__(self, baseline: str, versions: Sequence[str]):
+        self.baseline = baseline
+        self.audits = 0
+        self.overall = {v: {} for v in [baseline, *versions]}
+        self.versions = {v: {
+            'changed': 0,
+            'overall_changed': 0,
+            'transitions': {},
+            'block_changes': {},
+            'confidence_delta_total': 0,
+            'recommendations_added': {},
+            'recommendations_removed': {},
+            'contradictions_added': {},
+            'contradictions_removed': {}
+        } for v in versions}
+
+    @staticmethod
+    def _count(counter: Dict[str, int], keys: Iterable[str]):
+        for key in keys:
+            counter[key] = counter.get(key, 0) + 1
+
+    def add(self, comparison: Dict[str, Any]):
+        self.audits += 1
+        for version, result in comparison['results'].items():
+            self._count(self.overall[version], [result['overall_status']])
+        for version, diff in comparison['diff'].items():
+            stats = self.versions[version]
+            stats['changed'] += diff['changed']
+            stats['confidence_delta_total'] += diff['confidence_delta']
+            if diff['overall_status']:
+                stats['overall_changed'] += 1
+                self._count(stats['transitions'], ['->'.join(diff['overall_status'])])
+            self._count(stats['block_changes'], diff['block_statuses'])
+            for field in ('recommendations_added', 'recommendations_removed',
+                          'contradictions_added', 'contradictions_removed'):
+                self._count(stats[field], diff[field])
+
+    def to_dict(self) -> Dict[str, Any]:
+        versions = {}
+        for version, stats in self.versions.items():
+            stats = dict(stats)
+            total = stats.pop('confidence_delta_total')
+            stats['mean_confidence_delta'] = round(total / self.audits, 3) if self.audits else 0.0
+            versions[version] = stats
+        return {
+            'audits': self.audits,
+            'baseline': self.baseline,
+            'overall_status': self.overall,
+            'versions': versions
+        }
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def _read_payloads(path: str):
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Compare scoring outcomes across ruleset versions')
+    parser.add_argument('directory', help='ruleset snapshot directory, e.g. config/rulesets')
+    parser.add_argument('versions', nargs='+', help='versions to compare; the first is the baseline')
+    parser.add_argument('--input', required=True, help='JSON lines file of webhook payloads')
+    parser.add_argument('--changed', action='store_true', help='also print the audits that changed')
+    args = parser.parse_args(argv)
+
+    store = RulesetStore(args.directory)
+    try:
+        comparison = RulesetComparison([store.load(v) for v in args.versions])
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    report = comparison.compare_batch(_read_payloads(args.input))
+    print(json.dumps(report if args.changed else report['summary'], indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,546 @@
+#!/usr/bin/env python3
+"""
+Hiring Execution & Talent Efficiency Audit
+Rulesets v1.0
+
+Versioned scoring rule snapshots: thresholds and penalties, critical
+questions, gate rules, cross-validation rules and recommendation triggers.
+
+A Ruleset is immutable once built, so scoring code reads it without locks.
+A RulesetRegistry holds the active snapshot; activating a new version
+builds the replacement off to the side and swaps one reference, so audits
+being scored keep the snapshot they started with and every result is
+stamped with exactly one version.
+
+Snapshots live in a directory as <version>.json, with an ACTIVE file
+naming the version workers should use:
+
+    config/rulesets/
+        2025.1.json
+        2025.2.json
+        ACTIVE              "2025.2"
+
+Usage:
+    python rulesets.py config/rulesets export       # write the built-in rules as a snapshot
+    python rulesets.py config/rulesets list
+    python rulesets.py config/rulesets activate 2025.2
+"""
+
+import argparse
+import hashlib
+import json
+import operator
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+from types import MappingProxyType
+from typing import Callable, Dict, List, Any, Optional
+
+
+ACTIVE_FILE = 'ACTIVE'
+
+VERSION_PATTERN = re.compile(r'^[A-Za-z0-9][A-Za-z0-9._-]{0,63}$')
+
+REQUIRED_CONFIG_KEYS = (
+    'GREEN_THRESHOLD', 'YELLOW_THRESHOLD', 'STATUS_SCORES', 'CONTRADICTION_PENALTY',
+    'GATE_FAILURE_PENALTY', 'DTC', 'CRITICAL_RED_BELOW', 'DISAGREEMENT_STDEV',
+    'DISAGREEMENT_BLOCK_SHARE'
+)
+
+SEVERITIES = ('force-red', 'hard', 'soft')
+
+NUMERIC_CONFIG_KEYS = (
+    'GREEN_THRESHOLD', 'YELLOW_THRESHOLD', 'CONTRADICTION_PENALTY', 'GATE_FAILURE_PENALTY',
+    'CRITICAL_RED_BELOW', 'DISAGREEMENT_STDEV', 'DISAGREEMENT_BLOCK_SHARE'
+)
+
+# Status -> number tables in the scoring config and the statuses each must cover
+STATUS_MAPS = {
+    'STATUS_SCORES': ('green', 'yellow', 'red', 'gray'),
+    'DTC': ('green', 'yellow', 'red')
+}
+
+OPERATORS = {
+    '>=': operator.ge, '<=': operator.le, '>': operator.gt,
+    '<': operator.lt, '==': operator.eq, '!=': operator.ne
+}
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_text(value) -> bool:
+    return isinstance(value, str) and bool(value)
+
+
+def _freeze(value):
+    """Read-only copy of nested JSON-style data"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def thaw(value):
+    """Plain dicts/lists again from a frozen section, for JSON"""
+    if isinstance(value, MappingProxyType):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(v) for v in value]
+    return value
+
+
+# ============================================================================
+# RECOMMENDATION TRIGGERS
+# ============================================================================
+
+# Triggers are data so they can be versioned with the rest of the rules. A
+# trigger fires when any of its clauses holds:
+#
+#     {"status": "block2", "in": ["red", "yellow"]}       block status
+#     {"score": "block1", "op": "<", "value": 1.5}        block average
+#     {"answer": "b3_q3", "op": "<=", "value": 1}         raw answer (-1 included)
+#     {"flag": "SLA Theatre"}                             cross-validation flag
+#
+# Missing statuses, scores and answers never match.
+
+def _compile_clause(clause) -> Callable:
+    if 'status' in clause:
+        block, allowed = clause['status'], frozenset(clause['in'])
+        return lambda st, sc, fl, r: st.get(block) in allowed
+    if 'flag' in clause:
+        flag = clause['flag']
+        return lambda st, sc, fl, r: flag in fl
+    for kind in ('score', 'answer'):
+        if kind in clause:
+            key, target = clause[kind], clause['value']
+            op = OPERATORS.get(clause.get('op'))
+            if op is None:
+                raise ValueError(f"Unknown operator {clause.get('op')!r} in {clause}")
+            if not isinstance(target, (int, float)) or isinstance(target, bool):
+                raise ValueError(f"Non-numeric value in {clause}")
+            if kind == 'score':
+                def check(st, sc, fl, r, key=key, op=op, target=target):
+                    value = sc.get(key)
+                    return value is not None and op(value, target)
+            else:
+                def check(st, sc, fl, r, key=key, op=op, target=target):
+                    value = r.get(key)
+                    return value is not None and op(value, target)
+            return check
+    raise ValueError(f"Unknown trigger clause {clause}")
+
+
+def compile_trigger(clauses) -> Callable:
+    """condition(statuses, scores, flags, responses) for a list of clauses"""
+    if not clauses:
+        raise ValueError("Trigger needs at least one clause")
+    checks = tuple(_compile_clause(c) for c in clauses)
+    if len(checks) == 1:
+        return checks[0]
+    return lambda st, sc, fl, r: any(check(st, sc, fl, r) for check in checks)
+
+
+# ============================================================================
+# RULESET SNAPSHOT
+# ============================================================================
+
+class Ruleset:
+    """
+    One immutable version of the scoring rules
+
+    Built with Ruleset.from_dict(), which validates the rules and compiles
+    everything the scorer needs per audit (status table, critical question
+    sets, trigger conditions) once per version.
+    """
+
+    __slots__ = ('version', 'digest', 'config', 'critical_questions', 'critical_sets',
+                 'cross_validation_rules', 'gate_rules', 'recommendation_triggers',
+                 'conditions', 'status_table', '_source')
+
+    def __init__(self, **fields):
+        for name, value in fields.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Ruleset snapshots are immutable; build a new version instead")
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Ruleset':
+        """
+        Validate and compile a snapshot
+
+        Raises:
+            ValueError: the snapshot is malformed; nothing is partially applied
+        """
+        # Imported here: scoring_engine builds its built-in snapshot with this module
+        from scoring_engine import build_status_table
+
+        if not isinstance(data, dict):
+            raise ValueError(f"Ruleset snapshot must be an object, got {type(data).__name__}")
+        version = data.get('version')
+        if not isinstance(version, str) or not VERSION_PATTERN.match(version):
+            raise ValueError(f"Invalid ruleset version: {version!r}")
+
+        config = data.get('scoring') or {}
+        if not isinstance(config, dict):
+            raise ValueError(f"Ruleset {version}: scoring config must be an object")
+        missing = [k for k in REQUIRED_CONFIG_KEYS if k not in config]
+        if missing:
+            raise ValueError(f"Ruleset {version}: scoring config missing {missing}")
+        for key in NUMERIC_CONFIG_KEYS:
+            if not _is_number(config[key]):
+                raise ValueError(f"Ruleset {version}: {key} must be a number, got {config[key]!r}")
+        for key, statuses in STATUS_MAPS.items():
+            table = config[key]
+            if not isinstance(table, dict) or not all(_is_number(table.get(s)) for s in statuses):
+                raise ValueError(f"Ruleset {version}: {key} needs a number for each of {list(statuses)}")
+        if not 0 <= config['YELLOW_THRESHOLD'] <= config['GREEN_THRESHOLD'] <= 3:
+            raise ValueError(f"Ruleset {version}: thresholds must satisfy 0 <= yellow <= green <= 3")
+
+        critical = data.get('critical_questions') or {}
+        if not isinstance(critical, dict):
+            raise ValueError(f"Ruleset {version}: critical_questions must be an object")
+        for block, questions in critical.items():
+            if not isinstance(questions, (list, tuple)) or not all(_is_text(q) for q in questions):
+                raise ValueError(f"Ruleset {version}: critical questions for {block} must be a list of ids")
+        critical = {b: list(qs) for b, qs in critical.items()}
+
+        rules = data.get('cross_validation_rules') or []
+        if not isinstance(rules, (list, tuple)) or not all(isinstance(rule, dict) for rule in rules):
+            raise ValueError(f"Ruleset {version}: cross_validation_rules must be a list of objects")
+        rules = list(rules)
+        seen = set()
+        for rule in rules:
+            if not _is_text(rule.get('id')):
+                raise ValueError(f"Ruleset {version}: cross-validation rule without an id: {rule}")
+            if rule.get('id') in seen:
+                raise ValueError(f"Ruleset {version}: duplicate cross-validation rule {rule.get('id')}")
+            seen.add(rule.get('id'))
+            if rule.get('severity') not in SEVERITIES:
+                raise ValueError(f"Ruleset {version}: rule {rule.get('id')} has severity {rule.get('severity')!r}")
+            for side in ('source', 'validator'):
+                clause = rule.get(side)
+                if not isinstance(clause, dict) or not _is_text(clause.get('question')):
+                    raise ValueError(f"Ruleset {version}: rule {rule.get('id')} {side} needs a question")
+                if clause.get('operator') not in OPERATORS:
+                    raise ValueError(f"Ruleset {version}: rule {rule.get('id')} {side} operator invalid")
+                if not _is_number(clause.get('value')):
+                    raise ValueError(f"Ruleset {version}: rule {rule.get('id')} {side} value must be a number")
+            for field in ('name', 'diagnosis'):
+                if not _is_text(rule.get(field)):
+                    raise ValueError(f"Ruleset {version}: rule {rule.get('id')} missing {field}")
+
+        gates = data.get('gate_rules') or []
+        if not isinstance(gates, (list, tuple)):
+            raise ValueError(f"Ruleset {version}: gate_rules must be a list")
+        gates = list(gates)
+        for gate in gates:
+            if not isinstance(gate, dict) or not _is_text(gate.get('block')) or not _is_text(gate.get('gate')):
+                raise ValueError(f"Ruleset {version}: gate rule needs 'gate' and 'block': {gate}")
+
+        triggers = data.get('recommendation_triggers') or {}
+        if not isinstance(triggers, dict):
+            raise ValueError(f"Ruleset {version}: recommendation_triggers must be an object")
+        triggers = dict(triggers)
+        conditions = {}
+        for rec_id, trigger in triggers.items():
+            if not isinstance(trigger, dict) or not trigger.get('risk_name') or \
+                    not isinstance(trigger.get('priority'), int):
+                raise ValueError(f"Ruleset {version}: trigger {rec_id} needs risk_name and priority")
+            try:
+                conditions[rec_id] = compile_trigger(trigger.get('when'))
+            except (KeyError, TypeError, ValueError) as e:
+                raise ValueError(f"Ruleset {version}: trigger {rec_id}: {e}")
+
+        source = {
+            'version': version,
+            'scoring': config,
+            'critical_questions': critical,
+            'cross_validation_rules': rules,
+            'gate_rules': gates,
+            'recommendation_triggers': triggers
+        }
+        frozen = _freeze(source)
+        canonical = json.dumps({k: v for k, v in source.items() if k != 'version'},
+                               sort_keys=True, separators=(',', ':'))
+        return cls(
+            version=version,
+            digest=hashlib.sha256(canonical.encode('utf-8')).hexdigest(),
+            config=frozen['scoring'],
+            critical_questions=frozen['critical_questions'],
+            critical_sets=MappingProxyType({b: frozenset(qs) for b, qs in critical.items()}),
+            cross_validation_rules=frozen['cross_validation_rules'],
+            gate_rules=frozen['gate_rules'],
+            recommendation_triggers=frozen['recommendation_triggers'],
+            conditions=MappingProxyType(conditions),
+            status_table=build_status_table(config),
+            _source=frozen
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return thaw(self._source)
+
+    def replace(self, version: str, **changes) -> 'Ruleset':
+        """New snapshot with some top-level sections replaced (copy-on-write)"""
+        data = self.to_dict()
+        for section, value in changes.items():
+            if section not in data or section == 'version':
+                raise ValueError(f"Unknown ruleset section: {section}")
+            if isinstance(value, dict) and isinstance(data[section], dict):
+                data[section] = dict(data[section], **value)
+            else:
+                data[section] = value
+        data['version'] = version
+        return Ruleset.from_dict(data)
+
+    def __repr__(self):
+        return f"<Ruleset {self.version} {self.digest[:12]}>"
+
+
+# ============================================================================
+# SNAPSHOT DIRECTORY
+# ============================================================================
+
+def _atomic_write(path: str, text: str):
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or '.', prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+class RulesetStore:
+    """A directory of <version>.json snapshots plus the ACTIVE pointer"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._cache = {}   # version -> (mtime_ns, Ruleset); snapshots never change in place
+
+    def _path(self, version: str) -> str:
+        if not VERSION_PATTERN.match(version or ''):
+            raise ValueError(f"Invalid ruleset version: {version!r}")
+        return os.path.join(self.directory, f'{version}.json')
+
+    def versions(self) -> List[str]:
+        if not os.path.isdir(self.directory):
+            return []
+        return sorted(name[:-5] for name in os.listdir(self.directory)
+                      if name.endswith('.json') and not name.startswith('.'))
+
+    def load(self, version: str) -> Ruleset:
+        """
+        Raises:
+            ValueError: unknown version, unreadable JSON or invalid rules
+        """
+        path = self._path(version)
+        try:
+            mtime = os.stat(path).st_mtime_ns
+            cached = self._cache.get(version)
+            if cached and cached[0] == mtime:
+                return cached[1]
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            raise ValueError(f"Unknown ruleset version: {version}")
+        except (OSError, json.JSONDecodeError) as e:
+            raise ValueError(f"Unreadable ruleset {version}: {e}")
+        ruleset = Ruleset.from_dict(data)
+        if ruleset.version != version:
+            raise ValueError(f"{path} declares version {ruleset.version}")
+        self._cache[version] = (mtime, ruleset)
+        return ruleset
+
+    def save(self, ruleset: Ruleset) -> str:
+        """
+        Write a snapshot; a published version is never rewritten with other rules
+
+        Raises:
+            ValueError: the version already exists with different rules
+        """
+        path = self._path(ruleset.version)
+        if os.path.exists(path) and self.load(ruleset.version).digest != ruleset.digest:
+            raise ValueError(f"Ruleset {ruleset.version} already exists with different rules")
+        os.makedirs(self.directory, exist_ok=True)
+        _atomic_write(path, json.dumps(ruleset.to_dict(), indent=2) + '\n')
+        return path
+
+    def active_version(self) -> Optional[str]:
+        try:
+            with open(os.path.join(self.directory, ACTIVE_FILE), encoding='utf-8') as f:
+                return f.read().strip() or None
+        except FileNotFoundError:
+            return None
+
+    def activate(self, version: str):
+        """Point ACTIVE at `version`; workers polling the store pick it up"""
+        self.load(version)
+        _atomic_write(os.path.join(self.directory, ACTIVE_FILE), version + '\n')
+
+
+# ============================================================================
+# ACTIVE SNAPSHOT
+# ============================================================================
+
+class RulesetRegistry:
+    """
+    Holds the ruleset workers score with
+
+    current() is a plain attribute read. Writers (swap, reload) serialize on
+    a lock, build the new snapshot first and then replace the reference, so
+    readers see either the old or the new version, never a mix. Every
+    snapshot that has been active stays reachable through get(), so results
+    scored before a swap can still be explained with their own rules.
+    """
+
+    def __init__(self, default: Ruleset, store: RulesetStore = None, poll_interval: float = 5.0):
+        self.default = default
+        self._current = default
+        self._lock = threading.Lock()
+        self.store = None
+        self.poll_interval = poll_interval
+        self._next_poll = float('inf')
+        self.swaps = 0
+        self.last_error = None
+        self._activated = {default.version: default}   # version -> snapshot that was active
+        if store is not None:
+            self.attach(store, poll_interval)
+
+    def current(self) -> Ruleset:
+        """The active snapshot; polls the attached store at most every poll_interval"""
+        if time.monotonic() >= self._next_poll:
+            self._poll()
+        return self._current
+
+    def get(self, version: str) -> Ruleset:
+        """
+        Snapshot for a version stamped on a result
+
+        Raises:
+            ValueError: the version was never active here and the attached
+                        store (if any) does not have it
+        """
+        ruleset = self._current
+        if ruleset.version == version:
+            return ruleset
+        ruleset = self._activated.get(version)
+        if ruleset is not None:
+            return ruleset
+        store = self.store
+        if store is None:
+            raise ValueError(f"Unknown ruleset version: {version}")
+        return store.load(version)
+
+    def _poll(self):
+        # One worker thread reloads; the rest keep reading the current snapshot
+        if self._lock.acquire(blocking=False):
+            try:
+                self._next_poll = time.monotonic() + self.poll_interval
+                self._reload_locked()
+            finally:
+                self._lock.release()
+
+    def swap(self, ruleset: Ruleset) -> Ruleset:
+        """Activate `ruleset` in this process; returns the previous snapshot"""
+        with self._lock:
+            previous, self._current = self._current, ruleset
+            self._activated[ruleset.version] = ruleset
+            self.swaps += previous is not ruleset
+            return previous
+
+    def attach(self, store: RulesetStore, poll_interval: float = None):
+        """Follow the store's ACTIVE version from now on"""
+        with self._lock:
+            self.store = store
+            if poll_interval is not None:
+                self.poll_interval = poll_interval
+            self._next_poll = time.monotonic() + self.poll_interval
+            self._reload_locked()
+
+    def detach(self):
+        """Stop following the store; the current snapshot stays active"""
+        with self._lock:
+            self.store = None
+            self._next_poll = float('inf')
+
+    def reload(self) -> bool:
+        """Check the store now; True if a different version was swapped in"""
+        with self._lock:
+            return self._reload_locked()
+
+    def _reload_locked(self) -> bool:
+        if self.store is None:
+            return False
+        version = self.store.active_version()
+        if version is None or version == self._current.version:
+            return False
+        try:
+            ruleset = self.store.load(version)
+        except Exception as e:
+            # A bad snapshot never replaces a working one, whatever it breaks while building
+            self.last_error = str(e) if isinstance(e, ValueError) else f'{type(e).__name__}: {e}'
+            return False
+        self._current = ruleset
+        self._activated[ruleset.version] = ruleset
+        self.swaps += 1
+        self.last_error = None
+        return True
+
+    def status(self) -> Dict[str, Any]:
+        ruleset = self._current
+        return {
+            'version': ruleset.version,
+            'digest': ruleset.digest,
+            'store': self.store.directory if self.store else None,
+            'swaps': self.swaps,
+            'last_error': self.last_error
+        }
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Manage versioned scoring rulesets')
+    parser.add_argument('directory', help='snapshot directory, e.g. config/rulesets')
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('list', help='list versions and the active one')
+    export = sub.add_parser('export', help='write the built-in rules as a snapshot')
+    export.add_argument('--version', help='version to publish them as')
+    activate = sub.add_parser('activate', help='make a version active')
+    activate.add_argument('version')
+    args = parser.parse_args(argv)
+
+    store = RulesetStore(args.directory)
+    try:
+        if args.command == 'list':
+            active = store.active_version()
+            for version in store.versions():
+                print(f"{'*' if version == active else ' '} {version}  {store.load(version).digest[:12]}")
+        elif args.command == 'export':
+            from scoring_engine import BUILTIN_RULESET
+            ruleset = BUILTIN_RULESET
+            if args.version:
+                ruleset = Ruleset.from_dict(dict(ruleset.to_dict(), version=args.version))
+            print(store.save(ruleset))
+        elif args.command == 'activate':
+            store.activate(args.version)
+            print(f"active: {args.version}")
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,718 @@
+#!/usr/bin/env python3
+"""
+Hiring Execution & Talent Efficiency Audit
+Scoring Engine v1.0 (Python)
+
+Python port of automation/scoring_engine.js. Each function maps to one of the
+n8n Code nodes so the same stages can run in-process.
+"""
+
+import math
+from datetime import datetime
+from typing import Dict, List, Any, Tuple, Iterable
+
+from auto_flags import evaluate_auto_flags
+from rulesets import Ruleset, RulesetRegistry
+
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+SCORING_CONFIG = {
+    # Thresholds
+    'GREEN_THRESHOLD': 2.3,
+    'YELLOW_THRESHOLD': 1.5,
+
+    # Score weights for confidence calculation
+    'STATUS_SCORES': {'green': 90, 'yellow': 60, 'red': 30, 'gray': 50},
+
+    # Deductions
+    'CONTRADICTION_PENALTY': 3,
+    'GATE_FAILURE_PENALTY': 5,
+
+    # Data Trust Coefficient
+    'DTC': {'green': 1.0, 'yellow': 0.85, 'red': 0.7},
+
+    # A critical question is RED when its (mean) score rounds to 0
+    'CRITICAL_RED_BELOW': 0.5,
+
+    # Multi-respondent disagreement: per-question std dev on the 0-3 scale,
+    # and the share of a block's questions that must disagree to flag it
+    'DISAGREEMENT_STDEV': 1.0,
+    'DISAGREEMENT_BLOCK_SHARE': 0.34
+}
+
+# Critical questions that force RED if score = 0
+CRITICAL_QUESTIONS = {
+    'block1': ['b1_q3', 'b1_q4', 'b1_q7'],
+    'block2': ['b2_q3', 'b2_q5', 'b2_q6'],
+    'block3': ['b3_q2', 'b3_q3'],
+    'block4': ['b4_q1', 'b4_q2', 'b4_q4'],
+    'block5': ['b5_q1', 'b5_q2'],
+    'block6': ['b6_q5', 'b6_q8'],
+    'block7': ['b7_q1', 'b7_q2']
+}
+
+# Cross-validation rules
+CROSS_VALIDATION_RULES = [
+    {'id': 'CV-01', 'name': 'Ownerless Hiring in Practice',
+     'source': {'question': 'b1_q3', 'operator': '>=', 'value': 2},
+     'validator': {'question': 'b6_q2', 'operator': '<=', 'value': 1},
+     'severity': 'force-red', 'diagnosis': 'Nominal ownership without mandate'},
+    {'id': 'CV-02', 'name': 'Planning Illusion',
+     'source': {'question': 'b1_q1', 'operator': '>=', 'value': 2},
+     'validator': {'question': 'b2_q5', 'operator': '<=', 'value': 1},
+     'severity': 'hard', 'diagnosis': 'Planning without capacity math'},
+    {'id': 'CV-03', 'name': 'Cadence Claimed Not Lived',
+     'source': {'question': 'b1_q7', 'operator': '>=', 'value': 2},
+     'validator': {'question': 'b3_q4', 'operator': '<=', 'value': 1},
+     'severity': 'hard', 'diagnosis': 'Prioritization cadence exists on paper only'},
+    {'id': 'CV-04', 'name': 'Visibility Illusion',
+     'source': {'question': 'b1_q5', 'operator': '>=', 'value': 2},
+     'validator': {'question': 'b7_q1', 'operator': '<=', 'value': 1},
+     'severity': 'hard', 'diagnosis': 'Dashboard fantasy - no reliable reporting'},
+    {'id': 'CV-05', 'name': 'SLA Theatre',
+     'source': {'question': 'b2_q3', 'operator': '>=', 'value': 2},
+     'validator': {'question': 'b6_q5', 'operator': '<=', 'value': 1},
+     'severity': 'force-red', 'diagnosis': 'SLA exists on paper only'},
+    {'id': 'CV-06', 'name': 'Capacity Denial',
+     'source': {'question': 'b2_q5', 'operator': '>=', 'value': 2},
+     'validator': {'question': 'b6_q8', 'operator': '<=', 'value': 1},
+     'severity': 'hard', 'diagnosis': 'Operational overload hidden'},
+    {'id': 'CV-07', 'name': 'Quality Misalignment',
+     'source': {'question': 'b2_q4', 'operator': '>=', 'value': 2},
+     'validator': {'question': 'b3_q1', 'operator': '<=', 'value': 1},
+     'severity': 'soft', 'diagnosis': 'TA and Delivery disagree on quality'},
+    {'id': 'CV-08', 'name': 'Interview Bottleneck Masked',
+     'source': {'question': 'b3_q2', 'operator': '>=', 'value': 2},
+     'validator': {'question': 'b5_q2', 'operator': '<=', 'value': 1},
+     'severity': 'force-red', 'diagnosis': 'Delivery denial on interviews'},
+    {'id': 'CV-09', 'name': 'Feedback Latency Hidden',
+     'source': {'question': 'b3_q3', 'operator': '>=', 'value': 2},
+     'validator': {'question': 'b6_q7', 'operator': '<=', 'value': 1},
+     'severity': 'hard', 'diagnosis': 'Feedback delays not visible'},
+    {'id': 'CV-11', 'name': 'Unfounded Budget',
+     'source': {'question': 'b4_q2', 'operator': '>=', 'value': 2},
+     'validator': {'question': 'b2_q5', 'operator': '<=', 'value': 1},
+     'severity': 'hard', 'diagnosis': 'Budget without formula'},
+    {'id': 'CV-15', 'name': 'Rubric Theatre',
+     'source': {'question': 'b5_q3', 'operator': '>=', 'value': 2},
+     'validator': {'question': 'b3_q4', 'operator': '<=', 'value': 1},
+     'severity': 'hard', 'diagnosis': 'Evaluation criteria exist but not used'},
+    {'id': 'CV-17', 'name': 'Evaluation Governance Broken',
+     'source': {'question': 'b5_q2', 'operator': '>=', 'value': 2},
+     'validator': {'question': 'b6_q7', 'operator': '<=', 'value': 1},
+     'severity': 'force-red', 'diagnosis': 'No accountability, no SLA'},
+    {'id': 'CV-20', 'name': 'Bottleneck Denial',
+     'source': {'question': 'b1_q6', 'operator': '<=', 'value': 1},
+     'validator': {'question': 'b6_q7', 'operator': '<=', 'value': 1},
+     'severity': 'hard', 'diagnosis': 'Executive blind to operational reality'},
+]
+
+# Recommendation triggers: fire when any clause holds (see rulesets.compile_trigger)
+RECOMMENDATION_TRIGGERS = {
+    'B1-R01': {'risk_name': 'Ownerless Hiring', 'priority': 1,
+               'when': [{'status': 'block1', 'in': ['red']},
+                        {'score': 'block1', 'op': '<', 'value': 1.5}]},
+    'B1-R04': {'risk_name': 'Political Prioritization', 'priority': 2,
+               'when': [{'answer': 'b1_q8', 'op': '==', 'value': 1}]},
+    'B2-R02': {'risk_name': 'SLA Theatre', 'priority': 1,
+               'when': [{'flag': 'SLA Theatre'}]},
+    'B2-R03': {'risk_name': 'Capacity Blindness', 'priority': 2,
+               'when': [{'status': 'block2', 'in': ['red', 'yellow']}]},
+    'B3-R01': {'risk_name': 'Interview Bottleneck', 'priority': 1,
+               'when': [{'status': 'block3', 'in': ['red']}]},
+    'B3-R02': {'risk_name': 'Feedback Latency', 'priority': 2,
+               'when': [{'answer': 'b3_q3', 'op': '<=', 'value': 1}]},
+    'B4-R01': {'risk_name': 'Financial Opacity', 'priority': 1,
+               'when': [{'status': 'block4', 'in': ['red']}]},
+    'B5-R01': {'risk_name': 'Evaluation Collapse', 'priority': 1,
+               'when': [{'status': 'block5', 'in': ['red']}]},
+    'B6-R01': {'risk_name': 'Operational Fragility', 'priority': 1,
+               'when': [{'status': 'block6', 'in': ['red']}]},
+    'B6-R03': {'risk_name': 'Key-Person Failure', 'priority': 1,
+               'when': [{'answer': 'b6_q4', 'op': '==', 'value': 0}]},
+    'B7-R01': {'risk_name': 'Systemic Visibility Failure', 'priority': 2,
+               'when': [{'status': 'block7', 'in': ['red']}]},
+    'B7-R02': {'risk_name': 'Shadow AI', 'priority': 2,
+               'when': [{'answer': 'b7_q3', 'op': '==', 'value': -1},
+                        {'answer': 'b7_q6', 'op': '<=', 'value': 1}]},
+}
+
+GATE_RULES = [
+    {'gate': 'GATE_0', 'block': 'block1', 'name': 'Ownerless Hiring',
+     'description': 'Executive ownership absent - overall system compromised',
+     'impact': 'System-wide instability'},
+    {'gate': 'GATE_1', 'block': 'block2', 'name': 'Ungoverned TA',
+     'description': 'TA Leadership governance broken - execution will fail',
+     'impact': 'Hiring execution failure'},
+    {'gate': 'GATE_1', 'block': 'block4', 'name': 'Financial Opacity',
+     'description': 'Financial governance broken - costs uncontrolled',
+     'impact': 'Budget overruns, no predictability'},
+    {'gate': 'EXECUTION', 'block': 'block3', 'name': 'Interview Bottleneck',
+     'description': 'Interview Bottleneck detected - execution at risk',
+     'impact': 'Candidates lost to slow process'},
+    {'gate': 'EXECUTION', 'block': 'block5', 'name': 'Evaluation Collapse',
+     'description': 'Evaluation Collapse detected - execution at risk',
+     'impact': 'False negatives, quality issues'},
+    {'gate': 'EXECUTION', 'block': 'block6', 'name': 'Operational Fragility',
+     'description': 'Operational Fragility detected - execution at risk',
+     'impact': 'Hero-based execution, key-person risk'},
+]
+
+
+# ============================================================================
+# CORE SCORING FUNCTIONS
+# ============================================================================
+
+def block_id_for(question_id: str):
+    """Return the block id for a question id like 'b3_q2', or None"""
+    if len(question_id) > 2 and question_id[0] == 'b' and question_id[1].isdigit() and question_id[2] == '_':
+        return f'block{question_id[1]}'
+    return None
+
+
+def calculate_block_scores(responses: Dict[str, int], ruleset: Ruleset = None) -> Tuple[Dict, Dict, Dict]:
+    """Calculate block scores and statuses from raw responses"""
+    ruleset = ruleset or current_ruleset()
+    block_scores = {}
+    block_statuses = {}
+    block_details = {}
+
+    # Group responses by block
+    block_responses = {}
+    for question_id, score in responses.items():
+        block_id = block_id_for(question_id)
+        if block_id:
+            block_responses.setdefault(block_id, {})[question_id] = score
+
+    for block_id, block_data in block_responses.items():
+        # Filter out "not relevant" (-1) responses
+        valid_scores = [v for v in block_data.values() if v is not None and v != -1]
+
+        if not valid_scores:
+            block_statuses[block_id] = 'gray'
+            block_scores[block_id] = None
+            block_details[block_id] = {'status': 'incomplete', 'question_count': 0}
+            continue
+
+        total = sum(valid_scores)
+        avg = total / len(valid_scores)
+        block_scores[block_id] = round(avg, 2)
+
+        criticals = ruleset.critical_questions.get(block_id, ())
+        critical_hits = [q for q in criticals if is_critical_red(block_data.get(q), ruleset.config)]
+
+        block_statuses[block_id] = block_status(total, len(valid_scores), bool(critical_hits), ruleset)
+        block_details[block_id] = {
+            'average': avg,
+            'question_count': len(valid_scores),
+            'total_questions': len(block_data),
+            'has_critical_red': bool(critical_hits),
+            'critical_questions': critical_hits
+        }
+
+    return block_scores, block_statuses, block_details
+
+
+def is_critical_red(value, config: Dict[str, Any] = SCORING_CONFIG) -> bool:
+    """Whether a critical question's answer forces its block red"""
+    return value is not None and value != -1 and value < config['CRITICAL_RED_BELOW']
+
+
+def status_for(avg: float, has_critical_red: bool, config: Dict[str, Any] = SCORING_CONFIG) -> str:
+    """Map a block average to a RAG status"""
+    if has_critical_red or avg < config['YELLOW_THRESHOLD']:
+        return 'red'
+    if avg < config['GREEN_THRESHOLD']:
+        return 'yellow'
+    return 'green'
+
+
+# ============================================================================
+# BLOCK STATUS LOOKUP TABLE
+# ============================================================================
+
+# With integer answers a block's status depends only on (answer sum, answered
+# count, critical red), so every combination is precomputed once. Blocks have
+# at most 12 questions today; aggregated (fractional) answers fall back to
+# status_for().
+STATUS_CODES = ('gray', 'red', 'yellow', 'green')
+MAX_BLOCK_QUESTIONS = 16
+STATUS_TABLE_MAX_TOTAL = 3 * MAX_BLOCK_QUESTIONS
+
+
+def pack_block_key(total: int, count: int, has_critical_red: bool) -> int:
+    """Table index for a block's (answer sum, answered count, critical red)"""
+    return ((total * (MAX_BLOCK_QUESTIONS + 1) + count) << 1) | has_critical_red
+
+
+def build_status_table(config: Dict[str, Any] = SCORING_CONFIG) -> bytes:
+    """One status code (index into STATUS_CODES) per packed block key"""
+    table = bytearray(pack_block_key(STATUS_TABLE_MAX_TOTAL, MAX_BLOCK_QUESTIONS, True) + 1)
+    for total in range(STATUS_TABLE_MAX_TOTAL + 1):
+        for count in range(1, MAX_BLOCK_QUESTIONS + 1):
+            for critical in (False, True):
+                status = status_for(total / count, critical, config)
+                table[pack_block_key(total, count, critical)] = STATUS_CODES.index(status)
+    return bytes(table)
+
+
+STATUS_TABLE = build_status_table()
+
+
+# ============================================================================
+# RULESETS
+# ============================================================================
+
+# The rules above as a snapshot; workers score with RULESETS.current(), which
+# a versioned snapshot directory can replace without a restart:
+#     RULESETS.attach(RulesetStore('config/rulesets'))
+BUILTIN_RULESET = Ruleset.from_dict({
+    'version': 'builtin-1.0',
+    'scoring': SCORING_CONFIG,
+    'critical_questions': CRITICAL_QUESTIONS,
+    'cross_validation_rules': CROSS_VALIDATION_RULES,
+    'gate_rules': GATE_RULES,
+    'recommendation_triggers': RECOMMENDATION_TRIGGERS
+})
+
+RULESETS = RulesetRegistry(BUILTIN_RULESET)
+
+
+def current_ruleset() -> Ruleset:
+    """Snapshot to score the next audit with; hold on to it for the whole audit"""
+    return RULESETS.current()
+
+
+def ruleset_for(version: str = None) -> Ruleset:
+    """
+    Snapshot a result was scored with, by its ruleset_version stamp (the
+    active one for unstamped results)
+
+    Raises:
+        ValueError: the version is not known to RULESETS or its store
+    """
+    return RULESETS.get(version) if version else current_ruleset()
+
+
+def block_status(total, count: int, has_critical_red: bool, ruleset: Ruleset = None) -> str:
+    """Block status from the sum of its answered (non -1) scores"""
+    ruleset = ruleset or current_ruleset()
+    if type(total) is int and 0 <= total <= STATUS_TABLE_MAX_TOTAL and 0 < count <= MAX_BLOCK_QUESTIONS:
+        return STATUS_CODES[ruleset.status_table[pack_block_key(total, count, has_critical_red)]]
+    return status_for(total / count, has_critical_red, ruleset.config)
+
+
+def apply_gate_rules(block_statuses: Dict[str, str], ruleset: Ruleset = None) -> Tuple[List, str]:
+    """Apply gate rules to determine overall status"""
+    gate_failures = []
+    overall_status = 'green'
+
+    for rule in (ruleset or current_ruleset()).gate_rules:
+        if block_statuses.get(rule['block']) == 'red':
+            gate_failures.append(dict(rule))
+            overall_status = 'red'
+
+    # If no RED, check for multiple YELLOWs
+    if overall_status != 'red':
+        yellow_count = sum(1 for s in block_statuses.values() if s == 'yellow')
+        if yellow_count >= 2:
+            overall_status = 'yellow'
+
+    # Block 1 YELLOW amplification
+    if block_statuses.get('block1') == 'yellow' and overall_status == 'green':
+        other_yellows = sum(1 for k, v in block_statuses.items() if k != 'block1' and v == 'yellow')
+        if other_yellows >= 1:
+            overall_status = 'yellow'
+
+    return gate_failures, overall_status
+
+
+def evaluate_condition(value, operator: str, target) -> bool:
+    """Evaluate a single comparison"""
+    if operator == '>=':
+        return value >= target
+    if operator == '<=':
+        return value <= target
+    if operator == '>':
+        return value > target
+    if operator == '<':
+        return value < target
+    if operator == '==':
+        return value == target
+    if operator == '!=':
+        return value != target
+    return False
+
+
+def check_cross_validation_rule(rule: Dict[str, Any], responses: Dict[str, int]):
+    """The contradiction a single CV rule reports for `responses`, or None"""
+    source_value = responses.get(rule['source']['question'])
+    validator_value = responses.get(rule['validator']['question'])
+
+    # Skip missing and "not relevant" responses
+    if source_value is None or validator_value is None:
+        return None
+    if source_value == -1 or validator_value == -1:
+        return None
+
+    source = rule['source']
+    validator = rule['validator']
+    if not (evaluate_condition(source_value, source['operator'], source['value']) and
+            evaluate_condition(validator_value, validator['operator'], validator['value'])):
+        return None
+    return {
+        'rule_id': rule['id'],
+        'name': rule['name'],
+        'severity': rule['severity'],
+        'diagnosis': rule['diagnosis'],
+        'source': {
+            'question': source['question'],
+            'value': source_value,
+            'expected': f"{source['operator']} {source['value']}"
+        },
+        'validator': {
+            'question': validator['question'],
+            'value': validator_value,
+            'expected': f"{validator['operator']} {validator['value']}"
+        }
+    }
+
+
+def run_cross_validation(responses: Dict[str, int], ruleset: Ruleset = None) -> Tuple[List, List]:
+    """Run cross-validation checks"""
+    contradictions = []
+    flags = []
+
+    for rule in (ruleset or current_ruleset()).cross_validation_rules:
+        contradiction = check_cross_validation_rule(rule, responses)
+        if contradiction:
+            contradictions.append(contradiction)
+            flags.append(rule['name'])
+
+    return contradictions, flags
+
+
+def apply_contradiction_escalation(current_status: str, contradictions: List) -> str:
+    """Update overall status based on contradictions"""
+    if any(c['severity'] == 'force-red' for c in contradictions):
+        return 'red'
+
+    # Multiple hard contradictions escalate yellow to red
+    hard_count = sum(1 for c in contradictions if c['severity'] == 'hard')
+    if hard_count >= 2 and current_status == 'yellow':
+        return 'red'
+
+    # Multiple soft contradictions escalate green to yellow
+    soft_count = sum(1 for c in contradictions if c['severity'] == 'soft')
+    if soft_count >= 3 and current_status == 'green':
+        return 'yellow'
+
+    return current_status
+
+
+def calculate_dtc(block7_status, ruleset: Ruleset = None) -> float:
+    """Calculate Data Trust Coefficient based on Block 7"""
+    return (ruleset or current_ruleset()).config['DTC'].get(block7_status, 1.0)
+
+
+def calculate_confidence_score(block_statuses: Dict, gate_failures: List,
+                               contradictions: List, dtc: float, ruleset: Ruleset = None) -> int:
+    """Calculate confidence score (0-100)"""
+    config = (ruleset or current_ruleset()).config
+    score_map = config['STATUS_SCORES']
+    scores = [score_map.get(s, 50) for s in block_statuses.values()]
+
+    confidence = sum(scores) / len(scores) if scores else 50
+    confidence -= len(contradictions) * config['CONTRADICTION_PENALTY']
+    confidence -= len(gate_failures) * config['GATE_FAILURE_PENALTY']
+    confidence *= dtc
+
+    # Math.round semantics (half up) to match scoring_engine.js
+    return max(0, min(100, math.floor(confidence + 0.5)))
+
+
+def select_recommendations(block_statuses: Dict, block_scores: Dict,
+                           flags: List, responses: Dict, ruleset: Ruleset = None) -> List[Dict]:
+    """Select applicable recommendations, sorted by priority"""
+    ruleset = ruleset or current_ruleset()
+    selected = []
+
+    for rec_id, trigger in ruleset.recommendation_triggers.items():
+        try:
+            if ruleset.conditions[rec_id](block_statuses, block_scores, flags, responses):
+                selected.append({
+                    'id': rec_id,
+                    'name': trigger['risk_name'],
+                    'priority': trigger['priority']
+                })
+        except (TypeError, KeyError):
+            # Skip if condition evaluation fails
+            continue
+
+    selected.sort(key=lambda r: r['priority'])
+    return selected
+
+
+def build_summary(overall_status: str, confidence_score: int, block_statuses: Dict,
+                  gate_failures: List, contradictions: List,
+                  recommendations: List, dtc: float) -> Dict:
+    """Build the summary block returned with every scoring result"""
+    return {
+        'overall_status': overall_status,
+        'confidence_score': confidence_score,
+        'red_blocks': [k for k, v in block_statuses.items() if v == 'red'],
+        'yellow_blocks': [k for k, v in block_statuses.items() if v == 'yellow'],
+        'green_blocks': [k for k, v in block_statuses.items() if v == 'green'],
+        'gate_failure_count': len(gate_failures),
+        'contradiction_count': len(contradictions),
+        'recommendation_count': len(recommendations),
+        'dtc': dtc
+    }
+
+
+# ============================================================================
+# MULTI-RESPONDENT AGGREGATION
+# ============================================================================
+
+class QuestionStats:
+    """Running statistics for one question (Welford's algorithm, O(1) memory)"""
+
+    __slots__ = ('count', 'mean', 'm2', 'min', 'max', 'skipped')
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = None
+        self.max = None
+        self.skipped = 0
+
+    def add(self, value):
+        if value is None:
+            return
+        if value == -1:
+            self.skipped += 1
+            return
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / self.count if self.count > 1 else 0.0
+
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self.variance)
+
+    @property
+    def value(self):
+        """Aggregated answer: the mean, or -1 if every respondent skipped"""
+        if self.count:
+            return self.mean
+        return -1 if self.skipped else None
+
+    def is_disagreement(self, min_stdev: float = SCORING_CONFIG['DISAGREEMENT_STDEV']) -> bool:
+        return self.count > 1 and self.stdev >= min_stdev
+
+    def to_dict(self, min_stdev: float = SCORING_CONFIG['DISAGREEMENT_STDEV']) -> Dict[str, Any]:
+        return {
+            'count': self.count,
+            'mean': round(self.mean, 3),
+            'variance': round(self.variance, 3),
+            'stdev': round(self.stdev, 3),
+            'min': self.min,
+            'max': self.max,
+            'skipped': self.skipped,
+            'disagreement': self.is_disagreement(min_stdev)
+        }
+
+
+class RespondentAggregator:
+    """
+    Streams respondent-tagged answers into per-question statistics
+
+    Only one QuestionStats per question is kept, so memory does not grow with
+    the number of respondents.
+    """
+
+    def __init__(self, config: Dict[str, Any] = SCORING_CONFIG):
+        self.config = config
+        self.questions = {}
+        self.respondent_count = 0
+        self.roles = {}
+
+    def add_answer(self, question_id: str, score):
+        stats = self.questions.get(question_id)
+        if stats is None:
+            stats = self.questions[question_id] = QuestionStats()
+        stats.add(score)
+
+    def add_respondent(self, respondent: Dict[str, Any]):
+        """Add one respondent: {'respondent_id', 'role', 'responses': {question_id: score}}"""
+        self.respondent_count += 1
+        role = respondent.get('role')
+        if role:
+            self.roles[role] = self.roles.get(role, 0) + 1
+        for question_id, score in (respondent.get('responses') or {}).items():
+            self.add_answer(question_id, score)
+
+    def consume(self, respondents: Iterable[Dict[str, Any]]):
+        for respondent in respondents:
+            self.add_respondent(respondent)
+        return self
+
+    def responses(self) -> Dict[str, float]:
+        """Aggregated {question_id: mean score} for the block/CV scorers"""
+        out = {}
+        for question_id, stats in self.questions.items():
+            value = stats.value
+            if value is not None:
+                out[question_id] = value
+        return out
+
+    def disagreement_contradictions(self, config: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+        """Soft contradictions for blocks where respondents disagree on many questions"""
+        config = config or self.config
+        per_block = {}
+        for question_id, stats in self.questions.items():
+            block_id = block_id_for(question_id)
+            if block_id and stats.count:
+                answered, disputed = per_block.get(block_id, (0, []))
+                if stats.is_disagreement(config['DISAGREEMENT_STDEV']):
+                    disputed = disputed + [question_id]
+                per_block[block_id] = (answered + 1, disputed)
+
+        contradictions = []
+        for block_id in sorted(per_block):
+            answered, disputed = per_block[block_id]
+            if disputed and len(disputed) / answered >= config['DISAGREEMENT_BLOCK_SHARE']:
+                contradictions.append({
+                    'rule_id': f'DIS-{block_id}',
+                    'name': 'Respondent Disagreement',
+                    'severity': 'soft',
+                    'diagnosis': f'Respondents disagree on {len(disputed)} of {answered} questions',
+                    'block': block_id,
+                    'questions': sorted(disputed)
+                })
+        return contradictions
+
+    def summary(self, config: Dict[str, Any] = None) -> Dict[str, Any]:
+        config = config or self.config
+        return {
+            'respondent_count': self.respondent_count,
+            'roles': dict(self.roles),
+            'questions': {q: s.to_dict(config['DISAGREEMENT_STDEV'])
+                          for q, s in sorted(self.questions.items())}
+        }
+
+
+def resolve_responses(payload: Dict[str, Any], ruleset: Ruleset = None):
+    """
+    Return (responses, aggregator) for a payload
+
+    Flat payloads carry {question_id: score} in 'responses'. Multi-respondent
+    payloads carry an iterable of respondent records in 'respondents', which
+    is consumed once without materializing the rows.
+    """
+    respondents = payload.get('respondents')
+    if respondents is None:
+        return payload.get('responses') or {}, None
+    aggregator = RespondentAggregator((ruleset or current_ruleset()).config).consume(respondents)
+    responses = aggregator.responses()
+    # Flat answers (e.g. from the buyer) are kept where no respondent answered
+    for question_id, score in (payload.get('responses') or {}).items():
+        responses.setdefault(question_id, score)
+    return responses, aggregator
+
+
+# ============================================================================
+# MAIN SCORING FUNCTION
+# ============================================================================
+
+def collect_contradictions(responses: Dict[str, Any], aggregator, ruleset: Ruleset) -> Tuple[List, List]:
+    """Cross-validation contradictions plus respondent disagreement, with their flags"""
+    contradictions, flags = run_cross_validation(responses, ruleset)
+    if aggregator:
+        disagreements = aggregator.disagreement_contradictions(ruleset.config)
+        contradictions += disagreements
+        flags += [c['name'] for c in disagreements[:1]]
+    return contradictions, flags
+
+
+def payload_auto_flags(payload: Dict[str, Any], responses: Dict[str, Any]) -> List[Dict]:
+    """Auto-Flags for a payload, evaluated against its config answers or metadata"""
+    return evaluate_auto_flags(responses, payload.get('config') or payload.get('metadata') or {})
+
+
+def build_result(payload: Dict[str, Any], ruleset: Ruleset, responses: Dict[str, Any], aggregator, *,
+                 block_scores: Dict, block_statuses: Dict, block_details: Dict,
+                 gate_failures: List, gate_status: str, contradictions: List, flags: List,
+                 auto_flags: List, recommendations: List = None, timestamp: str = None) -> Dict[str, Any]:
+    """
+    Finish scoring from the stage outputs and assemble the result
+
+    Escalation, DTC, confidence and (unless given) recommendations are
+    computed here; run_audit_scoring, the pipeline's finalize stage and the
+    ruleset comparison all build their results with this function.
+    """
+    overall_status = apply_contradiction_escalation(gate_status, contradictions)
+    dtc = calculate_dtc(block_statuses.get('block7'), ruleset)
+    confidence_score = calculate_confidence_score(block_statuses, gate_failures, contradictions, dtc, ruleset)
+    if recommendations is None:
+        recommendations = select_recommendations(block_statuses, block_scores, flags, responses, ruleset)
+
+    result = {
+        'audit_id': payload.get('audit_id'),
+        'timestamp': timestamp or datetime.now().isoformat(),
+        'metadata': payload.get('metadata') or {},
+        'block_scores': block_scores,
+        'block_statuses': block_statuses,
+        'block_details': block_details,
+        'gate_failures': gate_failures,
+        'contradictions': contradictions,
+        'flags': flags,
+        'auto_flags': auto_flags,
+        'overall_status': overall_status,
+        'confidence_score': confidence_score,
+        'data_trust_coefficient': dtc,
+        'selected_recommendations': recommendations,
+        'summary': build_summary(overall_status, confidence_score, block_statuses,
+                                 gate_failures, contradictions, recommendations, dtc),
+        'ruleset_version': ruleset.version
+    }
+    if aggregator:
+        result['respondents'] = aggregator.summary(ruleset.config)
+    if payload.get('validation'):
+        result['validation'] = payload['validation']
+    return result
+
+
+def run_audit_scoring(payload: Dict[str, Any], ruleset: Ruleset = None) -> Dict[str, Any]:
+    """
+    Run complete audit scoring
+
+    Args:
+        payload: dict with audit_id, responses (or respondents) and optional metadata
+        ruleset: rules to score with (defaults to the active snapshot)
+    """
+    # One snapshot for the whole audit, even if a new version is activated meanwhile
+    ruleset = ruleset or current_ruleset()
+    responses, aggregator = resolve_responses(payload, ruleset)
+
+    block_scores, block_statuses, block_details = calculate_block_scores(responses, ruleset)
+    gate_failures, gate_status = apply_gate_rules(block_statuses, ruleset)
+    contradictions, flags = collect_contradictions(responses, aggregator, ruleset)
+
+    return build_result(
+        payload, ruleset, responses, aggregator,
+        block_scores=block_scores, block_statuses=block_statuses, block_details=block_details,
+        gate_failures=gate_failures, gate_status=gate_status,
+        contradictions=contradictions, flags=flags, auto_flags=payload_auto_flags(payload, responses)
+    )
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Hiring Execution & Talent Efficiency Audit
+Scoring Pipeline Executor v1.0
+
+Runs the stages of automation/n8n_workflow_scoring_engine.json in-process as
+a DAG instead of one n8n Code node per hop:
+
+    Webhook ──> Resolve Responses ─┬─> Calculate Block Scores ──> Apply Gate Rules ─┐
+                                   └─> Cross-Validation ────────────────────────────┴─> Finalize Scoring
+
+Stages whose dependencies are satisfied run concurrently, items are processed
+in batches, and wall-clock time is recorded per stage. The ruleset snapshot is
+taken once per item when its responses are resolved and every later stage
+scores with it.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Any, Iterable, Tuple
+
+from scoring_engine import (
+    calculate_block_scores, apply_gate_rules, collect_contradictions, payload_auto_flags,
+    build_result, resolve_responses, current_ruleset
+)
+
+
+# ============================================================================
+# STAGE DEFINITIONS
+# ============================================================================
+
+class Stage:
+    """A single pipeline node: a function of the webhook payload and upstream outputs"""
+
+    def __init__(self, name: str, func: Callable[[Dict, Dict], Any], depends_on: Iterable[str] = ()):
+        """
+        Args:
+            name: unique stage name
+            func: callable(payload, upstream) -> output, where upstream maps
+                  dependency names to their outputs for the same item
+            depends_on: names of stages that must finish first
+        """
+        self.name = name
+        self.func = func
+        self.depends_on = tuple(depends_on)
+
+
+def _stage_resolve_responses(payload, upstream):
+    ruleset = current_ruleset()
+    responses, aggregator = resolve_responses(payload, ruleset)
+    return {'responses': responses, 'aggregator': aggregator, 'ruleset': ruleset}
+
+
+def _stage_block_scores(payload, upstream):
+    resolved = upstream['resolve_responses']
+    scores, statuses, details = calculate_block_scores(resolved['responses'], resolved['ruleset'])
+    return {'block_scores': scores, 'block_statuses': statuses, 'block_details': details}
+
+
+def _stage_gate_rules(payload, upstream):
+    statuses = upstream['calculate_block_scores']['block_statuses']
+    gate_failures, gate_status = apply_gate_rules(statuses, upstream['resolve_responses']['ruleset'])
+    return {'gate_failures': gate_failures, 'gate_status': gate_status}
+
+
+def _stage_cross_validation(payload, upstream):
+    resolved = upstream['resolve_responses']
+    contradictions, flags = collect_contradictions(resolved['responses'], resolved['aggregator'],
+                                                   resolved['ruleset'])
+    auto_flags = payload_auto_flags(payload, resolved['responses'])
+    return {'contradictions': contradictions, 'flags': flags, 'auto_flags': auto_flags}
+
+
+def _stage_finalize(payload, upstream):
+    resolved = upstream['resolve_responses']
+    return build_result(payload, resolved['ruleset'], resolved['responses'], resolved['aggregator'],
+                        **upstream['calculate_block_scores'], **upstream['apply_gate_rules'],
+                        **upstream['cross_validation'])
+
+
+# Same nodes as the n8n workflow; cross-validation only needs the responses
+SCORING_STAGES = [
+    Stage('resolve_responses', _stage_resolve_responses),
+    Stage('calculate_block_scores', _stage_block_scores, depends_on=['resolve_responses']),
+    Stage('apply_gate_rules', _stage_gate_rules, depends_on=['resolve_responses', 'calculate_block_scores']),
+    Stage('cross_validation', _stage_cross_validation, depends_on=['resolve_responses']),
+    Stage('finalize_scoring', _stage_finalize,
+          depends_on=['resolve_responses', 'calculate_block_scores', 'apply_gate_rules',
+                      'cross_validation']),
+]
+
+
+# ============================================================================
+# PIPELINE EXECUTOR
+# ============================================================================
+
+class ScoringPipeline:
+    """DAG executor for scoring stages"""
+
+    def __init__(self, stages: List[Stage] = None, max_workers: int = 4, batch_size: int = 256,
+                 output_stage: str = None):
+        """
+        Args:
+            stages: stage list (defaults to SCORING_STAGES)
+            max_workers: threads used for independent stages; 1 runs sequentially
+            batch_size: items handed to a stage per call in run_batch()
+            output_stage: stage whose output is returned; defaults to the only
+                stage nothing depends on
+
+        Raises:
+            ValueError: unknown dependency or output stage, a cycle, or no
+                single sink stage when output_stage is not given
+        """
+        self.stages = {s.name: s for s in (stages or SCORING_STAGES)}
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self.levels = self._topological_levels()
+        self.output_stage = output_stage or self._sink_stage()
+        if self.output_stage not in self.stages:
+            raise ValueError(f"Unknown output stage '{self.output_stage}'")
+        self.timings = {name: 0.0 for name in self.stages}
+        self.items_processed = 0
+        self._executor = ThreadPoolExecutor(max_workers=max_workers) if max_workers > 1 else None
+
+    def _topological_levels(self) -> List[List[str]]:
+        """Group stages into levels; every stage in a level has all deps in earlier levels"""
+        for stage in self.stages.values():
+            for dep in stage.depends_on:
+                if dep not in self.stages:
+                    raise ValueError(f"Stage '{stage.name}' depends on unknown stage '{dep}'")
+
+        levels = []
+        done = set()
+        remaining = list(self.stages)
+        while remaining:
+            ready = [n for n in remaining if all(d in done for d in self.stages[n].depends_on)]
+            if not ready:
+                raise ValueError(f"Cycle detected between stages: {remaining}")
+            levels.append(ready)
+            done.update(ready)
+            remaining = [n for n in remaining if n not in done]
+        return levels
+
+    def _sink_stage(self) -> str:
+        """The one stage no other stage depends on"""
+        used = {dep for stage in self.stages.values() for dep in stage.depends_on}
+        sinks = [name for name in self.stages if name not in used]
+        if len(sinks) != 1:
+            raise ValueError(f"Pipeline needs exactly one sink stage or an explicit output_stage, got {sinks}")
+        return sinks[0]
+
+    def _run_stage(self, name: str, payloads: List[Dict], outputs: List[Dict]) -> Tuple[List[Any], float]:
+        stage = self.stages[name]
+        start = time.perf_counter()
+        results = []
+        for payload, item_outputs in zip(payloads, outputs):
+            upstream = {dep: item_outputs[dep] for dep in stage.depends_on}
+            results.append(stage.func(payload, upstream))
+        return results, time.perf_counter() - start
+
+    def _run_chunk(self, payloads: List[Dict]) -> List[Dict]:
+        outputs = [{} for _ in payloads]
+
+        for level in self.levels:
+            if self._executor and len(level) > 1:
+                futures = {name: self._executor.submit(self._run_stage, name, payloads, outputs)
+                           for name in level}
+                level_results = {name: f.result() for name, f in futures.items()}
+            else:
+                level_results = {name: self._run_stage(name, payloads, outputs) for name in level}
+
+            for name, (results, elapsed) in level_results.items():
+                self.timings[name] += elapsed
+                for item_outputs, result in zip(outputs, results):
+                    item_outputs[name] = result
+
+        self.items_processed += len(payloads)
+        return [item_outputs[self.output_stage] for item_outputs in outputs]
+
+    def run(self, payload: Dict) -> Dict:
+        """Score a single webhook payload"""
+        return self._run_chunk([payload])[0]
+
+    def run_batch(self, payloads: Iterable[Dict]) -> List[Dict]:
+        """Score many payloads, handing each stage up to batch_size items at a time"""
+        results = []
+        chunk = []
+        for payload in payloads:
+            chunk.append(payload)
+            if len(chunk) >= self.batch_size:
+                results.extend(self._run_chunk(chunk))
+                chunk = []
+        if chunk:
+            results.extend(self._run_chunk(chunk))
+        return results
+
+    def get_timings(self) -> Dict[str, Any]:
+        """Return accumulated per-stage timings in milliseconds"""
+        return {
+            'items_processed': self.items_processed,
+            'stages_ms': {name: round(t * 1000, 3) for name, t in self.timings.items()},
+            'total_ms': round(sum(self.timings.values()) * 1000, 3)
+        }
+
+    def reset_timings(self):
+        self.timings = {name: 0.0 for name in self.stages}
+        self.items_processed = 0
+
+    def close(self):
+        """Shut down the worker threads"""
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Hiring Execution & Talent Efficiency Audit
+Answer Sensitivity Analyzer v1.0
+
+Answers "which single answer would flip a block or the overall status?"
+for every question of the question bank, answered or not, without
+re-running the scorer per alternative. Per-block running sums are built
+once; each (question, alternative option) is then a delta update of one
+block plus re-evaluation of only the cross-validation rules that reference
+the question.
+"""
+
+import time
+from functools import lru_cache
+from typing import Dict, List, Any
+
+from response_codec import question_registry
+from rulesets import Ruleset
+from scoring_engine import (
+    block_id_for, status_for, apply_gate_rules, evaluate_condition,
+    apply_contradiction_escalation, is_critical_red, current_ruleset
+)
+
+
+# Possible answer values (see scoringEngine.questionScore in audit_forms_spec_complete.json)
+OPTION_VALUES = (3, 2, 1, 0, -1)
+
+
+@lru_cache(maxsize=1)
+def _question_bank():
+    """Block question ids in bank order, read from the question CSV once"""
+    return tuple(question_registry())
+
+
+def _question_order(question_id: str):
+    """Sort key (block number, question number); 'b1_q2' sorts before 'b1_q10'"""
+    block, _, number = question_id.partition('_q')
+    return (int(block[1:]), int(number) if number.isdigit() else 0, question_id)
+
+
+@lru_cache(maxsize=8)
+def _ruleset_index(ruleset: Ruleset):
+    """(critical question set, question_id -> CV rules that read it), once per snapshot"""
+    index = {}
+    for rule in ruleset.cross_validation_rules:
+        for side in ('source', 'validator'):
+            index.setdefault(rule[side]['question'], []).append(rule)
+    critical = frozenset(q for qs in ruleset.critical_questions.values() for q in qs)
+    return critical, index
+
+
+class BlockAccumulator:
+    """Running sum, answered count and critical-zero count for one block"""
+
+    __slots__ = ('total', 'count', 'critical_red', 'config')
+
+    def __init__(self, config):
+        self.total = 0.0
+        self.count = 0
+        self.critical_red = 0
+        self.config = config
+
+    def status(self, total=None, count=None, critical_red=None):
+        total = self.total if total is None else total
+        count = self.count if count is None else count
+        critical_red = self.critical_red if critical_red is None else critical_red
+        if count == 0:
+            return 'gray'
+        return status_for(total / count, critical_red > 0, self.config)
+
+
+def _rule_fires(rule, responses, override_q=None, override_v=None):
+    def value(q):
+        return override_v if q == override_q else responses.get(q)
+
+    src = value(rule['source']['question'])
+    val = value(rule['validator']['question'])
+    if src is None or val is None or src == -1 or val == -1:
+        return False
+    return evaluate_condition(src, rule['source']['operator'], rule['source']['value']) and \
+        evaluate_condition(val, rule['validator']['operator'], rule['validator']['value'])
+
+
+def _overall(statuses, severities, ruleset):
+    _, gate_status = apply_gate_rules(statuses, ruleset)
+    return apply_contradiction_escalation(gate_status, [{'severity': s} for s in severities])
+
+
+def analyze_sensitivity(responses: Dict[str, Any], extra_contradictions: List[Dict] = (),
+                        ruleset: Ruleset = None) -> Dict[str, Any]:
+    """
+    Compute the block and overall status for every question of the question
+    bank (plus any other answered block question) under every alternative
+    option; unanswered questions are tried with every option
+
+    Args:
+        responses: flat {question_id: score} dict (aggregated means also work)
+        extra_contradictions: contradictions not derived from single answers
+            (e.g. respondent disagreement); held fixed across alternatives
+        ruleset: rules to analyze under (defaults to the active snapshot)
+
+    Returns:
+        dict with the base statuses, the list of flips sorted by (block,
+        question number) and timing
+    """
+    start = time.perf_counter()
+    ruleset = ruleset or current_ruleset()
+    config = ruleset.config
+    critical_set, rule_index = _ruleset_index(ruleset)
+    cv_rules = ruleset.cross_validation_rules
+
+    # One pass: per-block running sums
+    blocks = {}
+    for q, v in responses.items():
+        block_id = block_id_for(q)
+        if not block_id:
+            continue
+        acc = blocks.get(block_id)
+        if acc is None:
+            acc = blocks[block_id] = BlockAccumulator(config)
+        if v is not None and v != -1:
+            acc.total += v
+            acc.count += 1
+        if q in critical_set and is_critical_red(v, config):
+            acc.critical_red += 1
+
+    base_statuses = {b: acc.status() for b, acc in blocks.items()}
+    base_fired = {rule['id']: _rule_fires(rule, responses) for rule in cv_rules}
+    severity = {rule['id']: rule['severity'] for rule in cv_rules}
+    fixed = [c['severity'] for c in extra_contradictions]
+    base_overall = _overall(base_statuses, fixed + [severity[r] for r, f in base_fired.items() if f], ruleset)
+
+    reported_statuses = dict(base_statuses)
+    questions = _question_bank()
+    known = set(questions)
+    questions += tuple(q for q in responses if q not in known and block_id_for(q))
+
+    flips = []
+    evaluated = 0
+    for q in sorted(questions, key=_question_order):
+        current = responses.get(q)
+        block_id = block_id_for(q)
+        acc = blocks.get(block_id)
+        if acc is None:
+            # Nothing answered in this block yet; absent and gray gate the same way
+            acc = blocks[block_id] = BlockAccumulator(config)
+            base_statuses[block_id] = 'gray'
+        cur_answered = current is not None and current != -1
+        cur_critical = q in critical_set and is_critical_red(current, config)
+        rules = rule_index.get(q, ())
+
+        for option in OPTION_VALUES:
+            if option == current:
+                continue
+            evaluated += 1
+
+            # Delta update of the single affected block
+            total = acc.total - (current if cur_answered else 0) + (option if option != -1 else 0)
+            count = acc.count - cur_answered + (option != -1)
+            critical_red = acc.critical_red - cur_critical + \
+                (q in critical_set and is_critical_red(option, config))
+            new_status = acc.status(total, count, critical_red)
+
+            fired = base_fired
+            if rules:
+                fired = dict(base_fired)
+                for rule in rules:
+                    fired[rule['id']] = _rule_fires(rule, responses, q, option)
+
+            if new_status == base_statuses[block_id] and fired is base_fired:
+                continue  # nothing the overall status depends on has changed
+
+            statuses = base_statuses
+            if new_status != base_statuses[block_id]:
+                statuses = dict(base_statuses)
+                statuses[block_id] = new_status
+            overall = _overall(statuses, fixed + [severity[r] for r, f in fired.items() if f], ruleset)
+
+            if new_status != base_statuses[block_id] or overall != base_overall:
+                flips.append({
+                    'question': q,
+                    'block': block_id,
+                    'from_value': current,
+                    'to_value': option,
+                    'block_status_from': base_statuses[block_id],
+                    'block_status_to': new_status,
+                    'overall_from': base_overall,
+                    'overall_to': overall
+                })
+
+    return {
+        'base': {'block_statuses': reported_statuses, 'overall_status': base_overall},
+        'flips': flips,
+        'evaluated': evaluated,
+        'elapsed_ms': round((time.perf_counter() - start) * 1000, 3)
+    }
+
+
+def flips_for_block(analysis: Dict[str, Any], block_id: str, to_status: str = None) -> List[Dict]:
+    """Filter flips changing one block, optionally to a specific status"""
+    return [f for f in analysis['flips']
+            if f['block'] == block_id and f['block_status_to'] != f['block_status_from']
+            and (to_status is None or f['block_status_to'] == to_status)]
+
+
+def overall_flips(analysis: Dict[str, Any]) -> List[Dict]:
+    """Flips that change the overall audit status"""
+    return [f for f in analysis['flips'] if f['overall_to'] != f['overall_from']]
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Hiring Execution & Talent Efficiency Audit
+Stage Checkpoints v1.0
+
+Persists the output of every workflow stage (submission, scoring,
+recommendations, report data, PDF, delivery) in a SQLite file, keyed by
+audit id and a hash of the stage's inputs. Rerunning an audit reuses every
+stage whose inputs are unchanged and resumes at the first incomplete one,
+so a failed PDF render or email retry does not redo scoring.
+
+A stage's input hash covers the run inputs and the output hashes of the
+stages it depends on: changed answers invalidate the whole chain, and a
+recomputed upstream stage with a different output invalidates everything
+downstream of it.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Any, Optional
+
+from scoring_pipeline import Stage
+from tracing import NOOP_TRACER
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    audit_id     TEXT PRIMARY KEY,
+    input_hash   TEXT NOT NULL,
+    inputs       TEXT NOT NULL,
+    status       TEXT NOT NULL,
+    failed_stage TEXT,
+    last_error   TEXT,
+    attempts     INTEGER NOT NULL DEFAULT 0,
+    updated_at   REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_runs_status ON runs (status, updated_at);
+
+CREATE TABLE IF NOT EXISTS checkpoints (
+    audit_id     TEXT NOT NULL,
+    stage        TEXT NOT NULL,
+    input_hash   TEXT NOT NULL,
+    output       TEXT NOT NULL,
+    output_hash  TEXT NOT NULL,
+    elapsed_ms   REAL NOT NULL,
+    completed_at REAL NOT NULL,
+    PRIMARY KEY (audit_id, stage)
+);
+"""
+
+# Runs that `resume_failed` picks up ('running' = interrupted by a crash)
+UNFINISHED_STATUSES = ('failed', 'running')
+
+
+def _dumps(value):
+    return json.dumps(value, sort_keys=True, separators=(',', ':'), default=str)
+
+
+def content_hash(value: Any) -> str:
+    """sha256 of the canonical JSON form of `value`"""
+    return hashlib.sha256(_dumps(value).encode('utf-8')).hexdigest()
+
+
+class CheckpointStore:
+    """SQLite file of per-stage outputs and per-audit run status"""
+
+    def __init__(self, db_path: str):
+        """
+        Args:
+            db_path: path of the SQLite checkpoint file (':memory:' for throwaway runs)
+        """
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(SCHEMA)
+
+    def begin_run(self, audit_id: str, input_hash: str, inputs: Dict[str, Any]):
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO runs (audit_id, input_hash, inputs, status, attempts, updated_at) "
+                "VALUES (?, ?, ?, 'running', 1, ?) ON CONFLICT(audit_id) DO UPDATE SET "
+                "input_hash = excluded.input_hash, inputs = excluded.inputs, status = 'running', "
+                "attempts = attempts + 1, updated_at = excluded.updated_at",
+                (audit_id, input_hash, _dumps(inputs), time.time())
+            )
+
+    def finish_run(self, audit_id: str, failed_stage: str = None, error: str = None):
+        with self._lock:
+            self._conn.execute(
+                'UPDATE runs SET status = ?, failed_stage = ?, last_error = ?, updated_at = ? WHERE audit_id = ?',
+                ('failed' if failed_stage else 'complete', failed_stage, error, time.time(), audit_id)
+            )
+
+    def get_run(self, audit_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT audit_id, input_hash, inputs, status, failed_stage, last_error, attempts '
+                'FROM runs WHERE audit_id = ?', (audit_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        keys = ('audit_id', 'input_hash', 'inputs', 'status', 'failed_stage', 'last_error', 'attempts')
+        run = dict(zip(keys, row))
+        run['inputs'] = json.loads(run['inputs'])
+        return run
+
+    def unfinished_runs(self, limit: int = None) -> List[str]:
+        """Audit ids of failed or interrupted runs, oldest first"""
+        sql = f"SELECT audit_id FROM runs WHERE status IN ({','.join('?' * len(UNFINISHED_STATUSES))}) " \
+              f"ORDER BY updated_at"
+        params = list(UNFINISHED_STATUSES)
+        if limit is not None:
+            sql += ' LIMIT ?'
+            params.append(limit)
+        with self._lock:
+            return [r[0] for r in self._conn.execute(sql, params)]
+
+    def load(self, audit_id: str, stage: str, input_hash: str) -> Optional[Dict[str, Any]]:
+        """Stored checkpoint for `stage` if it was computed from the same inputs"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT output, output_hash FROM checkpoints WHERE audit_id = ? AND stage = ? AND input_hash = ?',
+                (audit_id, stage, input_hash)
+            ).fetchone()
+        if row is None:
+            return None
+        return {'output': json.loads(row[0]), 'output_hash': row[1]}
+
+    def save(self, audit_id: str, stage: str, input_hash: str, output: Any, elapsed_ms: float) -> str:
+        """Store a stage output; returns its hash"""
+        data = _dumps(output)
+        output_hash = hashlib.sha256(data.encode('utf-8')).hexdigest()
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO checkpoints '
+                '(audit_id, stage, input_hash, output, output_hash, elapsed_ms, completed_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (audit_id, stage, input_hash, data, output_hash, elapsed_ms, time.time())
+            )
+        return output_hash
+
+    def stats(self) -> Dict[str, int]:
+        """Count runs per status"""
+        with self._lock:
+            rows = self._conn.execute('SELECT status, COUNT(*) FROM runs GROUP BY status').fetchall()
+        return dict(rows)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+# ============================================================================
+# RUNNER
+# ============================================================================
+
+class CheckpointedWorkflow:
+    """Runs an ordered list of stages per audit, reusing stored stage outputs"""
+
+    def __init__(self, stages: List[Stage], store: CheckpointStore, tracer=None):
+        """
+        Args:
+            stages: stages in execution order; func(inputs, upstream) must
+                    return JSON-serializable output (upstream maps the
+                    stage's depends_on names to their outputs)
+            store: where checkpoints and run status are kept
+            tracer: optional tracing.Tracer; each run is a 'workflow' span
+                    with one child span per stage
+        """
+        names = [s.name for s in stages]
+        for stage in stages:
+            unknown = [d for d in stage.depends_on if d not in names[:names.index(stage.name)]]
+            if unknown:
+                raise ValueError(f"Stage '{stage.name}' depends on {unknown}, which do not run before it")
+        self.stages = stages
+        self.store = store
+        self.tracer = tracer or NOOP_TRACER
+
+    def run(self, audit_id: str, inputs: Dict[str, Any], traceparent: str = None) -> Dict[str, Any]:
+        """
+        Run (or resume) one audit
+
+        Args:
+            traceparent: trace context of the webhook that started the audit
+                         (not part of the input hash)
+
+        Returns:
+            dict with status ('complete' / 'failed'), outputs per finished
+            stage, the stages reused from checkpoints and those executed,
+            resumed_from (first executed stage) and failed_stage / error
+        """
+        with self.tracer.start_span('workflow', {'audit.id': audit_id}, parent=traceparent) as span:
+            result = self._run_stages(audit_id, inputs)
+            span.set_attributes({'workflow.status': result['status'], 'workflow.reused': result['reused'],
+                                 'workflow.resumed_from': result['resumed_from']})
+            if result['error']:
+                span.set_error(result['error'])
+        return result
+
+    def _run_stages(self, audit_id, inputs):
+        run_hash = content_hash(inputs)
+        self.store.begin_run(audit_id, run_hash, inputs)
+
+        outputs, output_hashes = {}, {}
+        reused, executed = [], []
+        for stage in self.stages:
+            stage_hash = content_hash([stage.name, run_hash, [output_hashes[d] for d in stage.depends_on]])
+            checkpoint = self.store.load(audit_id, stage.name, stage_hash)
+            if checkpoint is not None:
+                outputs[stage.name] = checkpoint['output']
+                output_hashes[stage.name] = checkpoint['output_hash']
+                reused.append(stage.name)
+                continue
+
+            start = time.perf_counter()
+            with self.tracer.start_span(stage.name) as span:
+                try:
+                    output = stage.func(inputs, {d: outputs[d] for d in stage.depends_on})
+                    # Round-trip through JSON so a fresh run and a resumed run see the same values
+                    output = json.loads(_dumps(output))
+                except Exception as e:
+                    error = f'{type(e).__name__}: {e}'
+                    span.set_error(error)
+                    self.store.finish_run(audit_id, stage.name, error)
+                    return self._result(audit_id, 'failed', outputs, reused, executed,
+                                        failed_stage=stage.name, error=error)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            output_hashes[stage.name] = self.store.save(audit_id, stage.name, stage_hash, output, elapsed_ms)
+            outputs[stage.name] = output
+            executed.append(stage.name)
+
+        self.store.finish_run(audit_id)
+        return self._result(audit_id, 'complete', outputs, reused, executed)
+
+    def resume_failed(self, limit: int = None) -> List[Dict[str, Any]]:
+        """Rerun every failed or interrupted audit from its stored inputs"""
+        return [self.run(audit_id, self.store.get_run(audit_id)['inputs'])
+                for audit_id in self.store.unfinished_runs(limit)]
+
+    @staticmethod
+    def _result(audit_id, status, outputs, reused, executed, failed_stage=None, error=None):
+        return {
+            'audit_id': audit_id,
+            'status': status,
+            'outputs': outputs,
+            'reused': reused,
+            'executed': executed,
+            'resumed_from': (executed or [failed_stage])[0] if reused else None,
+            'failed_stage': failed_stage,
+            'error': error
+        }
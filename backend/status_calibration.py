@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Hiring Execution & Talent Efficiency Audit
+Status Calibration Tool v1.0
+
+Reports how block statuses are distributed over the full answer space of
+each block, for calibrating GREEN_THRESHOLD / YELLOW_THRESHOLD and the
+critical-RED rule. Blocks have up to 12 questions (5^12 combinations), so
+combinations are not enumerated one by one: the block status only depends
+on (answer sum, answered count, critical red), and the number of answer
+combinations reaching each of those states is counted question by question
+and looked up in the scorer's status table.
+
+Usage:
+    python status_calibration.py
+    python status_calibration.py --green 2.0 2.3 2.5 --yellow 1.5
+"""
+
+import argparse
+import sys
+from typing import Dict, List, Any, Iterable, Sequence, Tuple
+
+from scoring_engine import (
+    SCORING_CONFIG, CRITICAL_QUESTIONS, STATUS_CODES, build_status_table, pack_block_key
+)
+from payload_validator import read_question_csv
+
+
+STATUS_ORDER = ('green', 'yellow', 'red', 'gray')
+
+
+def block_answer_spaces() -> Dict[str, List[Tuple[str, Tuple[int, ...], bool]]]:
+    """block_id -> [(question_id, allowed scores, is_critical)] from the question bank"""
+    spaces = {}
+    for rule in read_question_csv():
+        if rule['form'] == 'config':
+            continue
+        critical = rule['question'] in CRITICAL_QUESTIONS.get(rule['form'], ())
+        spaces.setdefault(rule['form'], []).append(
+            (rule['question'], tuple(sorted(set(rule['values']), reverse=True)), critical))
+    return spaces
+
+
+def answer_space_distribution(questions: Iterable[Tuple[Sequence[int], bool]],
+                              config: Dict[str, Any] = SCORING_CONFIG,
+                              table: bytes = None) -> Dict[str, int]:
+    """
+    Number of answer combinations per block status
+
+    Args:
+        questions: (allowed scores, is_critical) per question; -1 is "not relevant"
+        config: thresholds to evaluate
+        table: status table built from `config` (built here if omitted)
+    """
+    table = table or build_status_table(config)
+    critical_below = config['CRITICAL_RED_BELOW']
+
+    # (answer sum, answered count, critical red) -> number of combinations
+    states = {(0, 0, False): 1}
+    for values, critical in questions:
+        nxt = {}
+        for (total, count, red), ways in states.items():
+            for value in values:
+                if value == -1:
+                    key = (total, count, red)
+                else:
+                    key = (total + value, count + 1, red or (critical and value < critical_below))
+                nxt[key] = nxt.get(key, 0) + ways
+        states = nxt
+
+    counts = dict.fromkeys(STATUS_ORDER, 0)
+    for (total, count, red), ways in states.items():
+        status = 'gray' if count == 0 else STATUS_CODES[table[pack_block_key(total, count, red)]]
+        counts[status] += ways
+    return counts
+
+
+def block_distributions(config: Dict[str, Any] = SCORING_CONFIG) -> Dict[str, Dict[str, Any]]:
+    """Status counts and shares over each block's full answer space"""
+    table = build_status_table(config)
+    report = {}
+    for block_id, questions in sorted(block_answer_spaces().items()):
+        counts = answer_space_distribution([(values, critical) for _, values, critical in questions],
+                                           config, table)
+        combinations = sum(counts.values())
+        report[block_id] = {
+            'questions': len(questions),
+            'critical_questions': sum(1 for q in questions if q[2]),
+            'combinations': combinations,
+            'counts': counts,
+            'shares': {s: round(n / combinations, 4) for s, n in counts.items()}
+        }
+    return report
+
+
+def calibrate(green_thresholds: Iterable[float], yellow_thresholds: Iterable[float]) -> List[Dict[str, Any]]:
+    """Block status shares for every (green, yellow) threshold pair"""
+    rows = []
+    for yellow in yellow_thresholds:
+        for green in green_thresholds:
+            if green < yellow:
+                continue
+            config = dict(SCORING_CONFIG, GREEN_THRESHOLD=green, YELLOW_THRESHOLD=yellow)
+            rows.append({'green': green, 'yellow': yellow, 'blocks': block_distributions(config)})
+    return rows
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Block status distribution over the full answer space')
+    parser.add_argument('--green', type=float, nargs='+', default=[SCORING_CONFIG['GREEN_THRESHOLD']])
+    parser.add_argument('--yellow', type=float, nargs='+', default=[SCORING_CONFIG['YELLOW_THRESHOLD']])
+    args = parser.parse_args(argv)
+
+    for row in calibrate(args.green, args.yellow):
+        print(f"\nGREEN >= {row['green']}  YELLOW >= {row['yellow']}")
+        print(f"{'Block':<8} {'Qs':>3} {'Crit':>4} {'Combinations':>16}  " +
+              '  '.join(f'{s:>7}' for s in STATUS_ORDER))
+        for block_id, dist in row['blocks'].items():
+            print(f"{block_id:<8} {dist['questions']:>3} {dist['critical_questions']:>4} "
+                  f"{dist['combinations']:>16,}  " +
+                  '  '.join(f"{dist['shares'][s]:>7.1%}" for s in STATUS_ORDER))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+Hiring Execution & Talent Efficiency Audit
+Workflow Tracing v1.0
+
+Lightweight spans for following one audit from webhook to email delivery.
+Spans of one audit share a trace id: nested spans pick up their parent from
+a context variable (which also follows asyncio tasks), and the trace context
+crosses queues and processes as a W3C `traceparent` string stored in the
+payload.
+
+Finished spans are written to a local file in the OTLP/JSON encoding (one
+`{"resourceSpans": [...]}` object per line, as written by the OpenTelemetry
+collector file exporter), so they can be replayed into any OTel backend.
+
+Sampling is decided once per trace from the trace id (same rule as the
+OTel TraceIdRatioBased sampler) and inherited by every child span, so a
+trace is either complete or absent. Unsampled spans only carry ids; they
+take no timestamps and are never exported.
+"""
+
+import contextvars
+import json
+import random
+import sys
+import threading
+import time
+from typing import Dict, List, Any, Optional, Union
+
+
+SCOPE_NAME = 'hiring-audit'
+SCOPE_VERSION = '1.0'
+
+# OTLP enum values
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+SPAN_KIND_CLIENT = 3
+STATUS_UNSET, STATUS_OK, STATUS_ERROR = 0, 1, 2
+
+_current_span = contextvars.ContextVar('hiring_audit_span', default=None)
+_id_random = random.Random()
+
+
+def current_span() -> Optional['Span']:
+    """The innermost active span in this context, if any"""
+    return _current_span.get()
+
+
+def format_traceparent(trace_id: int, span_id: int, sampled: bool) -> str:
+    return f"00-{trace_id:032x}-{span_id:016x}-{'01' if sampled else '00'}"
+
+
+def parse_traceparent(value: str):
+    """(trace_id, span_id, sampled) from a W3C traceparent, or None if malformed"""
+    try:
+        version, trace_id, span_id, flags = value.split('-')
+        if version != '00' or len(trace_id) != 32 or len(span_id) != 16:
+            return None
+        trace_id, span_id = int(trace_id, 16), int(span_id, 16)
+        if not trace_id or not span_id:
+            return None
+        return trace_id, span_id, bool(int(flags, 16) & 1)
+    except (AttributeError, ValueError):
+        return None
+
+
+def _otlp_value(value):
+    if isinstance(value, bool):
+        return {'boolValue': value}
+    if isinstance(value, int):
+        return {'intValue': str(value)}
+    if isinstance(value, float):
+        return {'doubleValue': value}
+    if isinstance(value, (list, tuple)):
+        return {'arrayValue': {'values': [_otlp_value(v) for v in value]}}
+    return {'stringValue': str(value)}
+
+
+def _otlp_attributes(attributes):
+    return [{'key': k, 'value': _otlp_value(v)} for k, v in attributes.items()]
+
+
+# ============================================================================
+# SPANS
+# ============================================================================
+
+class Span:
+    """One timed operation; use as a context manager"""
+
+    __slots__ = ('tracer', 'name', 'kind', 'trace_id', 'span_id', 'parent_id', 'sampled',
+                 'start_ns', 'end_ns', 'attributes', 'status', 'status_message', '_token')
+
+    def __init__(self, tracer, name, trace_id, span_id, parent_id, sampled, kind, attributes):
+        self.tracer = tracer
+        self.name = name
+        self.kind = kind
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.sampled = sampled
+        self.attributes = dict(attributes) if sampled and attributes else {}
+        self.status = STATUS_UNSET
+        self.status_message = None
+        self.start_ns = time.time_ns() if sampled else 0
+        self.end_ns = None
+        self._token = None
+
+    @property
+    def traceparent(self) -> str:
+        return format_traceparent(self.trace_id, self.span_id, self.sampled)
+
+    def set_attribute(self, key: str, value: Any):
+        if self.sampled and value is not None:
+            self.attributes[key] = value
+
+    def set_attributes(self, attributes: Dict[str, Any]):
+        if self.sampled:
+            for key, value in attributes.items():
+                self.set_attribute(key, value)
+
+    def set_error(self, message: str):
+        self.status = STATUS_ERROR
+        self.status_message = message
+
+    def end(self):
+        if self.end_ns is not None:
+            return
+        if not self.sampled:
+            self.end_ns = 0
+            return
+        self.end_ns = time.time_ns()
+        if self.status == STATUS_UNSET:
+            self.status = STATUS_OK
+        self.tracer._export(self)
+
+    def __enter__(self):
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        _current_span.reset(self._token)
+        if exc is not None and self.status != STATUS_ERROR:
+            self.set_error(f'{exc_type.__name__}: {exc}')
+        self.end()
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        return None if not self.end_ns else (self.end_ns - self.start_ns) / 1e6
+
+    def to_otlp(self) -> Dict[str, Any]:
+        span = {
+            'traceId': f'{self.trace_id:032x}',
+            'spanId': f'{self.span_id:016x}',
+            'name': self.name,
+            'kind': self.kind,
+            'startTimeUnixNano': str(self.start_ns),
+            'endTimeUnixNano': str(self.end_ns),
+            'attributes': _otlp_attributes(self.attributes),
+            'status': {'code': self.status}
+        }
+        if self.parent_id:
+            span['parentSpanId'] = f'{self.parent_id:016x}'
+        if self.status_message:
+            span['status']['message'] = self.status_message
+        return span
+
+
+# ============================================================================
+# EXPORT
+# ============================================================================
+
+class OTLPJsonFileExporter:
+    """Buffers finished spans and appends them to a file as OTLP/JSON lines"""
+
+    def __init__(self, path: str, service_name: str = 'hiring-audit', batch_size: int = 512):
+        """
+        Args:
+            path: output file (appended to)
+            service_name: `service.name` resource attribute
+            batch_size: spans buffered before a line is written
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self.resource = {'attributes': _otlp_attributes({'service.name': service_name})}
+        self._buffer = []
+        self._lock = threading.Lock()
+        self.exported = 0
+
+    def export(self, span: Span):
+        with self._lock:
+            self._buffer.append(span.to_otlp())
+            if len(self._buffer) >= self.batch_size:
+                self._flush_locked()
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if not self._buffer:
+            return
+        line = json.dumps({'resourceSpans': [{
+            'resource': self.resource,
+            'scopeSpans': [{'scope': {'name': SCOPE_NAME, 'version': SCOPE_VERSION}, 'spans': self._buffer}]
+        }]}, separators=(',', ':'))
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(line + '\n')
+        self.exported += len(self._buffer)
+        self._buffer = []
+
+    def close(self):
+        self.flush()
+
+
+class InMemoryExporter:
+    """Keeps finished spans in a list (tests)"""
+
+    def __init__(self):
+        self.spans = []
+
+    def export(self, span: Span):
+        self.spans.append(span)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+# ============================================================================
+# TRACER
+# ============================================================================
+
+class Tracer:
+    """Creates spans and applies trace-level sampling"""
+
+    def __init__(self, exporter=None, sample_rate: float = 1.0):
+        """
+        Args:
+            exporter: OTLPJsonFileExporter / InMemoryExporter; None records nothing
+            sample_rate: share of new traces recorded (0.0 - 1.0); child spans
+                         and traces continued from a traceparent follow their parent
+        """
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError(f"sample_rate must be within [0, 1], got {sample_rate}")
+        self.exporter = exporter
+        self.sample_rate = sample_rate
+        self._threshold = int(sample_rate * (1 << 64)) if exporter is not None else 0
+
+    def start_span(self, name: str, attributes: Dict[str, Any] = None,
+                   parent: Union[Span, str, None] = None, kind: int = SPAN_KIND_INTERNAL) -> Span:
+        """
+        Start a span (end it with `with` or span.end())
+
+        Args:
+            parent: parent span or traceparent string; defaults to the
+                    current span, and starts a new trace if there is none
+        """
+        if parent is None:
+            parent = _current_span.get()
+        if isinstance(parent, str):
+            parent = parse_traceparent(parent)
+            if parent is not None:
+                trace_id, parent_id, sampled = parent
+        elif parent is not None:
+            trace_id, parent_id, sampled = parent.trace_id, parent.span_id, parent.sampled
+
+        if parent is None:
+            trace_id = _id_random.getrandbits(128) or 1
+            parent_id = None
+            sampled = (trace_id & 0xFFFFFFFFFFFFFFFF) < self._threshold
+        sampled = sampled and self.exporter is not None
+        return Span(self, name, trace_id, _id_random.getrandbits(64) or 1, parent_id, sampled, kind, attributes)
+
+    def _export(self, span: Span):
+        self.exporter.export(span)
+
+    def flush(self):
+        if self.exporter is not None:
+            self.exporter.flush()
+
+    def close(self):
+        if self.exporter is not None:
+            self.exporter.close()
+
+
+NOOP_TRACER = Tracer()
+
+
+# ============================================================================
+# READING TRACES BACK
+# ============================================================================
+
+def load_spans(path: str) -> List[Dict[str, Any]]:
+    """Flat list of OTLP span dicts from an exported file"""
+    spans = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            for resource_spans in json.loads(line)['resourceSpans']:
+                for scope_spans in resource_spans['scopeSpans']:
+                    spans.extend(scope_spans['spans'])
+    return spans
+
+
+def trace_breakdown(spans: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Per trace: end-to-end duration and time per span name
+
+    Returns:
+        {trace_id: {'duration_ms', 'root', 'spans': {name: ms}, 'errors': [...]}}
+    """
+    traces = {}
+    for span in spans:
+        trace = traces.setdefault(span['traceId'], {'start': None, 'end': None, 'root': None,
+                                                    'spans': {}, 'errors': []})
+        start, end = int(span['startTimeUnixNano']), int(span['endTimeUnixNano'])
+        trace['start'] = start if trace['start'] is None else min(trace['start'], start)
+        trace['end'] = end if trace['end'] is None else max(trace['end'], end)
+        trace['spans'][span['name']] = trace['spans'].get(span['name'], 0.0) + (end - start) / 1e6
+        if 'parentSpanId' not in span:
+            trace['root'] = span['name']
+        if span['status'].get('code') == STATUS_ERROR:
+            trace['errors'].append(f"{span['name']}: {span['status'].get('message', '')}")
+
+    return {
+        trace_id: {
+            'duration_ms': round((t['end'] - t['start']) / 1e6, 3),
+            'root': t['root'],
+            'spans': {name: round(ms, 3) for name, ms in t['spans'].items()},
+            'errors': t['errors']
+        }
+        for trace_id, t in traces.items()
+    }
+
+
+def main(argv=None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 1:
+        print('Usage: python tracing.py <traces.jsonl>')
+        return 2
+    for trace_id, trace in trace_breakdown(load_spans(argv[0])).items():
+        print(f"\n{trace_id}  {trace['root']}  {trace['duration_ms']:.1f}ms")
+        for name, ms in sorted(trace['spans'].items(), key=lambda item: -item[1]):
+            print(f"   {name:<32} {ms:>10.1f}ms")
+        for error in trace['errors']:
+            print(f"   ❌ {error}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Hiring Audit - Airtable Client Test
+===================================
+
+Runs the batched Airtable client (backend/airtable_client.py) against the
+bundled local stub server: 10-record batching, rate-limit scheduling at
+Airtable's default limit, 429 retries, no resending of POSTs after a
+connection error, reconnecting when the server drops idle keep-alive
+connections, and upsert semantics.
+
+Run: python airtable_client_test.py
+"""
+
+import os
+import socket
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'backend'))
+
+from integration_test import TEST_SCENARIOS, TestResult
+from airtable_client import AirtableClient, AirtableStubServer, result_to_fields
+from scoring_engine import run_audit_scoring
+
+
+def test_batched_creates():
+    result = TestResult("Batched Creates Within Rate Limit")
+
+    with AirtableStubServer(requests_per_second=20) as stub:
+        with AirtableClient('key', 'appTEST', api_url=stub.url, requests_per_second=20) as client:
+            records = [{'audit_id': f'AUD-{i}', 'company_name': f'Co {i}'} for i in range(95)]
+            start = time.perf_counter()
+            created = client.create_records('Audits', records)
+            elapsed = time.perf_counter() - start
+
+        if len(created) != 95 or len(stub.tables.get('Audits', {})) != 95:
+            result.add_error(f"Expected 95 records, created {len(created)}")
+        if len(stub.request_log) != 10:
+            result.add_error(f"Expected 10 requests, stub saw {len(stub.request_log)}")
+        if any(n > 10 for _, _, n in stub.request_log):
+            result.add_error("A request carried more than 10 records")
+        if stub.rejected:
+            result.add_error(f"Client exceeded the rate limit {stub.rejected} times")
+        print(f"   95 records in {elapsed * 1000:.0f} ms over {len(stub.request_log)} requests")
+
+    return result
+
+
+def test_default_rate_limit():
+    result = TestResult("Default Rate Matches Airtable's Rolling Second")
+
+    with AirtableStubServer() as stub:
+        with AirtableClient('key', 'appTEST', api_url=stub.url) as client:
+            created = client.create_records('Audits', [{'audit_id': f'AUD-{i}'} for i in range(100)])
+            stats = dict(client.stats)
+
+        if len(created) != 100 or len(stub.request_log) != 10:
+            result.add_error(f"Expected 100 records in 10 requests, got {len(created)} in {len(stub.request_log)}")
+        if stub.rejected or stats['retries']:
+            result.add_error(f"Default client exceeded the default limit: {stub.rejected} rejected, "
+                             f"{stats['retries']} retries")
+
+    return result
+
+
+def test_retry_on_429():
+    result = TestResult("Retry on 429 With Jitter")
+
+    with AirtableStubServer(requests_per_second=5) as stub:
+        # Client deliberately configured faster than the server allows
+        with AirtableClient('key', 'appTEST', api_url=stub.url,
+                            requests_per_second=50, backoff=0.05) as client:
+            created = client.create_records('Audits', [{'audit_id': f'AUD-{i}'} for i in range(80)])
+            retries = client.stats['retries']
+
+        if len(stub.tables.get('Audits', {})) != 80 or len(created) != 80:
+            result.add_error(f"Records lost under rate limiting: {len(created)} created")
+        if retries == 0 or stub.rejected == 0:
+            result.add_error("Expected the stub to throttle and the client to retry")
+
+    return result
+
+
+def test_no_post_resend_after_connection_error():
+    result = TestResult("POST Not Resent After Connection Error")
+
+    # A port nobody listens on: every request fails at the connection level
+    sock = socket.socket()
+    sock.bind(('127.0.0.1', 0))
+    dead_url = f'http://127.0.0.1:{sock.getsockname()[1]}'
+    sock.close()
+
+    with AirtableClient('key', 'appTEST', api_url=dead_url, requests_per_second=50,
+                        max_retries=2, backoff=0.01) as client:
+        try:
+            client.create_records('Audits', [{'audit_id': 'AUD-1'}])
+            result.add_error("Connection error swallowed")
+        except OSError:
+            pass
+        if client.stats['retries']:
+            result.add_error(f"POST resent {client.stats['retries']} times")
+
+        try:
+            client.upsert_records('Audits', [{'audit_id': 'AUD-1'}], merge_on=['audit_id'])
+            result.add_error("Connection error swallowed")
+        except OSError:
+            pass
+        if client.stats['retries'] != 2:
+            result.add_error(f"Idempotent upsert retried {client.stats['retries']} times, expected 2")
+
+    return result
+
+
+def test_reconnect_after_idle_close():
+    result = TestResult("Reconnect After Idle Keep-Alive Close")
+
+    with AirtableStubServer(requests_per_second=50, drop_idle=True) as stub:
+        with AirtableClient('key', 'appTEST', api_url=stub.url, requests_per_second=50,
+                            pool_size=1, max_retries=0) as client:
+            for i in range(5):
+                try:
+                    client.create_records('Audits', [{'audit_id': f'AUD-{i}'}])
+                except OSError as e:
+                    result.add_error(f"Create #{i + 1} failed on a dropped keep-alive: {e!r}")
+                    break
+                time.sleep(0.05)  # let the server's close reach the idle socket
+        if len(stub.tables.get('Audits', {})) != 5 or len(stub.request_log) != 5:
+            result.add_error(f"Expected 5 records from 5 requests, got {len(stub.tables.get('Audits', {}))} "
+                             f"from {len(stub.request_log)}")
+
+    return result
+
+
+def test_results_upsert():
+    result = TestResult("Results Upsert")
+
+    scored = [run_audit_scoring({'audit_id': sid, 'responses': s['responses']})
+              for sid, s in TEST_SCENARIOS.items()]
+
+    with AirtableStubServer(requests_per_second=50) as stub:
+        with AirtableClient('key', 'appTEST', api_url=stub.url, requests_per_second=50) as client:
+            client.upsert_records('Results', [result_to_fields(r) for r in scored], merge_on=['audit_id'])
+            client.upsert_records('Results', [result_to_fields(r) for r in scored], merge_on=['audit_id'])
+
+        rows = list(stub.tables['Results'].values())
+        if len(rows) != len(scored):
+            result.add_error(f"Upsert duplicated records: {len(rows)} rows for {len(scored)} audits")
+        statuses = {r['fields']['audit_id']: r['fields']['overall_status'] for r in rows}
+        if statuses.get('healthy_company') != 'green':
+            result.add_error(f"Unexpected stored status: {statuses}")
+
+    return result
+
+
+def run_all_tests():
+    print("=" * 70)
+    print("HIRING AUDIT - AIRTABLE CLIENT TEST")
+    print("=" * 70)
+
+    results = [
+        test_batched_creates(),
+        test_default_rate_limit(),
+        test_retry_on_429(),
+        test_no_post_resend_after_connection_error(),
+        test_reconnect_after_idle_close(),
+        test_results_upsert()
+    ]
+    for test_result in results:
+        print(test_result)
+
+    failed = sum(1 for r in results if not r.passed)
+    print(f"\nPassed: {len(results) - failed}/{len(results)}")
+    return 0 if failed == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(run_all_tests())
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Hiring Audit - Audit Store Test
+===============================
+
+Validates the embedded SQLite store (backend/audit_store.py): bulk upsert
+of scoring batches, indexed lookups, segment dashboard queries and the
+ruleset version stamped on every stored result.
+
+Run: python audit_store_test.py
+"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'backend'))
+
+from integration_test import TEST_SCENARIOS, TestResult
+from audit_store import AuditStore
+from scoring_engine import run_audit_scoring, BUILTIN_RULESET
+
+
+def test_bulk_upsert_and_lookup():
+    result = TestResult("Bulk Upsert & Lookup")
+
+    store = AuditStore(':memory:')
+    segments = ['51-200 employees', '501-1000 employees']
+    audits = []
+    payloads = []
+    for i in range(200):
+        for scenario_id, scenario in TEST_SCENARIOS.items():
+            audit_id = f'{scenario_id}-{i}'
+            audits.append({'audit_id': audit_id, 'company_name': f'Co {i}',
+                           'company_size': segments[i % 2], 'company_type': 'IT Product Company',
+                           'status': 'scoring'})
+            payloads.append({'audit_id': audit_id, 'responses': scenario['responses']})
+
+    store.upsert_audits(audits)
+    scored = [run_audit_scoring(p) for p in payloads]
+    store.upsert_results(scored)
+    # Re-scoring the same batch must update in place, not duplicate
+    store.upsert_results(scored)
+
+    stored = store.get_result('sla_theatre-7')
+    if not stored or stored['overall_status'] != 'red':
+        result.add_error(f"Unexpected stored result: {stored}")
+    elif not any(c['rule_id'] == 'CV-05' for c in stored['contradictions']):
+        result.add_error("Contradictions were not round-tripped as JSON")
+
+    audit = store.get_audit('sla_theatre-7')
+    if audit['status'] != 'completed' or not audit['completed_at']:
+        result.add_error(f"Audit not marked completed after scoring: {audit['status']}")
+
+    reds = store.results_by_status('red', limit=10000)
+    expected_reds = sum(1 for r in scored if r['overall_status'] == 'red')
+    if len(reds) != expected_reds:
+        result.add_error(f"Expected {expected_reds} red results, got {len(reds)}")
+
+    counts = store.status_counts_by_segment(company_size='51-200 employees')
+    if sum(counts.values()) != len(scored) // 2:
+        result.add_error(f"Segment counts wrong: {counts}")
+
+    store.close()
+    return result
+
+
+def test_indexes_used():
+    result = TestResult("Lookup Queries Use Indexes")
+
+    store = AuditStore(':memory:')
+    queries = [
+        ("SELECT * FROM results WHERE overall_status = 'red' ORDER BY calculated_at DESC", 'idx_results_status'),
+        ("SELECT * FROM audits WHERE created_at >= '2025'", 'idx_audits_created'),
+        ("SELECT * FROM audits WHERE company_size = 'x' AND company_type = 'y'", 'idx_audits_segment'),
+        ("SELECT * FROM responses WHERE audit_id = 'x'", 'idx_responses_audit'),
+    ]
+    for sql, index in queries:
+        plan = ' '.join(str(tuple(r)) for r in store._conn.execute('EXPLAIN QUERY PLAN ' + sql))
+        if index not in plan:
+            result.add_error(f"{index} not used by: {sql}")
+
+    store.close()
+    return result
+
+
+def test_responses_and_artifacts():
+    result = TestResult("Responses & Report Artifacts")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = AuditStore(os.path.join(tmp, 'audit.db'))
+        store.upsert_audits([{'audit_id': 'AUD-1', 'company_name': 'Acme', 'blocks_completed': ['config']}])
+        store.upsert_responses([
+            {'audit_id': 'AUD-1', 'block_id': 'block1', 'responses': {'b1_q1': 3}},
+            {'audit_id': 'AUD-1', 'block_id': 'block1', 'responses': {'b1_q1': 2}},
+        ])
+        rows = store.get_responses('AUD-1')
+        if len(rows) != 1 or rows[0]['responses'] != {'b1_q1': 2}:
+            result.add_error(f"Response upsert did not replace the block submission: {rows}")
+
+        store.record_artifact('AUD-1', 2, '/tmp/AUD-1_report.pdf', size_bytes=12345)
+        artifacts = store.get_artifacts('AUD-1')
+        if len(artifacts) != 1 or artifacts[0]['size_bytes'] != 12345:
+            result.add_error(f"Artifact not recorded: {artifacts}")
+        store.close()
+
+    return result
+
+
+def test_ruleset_version_stored():
+    result = TestResult("Ruleset Version Stored With Results")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'audit.db')
+        # A database created before results carried a ruleset version
+        conn = sqlite3.connect(path)
+        conn.executescript("""
+            CREATE TABLE results (
+                audit_id TEXT PRIMARY KEY, block_statuses TEXT NOT NULL, block_scores TEXT NOT NULL,
+                overall_status TEXT NOT NULL, confidence_score INTEGER NOT NULL,
+                gate_failures TEXT NOT NULL, contradictions TEXT NOT NULL,
+                recommendations TEXT NOT NULL, calculated_at TEXT NOT NULL);
+            INSERT INTO results VALUES ('old', '{}', '{}', 'green', 90, '[]', '[]', '[]', '2024-01-01');
+        """)
+        conn.commit()
+        conn.close()
+
+        store = AuditStore(path)
+        if store.get_result('old')['ruleset_version'] is not None:
+            result.add_error("Pre-existing result given a ruleset version")
+
+        strict = BUILTIN_RULESET.replace('strict', scoring={'GREEN_THRESHOLD': 2.8})
+        payload = {'audit_id': 'AUD-1', 'responses': TEST_SCENARIOS['healthy_company']['responses']}
+        store.upsert_results([run_audit_scoring(payload, BUILTIN_RULESET)])
+        if store.get_result('AUD-1')['ruleset_version'] != 'builtin-1.0':
+            result.add_error(f"Ruleset version not stored: {store.get_result('AUD-1')}")
+        store.upsert_results([run_audit_scoring(payload, strict)])
+        if store.get_result('AUD-1')['ruleset_version'] != 'strict':
+            result.add_error("Re-scoring under a new version did not update the stamp")
+        store.close()
+
+    return result
+
+
+def run_all_tests():
+    print("=" * 70)
+    print("HIRING AUDIT - AUDIT STORE TEST")
+    print("=" * 70)
+
+    results = [
+        test_bulk_upsert_and_lookup(),
+        test_indexes_used(),
+        test_responses_and_artifacts(),
+        test_ruleset_version_stored()
+    ]
+    for test_result in results:
+        print(test_result)
+
+    failed = sum(1 for r in results if not r.passed)
+    print(f"\nPassed: {len(results) - failed}/{len(results)}")
+    return 0 if failed == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(run_all_tests())
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Hiring Audit - Auto-Flag Engine Test
+====================================
+
+Validates backend/auto_flags.py: expression compilation, flag results for
+known configurations, surfacing through scoring and the pipeline, and the
+compiled engine against naive per-audit string evaluation.
+
+Run: python auto_flags_test.py
+"""
+
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'backend'))
+
+from integration_test import TEST_SCENARIOS, TestResult
+from auto_flags import (
+    AutoFlagEngine, AutoFlagSyntaxError, build_context, compile_expression,
+    read_auto_flag_column, default_engine
+)
+from scoring_engine import run_audit_scoring
+from scoring_pipeline import ScoringPipeline
+
+
+CONFIG = {
+    'company_size': '201-500 employees',
+    'monthly_volume': '31-50 per month',
+    'agency_usage': 'Often (20-50% of hires)',
+    'hiring_geography': 'Multi-country (EU)'
+}
+
+
+def naive_evaluate(rows, responses, config):
+    """Reference: rewrite every expression into Python source and eval() it per audit"""
+    ctx = build_context(config, responses)
+    fired = []
+    for row in rows:
+        expression = row['expression']
+        if expression.upper().startswith('CV:'):
+            continue
+        condition = expression.partition('→')[0].strip()
+        value = responses.get(row['question'])
+        if value is None or (value == -1 and 'value=-1' not in condition.replace(' ', '')):
+            continue
+        source = condition.replace('%', '').replace('&', ' and ').replace('|', ' or ')
+        source = re.sub(r'(?<![<>!=])=(?!=)', '==', source)
+        names = dict(ctx, value=value)
+        try:
+            if eval(source, {}, names):
+                fired.append(row['question'])
+        except TypeError:
+            # A None band compared with a number: the flag cannot fire
+            pass
+    return fired
+
+
+def test_compiled_expressions():
+    result = TestResult("Compiled Expressions")
+
+    ctx = {'value': 0, 'size': 350, 'volume': 40, 'company_type': 'product',
+           'agency_use': 35, 'demand_high': True, 'AI_used': False, 'GDPR': True}
+    cases = [
+        ('size>100 & value=0', True),
+        ('size>500 & value=0', False),
+        ('agency_use>20% & value<=1', True),
+        ('AI_used & value=0', False),
+        ('AI_used | GDPR', True),
+        ('company_type=product', True),
+        ('company_type!=rpo & value!=0', False)
+    ]
+    for expression, expected in cases:
+        if compile_expression(expression)(ctx) != expected:
+            result.add_error(f"{expression!r} should be {expected}")
+
+    if compile_expression('size>100')(dict(ctx, size=None)):
+        result.add_error("Unknown size must not satisfy a comparison")
+
+    for bad in ('headcount>100', 'value=0 &', 'size>>1'):
+        try:
+            compile_expression(bad)
+            result.add_error(f"{bad!r} should not compile")
+        except AutoFlagSyntaxError:
+            pass
+
+    return result
+
+
+def test_question_bank_flags():
+    result = TestResult("Question Bank Auto-Flags")
+
+    engine = default_engine()
+    if len(engine.flags) < 10:
+        result.add_error(f"Only {len(engine.flags)} Auto-Flags compiled from the CSV")
+    if not any(link.get('target_question') for links in engine.cv_links.values() for link in links):
+        result.add_error("CV: references were not collected as cross-validation links")
+
+    responses = {'b1_q1': 0, 'b4_q4': 0, 'b4_q8': 1, 'b7_q5': 2, 'b7_q7': 0, 'b7_q10': 0, 'b6_q1': 2}
+    fired = {f['question'] for f in engine.evaluate(responses, CONFIG)}
+    expected = {'b1_q1', 'b4_q4', 'b4_q8', 'b7_q7', 'b7_q10'}
+    if fired != expected:
+        result.add_error(f"Expected {sorted(expected)}, got {sorted(fired)}")
+
+    # Small single-country company with no agency use: only value-only flags remain
+    small = {'company_size': '1-50 employees', 'monthly_volume': '1-5 per month',
+             'agency_usage': 'Never', 'hiring_geography': 'Single country'}
+    fired = {f['question'] for f in engine.evaluate(responses, small)}
+    if fired != {'b7_q7'}:
+        result.add_error(f"Config context not applied: {sorted(fired)}")
+
+    # "Not relevant" answers never satisfy a flag unless it tests for them
+    na = {'b1_q3': -1, 'b4_q8': -1, 'b6_q1': 3, 'b7_q5': -1}
+    fired = [f['question'] for f in engine.evaluate(na, {'agency_usage': 'Heavily (>50% of hires)'})]
+    if fired != ['b7_q5']:
+        result.add_error(f"Not-relevant answers handled wrongly: {fired}")
+
+    return result
+
+
+def test_surfaced_in_scoring():
+    result = TestResult("Auto-Flags in Scoring & Pipeline")
+
+    payloads = [{'audit_id': sid, 'responses': s['responses'], 'config': CONFIG}
+                for sid, s in TEST_SCENARIOS.items()]
+    with ScoringPipeline() as pipeline:
+        piped = pipeline.run_batch(payloads)
+
+    for payload, from_pipeline in zip(payloads, piped):
+        scored = run_audit_scoring(payload)
+        if scored['auto_flags'] != from_pipeline['auto_flags']:
+            result.add_error(f"{payload['audit_id']}: pipeline auto_flags differ from engine")
+        expected = naive_evaluate(read_auto_flag_column(), payload['responses'], CONFIG)
+        if [f['question'] for f in scored['auto_flags']] != expected:
+            result.add_error(f"{payload['audit_id']}: compiled flags differ from naive evaluation")
+
+    return result
+
+
+def test_faster_than_naive():
+    result = TestResult("Compiled vs Naive Evaluation")
+
+    rows = read_auto_flag_column()
+    engine = AutoFlagEngine(rows)
+    audits = [s['responses'] for s in TEST_SCENARIOS.values()] * 200
+
+    start = time.perf_counter()
+    for responses in audits:
+        naive_evaluate(rows, responses, CONFIG)
+    naive_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for responses in audits:
+        engine.evaluate(responses, CONFIG)
+    compiled_s = time.perf_counter() - start
+
+    print(f"   {len(audits)} audits: naive {naive_s * 1000:.1f}ms, "
+          f"compiled {compiled_s * 1000:.1f}ms ({naive_s / compiled_s:.1f}x)")
+    if compiled_s >= naive_s:
+        result.add_error("Compiled engine is not faster than naive string evaluation")
+
+    return result
+
+
+def run_all_tests():
+    print("=" * 70)
+    print("HIRING AUDIT - AUTO-FLAG ENGINE TEST")
+    print("=" * 70)
+
+    results = [
+        test_compiled_expressions(),
+        test_question_bank_flags(),
+        test_surfaced_in_scoring(),
+        test_faster_than_naive()
+    ]
+    for test_result in results:
+        print(test_result)
+
+    failed = sum(1 for r in results if not r.passed)
+    print(f"\nPassed: {len(results) - failed}/{len(results)}")
+    return 0 if failed == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(run_all_tests())
@@ -13,12 +13,20 @@ Simulates the complete audit workflow as it would run in production:
 This can be used as a reference implementation or smoke test.
 """
 
+import argparse
+import asyncio
 import json
 import os
 import sys
 from datetime import datetime
 from typing import Dict, Any
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'backend'))
+
+from scoring_pipeline import Stage
+from stage_checkpoints import CheckpointStore, CheckpointedWorkflow
+from tracing import Tracer, OTLPJsonFileExporter, current_span
+
 # ============================================================================
 # SIMULATED FORM SUBMISSION
 # ============================================================================
@@ -215,6 +223,7 @@ def generate_report_data(scoring_result: Dict, metadata: Dict) -> Dict:
         'confidence_score': scoring_result.get('confidence_score', 50),
         'gate_failures': scoring_result.get('gate_failures', []),
         'contradictions': [c['name'] for c in scoring_result.get('contradictions', [])],
+        'auto_flags': scoring_result.get('auto_flags', []),
         'recommendations': scoring_result.get('recommendations', [])
     }
 
@@ -223,63 +232,144 @@ def generate_report_data(scoring_result: Dict, metadata: Dict) -> Dict:
 # WORKFLOW SIMULATION
 # ============================================================================
 
+E2E_STAGES = [
+    Stage('submission', lambda inputs, up: simulate_form_submission(
+        inputs['audit_id'], inputs['company_name'], inputs['responses'])),
+    Stage('scoring', lambda inputs, up: process_scoring(up['submission']), ['submission']),
+    Stage('recommendations', lambda inputs, up: select_recommendations(up['scoring']), ['scoring']),
+    Stage('report_data', lambda inputs, up: generate_report_data(
+        up['recommendations'], up['submission']['metadata']), ['recommendations', 'submission']),
+    Stage('pdf', lambda inputs, up: render_pdf(inputs, up['report_data'], up['submission']['metadata']),
+          ['report_data', 'submission']),
+    Stage('delivery', lambda inputs, up: deliver_report(inputs, up['pdf'], up['submission']['metadata']),
+          ['pdf', 'submission'])
+]
+
+
+def render_pdf(inputs: Dict, report_data: Dict, metadata: Dict) -> Dict:
+    """
+    PDF stage; raises on failure so the run can be resumed at this stage
+    """
+    if not inputs.get('generate_pdf'):
+        return {'pdf_path': None}
+
+    from audit_report_generator import HiringAuditReportGenerator
+
+    level = {'lite': 1, 'standard': 2, 'premium': 3}.get(metadata.get('audit_tier'), 2)
+    pdf_path = os.path.join(inputs['output_dir'], f"{inputs['audit_id']}_report.pdf")
+    generator = HiringAuditReportGenerator(audit_data=report_data, output_path=pdf_path, level=level)
+    generator.generate()
+    span = current_span()
+    if span is not None:
+        span.set_attributes({'report.level': level, 'report.render_mode': generator.render_stats['mode']})
+    return {'pdf_path': pdf_path}
+
+
+def deliver_report(inputs: Dict, pdf: Dict, metadata: Dict) -> Dict:
+    """
+    Email stage (only when an email API is configured); raises if any
+    recipient failed so the run can be resumed at this stage
+    """
+    if not inputs.get('email_api_url') or not pdf['pdf_path']:
+        return {'sent': 0, 'skipped': True}
+
+    from email_delivery import AsyncEmailSender
+
+    span = current_span()
+    sender = AsyncEmailSender(os.environ.get('SENDGRID_API_KEY', 'test-key'), 'audit@example.com',
+                              api_url=inputs['email_api_url'], backoff=0.01,
+                              tracer=span.tracer if span is not None else None)
+    try:
+        outcome = asyncio.run(sender.send_report(pdf['pdf_path'], metadata.get('company_name', 'Unknown'),
+                                                 metadata.get('buyer_email')))
+    finally:
+        sender.close()
+    if outcome['failed']:
+        raise RuntimeError(f"Email delivery failed: {outcome['failed'][0].last_error}")
+    return {'sent': len(outcome['sent']), 'skipped': False}
+
+
 def run_e2e_workflow(audit_id: str, company_name: str, responses: Dict[str, int], 
-                     generate_pdf: bool = False, output_dir: str = '/tmp') -> Dict:
+                     generate_pdf: bool = False, output_dir: str = '/tmp',
+                     checkpoints: CheckpointStore = None, email_api_url: str = None,
+                     tracer: Tracer = None, traceparent: str = None) -> Dict:
     """
     Run complete E2E workflow
+
+    With a CheckpointStore, stage outputs are persisted per audit and a rerun
+    resumes at the first stage that did not complete for the same inputs.
+    With a Tracer, the run and each stage are recorded as spans (continuing
+    the webhook's trace when its traceparent is given).
     """
     print(f"\n{'='*60}")
     print(f"E2E WORKFLOW: {audit_id}")
     print(f"{'='*60}")
-    
-    # Step 1: Form submission
-    print("\n📝 Step 1: Simulating form submission...")
-    form_payload = simulate_form_submission(audit_id, company_name, responses)
-    print(f"   Received {len(responses)} responses")
-    
-    # Step 2: Scoring
-    print("\n⚙️  Step 2: Running scoring engine...")
-    scoring_result = process_scoring(form_payload)
-    print(f"   Overall Status: {scoring_result['overall_status'].upper()}")
-    print(f"   Confidence: {scoring_result['confidence_score']}/100")
-    print(f"   Gate Failures: {len(scoring_result['gate_failures'])}")
-    print(f"   Contradictions: {len(scoring_result['contradictions'])}")
-    
-    # Step 3: Recommendations
-    print("\n💡 Step 3: Selecting recommendations...")
-    with_recs = select_recommendations(scoring_result)
-    print(f"   Selected {len(with_recs['recommendations'])} recommendations")
-    
-    # Step 4: Report data
-    print("\n📊 Step 4: Preparing report data...")
-    report_data = generate_report_data(with_recs, form_payload['metadata'])
-    
-    # Step 5: PDF generation (optional)
-    pdf_path = None
-    if generate_pdf:
-        print("\n📄 Step 5: Generating PDF report...")
-        try:
-            sys.path.insert(0, '/home/claude/report_generator')
-            from audit_report_generator import HiringAuditReportGenerator
-            
-            level = {'lite': 1, 'standard': 2, 'premium': 3}.get(
-                form_payload['metadata'].get('audit_tier'), 2
-            )
-            
-            pdf_path = os.path.join(output_dir, f'{audit_id}_report.pdf')
-            generator = HiringAuditReportGenerator(
-                audit_data=report_data,
-                output_path=pdf_path,
-                level=level
-            )
-            generator.generate()
-            print(f"   ✅ PDF generated: {pdf_path}")
-        except Exception as e:
-            print(f"   ❌ PDF generation failed: {e}")
-    
+
+    store = checkpoints or CheckpointStore(':memory:')
+    inputs = {'audit_id': audit_id, 'company_name': company_name, 'responses': responses,
+              'generate_pdf': generate_pdf, 'output_dir': output_dir}
+    if email_api_url:
+        inputs['email_api_url'] = email_api_url
+    run = CheckpointedWorkflow(E2E_STAGES, store, tracer).run(audit_id, inputs, traceparent)
+    if checkpoints is None:
+        store.close()
+    return report_workflow_run(run)
+
+
+def report_workflow_run(run: Dict) -> Dict:
+    """
+    Print the stage log and summary of one (possibly resumed) workflow run
+    """
+    outputs = run['outputs']
+    if run['reused']:
+        print(f"\n♻️  Reused checkpoints: {', '.join(run['reused'])}")
+
+    steps = [
+        ('submission', "📝 Step 1: Simulating form submission..."),
+        ('scoring', "⚙️  Step 2: Running scoring engine..."),
+        ('recommendations', "💡 Step 3: Selecting recommendations..."),
+        ('report_data', "📊 Step 4: Preparing report data..."),
+        ('pdf', "📄 Step 5: Generating PDF report..."),
+        ('delivery', "📧 Step 6: Delivering report...")
+    ]
+    for name, label in steps:
+        if name not in run['executed'] and name != run['failed_stage']:
+            continue
+        print(f"\n{label}")
+        if name == run['failed_stage']:
+            print(f"   ❌ {name} failed: {run['error']}")
+        elif name == 'submission':
+            print(f"   Received {len(outputs['submission']['responses'])} responses")
+        elif name == 'scoring':
+            scoring = outputs['scoring']
+            print(f"   Overall Status: {scoring['overall_status'].upper()}")
+            print(f"   Confidence: {scoring['confidence_score']}/100")
+            print(f"   Gate Failures: {len(scoring['gate_failures'])}")
+            print(f"   Contradictions: {len(scoring['contradictions'])}")
+        elif name == 'recommendations':
+            print(f"   Selected {len(outputs['recommendations']['recommendations'])} recommendations")
+        elif name == 'pdf' and outputs['pdf']['pdf_path']:
+            print(f"   ✅ PDF generated: {outputs['pdf']['pdf_path']}")
+        elif name == 'delivery' and not outputs['delivery']['skipped']:
+            print(f"   ✅ Sent to {outputs['delivery']['sent']} recipient(s)")
+
+    audit_id = run['audit_id']
+    form_payload = outputs.get('submission')
+    scoring_result = outputs.get('scoring')
+    with_recs = outputs.get('recommendations', {'recommendations': []})
+    report_data = outputs.get('report_data')
+    pdf_path = outputs.get('pdf', {}).get('pdf_path')
+    if scoring_result is None:
+        return {'audit_id': audit_id, 'status': run['status'], 'failed_stage': run['failed_stage'],
+                'form_payload': form_payload, 'scoring_result': None, 'recommendations': [],
+                'report_data': None, 'pdf_path': None}
+
     # Summary
     print(f"\n{'='*60}")
-    print("WORKFLOW COMPLETE")
+    if run['status'] == 'complete':
+        print("WORKFLOW COMPLETE")
+    else:
+        print(f"WORKFLOW FAILED AT STAGE: {run['failed_stage']} (rerun resumes here)")
     print(f"{'='*60}")
     
     # Block status visualization
@@ -310,6 +400,8 @@ def run_e2e_workflow(audit_id: str, company_name: str, responses: Dict[str, int]
     
     return {
         'audit_id': audit_id,
+        'status': run['status'],
+        'failed_stage': run['failed_stage'],
         'form_payload': form_payload,
         'scoring_result': scoring_result,
         'recommendations': with_recs['recommendations'],
@@ -378,22 +470,53 @@ SCENARIOS = {
 # MAIN
 # ============================================================================
 
-def main():
+def resume_failed(checkpoints: CheckpointStore, limit: int = None, tracer: Tracer = None) -> list:
+    """
+    Batch "resume failed": rerun only the unfinished stages of every failed
+    or interrupted audit in the checkpoint store
+    """
+    workflow = CheckpointedWorkflow(E2E_STAGES, checkpoints, tracer)
+    return [report_workflow_run(run) for run in workflow.resume_failed(limit)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Hiring audit E2E workflow simulation')
+    parser.add_argument('--checkpoints', help='SQLite checkpoint file; reruns resume completed stages')
+    parser.add_argument('--resume-failed', action='store_true',
+                        help='only resume failed / interrupted audits from --checkpoints')
+    parser.add_argument('--trace', help='append OTLP/JSON spans to this file')
+    parser.add_argument('--sample-rate', type=float, default=1.0, help='share of audits traced')
+    args = parser.parse_args(argv)
+    if args.resume_failed and not args.checkpoints:
+        parser.error('--resume-failed requires --checkpoints')
+
     print("\n" + "=" * 70)
     print("HIRING AUDIT - FULL E2E WORKFLOW SIMULATION")
     print("=" * 70)
     
-    results = []
-    
-    for scenario_id, scenario in SCENARIOS.items():
-        result = run_e2e_workflow(
-            audit_id=f"E2E-{scenario_id.upper()}-001",
-            company_name=scenario['company'],
-            responses=scenario['responses'],
-            generate_pdf=True,
-            output_dir='/tmp'
-        )
-        results.append(result)
+    checkpoints = CheckpointStore(args.checkpoints) if args.checkpoints else None
+    tracer = Tracer(OTLPJsonFileExporter(args.trace), args.sample_rate) if args.trace else None
+    if args.resume_failed:
+        results = resume_failed(checkpoints, tracer=tracer)
+    else:
+        results = []
+        for scenario_id, scenario in SCENARIOS.items():
+            result = run_e2e_workflow(
+                audit_id=f"E2E-{scenario_id.upper()}-001",
+                company_name=scenario['company'],
+                responses=scenario['responses'],
+                generate_pdf=True,
+                output_dir='/tmp',
+                checkpoints=checkpoints,
+                tracer=tracer
+            )
+            results.append(result)
+    if checkpoints is not None:
+        print(f"\nCheckpoint runs by status: {checkpoints.stats()}")
+        checkpoints.close()
+    if tracer is not None:
+        tracer.close()
+        print(f"\n🔎 Spans written to: {args.trace}")
     
     # Final summary
     print("\n" + "=" * 70)
@@ -404,6 +527,9 @@ def main():
     print("-" * 50)
     for result in results:
         scoring = result['scoring_result']
+        if scoring is None:
+            print(f"❌ {result['audit_id']}: failed at {result['failed_stage']}")
+            continue
         status_emoji = {'green': '🟢', 'yellow': '🟡', 'red': '🔴'}[scoring['overall_status']]
         print(f"{status_emoji} {result['audit_id']}: {scoring['overall_status'].upper()} ({scoring['confidence_score']}/100)")
         if result['pdf_path']:
@@ -417,6 +543,7 @@ def main():
         for r in results:
             export_data.append({
                 'audit_id': r['audit_id'],
+                'status': r['status'],
                 'scoring': r['scoring_result'],
                 'recommendations': r['recommendations'],
                 'pdf_path': r['pdf_path']
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Hiring Audit - Email Delivery Test
+==================================
+
+Sends report emails through the async sender (backend/email_delivery.py)
+to the bundled SendGrid stub: shared attachment encoding, fan-out to
+stakeholders, the retry queue, final 4xx rejections, no resending after
+a connection lost mid-request and per-message error isolation.
+
+Run: python email_delivery_test.py
+"""
+
+import asyncio
+import base64
+import os
+import socket
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'backend'))
+
+from integration_test import TestResult
+from email_delivery import AsyncEmailSender, EmailMessage, SendGridStubServer, report_messages
+
+
+def _write_pdf(tmp):
+    path = os.path.join(tmp, 'report.pdf')
+    with open(path, 'wb') as f:
+        f.write(b'%PDF-1.4\n' + os.urandom(200_000))
+    return path
+
+
+def test_fan_out_shares_attachment():
+    result = TestResult("Fan-out Shares One Encoded Attachment")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = _write_pdf(tmp)
+        recipients = ['buyer@example.com'] + [f'exec{i}@example.com' for i in range(20)]
+        messages = report_messages(pdf_path, 'Acme', recipients + ['buyer@example.com'])
+
+        if len(messages) != 21:
+            result.add_error(f"Duplicate recipients not collapsed: {len(messages)} messages")
+        if len({id(m.attachment) for m in messages}) != 1:
+            result.add_error("Attachment was encoded more than once")
+
+        with SendGridStubServer() as stub:
+            sender = AsyncEmailSender('key', 'audit@example.com', api_url=stub.url, max_in_flight=4)
+            outcome = asyncio.run(sender.send_all(messages))
+            sender.close()
+
+        if len(outcome['sent']) != 21 or len(stub.messages) != 21:
+            result.add_error(f"Expected 21 deliveries, stub received {len(stub.messages)}")
+        delivered = {m['personalizations'][0]['to'][0]['email'] for m in stub.messages}
+        if delivered != set(recipients):
+            result.add_error("Delivered recipients do not match")
+        with open(pdf_path, 'rb') as f:
+            original = f.read()
+        if base64.b64decode(stub.messages[0]['attachments'][0]['content']) != original:
+            result.add_error("Attachment content corrupted in transit")
+
+    return result
+
+
+def test_retry_queue():
+    result = TestResult("Retry Queue on 5xx")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = _write_pdf(tmp)
+        with SendGridStubServer(fail_first=3) as stub:
+            sender = AsyncEmailSender('key', 'audit@example.com', api_url=stub.url, backoff=0.01)
+            outcome = asyncio.run(sender.send_report(
+                pdf_path, 'Acme', 'buyer@example.com', ['cfo@example.com', 'coo@example.com']))
+            sender.close()
+
+        if len(outcome['sent']) != 3 or outcome['failed']:
+            result.add_error(f"Expected all 3 sent after retries: {outcome}")
+        if sender.stats['retried'] != 3:
+            result.add_error(f"Expected 3 retries, got {sender.stats['retried']}")
+
+        with SendGridStubServer(fail_first=100) as stub:
+            sender = AsyncEmailSender('key', 'audit@example.com', api_url=stub.url,
+                                      backoff=0.01, max_retries=2)
+            outcome = asyncio.run(sender.send_report(pdf_path, 'Acme', 'buyer@example.com'))
+            sender.close()
+
+        if len(outcome['failed']) != 1 or outcome['failed'][0].attempts != 3 or \
+                outcome['failed'][0].status != 'failed':
+            result.add_error("Message should fail permanently after max_retries")
+
+    return result
+
+
+def test_rejections_and_errors_isolated():
+    result = TestResult("Rejections and Errors Isolated Per Message")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = _write_pdf(tmp)
+        messages = report_messages(pdf_path, 'Acme <Holdings> & Co', ['buyer@example.com', 'bad@example.com'],
+                                   report_url='https://example.com/r?a=1&b="2"')
+        if 'Acme &lt;Holdings&gt; &amp; Co' not in messages[0].html or '<Holdings>' in messages[0].html \
+                or '"2"' in messages[0].html:
+            result.add_error("Company name / URL not HTML-escaped")
+
+        # Unserializable bodies raise inside every worker that picks them up
+        broken = [EmailMessage(f'broken{i}@example.com', object(), '<p>x</p>') for i in range(4)]
+        with SendGridStubServer(reject=['bad@example.com']) as stub:
+            sender = AsyncEmailSender('key', 'audit@example.com', api_url=stub.url,
+                                      max_in_flight=2, backoff=0.01)
+            outcome = asyncio.run(asyncio.wait_for(sender.send_all(broken + messages), timeout=10))
+            sender.close()
+
+        statuses = {m.to_email: m.status for m in outcome['sent'] + outcome['failed']}
+        if statuses.get('buyer@example.com') != 'sent' or len(stub.messages) != 1:
+            result.add_error(f"Good message not delivered after worker errors: {statuses}")
+        rejected = [m for m in outcome['failed'] if m.to_email == 'bad@example.com']
+        if not rejected or rejected[0].status != 'rejected' or rejected[0].attempts != 1:
+            result.add_error("4xx should be rejected after one attempt without retries")
+        errored = [m for m in outcome['failed'] if m.to_email.startswith('broken')]
+        if len(errored) != 4 or not all('TypeError' in (m.last_error or '') for m in errored):
+            result.add_error(f"Send errors not recorded per message: {[m.last_error for m in errored]}")
+        if sender.stats['retried']:
+            result.add_error(f"Non-retryable outcomes retried {sender.stats['retried']} times")
+
+    return result
+
+
+def test_no_resend_after_send():
+    result = TestResult("No Resend After the Request Was Sent")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = _write_pdf(tmp)
+        with SendGridStubServer(hang_up=['buyer@example.com']) as stub:
+            sender = AsyncEmailSender('key', 'audit@example.com', api_url=stub.url, backoff=0.01)
+            outcome = asyncio.run(sender.send_report(pdf_path, 'Acme', 'buyer@example.com', ['cfo@example.com']))
+            sender.close()
+
+        buyer = [m for m in outcome['failed'] if m.to_email == 'buyer@example.com']
+        if not buyer or buyer[0].attempts != 1 or buyer[0].status != 'failed':
+            result.add_error(f"Message lost after sending should fail without retry: {outcome}")
+        if sum(1 for m in stub.messages if m['personalizations'][0]['to'][0]['email'] == 'buyer@example.com') != 1:
+            result.add_error("Accepted message was sent again")
+        if [m.to_email for m in outcome['sent']] != ['cfo@example.com']:
+            result.add_error("Other recipients affected by the lost connection")
+
+        # Nothing listening: the request never left, so it is retried
+        sock = socket.socket()
+        sock.bind(('127.0.0.1', 0))
+        dead_url = f'http://127.0.0.1:{sock.getsockname()[1]}'
+        sock.close()
+        sender = AsyncEmailSender('key', 'audit@example.com', api_url=dead_url, backoff=0.01, max_retries=2)
+        outcome = asyncio.run(sender.send_report(pdf_path, 'Acme', 'buyer@example.com'))
+        sender.close()
+        if not outcome['failed'] or outcome['failed'][0].attempts != 3 or sender.stats['retried'] != 2:
+            result.add_error(f"Unsent request not retried: {sender.stats}")
+
+    return result
+
+
+def run_all_tests():
+    print("=" * 70)
+    print("HIRING AUDIT - EMAIL DELIVERY TEST")
+    print("=" * 70)
+
+    results = [
+        test_fan_out_shares_attachment(),
+        test_retry_queue(),
+        test_rejections_and_errors_isolated(),
+        test_no_resend_after_send()
+    ]
+    for test_result in results:
+        print(test_result)
+
+    failed = sum(1 for r in results if not r.passed)
+    print(f"\nPassed: {len(results) - failed}/{len(results)}")
+    return 0 if failed == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(run_all_tests())
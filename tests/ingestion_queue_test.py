@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Hiring Audit - Ingestion Queue Test
+===================================
+
+Validates the SQLite webhook journal (backend/ingestion_queue.py):
+deduplication of retried webhooks, coalescing of config + block forms
+(multi-respondent forms included), lease-based crash recovery, lease
+renewal while failures are isolated and batch hand-off to the scoring
+pipeline.
+
+Run: python ingestion_queue_test.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'backend'))
+
+from e2e_workflow_test import simulate_form_submission, SCENARIOS
+from integration_test import TestResult
+from ingestion_queue import IngestionQueue, BLOCK_FORM_IDS
+from scoring_engine import run_audit_scoring
+from scoring_pipeline import ScoringPipeline
+
+
+def _block_forms(audit_id, responses):
+    """Split a full response set into config + per-block webhook payloads"""
+    payloads = [{'audit_id': audit_id, 'form_id': 'config', 'metadata': {'company_name': audit_id},
+                 'responses': {'company_size': '201-500 employees'}}]
+    for i, form_id in enumerate(BLOCK_FORM_IDS, 1):
+        payloads.append({
+            'audit_id': audit_id,
+            'form_id': form_id,
+            'responses': {k: v for k, v in responses.items() if k.startswith(f'b{i}_')}
+        })
+    return payloads
+
+
+def test_dedup_and_coalescing():
+    result = TestResult("Dedup & Coalescing")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        queue = IngestionQueue(os.path.join(tmp, 'ingest.db'))
+        responses = SCENARIOS['midsize_growing']['responses']
+        forms = _block_forms('AUD-1', responses)
+
+        for payload in forms[:-1]:
+            queue.enqueue(payload)
+        if queue.claim_batch():
+            result.add_error("Audit was released before all forms arrived")
+
+        # n8n retry of an already journaled form
+        ack = queue.enqueue(forms[0])
+        if ack['status'] != 'duplicate':
+            result.add_error(f"Retry not deduplicated: {ack}")
+
+        ack = queue.enqueue(forms[-1])
+        if ack.get('audit_status') != 'ready':
+            result.add_error(f"Audit not ready after last form: {ack}")
+
+        batch = queue.claim_batch()
+        if len(batch) != 1:
+            result.add_error(f"Expected one coalesced audit, got {len(batch)}")
+        else:
+            merged = batch[0]
+            if merged['responses'] != responses:
+                result.add_error("Coalesced responses do not match the original answers")
+            if merged['config'].get('company_size') != '201-500 employees':
+                result.add_error("Config answers were not kept separate from block responses")
+
+        queue.mark_done([p['audit_id'] for p in batch])
+        if queue.enqueue(forms[3])['status'] != 'duplicate':
+            result.add_error("Late retry after scoring was not deduplicated")
+
+        # Multi-respondent block forms: one respondent's answers span several forms
+        multi = [{'audit_id': 'AUD-M', 'form_id': 'config', 'responses': {'company_size': '51-200 employees'}}]
+        expected = {'r1': {}, 'r2': {}}
+        for i, form_id in enumerate(BLOCK_FORM_IDS, 1):
+            records = []
+            for respondent_id, role, offset in (('r1', 'TA', 0), ('r2', 'Delivery', 1)):
+                answers = {k: max(0, v - offset) for k, v in responses.items() if k.startswith(f'b{i}_')}
+                expected[respondent_id].update(answers)
+                records.append({'respondent_id': respondent_id, 'role': role, 'responses': answers})
+            multi.append({'audit_id': 'AUD-M', 'form_id': form_id, 'respondents': records})
+        queue.enqueue_many(multi)
+        batch = queue.claim_batch()
+        merged = batch[0] if batch else {}
+        got = {r['respondent_id']: r['responses'] for r in merged.get('respondents', [])}
+        if got != expected:
+            result.add_error(f"Respondents not coalesced per respondent: {sorted(got)}")
+        else:
+            direct = run_audit_scoring({'audit_id': 'AUD-M', 'respondents': [
+                {'respondent_id': rid, 'role': role, 'responses': expected[rid]}
+                for rid, role in (('r1', 'TA'), ('r2', 'Delivery'))]})
+            scored = run_audit_scoring(merged)
+            if scored['respondents'] != direct['respondents'] or \
+                    scored['block_statuses'] != direct['block_statuses']:
+                result.add_error("Coalesced respondents score differently from the original records")
+        queue.close()
+
+    return result
+
+
+def test_crash_recovery():
+    result = TestResult("Crash Recovery")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'ingest.db')
+        queue = IngestionQueue(db_path, lease_seconds=0.2)
+        queue.enqueue(simulate_form_submission('AUD-2', 'Crash Co', SCENARIOS['startup_chaos']['responses']))
+        if len(queue.claim_batch()) != 1:
+            result.add_error("Combined form submission was not ready immediately")
+
+        # A second worker opening the journal must not take over live claims
+        other = IngestionQueue(db_path, lease_seconds=0.2)
+        if other.claim_batch() or other.stats() != {'processing': 1}:
+            result.add_error(f"Second worker took an audit still under lease: {other.stats()}")
+        queue.close()  # first worker dies while processing
+
+        time.sleep(0.25)
+        if [p['audit_id'] for p in other.claim_batch()] != ['AUD-2']:
+            result.add_error("In-flight audit was not taken over after its lease expired")
+        other.close()
+
+        # Repeatedly abandoned audits are parked instead of cycling forever
+        time.sleep(0.25)
+        queue = IngestionQueue(db_path, max_attempts=2)
+        if queue.claim_batch() or queue.stats() != {'failed': 1}:
+            result.add_error(f"Abandoned audit not parked after max_attempts: {queue.stats()}")
+        queue.close()
+
+    return result
+
+
+def test_drain_throughput():
+    result = TestResult("Drain to Scorer & Throughput")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        queue = IngestionQueue(os.path.join(tmp, 'ingest.db'))
+        payloads = []
+        for i in range(500):
+            payloads.extend(_block_forms(f'AUD-{i:04d}', SCENARIOS['enterprise_mature']['responses']))
+
+        start = time.perf_counter()
+        for i in range(0, len(payloads), 200):
+            queue.enqueue_many(payloads[i:i + 200])
+        rate = len(payloads) / (time.perf_counter() - start)
+        print(f"   enqueue rate: {rate:,.0f} submissions/s")
+        if rate < 2000:
+            result.add_error(f"Enqueue rate too low: {rate:.0f}/s")
+
+        with ScoringPipeline() as pipeline:
+            scored = queue.drain(pipeline.run_batch, batch_size=64)
+        if len(scored) != 500:
+            result.add_error(f"Expected 500 scored audits, got {len(scored)}")
+        if any(r['overall_status'] != 'green' for r in scored):
+            result.add_error("Coalesced enterprise audits should all score green")
+        if queue.stats().get('done') != 500:
+            result.add_error(f"Unexpected queue state: {queue.stats()}")
+        queue.close()
+
+    return result
+
+
+def test_drain_isolates_failures():
+    result = TestResult("Drain Isolates Failing Audits")
+
+    def score_batch(batch):
+        if any(p['audit_id'] == 'AUD-BAD' for p in batch):
+            raise ValueError("unscorable payload")
+        return [{'audit_id': p['audit_id']} for p in batch]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        queue = IngestionQueue(os.path.join(tmp, 'ingest.db'), max_attempts=2)
+        for audit_id in ('AUD-A', 'AUD-BAD', 'AUD-B', 'AUD-C'):
+            queue.enqueue(simulate_form_submission(audit_id, audit_id, SCENARIOS['startup_chaos']['responses']))
+
+        scored = queue.drain(score_batch, batch_size=10)
+        if sorted(r['audit_id'] for r in scored) != ['AUD-A', 'AUD-B', 'AUD-C']:
+            result.add_error(f"Healthy audits not scored: {scored}")
+        if queue.stats() != {'done': 3, 'failed': 1}:
+            result.add_error(f"Unexpected queue state: {queue.stats()}")
+        attempts = dict(queue._conn.execute('SELECT audit_id, attempts FROM audits').fetchall())
+        if attempts != {'AUD-A': 1, 'AUD-BAD': 2, 'AUD-B': 1, 'AUD-C': 1}:
+            result.add_error(f"Batch failure used up other audits' attempts: {attempts}")
+        queue.close()
+
+    return result
+
+
+def test_isolation_keeps_leases():
+    result = TestResult("Isolation Pass Keeps Its Leases")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'ingest.db')
+        queue = IngestionQueue(db_path, lease_seconds=0.3)
+        other = IngestionQueue(db_path, lease_seconds=0.3)
+        audit_ids = [f'AUD-{i}' for i in range(6)]
+        for audit_id in audit_ids:
+            queue.enqueue(simulate_form_submission(audit_id, audit_id, SCENARIOS['startup_chaos']['responses']))
+
+        taken = []
+
+        def score_batch(batch):
+            if len(batch) > 1:
+                raise ValueError("batch failed")
+            time.sleep(0.1)  # the whole isolation pass outlives one lease
+            taken.extend(p['audit_id'] for p in other.claim_batch())
+            return [{'audit_id': p['audit_id']} for p in batch]
+
+        scored = queue.drain(score_batch, batch_size=10)
+        if taken:
+            result.add_error(f"Another worker took over audits still being isolated: {taken}")
+        if sorted(r['audit_id'] for r in scored) != audit_ids or queue.stats() != {'done': 6}:
+            result.add_error(f"Unexpected outcome: {len(scored)} scored, {queue.stats()}")
+        queue.close()
+        other.close()
+
+    return result
+
+
+def run_all_tests():
+    print("=" * 70)
+    print("HIRING AUDIT - INGESTION QUEUE TEST")
+    print("=" * 70)
+
+    results = [
+        test_dedup_and_coalescing(),
+        test_crash_recovery(),
+        test_drain_isolates_failures(),
+        test_isolation_keeps_leases(),
+        test_drain_throughput()
+    ]
+    for test_result in results:
+        print(test_result)
+
+    failed = sum(1 for r in results if not r.passed)
+    print(f"\nPassed: {len(results) - failed}/{len(results)}")
+    return 0 if failed == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(run_all_tests())
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Hiring Audit - Payload Validator Test
+=====================================
+
+Validates backend/payload_validator.py: rules compiled from the form spec
+and question CSV, issue detection, reject / annotate modes, the ingestion
+queue hook and validation throughput.
+
+Run: python payload_validator_test.py
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'backend'))
+
+from integration_test import TestResult
+from ingestion_queue import IngestionQueue, BLOCK_FORM_IDS
+from payload_validator import PayloadValidator, PayloadValidationError, default_validator, read_form_spec
+from scoring_engine import run_audit_scoring
+
+
+def _valid_responses(validator, rng):
+    """One allowed score for every block question"""
+    return {q: rng.choice(sorted(values)) for q, values in validator.allowed.items()
+            if validator.form_of[q] in BLOCK_FORM_IDS}
+
+
+def _spec_form_answers(form_id):
+    """Every question of a form spec form answered the way the web form would"""
+    answers = {}
+    for rule in read_form_spec():
+        if rule['form'] != form_id:
+            continue
+        if isinstance(rule['values'], list):
+            answers[rule['question']] = rule['values'][-1]
+        else:
+            answers[rule['question']] = 'buyer@acme.example' if rule['values'].email else 'Acme'
+    return answers
+
+
+def _codes(issues):
+    return {(i['code'], i['question']) for i in issues}
+
+
+def test_compiled_rules():
+    result = TestResult("Rules Compiled From Spec & CSV")
+
+    validator = default_validator()
+    if validator.allowed['b1_q1'] != frozenset([3, 2, 1, 0, -1]):
+        result.add_error(f"b1_q1 scores: {sorted(validator.allowed['b1_q1'])}")
+    # Block 5 questions have no score 1 option
+    if 1 in validator.allowed['b5_q1']:
+        result.add_error("b5_q1 should not allow a score of 1")
+    if 'Single country' not in validator.allowed['hiring_geography']:
+        result.add_error("Config options from the form spec missing")
+    if len(validator.required_all_blocks) != 74:
+        result.add_error(f"Expected 74 required block questions, got {len(validator.required_all_blocks)}")
+
+    return result
+
+
+def test_spec_conforming_forms():
+    result = TestResult("Spec-Conforming Webhooks Validate Cleanly")
+
+    validator = default_validator()
+    config = _spec_form_answers('config')
+    block1 = _spec_form_answers('block1')
+    for form_id, answers in (('config', config), ('block1', block1)):
+        issues = validator.validate({'audit_id': 'S', 'form_id': form_id, 'responses': answers})
+        if issues:
+            result.add_error(f"Complete {form_id} form reported issues: {issues}")
+
+    # One authority per question: CSV ids are mapped and its labels do not widen the spec's
+    if 'ta_function' in validator.allowed or 'ta_function_exists' not in validator.required['config']:
+        result.add_error("CSV config id not mapped onto the spec id")
+    if validator.allowed['hiring_pattern'] != frozenset(
+            ['Mostly planned (>70% from annual plan)', 'Mixed (40-70% planned)', 'Mostly reactive (<40% planned)']):
+        result.add_error(f"Hiring pattern labels not reconciled: {sorted(validator.allowed['hiring_pattern'])}")
+
+    responses = _valid_responses(validator, random.Random(5))
+    forms = [{'audit_id': 'AUD-S', 'form_id': 'config', 'responses': config}] + \
+        [{'audit_id': 'AUD-S', 'form_id': form_id,
+          'responses': {q: v for q, v in responses.items() if q.startswith(f'b{i}_')}}
+         for i, form_id in enumerate(BLOCK_FORM_IDS, 1)]
+    with tempfile.TemporaryDirectory() as tmp:
+        queue = IngestionQueue(os.path.join(tmp, 'spec.db'), required_forms=['config', *BLOCK_FORM_IDS],
+                               validator=validator)
+        acks = [queue.enqueue(p) for p in forms]
+        if any(a['status'] == 'rejected' for a in acks) or len(queue.claim_batch()) != 1:
+            result.add_error(f"Spec-conforming audit never became ready: {[a['status'] for a in acks]}")
+        queue.close()
+
+    return result
+
+
+def test_issue_detection():
+    result = TestResult("Issue Detection")
+
+    validator = default_validator()
+    responses = _valid_responses(validator, random.Random(1))
+    if validator.validate({'audit_id': 'A', 'responses': responses}):
+        result.add_error("Fully answered payload reported issues")
+
+    bad = dict(responses, b1_q1=5, b5_q1=1, b2_q3='3', b3_q1=[2], b9_q1=3)
+    del bad['b7_q10']
+    found = _codes(validator.validate({'audit_id': 'A', 'responses': bad}))
+    expected = {('invalid_value', 'b1_q1'), ('invalid_value', 'b5_q1'), ('invalid_value', 'b2_q3'),
+                ('invalid_value', 'b3_q1'), ('unknown_question', 'b9_q1'), ('missing_required', 'b7_q10')}
+    if found != expected:
+        result.add_error(f"Expected {sorted(expected)}, got {sorted(found)}")
+
+    # Single-form webhooks are checked against their own form only
+    block2 = {q: v for q, v in responses.items() if q.startswith('b2_')}
+    if validator.validate({'audit_id': 'A', 'form_id': 'block2', 'responses': block2}):
+        result.add_error("Complete block2 form reported issues")
+    found = _codes(validator.validate({'audit_id': 'A', 'form_id': 'block2',
+                                       'responses': dict(block2, b1_q1=3)}))
+    if found != {('wrong_form', 'b1_q1')}:
+        result.add_error(f"Answer from another block not reported: {found}")
+
+    respondents = [{'respondent_id': 'r1', 'responses': responses},
+                   {'respondent_id': 'r2', 'responses': {'b4_q1': 7}}]
+    found = _codes(validator.validate({'audit_id': 'A', 'respondents': respondents}))
+    if found != {('invalid_value', 'b4_q1')}:
+        result.add_error(f"Respondent answers not checked: {found}")
+
+    return result
+
+
+def test_reject_and_annotate():
+    result = TestResult("Reject & Annotate Modes")
+
+    strict = default_validator()
+    lenient = PayloadValidator.from_spec(mode='annotate')
+    responses = _valid_responses(strict, random.Random(2))
+    payload = {'audit_id': 'A', 'responses': dict(responses, b1_q1=9, b9_q9=1)}
+
+    try:
+        strict.check(payload)
+        result.add_error("Reject mode accepted an invalid payload")
+    except PayloadValidationError as e:
+        if len(e.issues) != 2:
+            result.add_error(f"Unexpected issues: {e.issues}")
+
+    if strict.check({'audit_id': 'A', 'responses': responses})['responses'] is not responses:
+        result.add_error("Valid payload should pass through unchanged")
+
+    annotated = lenient.check(payload)
+    if 'b1_q1' in annotated['responses'] or 'b9_q9' in annotated['responses']:
+        result.add_error("Annotate mode kept rejected answers")
+    if len(annotated['responses']) != len(responses) - 1:
+        result.add_error("Annotate mode dropped valid answers")
+    if 'b1_q1' not in payload['responses']:
+        result.add_error("Annotate mode modified the original payload")
+
+    scored = run_audit_scoring(annotated)
+    if scored.get('validation', {}).get('valid') is not False or len(scored['validation']['issues']) != 2:
+        result.add_error("Scoring result does not carry the validation summary")
+
+    return result
+
+
+def test_ingestion_hook():
+    result = TestResult("Ingestion Queue Validation")
+
+    validator = default_validator()
+    responses = _valid_responses(validator, random.Random(3))
+    forms = [{'audit_id': 'AUD-V', 'form_id': form_id,
+              'responses': {q: v for q, v in responses.items() if q.startswith(f'b{i}_')}}
+             for i, form_id in enumerate(BLOCK_FORM_IDS, 1)]
+    forms[4]['responses']['b5_q2'] = 1
+
+    with tempfile.TemporaryDirectory() as tmp:
+        queue = IngestionQueue(os.path.join(tmp, 'strict.db'), required_forms=BLOCK_FORM_IDS,
+                               validator=validator)
+        acks = [queue.enqueue(p) for p in forms]
+        if acks[4]['status'] != 'rejected' or _codes(acks[4]['issues']) != {('invalid_value', 'b5_q2')}:
+            result.add_error(f"Invalid block5 webhook not rejected: {acks[4]}")
+        if queue.claim_batch():
+            result.add_error("Audit released without its rejected form")
+        queue.close()
+
+        queue = IngestionQueue(os.path.join(tmp, 'lenient.db'), required_forms=BLOCK_FORM_IDS,
+                               validator=PayloadValidator.from_spec(mode='annotate'))
+        for payload in forms:
+            queue.enqueue(payload)
+        batch = queue.claim_batch()
+        if len(batch) != 1 or 'b5_q2' in batch[0]['responses']:
+            result.add_error("Annotated form not journaled without the bad answer")
+        elif _codes(batch[0].get('validation', {}).get('issues', [])) != {('invalid_value', 'b5_q2')}:
+            result.add_error(f"Coalesced payload lost validation issues: {batch[0].get('validation')}")
+        queue.close()
+
+    return result
+
+
+def test_throughput():
+    result = TestResult("Validation Throughput")
+
+    validator = default_validator()
+    rng = random.Random(4)
+    base = [_valid_responses(validator, rng) for _ in range(20)]
+    payloads = []
+    for i in range(20000):
+        responses = dict(base[i % 20])
+        if i % 7 == 0:
+            responses['b1_q1'] = 5
+        payloads.append({'audit_id': f'T-{i}', 'responses': responses})
+
+    start = time.perf_counter()
+    invalid = sum(1 for p in payloads if validator.validate(p))
+    elapsed = time.perf_counter() - start
+    rate = len(payloads) / elapsed
+
+    print(f"   {len(payloads)} payloads in {elapsed * 1000:.0f}ms ({rate:,.0f}/s), {invalid} invalid")
+    if invalid != len(range(0, 20000, 7)):
+        result.add_error(f"Expected {len(range(0, 20000, 7))} invalid payloads, got {invalid}")
+    if rate < 10000:
+        result.add_error(f"Validation too slow: {rate:,.0f} payloads/s")
+
+    return result
+
+
+def run_all_tests():
+    print("=" * 70)
+    print("HIRING AUDIT - PAYLOAD VALIDATOR TEST")
+    print("=" * 70)
+
+    results = [
+        test_compiled_rules(),
+        test_spec_conforming_forms(),
+        test_issue_detection(),
+        test_reject_and_annotate(),
+        test_ingestion_hook(),
+        test_throughput()
+    ]
+    for test_result in results:
+        print(test_result)
+
+    failed = sum(1 for r in results if not r.passed)
+    print(f"\nPassed: {len(results) - failed}/{len(results)}")
+    return 0 if failed == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(run_all_tests())
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Hiring Audit - Portfolio Export Test
+====================================
+
+Validates backend/portfolio_export.py: ZIP of per-company reports and the
+merged portfolio PDF with table of contents, drawn with a configured TTF
+family, and the merged export's report cap.
+
+Run: python portfolio_export_test.py
+"""
+
+import io
+import json
+import os
+import sys
+import zipfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'backend'))
+
+import reportlab
+from reportlab import rl_config
+
+from integration_test import TEST_SCENARIOS, TestResult
+from audit_report_generator import HiringAuditReportGenerator
+from portfolio_export import export_zip, export_merged_pdf, TOC_ROWS_PER_PAGE, MAX_MERGED_REPORTS
+from report_fonts import register_font_family
+from scoring_engine import run_audit_scoring
+
+rl_config.invariant = 1
+
+FONT_DIR = os.path.join(os.path.dirname(reportlab.__file__), 'fonts')
+
+
+class UnseekableStream(io.RawIOBase):
+    """Write-only sink like an HTTP response body"""
+
+    def __init__(self):
+        self.buffer = io.BytesIO()
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        return self.buffer.write(data)
+
+
+def _portfolio(count):
+    scenarios = list(TEST_SCENARIOS.values())
+    audits = []
+    for i in range(count):
+        scenario = scenarios[i % len(scenarios)]
+        scored = run_audit_scoring({'audit_id': f'P-{i}', 'responses': scenario['responses']})
+        audits.append({
+            'company_name': f"Client {i} / {scenario['name']}",
+            'report_date': '2025-01-01',
+            'block_statuses': scored['block_statuses'],
+            'block_scores': scored['block_scores'],
+            'contradictions': [c['name'] for c in scored['contradictions']]
+        })
+    return audits
+
+
+def test_zip_export():
+    result = TestResult("Streaming ZIP Export")
+
+    audits = _portfolio(12)
+    sink = UnseekableStream()
+    manifest = export_zip(audits, sink, level=2)
+
+    archive = zipfile.ZipFile(io.BytesIO(sink.buffer.getvalue()))
+    names = archive.namelist()
+    if len(names) != len(audits) + 1 or 'index.json' not in names:
+        result.add_error(f"Unexpected archive members: {names}")
+    if json.loads(archive.read('index.json'))['reports'] != manifest:
+        result.add_error("index.json does not match the returned manifest")
+
+    for entry, audit in zip(manifest, audits):
+        standalone = io.BytesIO()
+        HiringAuditReportGenerator(audit, standalone, level=2).generate()
+        if archive.read(entry['file']) != standalone.getvalue():
+            result.add_error(f"{entry['file']} differs from a standalone render")
+            break
+    if '/' in manifest[0]['file'][4:]:
+        result.add_error(f"Company name not sanitized in file name: {manifest[0]['file']}")
+
+    return result
+
+
+def test_merged_pdf():
+    result = TestResult("Merged Portfolio PDF")
+
+    audits = _portfolio(TOC_ROWS_PER_PAGE + 5)
+    out = io.BytesIO()
+    entries = export_merged_pdf(audits, out, level=1)
+    pdf = out.getvalue()
+
+    if [e['index'] for e in entries] != list(range(len(audits))):
+        result.add_error("Table of contents does not list every audit in order")
+    # Two TOC pages are reserved, so the first report starts on page 3
+    if entries[0]['page'] != 3:
+        result.add_error(f"First report should start on page 3, got {entries[0]['page']}")
+    if any(b['page'] <= a['page'] for a, b in zip(entries, entries[1:])):
+        result.add_error("Report start pages are not increasing")
+
+    # Header/footer chrome is a single shared XObject; the rest are the TOC pages
+    if pdf.count(b'/Subtype /Form') != 1 + 2:
+        result.add_error(f"Expected 3 form XObjects, found {pdf.count(b'/Subtype /Form')}")
+    if pdf.count(b'/Type /Outlines') != 1 or pdf.count(b'/Subtype /Link') != len(audits):
+        result.add_error("Bookmarks or TOC links missing")
+
+    return result
+
+
+def test_merged_pdf_fonts():
+    result = TestResult("Merged PDF With TTF Fonts")
+
+    family = register_font_family(os.path.join(FONT_DIR, 'Vera.ttf'), os.path.join(FONT_DIR, 'VeraBd.ttf'),
+                                  name='PortfolioSans', cache_dir=None)
+    audits = _portfolio(3)
+    audits[0]['company_name'] = 'Client \u26a0 Risk'
+    out = io.BytesIO()
+    export_merged_pdf(audits, out, level=1, fonts=family)
+    pdf = out.getvalue()
+
+    # TOC and page chrome are forms, so a built-in face anywhere means a Helvetica setFont remains
+    if b'/BaseFont /Helvetica' in pdf:
+        result.add_error("Merged PDF still uses built-in Helvetica")
+    if b'/FontFile2' not in pdf:
+        result.add_error("TTF faces not embedded")
+
+    return result
+
+
+def test_merged_pdf_cap():
+    result = TestResult("Merged PDF Report Cap")
+
+    try:
+        export_merged_pdf([{}] * (MAX_MERGED_REPORTS + 1), io.BytesIO())
+        result.add_error("Portfolio over the cap was not rejected")
+    except ValueError as e:
+        if 'export_zip' not in str(e):
+            result.add_error(f"Error does not point to the ZIP export: {e}")
+
+    return result
+
+
+def run_all_tests():
+    print("=" * 70)
+    print("HIRING AUDIT - PORTFOLIO EXPORT TEST")
+    print("=" * 70)
+
+    results = [
+        test_zip_export(),
+        test_merged_pdf(),
+        test_merged_pdf_fonts(),
+        test_merged_pdf_cap()
+    ]
+    for test_result in results:
+        print(test_result)
+
+    failed = sum(1 for r in results if not r.passed)
+    print(f"\nPassed: {len(results) - failed}/{len(results)}")
+    return 0 if failed == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(run_all_tests())
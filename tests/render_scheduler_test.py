@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Hiring Audit - Render Scheduler Test
+====================================
+
+Validates backend/render_scheduler.py: level priority classes, fair
+queuing across customers, shortest-job-first ordering, the anti-starvation
+guard, threaded rendering through reused generators and queue metrics.
+
+Run: python render_scheduler_test.py
+"""
+
+import io
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'backend'))
+
+from integration_test import TEST_SCENARIOS, TestResult
+from render_scheduler import RenderScheduler, estimate_cost
+from scoring_engine import run_audit_scoring
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _report_data():
+    data = []
+    for scenario_id, scenario in TEST_SCENARIOS.items():
+        scored = run_audit_scoring({'audit_id': scenario_id, 'responses': scenario['responses']})
+        data.append({
+            'company_name': scenario['name'],
+            'report_date': '2025-01-01',
+            'block_statuses': scored['block_statuses'],
+            'contradictions': [f"{c['rule_id']}: {c['name']}" for c in scored['contradictions']]
+        })
+    return data
+
+
+def _drain(scheduler):
+    order = []
+    job = scheduler.next_job()
+    while job is not None:
+        order.append(job)
+        scheduler.complete(job)
+        job = scheduler.next_job()
+    return order
+
+
+def test_cost_estimate():
+    result = TestResult("Render Cost Estimate")
+
+    data = _report_data()[0]
+    if not estimate_cost(data, 1) < estimate_cost(data, 2) < estimate_cost(data, 3):
+        result.add_error("Cost does not grow with report level")
+    busier = dict(data, contradictions=data['contradictions'] + ['C-X: extra'] * 5)
+    if estimate_cost(busier, 2) <= estimate_cost(data, 2):
+        result.add_error("Contradictions not reflected in cost")
+    fewer = dict(data, block_statuses={'block1': 'green', 'block2': 'gray'})
+    if estimate_cost(fewer, 2) >= estimate_cost(data, 2):
+        result.add_error("Scored block count not reflected in cost")
+
+    return result
+
+
+def test_priority_fairness_and_sjf():
+    result = TestResult("Priority, Fair Queuing & SJF")
+
+    data = _report_data()[0]
+    small = dict(data, contradictions=[])
+    large = dict(data, contradictions=['C-X: extra'] * 10)
+
+    scheduler = RenderScheduler(max_wait=60, clock=FakeClock())
+    for i in range(8):
+        scheduler.submit('agency', large if i % 2 else small, level=2, job_id=f'agency-{i}')
+    scheduler.submit('buyer', small, level=2, job_id='buyer-0')
+    scheduler.submit('buyer-l1', small, level=1, job_id='l1-0')
+    scheduler.submit('custom', large, level=3, job_id='custom-0')
+
+    order = [j.job_id for j in _drain(scheduler)]
+    if order[0] != 'custom-0' or order[-1] != 'l1-0':
+        result.add_error(f"Level priority not respected: {order}")
+    # The single buyer is served right after the agency's first job, not after its batch
+    if order.index('buyer-0') > 2:
+        result.add_error(f"Agency batch starved the single buyer: {order}")
+    agency = [j for j in order if j.startswith('agency')]
+    agency_costs = [estimate_cost(small if int(j[-1]) % 2 == 0 else large, 2) for j in agency]
+    if agency_costs != sorted(agency_costs):
+        result.add_error(f"Agency jobs not shortest-first: {agency}")
+
+    # Two busy customers alternate by accumulated cost
+    scheduler = RenderScheduler(max_wait=60, clock=FakeClock())
+    for i in range(4):
+        scheduler.submit('a', small, level=2, job_id=f'a-{i}')
+        scheduler.submit('b', small, level=2, job_id=f'b-{i}')
+    customers = [j.customer_id for j in _drain(scheduler)]
+    if customers != ['a', 'b'] * 4:
+        result.add_error(f"Equal customers not interleaved: {customers}")
+
+    return result
+
+
+def test_starvation_guard():
+    result = TestResult("Anti-Starvation Guard")
+
+    clock = FakeClock()
+    data = _report_data()[0]
+    scheduler = RenderScheduler(max_wait=2.0, clock=clock)
+    scheduler.submit('low', data, level=1, job_id='l1')
+    for i in range(5):
+        scheduler.submit('high', data, level=3, job_id=f'l3-{i}')
+
+    order = []
+    for _ in range(6):
+        job = scheduler.next_job()
+        order.append(job.job_id)
+        clock.now += 1.0
+        scheduler.complete(job)
+    if order.index('l1') != 2:
+        result.add_error(f"L1 job not promoted after max_wait: {order}")
+    if scheduler.metrics()['promoted'] != 1:
+        result.add_error("Promotion past a higher class not counted")
+
+    # Under a backlog every job is overdue; fair queuing must still hold inside a class
+    clock = FakeClock()
+    scheduler = RenderScheduler(max_wait=2.0, clock=clock)
+    for i in range(50):
+        scheduler.submit('agency', data, level=1, job_id=f'agency-{i}')
+    clock.now = 0.1
+    scheduler.submit('buyer', data, level=1, job_id='buyer-0')
+    clock.now = 3.0
+    order = [j.job_id for j in _drain(scheduler)]
+    if order.index('buyer-0') > 1:
+        result.add_error(f"Overdue backlog fell back to FIFO: buyer ran #{order.index('buyer-0') + 1}")
+
+    # An overdue lower class takes the slots, but its fair queue picks the jobs
+    clock = FakeClock()
+    scheduler = RenderScheduler(max_wait=2.0, clock=clock)
+    for i in range(3):
+        scheduler.submit('agency', data, level=1, job_id=f'agency-l1-{i}')
+    clock.now = 0.5
+    scheduler.submit('buyer', data, level=1, job_id='buyer-l1')
+    scheduler.submit('custom', data, level=3, job_id='custom-0')
+    clock.now = 2.2  # only the agency's jobs are overdue
+    order = [j.job_id for j in _drain(scheduler)]
+    if order != ['agency-l1-0', 'buyer-l1', 'agency-l1-1', 'agency-l1-2', 'custom-0']:
+        result.add_error(f"Aging did not stay fair inside the promoted class: {order}")
+
+    # Overdue classes take turns: a backlog in either class cannot starve the other
+    for backlog_level, single_level in ((1, 3), (3, 1)):
+        clock = FakeClock()
+        scheduler = RenderScheduler(max_wait=2.0, clock=clock)
+        for i in range(100):
+            scheduler.submit('agency', data, level=backlog_level, job_id=f'backlog-{i}')
+        clock.now = 1.0
+        scheduler.submit('buyer', data, level=single_level, job_id='single')
+        clock.now = 10.0
+        order = [j.job_id for j in _drain(scheduler)]
+        if order.index('single') > 1:
+            result.add_error(f"L{backlog_level} backlog starved an overdue L{single_level} job: "
+                             f"ran #{order.index('single') + 1}")
+
+    # A higher class that is not overdue yet still yields to an overdue lower class
+    clock = FakeClock()
+    scheduler = RenderScheduler(max_wait=2.0, clock=clock)
+    scheduler.submit('buyer', data, level=1, job_id='l1')
+    clock.now = 1.5
+    for i in range(20):
+        scheduler.submit('agency', data, level=3, job_id=f'l3-{i}')
+    clock.now = 2.5
+    order = [j.job_id for j in _drain(scheduler)]
+    if order[0] != 'l1' or scheduler.metrics()['promoted'] != 1:
+        result.add_error(f"Overdue L1 job not promoted past a fresh L3 backlog: {order[:3]}")
+
+    return result
+
+
+def test_threaded_rendering_and_metrics():
+    result = TestResult("Threaded Rendering & Metrics")
+
+    data = _report_data()
+    with RenderScheduler() as scheduler:
+        jobs = [scheduler.submit(f'customer-{i % 3}', d, level=1 + i % 3, output=io.BytesIO())
+                for i, d in enumerate(data * 3)]
+        scheduler.start(workers=2)
+    if any(j.error for j in jobs):
+        result.add_error(f"Render failed: {[j.error for j in jobs if j.error][0]}")
+    if not all(j.output.getvalue().startswith(b'%PDF') for j in jobs):
+        result.add_error("Not every job produced a PDF")
+    if not all(j.result and j.result['sections'] for j in jobs):
+        result.add_error("Render stats not returned")
+
+    metrics = scheduler.metrics()
+    print(f"   {metrics['completed']} renders, SLA met {metrics['sla_met_rate']:.0%}, " +
+          ', '.join(f"{lvl} wait p95 {m['wait_ms_p95']:.0f}ms run {m['run_ms_avg']:.0f}ms"
+                    for lvl, m in metrics['levels'].items()))
+    if metrics['completed'] != len(jobs) or metrics['queued'] != 0:
+        result.add_error(f"Unexpected counters: {metrics}")
+    if sum(m['finished'] for m in metrics['levels'].values()) != len(jobs):
+        result.add_error("Per-level counts do not add up")
+    if set(metrics['served_cost_ms']) != {'customer-0', 'customer-1', 'customer-2'}:
+        result.add_error("Per-customer served cost missing")
+
+    try:
+        scheduler.submit('x', data[0], level=4)
+        result.add_error("Unknown level accepted")
+    except ValueError:
+        pass
+
+    return result
+
+
+def run_all_tests():
+    print("=" * 70)
+    print("HIRING AUDIT - RENDER SCHEDULER TEST")
+    print("=" * 70)
+
+    results = [
+        test_cost_estimate(),
+        test_priority_fairness_and_sjf(),
+        test_starvation_guard(),
+        test_threaded_rendering_and_metrics()
+    ]
+    for test_result in results:
+        print(test_result)
+
+    failed = sum(1 for r in results if not r.passed)
+    print(f"\nPassed: {len(results) - failed}/{len(results)}")
+    return 0 if failed == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(run_all_tests())
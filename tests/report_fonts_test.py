@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Hiring Audit - Report Fonts Test
+================================
+
+Validates backend/report_fonts.py: the pre-parsed font cache, registering
+a TTF family once per process, per-document glyph subsets and the
+time/size comparison against Helvetica. Uses the Vera TTFs shipped with
+reportlab, which lack the report symbols, so coverage is checked on the
+mechanism rather than on ⚠ / ✓ rendering.
+
+Run: python report_fonts_test.py
+"""
+
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'backend'))
+
+import reportlab
+from reportlab.pdfbase import pdfmetrics
+
+from audit_report_generator import HiringAuditReportGenerator, FragmentCache, get_custom_styles
+from integration_test import TestResult
+from report_fonts import (
+    HELVETICA, REPORT_SYMBOLS, load_face, register_font_family, default_font_family, compare_with_helvetica
+)
+
+
+FONT_DIR = os.path.join(os.path.dirname(reportlab.__file__), 'fonts')
+VERA = os.path.join(FONT_DIR, 'Vera.ttf')
+VERA_BOLD = os.path.join(FONT_DIR, 'VeraBd.ttf')
+
+AUDIT = {
+    'company_name': 'Glyph Works',
+    'report_date': '2025-01-01',
+    'block_statuses': {'block1': 'red', 'block2': 'yellow', 'block3': 'green', 'block4': 'yellow',
+                       'block5': 'red', 'block6': 'green', 'block7': 'gray'},
+    'contradictions': ['Budget ownership unclear']
+}
+
+
+def test_face_cache():
+    result = TestResult("Pre-Parsed Font Cache")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        parsed, source = load_face(VERA, tmp)
+        parse_ms = (time.perf_counter() - start) * 1000
+        if source != 'parsed' or len(os.listdir(tmp)) != 1:
+            result.add_error(f"First load should parse and write the cache: {source}, {os.listdir(tmp)}")
+
+        start = time.perf_counter()
+        cached, source = load_face(VERA, tmp)
+        cache_ms = (time.perf_counter() - start) * 1000
+        if source != 'cache':
+            result.add_error(f"Second load did not use the cache: {source}")
+        for attr in ('name', 'charToGlyph', 'charWidths', 'bbox', 'unitsPerEm', '_ttf_data'):
+            if getattr(parsed, attr) != getattr(cached, attr):
+                result.add_error(f"Cached face differs in {attr}")
+        if cached._pdfScale(2048) != parsed._pdfScale(2048):
+            result.add_error("Cached face scales metrics differently")
+        print(f"   Vera.ttf parse {parse_ms:.2f}ms, cached load {cache_ms:.2f}ms")
+
+        # A corrupt cache entry falls back to parsing
+        entry = os.path.join(tmp, os.listdir(tmp)[0])
+        with open(entry, 'wb') as f:
+            f.write(b'not a pickle')
+        if load_face(VERA, tmp)[1] != 'parsed' or load_face(VERA, tmp)[1] != 'cache':
+            result.add_error("Corrupt cache entry was not replaced")
+
+        # A changed font file gets a new cache entry
+        copy = os.path.join(tmp, 'Copy.ttf')
+        shutil.copy(VERA, copy)
+        if load_face(copy, tmp)[1] != 'parsed' or load_face(VERA, None)[1] != 'parsed':
+            result.add_error("New file or disabled cache did not parse")
+
+    return result
+
+
+def test_register_once():
+    result = TestResult("Register Once Per Process")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        family = register_font_family(VERA, VERA_BOLD, name='TestSans', cache_dir=tmp)
+        if register_font_family(VERA, VERA_BOLD, name='TestSans', cache_dir=tmp) is not family:
+            result.add_error("Second registration built a new family")
+        try:
+            register_font_family(VERA_BOLD, name='TestSans', cache_dir=tmp)
+            result.add_error("Re-registering a name with other files accepted")
+        except ValueError:
+            pass
+
+        if pdfmetrics.getFont('TestSans') is not family.fonts[0] or family.bold != 'TestSans-Bold':
+            result.add_error("Faces not registered with reportlab")
+        styles = get_custom_styles(family)
+        leftover = [name for name, style in styles.byName.items()
+                    if getattr(style, 'fontName', '').startswith('Helvetica') or
+                    getattr(style, 'bulletFontName', '').startswith('Helvetica')]
+        if leftover or styles['SectionHeader'].fontName != 'TestSans-Bold':
+            result.add_error(f"Styles still drawn with Helvetica: {leftover}")
+
+        if not set('⚠✓→●○') <= set(HELVETICA.missing_glyphs()) or '•' in HELVETICA.missing_glyphs():
+            result.add_error(f"Helvetica coverage wrong: {HELVETICA.missing_glyphs()}")
+        if '•' in family.missing_glyphs() or '⚠' not in family.missing_glyphs():
+            result.add_error(f"Vera coverage wrong: {family.missing_glyphs()}")
+
+        # Auto-detection only picks a family that covers the report symbols
+        if default_font_family(font_dirs=[tmp], cache_dir=tmp) is not HELVETICA:
+            result.add_error("Empty font dir did not fall back to Helvetica")
+        shutil.copy(VERA, os.path.join(tmp, 'DejaVuSans.ttf'))
+        if default_font_family(font_dirs=[tmp], cache_dir=tmp) is not HELVETICA:
+            result.add_error("Family without the report symbols was used")
+        if default_font_family(font_dirs=[tmp], cache_dir=tmp, symbols='•—').regular != 'AuditSans':
+            result.add_error("Installed family not picked up")
+
+    return result
+
+
+def test_subset_per_document():
+    result = TestResult("Per-Document Glyph Subsets")
+
+    family = register_font_family(VERA, VERA_BOLD, name='TestSans', cache_dir=None)
+    generator = HiringAuditReportGenerator(AUDIT, None, fragment_cache=FragmentCache(), fonts=family)
+
+    def render(data, level):
+        before = family.stats()['TestSans']['glyphs_embedded']
+        out = io.BytesIO()
+        generator.reset(data, out, level=level).generate()
+        return out.getvalue(), family.stats()['TestSans']['glyphs_embedded'] - before
+
+    short, short_glyphs = render(dict(AUDIT, company_name='Ab'), 1)
+    full, full_glyphs = render(AUDIT, 3)
+    if b'FontFile2' not in full or b'BitstreamVeraSans-Roman' not in full:
+        result.add_error("TTF subset not embedded")
+    if b'/Helvetica' in full:
+        result.add_error("Helvetica still referenced with the TTF family")
+    if not 0 < short_glyphs < full_glyphs < len(family.fonts[0].face.charToGlyph):
+        result.add_error(f"Subsets not sized by use: L1 {short_glyphs}, L3 {full_glyphs} glyphs")
+    print(f"   glyphs embedded: L1 {short_glyphs}, L3 {full_glyphs} of {len(family.fonts[0].face.charToGlyph)}")
+
+    # Generators without fonts are unaffected by the registration
+    plain = io.BytesIO()
+    HiringAuditReportGenerator(AUDIT, plain, level=3).generate()
+    if b'FontFile2' in plain.getvalue() or b'/Helvetica' not in plain.getvalue():
+        result.add_error("Default generator no longer uses Helvetica")
+
+    return result
+
+
+def test_compare_with_helvetica():
+    result = TestResult("Time & Size vs Helvetica")
+
+    family = register_font_family(VERA, VERA_BOLD, name='TestSans', cache_dir=None)
+    report = compare_with_helvetica(AUDIT, family, level=3, repeat=2)
+    helvetica, ttf = report['helvetica'], report['ttf']
+    if report['pdf_bytes_delta'] != ttf['pdf_bytes'] - helvetica['pdf_bytes'] or report['pdf_bytes_delta'] <= 0:
+        result.add_error(f"Size delta wrong: {report['pdf_bytes_delta']}")
+    if helvetica['missing_glyphs'] != HELVETICA.missing_glyphs() or not ttf['glyphs_per_document'].get('TestSans'):
+        result.add_error(f"Coverage / glyph counts missing: {report}")
+    if set(REPORT_SYMBOLS) & set(ttf['missing_glyphs']) != set(family.missing_glyphs()):
+        result.add_error("TTF coverage not reported")
+    print(f"   Helvetica {helvetica['render_ms']:.1f}ms {helvetica['pdf_bytes']:,d}B, "
+          f"Vera {ttf['render_ms']:.1f}ms {ttf['pdf_bytes']:,d}B "
+          f"({report['render_ms_delta']:+.1f}ms, {report['pdf_bytes_delta']:+,d}B)")
+
+    return result
+
+
+def run_all_tests():
+    print("=" * 70)
+    print("HIRING AUDIT - REPORT FONTS TEST")
+    print("=" * 70)
+
+    results = [
+        test_face_cache(),
+        test_register_once(),
+        test_subset_per_document(),
+        test_compare_with_helvetica()
+    ]
+    for test_result in results:
+        print(test_result)
+
+    failed = sum(1 for r in results if not r.passed)
+    print(f"\nPassed: {len(results) - failed}/{len(results)}")
+    return 0 if failed == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(run_all_tests())
@@ -0,0 +1,485 @@
+#!/usr/bin/env python3
+"""
+Hiring Audit - Report Generator Test
+====================================
+
+Validates backend/audit_report_generator.py behaviour beyond a single
+render: cross-report fragment caching, generator reuse, cached charts,
+deadline-aware degradation, the HTML/JSON preview renderer and reports
+explained with the ruleset their scores were stamped with.
+
+The memory soak defaults to a short run; set REPORT_SOAK_RENDERS=10000
+for the full worker-lifetime check.
+
+Run: python report_generator_test.py
+"""
+
+import gc
+import io
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'backend'))
+
+from reportlab import rl_config
+
+from integration_test import TEST_SCENARIOS, TestResult
+from audit_report_generator import (
+    HiringAuditReportGenerator, FragmentCache, AuditView, BLOCK_IDS, SectionStream, styles_fingerprint,
+    build_score_matrix, executive_summary_text
+)
+from reportlab.graphics.shapes import Drawing, String
+from reportlab.platypus import Table
+from report_preview import build_report_model, render_preview
+from scoring_engine import run_audit_scoring, RULESETS, BUILTIN_RULESET
+from sensitivity_analyzer import analyze_sensitivity
+
+# Deterministic PDF bytes (no timestamps / random ids) so renders can be compared
+rl_config.invariant = 1
+
+
+class UncachedFragments(FragmentCache):
+    """Always rebuilds; reference output for cache tests"""
+
+    def get(self, section, key, style_key, build):
+        return build()
+
+
+def _report_data():
+    data = []
+    for scenario_id, scenario in TEST_SCENARIOS.items():
+        scored = run_audit_scoring({'audit_id': scenario_id, 'responses': scenario['responses']})
+        data.append({
+            'company_name': scenario['name'],
+            'report_date': '2025-01-01',
+            'block_statuses': scored['block_statuses'],
+            'contradictions': [f"{c['rule_id']}: {c['name']}" for c in scored['contradictions']]
+        })
+    return data
+
+
+def _chart_report_data():
+    """Scored scenarios with block scores and answers, so charts and heatmaps render"""
+    data = []
+    for scenario_id, scenario in TEST_SCENARIOS.items():
+        scored = run_audit_scoring({'audit_id': scenario_id, 'responses': scenario['responses']})
+        data.append(dict(scored, company_name=scenario['name'], report_date='2025-01-01',
+                         responses=scenario['responses']))
+    return data
+
+
+def _render(data, level, cache):
+    out = io.BytesIO()
+    HiringAuditReportGenerator(data, out, level=level, fragment_cache=cache).generate()
+    return out.getvalue()
+
+
+def test_fragment_cache_output_identical():
+    result = TestResult("Fragment Cache Output Identical")
+
+    data = _report_data()
+    reference = [_render(d, 3, UncachedFragments()) for d in data]
+    cache = FragmentCache()
+    for _ in range(3):
+        if [_render(d, 3, cache) for d in data] != reference:
+            result.add_error("Cached render differs from uncached render")
+            break
+
+    metrics = cache.metrics()
+    if metrics['hit_rate'] < 0.75:
+        result.add_error(f"Hit rate too low across repeated reports: {metrics}")
+    if metrics['time_saved_ms'] <= 0:
+        result.add_error("Time saved not reported")
+    # Block detail fragments are keyed on (block, status) only
+    if metrics['entries'] > 7 * 4 + 4 + 2:
+        result.add_error(f"Unexpected number of cached fragments: {metrics['entries']}")
+
+    return result
+
+
+def test_fragment_cache_invalidation():
+    result = TestResult("Fragment Cache Invalidation")
+
+    data = _report_data()[0]
+    cache = FragmentCache()
+    _render(data, 2, cache)
+    before = cache.metrics()['entries']
+    if before == 0:
+        result.add_error("Nothing was cached")
+
+    cache.check_version(cache.template_version)
+    if cache.metrics()['entries'] != before:
+        result.add_error("Unchanged template version dropped the cache")
+    cache.check_version('2.0')
+    if cache.metrics()['entries'] != 0 or cache.template_version != '2.0':
+        result.add_error("Template version change did not invalidate fragments")
+
+    # A changed stylesheet must not reuse fragments built with the old one
+    generator = HiringAuditReportGenerator(data, io.BytesIO(), level=2, fragment_cache=cache)
+    generator.styles['RiskText'].fontSize = 11
+    if styles_fingerprint(generator.styles) == generator._styles_key:
+        result.add_error("Style change not reflected in fragment key")
+
+    return result
+
+
+def test_generator_reuse():
+    result = TestResult("Generator Reset & Reuse")
+
+    first, second = _report_data()[:2]
+    fresh = [_render(first, 3, None), _render(second, 2, None)]
+
+    out = io.BytesIO()
+    generator = HiringAuditReportGenerator(first, out, level=3)
+    generator.generate()
+    if out.getvalue() != fresh[0]:
+        result.add_error("Streamed render differs from a fresh render")
+
+    again = io.BytesIO()
+    generator.reset(first, again).generate()
+    if again.getvalue() != fresh[0]:
+        result.add_error("Second generate() on the same instance changed the output")
+
+    reused = io.BytesIO()
+    generator.reset(second, reused, level=2).generate()
+    if reused.getvalue() != fresh[1]:
+        result.add_error("Reset generator leaked state from the previous audit")
+
+    # The builder sees the rest of the current section plus exactly one more
+    sections = [[f's{i}-{j}' for j in range(n)] for i, n in enumerate((3, 1, 4, 0, 2))]
+    stream = SectionStream(iter(sections))
+    buffered = []
+    while len(stream):
+        buffered.append(list(stream))
+        del stream[0]
+    expected = [sections[0][i:] + sections[1] for i in range(3)] + \
+        [sections[1] + sections[2]] + [sections[2][i:] + sections[4] for i in range(4)] + [['s4-0', 's4-1'], ['s4-1']]
+    if buffered != expected:
+        result.add_error(f"Section lookahead wrong: {buffered[:5]}")
+
+    generator.release()
+    if generator.data is not None or generator.block_statuses or generator.elements:
+        result.add_error("release() kept per-report state")
+    try:
+        generator.generate()
+        result.add_error("generate() after release() should fail")
+    except ValueError:
+        pass
+
+    return result
+
+
+def test_memory_flat_across_renders():
+    result = TestResult("Memory Flat Across Renders")
+
+    renders = int(os.environ.get('REPORT_SOAK_RENDERS', 60))
+    warmup = max(10, renders // 5)
+    # Fresh answers every render, so no two reports share a chart or heatmap
+    rng = random.Random(7)
+    data = []
+    for i, audit in enumerate(_chart_report_data() * (renders // len(TEST_SCENARIOS) + 1)):
+        responses = {q: rng.choice([3, 2, 1, 0, -1]) for q in audit['responses']}
+        scored = run_audit_scoring({'audit_id': f'soak-{i}', 'responses': responses})
+        data.append(dict(audit, responses=responses, block_scores=scored['block_scores'],
+                         block_statuses=scored['block_statuses']))
+    fragments = FragmentCache()
+    drawings = FragmentCache(max_entries=64, max_bytes=512 * 1024)
+    generator = HiringAuditReportGenerator(data[0], io.BytesIO(), fragment_cache=fragments,
+                                           drawing_cache=drawings)
+
+    tracemalloc.start()
+    try:
+        baseline = None
+        for i in range(renders):
+            generator.reset(data[i], io.BytesIO(), level=1 + i % 3).generate()
+            generator.release()
+            if i == warmup - 1:
+                gc.collect()
+                baseline = tracemalloc.get_traced_memory()[0]
+        gc.collect()
+        growth = tracemalloc.get_traced_memory()[0] - baseline
+    finally:
+        tracemalloc.stop()
+
+    if growth > 256 * 1024:
+        result.add_error(f"Traced memory grew by {growth} bytes over {renders - warmup} renders")
+    if drawings.metrics()['bytes'] > 512 * 1024 or drawings.metrics()['misses'] < renders:
+        result.add_error(f"Chart cache not bounded or charts not rendered: {drawings.metrics()}")
+    if fragments.metrics()['entries'] > 7 * 4 + 4 + 2:
+        result.add_error(f"Per-audit charts crowding the static fragment cache: {fragments.metrics()}")
+
+    return result
+
+
+def test_cached_charts():
+    result = TestResult("Block Score Chart & Heatmap Cached")
+
+    scenario = TEST_SCENARIOS['sla_theatre']
+    scored = run_audit_scoring({'audit_id': 'charts', 'responses': scenario['responses']})
+    data = {'company_name': 'Chart Co', 'block_statuses': scored['block_statuses'],
+            'block_scores': scored['block_scores'], 'responses': scenario['responses']}
+
+    matrix = build_score_matrix(scenario['responses'])
+    if len(matrix) != 7 or matrix[5][4] != 1 or matrix[0][7] != 2 or matrix[2][7] is not None:
+        result.add_error(f"Unexpected score matrix: {matrix}")
+
+    cache = FragmentCache()
+    chart_cache = FragmentCache(max_entries=8, max_bytes=1024 * 1024)
+    drawings = []
+    for company in ('A', 'B'):
+        generator = HiringAuditReportGenerator(dict(data, company_name=company), io.BytesIO(),
+                                               fragment_cache=cache, drawing_cache=chart_cache)
+        generator._add_block_overview()
+        drawings.append([e for e in generator.elements if isinstance(e, Drawing)])
+
+    if len(drawings[0]) != 2:
+        result.add_error(f"Expected bar chart and heatmap, got {len(drawings[0])} drawings")
+    elif any(a.contents is not b.contents for a, b in zip(*drawings)):
+        result.add_error("Second report rebuilt its charts instead of reusing cached vectors")
+
+    if cache.metrics()['entries'] or chart_cache.metrics()['entries'] != 2 or not chart_cache.metrics()['bytes']:
+        result.add_error(f"Charts not kept in the byte-bounded drawing cache: {chart_cache.metrics()}")
+
+    changed = dict(data, block_scores=dict(data['block_scores'], block1=0.5))
+    generator = HiringAuditReportGenerator(changed, io.BytesIO(), fragment_cache=cache, drawing_cache=chart_cache)
+    generator._add_block_overview()
+    chart = [e for e in generator.elements if isinstance(e, Drawing)][0]
+    if chart.contents is drawings[0][0].contents:
+        result.add_error("Changed block scores reused a stale chart")
+
+    # An entry above the byte bound is rendered but never kept
+    tiny = FragmentCache(max_bytes=1024)
+    HiringAuditReportGenerator(data, io.BytesIO(), drawing_cache=tiny)._add_block_overview()
+    if tiny.metrics()['entries'] or tiny.metrics()['bytes']:
+        result.add_error(f"Oversized drawing cached: {tiny.metrics()}")
+
+    return result
+
+
+class SlowSummaryGenerator(HiringAuditReportGenerator):
+    """Simulates a saturated worker: the executive summary takes 300ms"""
+
+    def _add_executive_summary(self):
+        time.sleep(0.3)
+        super()._add_executive_summary()
+
+
+def test_deadline_degradation():
+    result = TestResult("Deadline-Aware Rendering")
+
+    scenario = TEST_SCENARIOS['sla_theatre']
+    scored = run_audit_scoring({'audit_id': 'deadline', 'responses': scenario['responses']})
+    data = {'company_name': 'Deadline Co', 'report_date': '2025-01-01',
+            'block_statuses': scored['block_statuses'], 'block_scores': scored['block_scores'],
+            'responses': scenario['responses']}
+
+    # A comfortable budget changes nothing
+    relaxed = io.BytesIO()
+    generator = HiringAuditReportGenerator(data, relaxed, level=3)
+    generator.generate(deadline=30)
+    if relaxed.getvalue() != _render(data, 3, None):
+        result.add_error("Render within budget differs from an unbounded render")
+    stats = generator.render_stats
+    if stats['degradations'] or stats['mode'] != 'full' or not stats['met_deadline'] or len(stats['sections']) != 9:
+        result.add_error(f"Unexpected stats for a relaxed render: {stats}")
+
+    # Projected overrun: charts dropped, findings from cache or compact, appendix table trimmed
+    slow = SlowSummaryGenerator(data, io.BytesIO(), level=3, fragment_cache=FragmentCache())
+    slow.generate(deadline=1.0)
+    actions = {(d['section'], d['action']) for d in slow.render_stats['degradations']}
+    if slow.render_stats['mode'] != 'reduced' or ('block_overview', 'skip_charts') not in actions:
+        result.add_error(f"Projected overrun did not reduce the render: {slow.render_stats}")
+    if not any(a.startswith('compact_') for _, a in actions) or \
+       ('sensitivity_appendix', 'skip_analysis') not in actions:
+        result.add_error(f"Expected compact findings and skipped analysis: {sorted(actions)}")
+    if not slow.render_stats['met_deadline']:
+        result.add_error(f"Reduced render still missed its deadline: {slow.render_stats['elapsed_ms']}ms")
+
+    # Deadline already gone: optional Level 3 sections are skipped entirely
+    out = io.BytesIO()
+    late = HiringAuditReportGenerator(data, out, level=3)
+    late.generate(deadline=0)
+    skipped = [d['section'] for d in late.render_stats['degradations'] if d['action'] == 'skip_section']
+    if late.render_stats['mode'] != 'minimal' or sorted(skipped) != \
+       ['appendices', 'implementation_roadmap', 'sensitivity_appendix']:
+        result.add_error(f"Expected optional sections skipped, got {skipped}")
+    if not out.getvalue().startswith(b'%PDF') or len(out.getvalue()) >= len(relaxed.getvalue()):
+        result.add_error("Minimal render is not a smaller valid PDF")
+
+    return result
+
+
+def test_audit_view():
+    result = TestResult("Precomputed AuditView")
+
+    data = _report_data()
+    generator = HiringAuditReportGenerator(data[0], io.BytesIO(), level=2)
+    view = generator.view
+    if hasattr(view, '__dict__'):
+        result.add_error("AuditView should use __slots__")
+    for attempt in (lambda: setattr(view, 'overall_status', 'green'),
+                    lambda: view.block_statuses.__setitem__('block1', 'green'),
+                    lambda: view.block_details['block1'].__setitem__('risks', ())):
+        try:
+            attempt()
+            result.add_error("AuditView was modified")
+        except (AttributeError, TypeError):
+            pass
+
+    statuses = data[0]['block_statuses']
+    if view.red_count != sum(1 for s in statuses.values() if s == 'red') or \
+       view.red_count + view.yellow_count + view.green_count != sum(1 for s in statuses.values() if s != 'gray'):
+        result.add_error("Status counts do not match the block statuses")
+    if bool(view.gate_failures) != (statuses.get('block1') == 'red' or statuses.get('block2') == 'red' or
+                                    statuses.get('block4') == 'red'):
+        result.add_error("Gate failures do not match blocks 1, 2 and 4")
+    all_green = AuditView({'block_statuses': {b: 'green' for b in BLOCK_IDS}})
+    if all_green.overall_status != 'green' or all_green.priority_risks or all_green.block_details['block3']['risks']:
+        result.add_error("All-green audit derived risks")
+    if AuditView({}).overall_score != 50:
+        result.add_error("Empty audit score should be neutral")
+
+    # Sections read the view built once per audit; it is replaced on reset
+    generator.generate()
+    if generator.view is not view:
+        result.add_error("View rebuilt during rendering")
+    generator.reset(data[1], io.BytesIO())
+    if generator.view is view or generator.view.company_name != data[1]['company_name']:
+        result.add_error("reset() did not build a view for the new audit")
+    generator.release()
+    if generator.view is not None:
+        result.add_error("release() kept the view")
+
+    return result
+
+
+def test_preview_matches_pdf_model():
+    result = TestResult("HTML/JSON Preview Shares Report Model")
+
+    for data in _report_data():
+        data = dict(data, company_name=data['company_name'] + ' & Sons')
+        generator = HiringAuditReportGenerator(data, io.BytesIO(), level=2)
+
+        start = time.perf_counter()
+        html = render_preview(data, level=2)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        model = json.loads(render_preview(data, level=2, fmt='json'))
+
+        if model['cover']['overall_status'] != generator.view.overall_status:
+            result.add_error(f"{data['company_name']}: overall status differs from PDF")
+        if [b['status'] for b in model['block_overview']['blocks']] != \
+           [generator.block_statuses.get(f'block{i}', 'gray') for i in range(1, 8)]:
+            result.add_error(f"{data['company_name']}: block statuses differ from PDF")
+        if model['executive_summary']['priority_risks'] != [dict(r) for r in generator.view.priority_risks[:3]]:
+            result.add_error(f"{data['company_name']}: priority risks differ from PDF")
+        if 'Sons' not in html or ' & Sons' in html or 'Recommendations' not in html:
+            result.add_error(f"{data['company_name']}: HTML preview incomplete or unescaped")
+        if data['company_name'] not in executive_summary_text(generator.view) or \
+                model['executive_summary']['summary'] != ' '.join(executive_summary_text(generator.view).split()):
+            result.add_error(f"{data['company_name']}: executive summary differs from PDF")
+        print(f"   {data['company_name']}: preview in {elapsed_ms:.2f}ms")
+
+    if 'findings' in build_report_model(_report_data()[0], level=1):
+        result.add_error("Level 1 preview should not include detailed findings")
+
+    # Statuses are client-supplied and end up in class attributes
+    hostile = '"><script>x</script>'
+    data = dict(_report_data()[0], block_statuses={'block1': hostile})
+    data['auto_flags'] = [{'question': '<q1>', 'flag': 'Flag'}]
+    html = render_preview(data, level=2)
+    if '<script>' in html or '<q1>' in html:
+        result.add_error("Status values or flag questions are not escaped in the HTML preview")
+
+    return result
+
+
+def test_stamped_ruleset():
+    result = TestResult("Report Uses the Stamped Ruleset")
+
+    strict = BUILTIN_RULESET.replace('strict-report', scoring={'GREEN_THRESHOLD': 2.8, 'YELLOW_THRESHOLD': 2.0})
+    responses = TEST_SCENARIOS['mixed_results']['responses']
+    try:
+        RULESETS.swap(strict)
+        scored = run_audit_scoring({'audit_id': 'stamped', 'responses': responses})
+    finally:
+        RULESETS.swap(BUILTIN_RULESET)   # hot swap before the report renders
+    data = {'company_name': 'Stamped Co', 'report_date': '2025-01-01', 'responses': responses,
+            'block_statuses': scored['block_statuses'], 'block_scores': scored['block_scores'],
+            'ruleset_version': scored['ruleset_version']}
+
+    def appendix_rows(audit_data):
+        generator = HiringAuditReportGenerator(audit_data, io.BytesIO(), level=3)
+        generator._add_sensitivity_appendix()
+        tables = [e for e in generator.elements if isinstance(e, Table)]
+        return [tuple(row[:2]) for row in tables[0]._cellvalues[1:]] if tables else []
+
+    def expected_rows(ruleset):
+        flips = sorted(analyze_sensitivity(responses, ruleset=ruleset)['flips'],
+                       key=lambda f: f['overall_to'] == f['overall_from'])
+        fmt = lambda v: 'Unanswered' if v is None else ('N/A' if v == -1 else str(v))
+        return [(f['question'], f"{fmt(f['from_value'])} → {fmt(f['to_value'])}") for f in flips[:30]]
+
+    if appendix_rows(data) != expected_rows(strict) or expected_rows(strict) == expected_rows(BUILTIN_RULESET):
+        result.add_error("Sensitivity appendix not computed under the result's ruleset")
+    if appendix_rows(dict(data, ruleset_version='retired-9')):
+        result.add_error("Appendix rendered for a ruleset version that cannot be resolved")
+    if appendix_rows({k: v for k, v in data.items() if k != 'ruleset_version'}) != expected_rows(BUILTIN_RULESET):
+        result.add_error("Unstamped data should use the active ruleset")
+
+    # Chart threshold lines and the methodology bands follow the same ruleset
+    def chart_labels(audit_data):
+        generator = HiringAuditReportGenerator(audit_data, io.BytesIO(), level=3)
+        generator._add_block_overview()
+        drawings = [e for e in generator.elements if isinstance(e, Drawing)]
+        return sorted(s.text for s in drawings[0].contents if isinstance(s, String))
+
+    def methodology(audit_data):
+        generator = HiringAuditReportGenerator(audit_data, io.BytesIO(), level=3)
+        generator._add_appendices()
+        return ' '.join(getattr(e, 'text', '') for e in generator.elements)
+
+    unstamped = {k: v for k, v in data.items() if k != 'ruleset_version'}
+    if chart_labels(data) != ['2.0', '2.8'] or chart_labels(unstamped) != ['1.5', '2.3']:
+        result.add_error(f"Chart thresholds not taken from the ruleset: {chart_labels(data)}, "
+                         f"{chart_labels(unstamped)}")
+    if chart_labels(dict(data, ruleset_version='retired-9')):
+        result.add_error("Threshold lines drawn for an unknown ruleset")
+    text = methodology(data)
+    if '≥2.8 average' not in text or '(2-2.79 average)' not in text or '<2 average' not in text:
+        result.add_error("Methodology bands not taken from the ruleset")
+    if '≥2.3 average' not in methodology(unstamped) or '(1.5-2.29 average)' not in methodology(unstamped):
+        result.add_error("Methodology bands wrong for the built-in ruleset")
+
+    return result
+
+
+def run_all_tests():
+    print("=" * 70)
+    print("HIRING AUDIT - REPORT GENERATOR TEST")
+    print("=" * 70)
+
+    results = [
+        test_fragment_cache_output_identical(),
+        test_fragment_cache_invalidation(),
+        test_generator_reuse(),
+        test_memory_flat_across_renders(),
+        test_cached_charts(),
+        test_deadline_degradation(),
+        test_audit_view(),
+        test_preview_matches_pdf_model(),
+        test_stamped_ruleset()
+    ]
+    for test_result in results:
+        print(test_result)
+
+    failed = sum(1 for r in results if not r.passed)
+    print(f"\nPassed: {len(results) - failed}/{len(results)}")
+    return 0 if failed == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(run_all_tests())
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Hiring Audit - Report Images Test
+=================================
+
+Validates backend/report_images.py: logo normalization and downsampling
+to the printed size, the content-hash cache and embedding each image once
+per document (single reports and the merged portfolio).
+
+Run: python report_images_test.py
+"""
+
+import io
+import os
+import random
+import re
+import struct
+import sys
+import tempfile
+import time
+import warnings
+import zlib
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'backend'))
+
+from PIL import Image as PILImage, ImageDraw
+from reportlab.pdfgen import canvas
+from reportlab.platypus import Image, SimpleDocTemplate
+
+import report_images
+from audit_report_generator import HiringAuditReportGenerator
+from integration_test import TestResult
+from portfolio_export import export_merged_pdf
+from report_images import ImageCache, process_image, draw_image, COVER_LOGO_BOX, PRINT_DPI
+
+
+AUDIT = {
+    'company_name': 'Logo Corp',
+    'report_date': '2025-01-01',
+    'block_statuses': {'block1': 'green', 'block2': 'yellow', 'block3': 'green', 'block4': 'green',
+                       'block5': 'red', 'block6': 'green', 'block7': 'yellow'}
+}
+
+
+def _encode(image, format, **kw):
+    out = io.BytesIO()
+    image.save(out, format, **kw)
+    return out.getvalue()
+
+
+def make_logo(width=3000, height=1000, noise=150000, seed=7):
+    """A transparent multi-megabyte PNG logo, like a raw designer export"""
+    image = PILImage.new('RGBA', (width, height), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    draw.ellipse((50, 50, height - 50, height - 50), fill=(30, 58, 95, 255))
+    draw.rectangle((height + 100, height // 3, width - 100, 2 * height // 3), fill=(74, 144, 194, 255))
+    rng = random.Random(seed)
+    pixels = image.load()
+    for _ in range(noise):
+        pixels[rng.randrange(width), rng.randrange(height)] = (rng.randrange(256), rng.randrange(256),
+                                                               rng.randrange(256), 255)
+    return _encode(image, 'PNG')
+
+
+def _image_xobjects(pdf):
+    return len(re.findall(rb'/Subtype /Image', pdf))
+
+
+def test_normalize_and_downsample():
+    result = TestResult("Normalize & Downsample")
+
+    logo = make_logo()
+    start = time.perf_counter()
+    image = process_image(logo)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    max_px = (round(COVER_LOGO_BOX[0] * PRINT_DPI / 72), round(COVER_LOGO_BOX[1] * PRINT_DPI / 72))
+    if image.width_px > max_px[0] or image.height_px > max_px[1] or image.width > COVER_LOGO_BOX[0] + 0.01:
+        result.add_error(f"Not sized to the printed box: {image.to_dict()}")
+    if abs(image.width / image.height - 3.0) > 0.01:
+        result.add_error("Aspect ratio not kept")
+    if PILImage.open(io.BytesIO(image.data)).mode != 'RGB':
+        result.add_error("Transparent logo not flattened onto white")
+    print(f"   {len(logo):,d}B upload -> {len(image.data):,d}B {image.format} "
+          f"{image.width_px}x{image.height_px}px in {elapsed_ms:.0f}ms")
+
+    flat = process_image(_encode(PILImage.new('P', (1200, 400), 3), 'PNG'))
+    if flat.format != 'PNG':
+        result.add_error(f"Flat-color logo stored as {flat.format}")
+    if image.format != 'JPEG':
+        result.add_error(f"Photographic logo stored as {image.format}")
+
+    tiny = process_image(_encode(PILImage.new('RGB', (30, 10), 'red'), 'PNG'))
+    if (tiny.width_px, tiny.height_px) != (30, 10) or round(tiny.width) != COVER_LOGO_BOX[0]:
+        result.add_error("Small logo upscaled or not printed at box size")
+
+    # A phone photo stored landscape with "rotate 90" in EXIF prints upright
+    exif = PILImage.Exif()
+    exif[report_images.EXIF_ORIENTATION] = 6
+    photo = process_image(_encode(PILImage.new('RGB', (4000, 3000), 'blue'), 'JPEG', exif=exif), box=(90, 90))
+    if photo.width_px >= photo.height_px or abs(photo.height - 90) > 0.01:
+        result.add_error(f"EXIF orientation not applied: {photo.to_dict()}")
+
+    for bad in (b'not an image', _encode(PILImage.new('RGB', (100, 100)), 'PNG')[:60]):
+        try:
+            process_image(bad)
+            result.add_error("Broken upload accepted")
+        except ValueError:
+            pass
+    limit, report_images.MAX_SOURCE_PIXELS = report_images.MAX_SOURCE_PIXELS, 1000
+    try:
+        process_image(logo)
+        result.add_error("Oversized upload decoded")
+    except ValueError:
+        pass
+    finally:
+        report_images.MAX_SOURCE_PIXELS = limit
+
+    return result
+
+
+def _declare_size(data, width, height):
+    """Small upload whose header declares width x height pixels"""
+    if data[:4] == b'\x89PNG':
+        ihdr = b'IHDR' + struct.pack('>II', width, height) + data[24:29]
+        return data[:12] + ihdr + struct.pack('>I', zlib.crc32(ihdr)) + data[33:]
+    return data[:18] + struct.pack('<ii', width, height) + data[26:]  # BMP
+
+
+def test_decompression_bombs():
+    result = TestResult("Decompression Bombs Refused")
+
+    small = PILImage.new('RGB', (64, 64), 'red')
+    bombs = {fmt: _declare_size(_encode(small, fmt), 14000, 14000) for fmt in ('PNG', 'BMP')}
+    if report_images.header_size(bombs['PNG']) != (14000, 14000) or \
+            report_images.header_size(_encode(small, 'JPEG')) != (64, 64) or \
+            report_images.header_size(_encode(small, 'GIF')) != (64, 64):
+        result.add_error("Header dimensions not read")
+
+    # PNG is caught from its header; BMP only by Pillow's own bomb check
+    for fmt, bomb in bombs.items():
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            try:
+                process_image(bomb)
+                result.add_error(f"{len(bomb):,d}B {fmt} declaring 14000x14000 accepted")
+            except ValueError:
+                pass
+            except Exception as e:
+                result.add_error(f"{fmt} bomb raised {type(e).__name__} instead of ValueError")
+
+    # Above Pillow's warning threshold but below its error threshold
+    warn_size = int((PILImage.MAX_IMAGE_PIXELS * 1.5) ** 0.5)
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        try:
+            process_image(_declare_size(_encode(small, 'BMP'), warn_size, warn_size))
+            result.add_error("Image over Pillow's warning threshold accepted")
+        except ValueError:
+            pass
+        except Exception as e:
+            result.add_error(f"Bomb warning escaped as {type(e).__name__}")
+
+    out = io.BytesIO()
+    generator = HiringAuditReportGenerator(dict(AUDIT, logo=bombs['PNG']), out)
+    try:
+        generator.generate()
+        degraded = [d['action'] for d in generator.render_stats['degradations']]
+        if not out.getvalue().startswith(b'%PDF') or 'skip_logo' not in degraded:
+            result.add_error(f"Report with a bomb logo not rendered without it: {degraded}")
+    except Exception as e:
+        result.add_error(f"Bomb logo broke the report: {type(e).__name__}: {e}")
+
+    return result
+
+
+def test_content_hash_cache():
+    result = TestResult("Content-Hash Cache")
+
+    logo = make_logo(1200, 400, noise=20000)
+    cache = ImageCache(max_entries=2)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'upload.png')
+        with open(path, 'wb') as f:
+            f.write(logo)
+
+        first = cache.get(logo)
+        if cache.get(path) is not first or cache.get(io.BytesIO(logo)) is not first:
+            result.add_error("Same content via path / stream not served from the cache")
+        if cache.get(logo, box=(80, 30)) is first:
+            result.add_error("Different printed box shared an entry")
+        cache.get(make_logo(600, 200, noise=0))
+        metrics = cache.metrics()
+        if metrics['entries'] != 2 or metrics['hits'] != 2 or metrics['misses'] != 3:
+            result.add_error(f"Unexpected cache metrics: {metrics}")
+        if cache.get(logo) is first or cache.metrics()['misses'] != 4:
+            result.add_error("Least recently used entry not evicted")
+
+    small = ImageCache(max_bytes=1)
+    small.get(logo)
+    if small.metrics()['entries'] or small.metrics()['bytes']:
+        result.add_error("Byte budget not enforced")
+
+    return result
+
+
+def test_embedded_once():
+    result = TestResult("Embedded Once Per Document")
+
+    logo = make_logo()
+    cache = ImageCache()
+
+    # Same image drawn on several pages of one canvas
+    out = io.BytesIO()
+    canv = canvas.Canvas(out)
+    image = cache.get(logo)
+    for _ in range(3):
+        draw_image(canv, image, 50, 700)
+        draw_image(canv, image, 300, 700, 80, 30)
+        canv.showPage()
+    canv.save()
+    if _image_xobjects(out.getvalue()) != 1:
+        result.add_error(f"Image embedded {_image_xobjects(out.getvalue())} times on one canvas")
+
+    report = io.BytesIO()
+    HiringAuditReportGenerator(dict(AUDIT, logo=logo), report, level=2, image_cache=cache).generate()
+    plain = io.BytesIO()
+    HiringAuditReportGenerator(AUDIT, plain, level=2, image_cache=cache).generate()
+    naive = io.BytesIO()
+    SimpleDocTemplate(naive).build([Image(io.BytesIO(logo), *COVER_LOGO_BOX)])
+    added = len(report.getvalue()) - len(plain.getvalue())
+    if _image_xobjects(report.getvalue()) != 1 or added > 40000:
+        result.add_error(f"Logo added {added:,d}B to the report")
+    print(f"   logo adds {added:,d}B per report (raw upload embedded: {len(naive.getvalue()):,d}B)")
+
+    # A partner portfolio with the same logo on every cover embeds it once
+    merged = io.BytesIO()
+    export_merged_pdf([dict(AUDIT, company_name=f'Client {i}', logo=logo) for i in range(4)], merged)
+    if _image_xobjects(merged.getvalue()) != 1:
+        result.add_error(f"Portfolio embedded the logo {_image_xobjects(merged.getvalue())} times")
+
+    generator = HiringAuditReportGenerator(dict(AUDIT, logo=b'\x89PNG broken'), io.BytesIO(), image_cache=cache)
+    generator.generate()
+    if [d['action'] for d in generator.render_stats['degradations']] != ['skip_logo']:
+        result.add_error("Broken logo not skipped")
+
+    return result
+
+
+def run_all_tests():
+    print("=" * 70)
+    print("HIRING AUDIT - REPORT IMAGES TEST")
+    print("=" * 70)
+
+    results = [
+        test_normalize_and_downsample(),
+        test_decompression_bombs(),
+        test_content_hash_cache(),
+        test_embedded_once()
+    ]
+    for test_result in results:
+        print(test_result)
+
+    failed = sum(1 for r in results if not r.passed)
+    print(f"\nPassed: {len(results) - failed}/{len(results)}")
+    return 0 if failed == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(run_all_tests())
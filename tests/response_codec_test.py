@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Hiring Audit - Response Codec Test
+==================================
+
+Validates backend/response_codec.py: 3-bit packing round trips, schema
+checks, the append-only archive with its offset index, and bulk NumPy
+decoding for re-scoring.
+
+Run: python response_codec_test.py
+"""
+
+import json
+import os
+import random
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'backend'))
+
+from integration_test import TEST_SCENARIOS, TestResult
+from response_codec import (
+    ResponseCodec, AuditArchive, CodecError, MISSING, ARCHIVE_HEADER_SIZE
+)
+from scoring_engine import run_audit_scoring
+
+
+def _random_responses(codec, rng):
+    return {q: rng.choice([3, 2, 1, 0, -1]) for q in codec.question_ids if rng.random() < 0.9}
+
+
+def test_codec_round_trip():
+    result = TestResult("Codec Round Trip")
+
+    codec = ResponseCodec()
+    if codec.record_size != 1 + (len(codec.question_ids) * 3 + 7) // 8:
+        result.add_error(f"Unexpected record size {codec.record_size}")
+
+    rng = random.Random(11)
+    samples = [s['responses'] for s in TEST_SCENARIOS.values()] + \
+              [_random_responses(codec, rng) for _ in range(200)] + [{}]
+    for responses in samples:
+        record = codec.encode(responses)
+        if codec.decode(record) != responses:
+            result.add_error(f"Round trip changed {responses}")
+            break
+    if len(codec.encode(samples[0])) * 10 > len(json.dumps(samples[0])):
+        result.add_error("Encoded record is not an order of magnitude smaller than JSON")
+
+    for bad in ({'b1_q1': 4}, {'b1_q1': 2.5}, {'b1_q1': True}, {'b9_q1': 1}):
+        try:
+            codec.encode(bad)
+            result.add_error(f"{bad} should not encode")
+        except CodecError:
+            pass
+
+    other = ResponseCodec(codec.question_ids, version=2)
+    try:
+        other.decode(codec.encode(samples[0]))
+        result.add_error("Record from schema 1 decoded as schema 2")
+    except CodecError:
+        pass
+
+    return result
+
+
+def test_archive_index_and_reopen():
+    result = TestResult("Archive Offset Index & Reopen")
+
+    codec = ResponseCodec()
+    rng = random.Random(12)
+    audits = [(f'AUD-{i}', _random_responses(codec, rng)) for i in range(500)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'audits.har')
+        with AuditArchive(path) as archive:
+            archive.append_many(audits[:300])
+            for audit_id, responses in audits[300:]:
+                archive.append(audit_id, responses)
+            if archive.get('AUD-42') != audits[42][1] or archive.get('missing') is not None:
+                result.add_error("Lookup by audit id failed")
+            # Re-submitted audit: the newer record wins
+            archive.append('AUD-1', audits[2][1])
+            if archive.get('AUD-1') != audits[2][1]:
+                result.add_error("Later append did not supersede the earlier record")
+
+        if os.path.getsize(path) != ARCHIVE_HEADER_SIZE + 501 * codec.record_size:
+            result.add_error(f"Unexpected archive size {os.path.getsize(path)}")
+
+        # Simulate a crash halfway through writing a record
+        with open(path, 'ab') as f:
+            f.write(codec.encode(audits[0][1])[:7])
+        with open(path + '.idx', 'a') as f:
+            f.write(f"AUD-torn\t{ARCHIVE_HEADER_SIZE + 501 * codec.record_size}\n")
+
+        with AuditArchive(path) as archive:
+            if len(archive) != 501 or 'AUD-torn' in archive.offsets:
+                result.add_error("Torn record was not discarded on reopen")
+            archive.append('AUD-new', audits[5][1])
+            if archive.get('AUD-new') != audits[5][1] or archive.get('AUD-499') != audits[499][1]:
+                result.add_error("Archive misaligned after reopen")
+
+        # A batch that fails to encode leaves the archive and its index untouched
+        with AuditArchive(path) as archive:
+            size = len(archive)
+            try:
+                archive.append_many([('AUD-A', audits[6][1]), ('AUD-B', {'b1_q1': 2.5})])
+                result.add_error("Unencodable batch accepted")
+            except CodecError:
+                pass
+            archive.append('AUD-C', audits[7][1])
+            if 'AUD-A' in archive.offsets or archive.get('AUD-A') is not None or \
+                    archive.get('AUD-C') != audits[7][1] or len(archive) != size + 1:
+                result.add_error("Failed batch left index entries behind")
+        with AuditArchive(path) as archive:
+            if 'AUD-A' in archive.offsets or archive.get('AUD-C') != audits[7][1]:
+                result.add_error("Failed batch visible after reopen")
+
+        try:
+            AuditArchive(path, ResponseCodec(codec.question_ids[:-1]))
+            result.add_error("Archive opened with a different question registry")
+        except CodecError:
+            pass
+
+    return result
+
+
+def test_bulk_decode_and_rescoring():
+    result = TestResult("Bulk NumPy Decode & Re-Scoring")
+
+    import numpy as np
+
+    codec = ResponseCodec()
+    scenarios = list(TEST_SCENARIOS.items())
+
+    with tempfile.TemporaryDirectory() as tmp:
+        with AuditArchive(os.path.join(tmp, 'audits.har')) as archive:
+            archive.append_many((f'{sid}-{i}', s['responses'])
+                                for i in range(2000) for sid, s in scenarios)
+            records = archive.records()
+            if records.base is None or records.flags.owndata:
+                result.add_error("Record view copies the mapped file")
+
+            scores = archive.scores()
+            if scores.shape != (2000 * len(scenarios), len(codec.question_ids)) or scores.dtype != np.int8:
+                result.add_error(f"Unexpected array {scores.shape} {scores.dtype}")
+
+            for row, (sid, scenario) in zip(scores[:len(scenarios)], scenarios):
+                rescored = run_audit_scoring({'audit_id': sid, 'responses': codec.to_responses(row)})
+                original = run_audit_scoring({'audit_id': sid, 'responses': scenario['responses']})
+                if rescored['block_statuses'] != original['block_statuses'] or \
+                   rescored['overall_status'] != original['overall_status']:
+                    result.add_error(f"{sid}: re-scoring from the archive changed the result")
+
+            subset = archive.scores([f'{scenarios[1][0]}-7', f'{scenarios[0][0]}-3'])
+            if codec.to_responses(subset[0]) != scenarios[1][1]['responses']:
+                result.add_error("Row selection by audit id returned the wrong audit")
+            answered = (scores[:len(scenarios)] != MISSING).sum(axis=1).tolist()
+            if answered != [len(s['responses']) for _, s in scenarios]:
+                result.add_error("Unanswered questions not decoded as MISSING")
+            del records, scores, subset
+
+    return result
+
+
+def run_all_tests():
+    print("=" * 70)
+    print("HIRING AUDIT - RESPONSE CODEC TEST")
+    print("=" * 70)
+
+    results = [
+        test_codec_round_trip(),
+        test_archive_index_and_reopen(),
+        test_bulk_decode_and_rescoring()
+    ]
+    for test_result in results:
+        print(test_result)
+
+    failed = sum(1 for r in results if not r.passed)
+    print(f"\nPassed: {len(results) - failed}/{len(results)}")
+    return 0 if failed == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(run_all_tests())
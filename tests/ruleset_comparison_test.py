@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Hiring Audit - Ruleset Comparison Test
+======================================
+
+Validates backend/ruleset_comparison.py: scoring one audit under several
+ruleset versions in a single pass gives the same results as scoring it
+once per version, shared rules are evaluated once, and the batch diff
+summary counts what changed against the baseline.
+
+Run: python ruleset_comparison_test.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'backend'))
+
+from integration_test import TEST_SCENARIOS, TestResult
+from ruleset_comparison import RulesetComparison, diff_results
+from scoring_engine import run_audit_scoring, BUILTIN_RULESET
+
+
+def _proposals():
+    """Baseline plus three proposals touching thresholds, CV rules, gates and triggers"""
+    rules = BUILTIN_RULESET.to_dict()
+    cv = [dict(r, severity='soft') if r['id'] == 'CV-02' else r for r in rules['cross_validation_rules']]
+    cv.append({'id': 'CV-21', 'name': 'Budget Denial',
+               'source': {'question': 'b4_q1', 'operator': '>=', 'value': 2},
+               'validator': {'question': 'b6_q8', 'operator': '<=', 'value': 1},
+               'severity': 'hard', 'diagnosis': 'Budget owner unaware of overload'})
+    triggers = dict(rules['recommendation_triggers'])
+    triggers['B3-R01'] = dict(triggers['B3-R01'], when=[{'status': 'block3', 'in': ['red', 'yellow']}])
+    return [
+        BUILTIN_RULESET,
+        BUILTIN_RULESET.replace('strict', scoring={'GREEN_THRESHOLD': 2.6, 'YELLOW_THRESHOLD': 1.8}),
+        BUILTIN_RULESET.replace('cv-tuned', cross_validation_rules=cv, recommendation_triggers=triggers,
+                                scoring={'DISAGREEMENT_STDEV': 0.8}),
+        BUILTIN_RULESET.replace('gates', gate_rules=rules['gate_rules'][:3],
+                                critical_questions={'block1': ['b1_q3', 'b1_q4']})
+    ]
+
+
+def _random_payloads(count, seed=11):
+    rng = random.Random(seed)
+    questions = [f'b{b}_q{q}' for b in range(1, 8) for q in range(1, 13)]
+    payloads = [{'audit_id': sid, 'responses': s['responses']} for sid, s in TEST_SCENARIOS.items()]
+    for i in range(count):
+        if i % 5 == 0:
+            respondents = [{'respondent_id': f'r{j}', 'role': 'TA' if j % 2 else 'Delivery',
+                            'responses': {q: rng.choice([3, 2, 1, 0, -1]) for q in questions if rng.random() < 0.7}}
+                           for j in range(3)]
+            payloads.append({'audit_id': f'multi-{i}', 'respondents': respondents})
+        else:
+            payloads.append({'audit_id': f'audit-{i}', 'metadata': {'company_size': '51-200'},
+                             'responses': {q: rng.choice([3, 3, 2, 2, 1, 0, -1]) for q in questions
+                                           if rng.random() < 0.85}})
+    return payloads
+
+
+def _comparable(result):
+    return {k: v for k, v in result.items() if k != 'timestamp'}
+
+
+def test_matches_separate_scoring():
+    result = TestResult("Single Pass Matches Per-Version Scoring")
+
+    rulesets = _proposals()
+    comparison = RulesetComparison(rulesets)
+    mismatches = 0
+    for payload in _random_payloads(300):
+        results = comparison.score(payload)
+        if list(results) != [r.version for r in rulesets]:
+            result.add_error(f"Results not in ruleset order: {list(results)}")
+            break
+        for ruleset in rulesets:
+            if _comparable(results[ruleset.version]) != _comparable(run_audit_scoring(payload, ruleset)):
+                mismatches += 1
+    if mismatches:
+        result.add_error(f"{mismatches} results differ from run_audit_scoring")
+
+    shared = comparison.describe()
+    if shared['status_groups'] != 3 or shared['gate_groups'] != 2:
+        result.add_error(f"Identical thresholds / gates not shared: {shared}")
+    if shared['cv_rules'] != {'unique': 15, 'total': 53} or shared['triggers'] != {'unique': 13, 'total': 48}:
+        result.add_error(f"Identical CV rules / triggers not shared: {shared}")
+
+    try:
+        RulesetComparison([BUILTIN_RULESET, BUILTIN_RULESET])
+        result.add_error("Duplicate versions accepted")
+    except ValueError:
+        pass
+
+    return result
+
+
+def test_diff_summary():
+    result = TestResult("Side-by-Side Diff Summary")
+
+    rulesets = _proposals()
+    comparison = RulesetComparison(rulesets)
+    payloads = _random_payloads(200, seed=3)
+    report = comparison.compare_batch(payloads)
+    summary = report['summary']
+
+    expected = {r.version: {'changed': 0, 'overall_changed': 0, 'transitions': {}} for r in rulesets[1:]}
+    changed_ids = []
+    for payload in payloads:
+        base = run_audit_scoring(payload, rulesets[0])
+        any_change = False
+        for ruleset in rulesets[1:]:
+            diff = diff_results(base, run_audit_scoring(payload, ruleset))
+            counts = expected[ruleset.version]
+            counts['changed'] += diff['changed']
+            any_change |= diff['changed']
+            if diff['overall_status']:
+                counts['overall_changed'] += 1
+                key = '->'.join(diff['overall_status'])
+                counts['transitions'][key] = counts['transitions'].get(key, 0) + 1
+        if any_change:
+            changed_ids.append(payload['audit_id'])
+
+    if summary['audits'] != len(payloads) or summary['baseline'] != 'builtin-1.0':
+        result.add_error(f"Batch size / baseline wrong: {summary['audits']}, {summary['baseline']}")
+    for version, counts in expected.items():
+        actual = {k: summary['versions'][version][k] for k in counts}
+        if actual != counts:
+            result.add_error(f"{version}: summary {actual} != {counts}")
+    if [c['audit_id'] for c in report['changed']] != changed_ids or 'results' in report['changed'][0]:
+        result.add_error("Changed audit list wrong")
+    if sum(summary['overall_status']['strict'].values()) != len(payloads):
+        result.add_error("Per-version status counts incomplete")
+    strict = summary['versions']['strict']
+    if not strict['transitions'] or any(t.split('->')[0] == 'red' for t in strict['transitions']) or \
+            strict['mean_confidence_delta'] >= 0:
+        result.add_error(f"Stricter thresholds should only worsen outcomes: {strict}")
+    if 'CV-21' not in summary['versions']['cv-tuned']['contradictions_added']:
+        result.add_error("New CV rule not reported in the diff")
+    print(f"   strict: {strict['overall_changed']}/{len(payloads)} overall changes {strict['transitions']}")
+
+    return result
+
+
+def test_faster_than_rescoring():
+    result = TestResult("Faster Than Scoring Each Version")
+
+    rulesets = _proposals() + [BUILTIN_RULESET.replace(f'green-{g}', scoring={'GREEN_THRESHOLD': g})
+                               for g in (2.2, 2.4, 2.5, 2.7)]
+    comparison = RulesetComparison(rulesets)
+    payloads = [p for p in _random_payloads(400, seed=5) if 'responses' in p]
+
+    start = time.perf_counter()
+    for payload in payloads:
+        for ruleset in rulesets:
+            run_audit_scoring(payload, ruleset)
+    separate = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for payload in payloads:
+        comparison.score(payload)
+    single_pass = time.perf_counter() - start
+
+    print(f"   {len(payloads)} audits x {len(rulesets)} rulesets: separate {separate * 1000:.0f}ms, "
+          f"single pass {single_pass * 1000:.0f}ms ({separate / single_pass:.1f}x)")
+    if single_pass >= separate:
+        result.add_error("Single pass not faster than scoring each version")
+
+    return result
+
+
+def run_all_tests():
+    print("=" * 70)
+    print("HIRING AUDIT - RULESET COMPARISON TEST")
+    print("=" * 70)
+
+    results = [
+        test_matches_separate_scoring(),
+        test_diff_summary(),
+        test_faster_than_rescoring()
+    ]
+    for test_result in results:
+        print(test_result)
+
+    failed = sum(1 for r in results if not r.passed)
+    print(f"\nPassed: {len(results) - failed}/{len(results)}")
+    return 0 if failed == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(run_all_tests())
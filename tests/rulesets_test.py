@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Hiring Audit - Rulesets Test
+============================
+
+Validates backend/rulesets.py: immutable versioned snapshots, rejection
+of malformed ones, the snapshot directory with its ACTIVE pointer, hot
+swapping in running workers without mixing versions inside one audit,
+and the version stamp on every scoring result.
+
+Run: python rulesets_test.py
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'backend'))
+
+from integration_test import TEST_SCENARIOS, TestResult
+from rulesets import Ruleset, RulesetStore, compile_trigger
+from scoring_engine import run_audit_scoring, current_ruleset, RULESETS, BUILTIN_RULESET
+from scoring_pipeline import ScoringPipeline
+from sensitivity_analyzer import analyze_sensitivity
+
+
+# Block 1 averages 2.5: green at the built-in 2.3 threshold, yellow at 2.8
+BORDERLINE = {'audit_id': 'borderline', 'responses': {'b1_q1': 3, 'b1_q2': 2, 'b1_q5': 3, 'b1_q6': 2}}
+
+
+def _payloads():
+    return [BORDERLINE] + [{'audit_id': sid, 'responses': s['responses']} for sid, s in TEST_SCENARIOS.items()]
+
+
+def test_snapshots():
+    result = TestResult("Immutable Versioned Snapshots")
+
+    ruleset = current_ruleset()
+    if ruleset is not BUILTIN_RULESET or run_audit_scoring(_payloads()[0])['ruleset_version'] != 'builtin-1.0':
+        result.add_error("Results not stamped with the built-in version")
+    try:
+        ruleset.version = 'x'
+        result.add_error("Snapshot attribute assignment accepted")
+    except AttributeError:
+        pass
+    try:
+        ruleset.config['GREEN_THRESHOLD'] = 0
+        result.add_error("Snapshot config mutated in place")
+    except TypeError:
+        pass
+
+    # Copy-on-write: the new version shares nothing mutable with the old one
+    strict = ruleset.replace('strict', scoring={'GREEN_THRESHOLD': 2.8})
+    if BUILTIN_RULESET.config['GREEN_THRESHOLD'] != 2.3 or strict.config['GREEN_THRESHOLD'] != 2.8:
+        result.add_error("replace() changed the original snapshot")
+    if Ruleset.from_dict(ruleset.to_dict()).digest != ruleset.digest or strict.digest == ruleset.digest:
+        result.add_error("Digest does not follow the rules")
+
+    for bad in ({'scoring': {'YELLOW_THRESHOLD': 2.5}},
+                {'cross_validation_rules': [dict(ruleset.to_dict()['cross_validation_rules'][0], severity='mild')]},
+                {'recommendation_triggers': {'X': {'risk_name': 'X', 'priority': 1, 'when': [{'score': 'block1'}]}}}):
+        try:
+            ruleset.replace('bad', **bad)
+            result.add_error(f"Invalid snapshot accepted: {bad}")
+        except ValueError:
+            pass
+
+    when = compile_trigger([{'answer': 'b7_q6', 'op': '<=', 'value': 1}, {'flag': 'SLA Theatre'}])
+    if not when({}, {}, [], {'b7_q6': -1}) or when({}, {}, [], {}) or not when({}, {}, ['SLA Theatre'], {}):
+        result.add_error("Trigger clauses evaluated wrongly")
+
+    # A stricter green threshold changes scores only through the snapshot passed in
+    payload = BORDERLINE
+    if run_audit_scoring(payload, strict)['block_statuses'] == run_audit_scoring(payload)['block_statuses'] or \
+            run_audit_scoring(payload, strict)['ruleset_version'] != 'strict':
+        result.add_error("Explicit snapshot not used for scoring")
+
+    return result
+
+
+def test_store_and_hot_reload():
+    result = TestResult("Snapshot Store & Hot Reload")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = RulesetStore(tmp)
+        store.save(BUILTIN_RULESET)
+        store.save(BUILTIN_RULESET.replace('2025.2', scoring={'GREEN_THRESHOLD': 2.8}))
+        if store.versions() != ['2025.2', 'builtin-1.0'] or store.load('2025.2').config['GREEN_THRESHOLD'] != 2.8:
+            result.add_error(f"Store listing / loading wrong: {store.versions()}")
+        try:
+            store.save(BUILTIN_RULESET.replace('2025.2', scoring={'GREEN_THRESHOLD': 2.9}))
+            result.add_error("Published version rewritten with other rules")
+        except ValueError:
+            pass
+
+        payload = BORDERLINE
+        try:
+            RULESETS.attach(store, poll_interval=0)
+            if current_ruleset() is not BUILTIN_RULESET:
+                result.add_error("No ACTIVE file should keep the current snapshot")
+
+            store.activate('2025.2')
+            scored = run_audit_scoring(payload)
+            if scored['ruleset_version'] != '2025.2' or scored != dict(
+                    run_audit_scoring(payload, store.load('2025.2')), timestamp=scored['timestamp']):
+                result.add_error("Activated version not picked up without a restart")
+            with ScoringPipeline() as pipeline:
+                if pipeline.run(payload)['ruleset_version'] != '2025.2':
+                    result.add_error("Pipeline not scoring with the active version")
+
+            # A broken snapshot never replaces a working one
+            with open(os.path.join(tmp, 'broken.json'), 'w') as f:
+                f.write('{"version": "broken", "scoring": {}}')
+            with open(os.path.join(tmp, 'ACTIVE'), 'w') as f:
+                f.write('broken\n')
+            if current_ruleset().version != '2025.2' or 'missing' not in (RULESETS.status()['last_error'] or ''):
+                result.add_error(f"Broken snapshot handled wrongly: {RULESETS.status()}")
+        finally:
+            RULESETS.detach()
+            RULESETS.swap(BUILTIN_RULESET)
+
+    return result
+
+
+def _malformed_snapshots():
+    """Snapshots with the wrong type in one section; each used to raise past ValueError"""
+    rules = BUILTIN_RULESET.to_dict()
+    gate = rules['gate_rules'][0]
+    return {
+        'string-threshold': {'scoring': dict(rules['scoring'], GREEN_THRESHOLD='2.3')},
+        'bool-penalty': {'scoring': dict(rules['scoring'], CONTRADICTION_PENALTY=True)},
+        'status-scores-list': {'scoring': dict(rules['scoring'], STATUS_SCORES=[90, 60, 30, 50])},
+        'dtc-missing-red': {'scoring': dict(rules['scoring'], DTC={'green': 1.0, 'yellow': 0.85})},
+        'scoring-list': {'scoring': [1, 2]},
+        'cv-not-object': {'cross_validation_rules': ['CV-01']},
+        'cv-source-string': {'cross_validation_rules': [dict(rules['cross_validation_rules'][0], source='b1_q3')]},
+        'cv-string-value': {'cross_validation_rules': [dict(rules['cross_validation_rules'][0],
+                                                            validator={'question': 'b6_q2', 'operator': '<=',
+                                                                       'value': '1'})]},
+        'gate-not-object': {'gate_rules': ['GATE_0']},
+        'gate-block-list': {'gate_rules': [dict(gate, block=['block1'])]},
+        'critical-string': {'critical_questions': {'block1': 'b1_q3'}},
+        'critical-numbers': {'critical_questions': {'block1': [3]}},
+        'trigger-not-object': {'recommendation_triggers': {'B1-R01': 'always'}},
+    }
+
+
+def test_malformed_snapshots():
+    result = TestResult("Malformed Snapshots Rejected")
+
+    base = BUILTIN_RULESET.to_dict()
+    snapshots = _malformed_snapshots()
+    for version, changes in snapshots.items():
+        try:
+            Ruleset.from_dict(dict(base, version=version, **changes))
+            result.add_error(f"{version}: accepted")
+        except ValueError:
+            pass
+        except Exception as e:
+            result.add_error(f"{version}: {type(e).__name__} instead of ValueError: {e}")
+    try:
+        Ruleset.from_dict(['not', 'a', 'snapshot'])
+        result.add_error("Non-object snapshot accepted")
+    except ValueError:
+        pass
+
+    # A running worker keeps scoring with the version it has
+    with tempfile.TemporaryDirectory() as tmp:
+        store = RulesetStore(tmp)
+        store.save(BUILTIN_RULESET)
+        store.activate(BUILTIN_RULESET.version)
+        for version, changes in snapshots.items():
+            with open(os.path.join(tmp, f'{version}.json'), 'w') as f:
+                json.dump(dict(base, version=version, **changes), f)
+        with open(os.path.join(tmp, 'list.json'), 'w') as f:
+            f.write('[]')
+        try:
+            RULESETS.attach(store, poll_interval=0)
+            for version in list(snapshots) + ['list']:
+                with open(os.path.join(tmp, 'ACTIVE'), 'w') as f:
+                    f.write(version + '\n')
+                try:
+                    scored = run_audit_scoring(BORDERLINE)
+                except Exception as e:
+                    result.add_error(f"{version}: scoring failed after activation: {type(e).__name__}: {e}")
+                    continue
+                if scored['ruleset_version'] != 'builtin-1.0' or not RULESETS.status()['last_error']:
+                    result.add_error(f"{version}: replaced the working snapshot: {RULESETS.status()}")
+        finally:
+            RULESETS.detach()
+            RULESETS.swap(BUILTIN_RULESET)
+
+    return result
+
+
+def test_swap_under_load():
+    result = TestResult("Atomic Swap Under Load")
+
+    strict = BUILTIN_RULESET.replace('strict', scoring={'GREEN_THRESHOLD': 2.8, 'YELLOW_THRESHOLD': 2.0})
+    expected = {}
+    for ruleset in (BUILTIN_RULESET, strict):
+        for payload in _payloads():
+            scored = run_audit_scoring(payload, ruleset)
+            expected[(ruleset.version, payload['audit_id'])] = (scored['block_statuses'], scored['overall_status'])
+
+    mixed = []
+    seen = set()
+    stop = threading.Event()
+
+    def worker():
+        while not stop.is_set():
+            for payload in _payloads():
+                scored = run_audit_scoring(payload)
+                seen.add(scored['ruleset_version'])
+                key = (scored['ruleset_version'], payload['audit_id'])
+                if (scored['block_statuses'], scored['overall_status']) != expected[key]:
+                    mixed.append(key)
+                analysis = analyze_sensitivity(payload['responses'], ruleset=strict)
+                if analysis['base']['block_statuses'] != expected[('strict', payload['audit_id'])][0]:
+                    mixed.append(('sensitivity', payload['audit_id']))
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    try:
+        for i in range(200):
+            RULESETS.swap(strict if i % 2 == 0 else BUILTIN_RULESET)
+            time.sleep(0.001)
+    finally:
+        stop.set()
+        for t in threads:
+            t.join()
+        RULESETS.swap(BUILTIN_RULESET)
+
+    if mixed:
+        result.add_error(f"{len(mixed)} results mixed rules from two versions, e.g. {mixed[0]}")
+    if seen != {'builtin-1.0', 'strict'}:
+        result.add_error(f"Workers did not see both versions: {seen}")
+
+    return result
+
+
+def run_all_tests():
+    print("=" * 70)
+    print("HIRING AUDIT - RULESETS TEST")
+    print("=" * 70)
+
+    results = [
+        test_snapshots(),
+        test_store_and_hot_reload(),
+        test_malformed_snapshots(),
+        test_swap_under_load()
+    ]
+    for test_result in results:
+        print(test_result)
+
+    failed = sum(1 for r in results if not r.passed)
+    print(f"\nPassed: {len(results) - failed}/{len(results)}")
+    return 0 if failed == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(run_all_tests())
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Hiring Audit - Scoring Engine Test
+==================================
+
+Validates backend/scoring_engine.py features beyond the single-respondent
+scenarios covered by integration_test.py.
+
+Run: python scoring_engine_test.py
+"""
+
+import itertools
+import os
+import random
+import tempfile
+import statistics
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'backend'))
+
+from integration_test import TEST_SCENARIOS, TestResult
+from scoring_engine import (
+    run_audit_scoring, RespondentAggregator, calculate_block_scores, block_status, status_for,
+    MAX_BLOCK_QUESTIONS, STATUS_TABLE_MAX_TOTAL
+)
+from response_codec import question_registry
+from scoring_pipeline import ScoringPipeline
+from sensitivity_analyzer import analyze_sensitivity, OPTION_VALUES
+from status_calibration import block_answer_spaces, answer_space_distribution, calibrate
+from audit_report_generator import HiringAuditReportGenerator
+
+
+def _respondents(responses, count, noise_questions=(), seed=7):
+    """Yield `count` respondents agreeing on `responses` except for noise_questions"""
+    rng = random.Random(seed)
+    for i in range(count):
+        answers = dict(responses)
+        for q in noise_questions:
+            answers[q] = rng.choice([0, 3])
+        yield {'respondent_id': f'r{i}', 'role': 'TA' if i % 2 else 'Delivery', 'responses': answers}
+
+
+def test_streaming_statistics():
+    result = TestResult("Streaming Per-Question Statistics")
+
+    rng = random.Random(1)
+    values = [rng.choice([0, 1, 2, 3, -1]) for _ in range(5000)]
+    agg = RespondentAggregator().consume(
+        {'respondent_id': i, 'responses': {'b1_q1': v}} for i, v in enumerate(values))
+
+    stats = agg.questions['b1_q1']
+    answered = [v for v in values if v != -1]
+    if abs(stats.mean - statistics.fmean(answered)) > 1e-9:
+        result.add_error("Streaming mean differs from reference")
+    if abs(stats.variance - statistics.pvariance(answered)) > 1e-9:
+        result.add_error("Streaming variance differs from reference")
+    if stats.skipped != len(values) - len(answered):
+        result.add_error("Not-relevant answers were not counted as skipped")
+    if agg.respondent_count != 5000 or len(agg.questions) != 1:
+        result.add_error("Aggregator should keep one stats object per question")
+
+    return result
+
+
+def test_unanimous_respondents_match_flat_scoring():
+    result = TestResult("Unanimous Respondents Match Flat Scoring")
+
+    for scenario_id, scenario in TEST_SCENARIOS.items():
+        flat = run_audit_scoring({'audit_id': scenario_id, 'responses': scenario['responses']})
+        multi = run_audit_scoring({'audit_id': scenario_id,
+                                   'respondents': _respondents(scenario['responses'], 50)})
+        if multi['block_statuses'] != flat['block_statuses'] or \
+           multi['overall_status'] != flat['overall_status']:
+            result.add_error(f"{scenario_id}: aggregated result differs from flat result")
+        if multi['respondents']['respondent_count'] != 50:
+            result.add_error(f"{scenario_id}: respondent count not reported")
+
+    return result
+
+
+def test_disagreement_signal():
+    result = TestResult("Disagreement Feeds Cross-Validation")
+
+    base = TEST_SCENARIOS['healthy_company']['responses']
+    noisy = ['b3_q1', 'b3_q4']
+    payload = {'audit_id': 'dis', 'respondents': _respondents(base, 200, noise_questions=noisy)}
+    scored = run_audit_scoring(payload)
+
+    dis = [c for c in scored['contradictions'] if c['rule_id'] == 'DIS-block3']
+    if not dis:
+        result.add_error("Block 3 disagreement was not reported as a contradiction")
+    elif dis[0]['severity'] != 'soft' or dis[0]['questions'] != noisy:
+        result.add_error(f"Unexpected disagreement contradiction: {dis[0]}")
+    if scored['respondents']['questions']['b3_q1']['stdev'] < 1.0:
+        result.add_error("Per-question std dev not surfaced")
+    if any(c['rule_id'].startswith('DIS-') and c['block'] != 'block3' for c in scored['contradictions']):
+        result.add_error("Disagreement flagged on unanimous blocks")
+
+    with ScoringPipeline() as pipeline:
+        piped = pipeline.run({'audit_id': 'dis', 'respondents': _respondents(base, 200, noise_questions=noisy)})
+    if [c['rule_id'] for c in piped['contradictions']] != [c['rule_id'] for c in scored['contradictions']]:
+        result.add_error("Pipeline and engine disagree on multi-respondent contradictions")
+
+    return result
+
+
+def test_sensitivity_matches_full_rescoring():
+    result = TestResult("Sensitivity Flip Map Matches Full Re-Scoring")
+
+    for scenario_id, scenario in TEST_SCENARIOS.items():
+        responses = scenario['responses']
+        analysis = analyze_sensitivity(responses)
+        base = run_audit_scoring({'audit_id': scenario_id, 'responses': responses})
+        if analysis['base']['overall_status'] != base['overall_status']:
+            result.add_error(f"{scenario_id}: base overall status differs")
+
+        flips = {(f['question'], f['to_value']): f for f in analysis['flips']}
+        order = [(int(f['block'][5:]), int(f['question'].split('_q')[1])) for f in analysis['flips']]
+        if order != sorted(order):
+            result.add_error(f"{scenario_id}: flips not ordered by block and question number")
+        # Every bank question, answered or not, is analyzed
+        for q in question_registry():
+            current = responses.get(q)
+            for option in OPTION_VALUES:
+                if option == current:
+                    continue
+                full = run_audit_scoring({'audit_id': scenario_id, 'responses': {**responses, q: option}})
+                block = f"block{q[1]}"
+                changed = full['block_statuses'].get(block, 'gray') != base['block_statuses'].get(block, 'gray') or \
+                    full['overall_status'] != base['overall_status']
+                flip = flips.get((q, option))
+                if changed != (flip is not None):
+                    result.add_error(f"{scenario_id}: {q}={option} flip map disagrees with re-scoring")
+                elif flip and (flip['block_status_to'] != full['block_statuses'].get(block, 'gray') or
+                               flip['overall_to'] != full['overall_status']):
+                    result.add_error(f"{scenario_id}: {q}={option} wrong resulting status")
+        print(f"   {scenario_id}: {analysis['evaluated']} alternatives in {analysis['elapsed_ms']}ms")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        scenario = TEST_SCENARIOS['sla_theatre']
+        data = {'company_name': 'Sensitivity Co', 'block_statuses': run_audit_scoring(
+            {'responses': scenario['responses']})['block_statuses'], 'responses': scenario['responses']}
+        generator = HiringAuditReportGenerator(data, os.path.join(tmp, 'l3.pdf'), level=3)
+        generator._add_sensitivity_appendix()
+        if not any('Answer Sensitivity' in getattr(e, 'text', '') for e in generator.elements):
+            result.add_error("Sensitivity appendix was not rendered")
+        HiringAuditReportGenerator(data, os.path.join(tmp, 'l3.pdf'), level=3).generate()
+
+    return result
+
+
+def test_status_lookup_table():
+    result = TestResult("Block Status Lookup Table")
+
+    for count in range(1, MAX_BLOCK_QUESTIONS + 1):
+        for total in range(STATUS_TABLE_MAX_TOTAL + 1):
+            for critical in (False, True):
+                if block_status(total, count, critical) != status_for(total / count, critical):
+                    result.add_error(f"Table disagrees with status_for at sum={total} count={count}")
+    # Fractional (multi-respondent) sums bypass the table
+    if block_status(20.5, 9, False) != status_for(20.5 / 9, False):
+        result.add_error("Fractional sum not evaluated directly")
+
+    # Exact distribution for block5 against scoring every combination
+    questions = block_answer_spaces()['block5']
+    brute = dict.fromkeys(('green', 'yellow', 'red', 'gray'), 0)
+    for answers in itertools.product(*(values for _, values, _ in questions)):
+        responses = {q: v for (q, _, _), v in zip(questions, answers)}
+        brute[calculate_block_scores(responses)[1]['block5']] += 1
+    counted = answer_space_distribution([(values, critical) for _, values, critical in questions])
+    if counted != brute:
+        result.add_error(f"Answer space distribution {counted} != enumeration {brute}")
+
+    # Raising the green threshold can only move blocks out of green
+    lenient, strict = calibrate([2.0, 2.5], [1.5])
+    for block_id, dist in lenient['blocks'].items():
+        if strict['blocks'][block_id]['counts']['green'] > dist['counts']['green']:
+            result.add_error(f"{block_id}: stricter threshold produced more green combinations")
+        if dist['combinations'] != 5 ** dist['questions'] and block_id != 'block5':
+            result.add_error(f"{block_id}: answer space size {dist['combinations']}")
+
+    return result
+
+
+def run_all_tests():
+    print("=" * 70)
+    print("HIRING AUDIT - SCORING ENGINE TEST")
+    print("=" * 70)
+
+    results = [
+        test_streaming_statistics(),
+        test_unanimous_respondents_match_flat_scoring(),
+        test_disagreement_signal(),
+        test_sensitivity_matches_full_rescoring(),
+        test_status_lookup_table()
+    ]
+    for test_result in results:
+        print(test_result)
+
+    failed = sum(1 for r in results if not r.passed)
+    print(f"\nPassed: {len(results) - failed}/{len(results)}")
+    return 0 if failed == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(run_all_tests())
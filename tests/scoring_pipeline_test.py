@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Hiring Audit - Scoring Pipeline Test
+====================================
+
+Validates that the in-process DAG executor (backend/scoring_pipeline.py)
+produces the same results as the single-call scoring engine, runs
+independent stages side by side and records per-stage timings.
+
+Run: python scoring_pipeline_test.py
+"""
+
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'backend'))
+
+from integration_test import TEST_SCENARIOS, TestResult
+from scoring_engine import run_audit_scoring
+from scoring_pipeline import ScoringPipeline, Stage
+
+
+def _comparable(result):
+    return {k: v for k, v in result.items() if k != 'timestamp'}
+
+
+def test_pipeline_matches_engine():
+    """Pipeline output must match run_audit_scoring for every scenario"""
+    result = TestResult("Pipeline Matches Scoring Engine")
+
+    with ScoringPipeline() as pipeline:
+        for scenario_id, scenario in TEST_SCENARIOS.items():
+            payload = {'audit_id': scenario_id, 'responses': scenario['responses']}
+            expected = _comparable(run_audit_scoring(payload))
+            actual = _comparable(pipeline.run(payload))
+            if actual != expected:
+                result.add_error(f"{scenario_id}: pipeline result differs from engine")
+            if actual['overall_status'] != scenario['expected_overall']:
+                result.add_error(
+                    f"{scenario_id}: expected '{scenario['expected_overall']}', got '{actual['overall_status']}'"
+                )
+
+    return result
+
+
+def test_batch_processing():
+    """Batches of mixed size keep item order and record timings for every stage"""
+    result = TestResult("Batched Processing & Stage Timings")
+
+    payloads = []
+    for i in range(50):
+        for scenario_id, scenario in TEST_SCENARIOS.items():
+            payloads.append({'audit_id': f'{scenario_id}-{i}', 'responses': scenario['responses']})
+
+    with ScoringPipeline(batch_size=32) as pipeline:
+        results = pipeline.run_batch(payloads)
+        timings = pipeline.get_timings()
+
+    if [r['audit_id'] for r in results] != [p['audit_id'] for p in payloads]:
+        result.add_error("Batch results are out of order")
+    if timings['items_processed'] != len(payloads):
+        result.add_error(f"Expected {len(payloads)} items processed, got {timings['items_processed']}")
+    for stage in ('calculate_block_scores', 'apply_gate_rules', 'cross_validation', 'finalize_scoring'):
+        if timings['stages_ms'].get(stage, 0) <= 0:
+            result.add_error(f"No timing recorded for stage '{stage}'")
+
+    return result
+
+
+def test_independent_stages_overlap():
+    """Stages without a dependency between them run concurrently"""
+    result = TestResult("Independent Stages Run Concurrently")
+
+    # Each stage waits for the other: both only pass the barrier if they run side by side
+    barrier = threading.Barrier(2, timeout=5)
+
+    def meet(name):
+        def func(payload, upstream):
+            try:
+                barrier.wait()
+                return name
+            except threading.BrokenBarrierError:
+                return f'{name} ran alone'
+        return func
+
+    stages = [
+        Stage('a', meet('a')),
+        Stage('b', meet('b')),
+        Stage('join', lambda payload, upstream: sorted(upstream.values()), depends_on=['a', 'b']),
+    ]
+
+    with ScoringPipeline(stages=stages, max_workers=2) as pipeline:
+        output = pipeline.run({})
+
+    if output != ['a', 'b']:
+        result.add_error(f"Independent stages did not overlap: {output}")
+
+    try:
+        ScoringPipeline(stages=[Stage('x', meet('x'), depends_on=['missing'])], max_workers=1)
+        result.add_error("Unknown dependency was not rejected")
+    except ValueError:
+        pass
+
+    # Two sinks: the output stage must be named
+    forked = [Stage('a', meet('a')), Stage('b', meet('b'))]
+    try:
+        ScoringPipeline(stages=forked, max_workers=1)
+        result.add_error("Ambiguous output stage was not rejected")
+    except ValueError:
+        pass
+    with ScoringPipeline(stages=[Stage('a', lambda p, u: 'a'), Stage('b', lambda p, u: 'b')],
+                         max_workers=1, output_stage='a') as pipeline:
+        if pipeline.run({}) != 'a':
+            result.add_error("Named output stage not returned")
+
+    return result
+
+
+def run_all_tests():
+    print("=" * 70)
+    print("HIRING AUDIT - SCORING PIPELINE TEST")
+    print("=" * 70)
+
+    results = [
+        test_pipeline_matches_engine(),
+        test_batch_processing(),
+        test_independent_stages_overlap()
+    ]
+    for test_result in results:
+        print(test_result)
+
+    failed = sum(1 for r in results if not r.passed)
+    print(f"\nPassed: {len(results) - failed}/{len(results)}")
+    return 0 if failed == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(run_all_tests())
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Hiring Audit - Stage Checkpoints Test
+=====================================
+
+Validates backend/stage_checkpoints.py with the E2E workflow: stage outputs
+persisted by audit id and input hash, resume at the first incomplete stage,
+invalidation on changed answers and the batch "resume failed" command.
+
+Run: python stage_checkpoints_test.py
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'backend'))
+
+from e2e_workflow_test import SCENARIOS, E2E_STAGES, run_e2e_workflow, resume_failed, main
+from integration_test import TestResult
+from scoring_pipeline import Stage
+from stage_checkpoints import CheckpointStore, CheckpointedWorkflow
+
+
+ALL_STAGES = [s.name for s in E2E_STAGES]
+
+
+def _run(store, audit_id, scenario, output_dir):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return run_e2e_workflow(audit_id, scenario['company'], scenario['responses'],
+                                generate_pdf=True, output_dir=output_dir, checkpoints=store)
+
+
+def test_resume_after_pdf_failure():
+    result = TestResult("Resume At Failed PDF Stage")
+
+    scenario = SCENARIOS['midsize_growing']
+    with tempfile.TemporaryDirectory() as tmp:
+        store = CheckpointStore(os.path.join(tmp, 'checkpoints.db'))
+        output_dir = os.path.join(tmp, 'reports')
+
+        failed = _run(store, 'AUD-1', scenario, output_dir)
+        if failed['status'] != 'failed' or failed['failed_stage'] != 'pdf':
+            result.add_error(f"Expected a PDF failure, got {failed['status']} / {failed['failed_stage']}")
+        if failed['scoring_result'] is None:
+            result.add_error("Completed stages not returned with the failed run")
+
+        os.makedirs(output_dir)
+        workflow = CheckpointedWorkflow(E2E_STAGES, store)
+        run = workflow.run('AUD-1', store.get_run('AUD-1')['inputs'])
+        if run['executed'] != ['pdf', 'delivery'] or run['reused'] != ALL_STAGES[:-2] or \
+           run['resumed_from'] != 'pdf':
+            result.add_error(f"Rerun did not resume at the PDF stage: {run['executed']}")
+        if not os.path.exists(run['outputs']['pdf']['pdf_path']):
+            result.add_error("PDF not written on resume")
+        if run['outputs']['scoring'] != failed['scoring_result']:
+            result.add_error("Resumed run saw a different scoring result")
+
+        again = workflow.run('AUD-1', store.get_run('AUD-1')['inputs'])
+        if again['executed'] or again['status'] != 'complete':
+            result.add_error(f"Completed run recomputed stages: {again['executed']}")
+        store.close()
+
+    return result
+
+
+def test_input_hash_invalidation():
+    result = TestResult("Input Hash Invalidation")
+
+    scenario = SCENARIOS['startup_chaos']
+    with tempfile.TemporaryDirectory() as tmp:
+        store = CheckpointStore(os.path.join(tmp, 'checkpoints.db'))
+        workflow = CheckpointedWorkflow(E2E_STAGES, store)
+        _run(store, 'AUD-2', scenario, tmp)
+        first = store.get_run('AUD-2')
+
+        changed = dict(scenario, responses=dict(scenario['responses'], b1_q1=3))
+        _run(store, 'AUD-2', changed, tmp)
+        if store.get_run('AUD-2')['input_hash'] == first['input_hash']:
+            result.add_error("Changed answers kept the same input hash")
+        run = workflow.run('AUD-2', first['inputs'])
+        if run['executed'] != ALL_STAGES:
+            result.add_error(f"Original answers reused checkpoints of the changed ones: {run['reused']}")
+
+        # Only stages downstream of a changed output are recomputed
+        calls = []
+        stages = [
+            Stage('a', lambda inputs, up: calls.append('a') or inputs['x'] % 2),
+            Stage('b', lambda inputs, up: calls.append('b') or up['a'] * 10, ['a']),
+            Stage('c', lambda inputs, up: calls.append('c') or up['b'] + 1, ['b'])
+        ]
+        toy = CheckpointedWorkflow(stages, store)
+        toy.run('AUD-3', {'x': 1})
+        calls.clear()
+        toy.run('AUD-3', {'x': 1})
+        if calls:
+            result.add_error(f"Unchanged inputs recomputed {calls}")
+        toy.run('AUD-3', {'x': 3})
+        if calls != ['a', 'b', 'c']:
+            result.add_error(f"New inputs should invalidate every stage: {calls}")
+
+        try:
+            CheckpointedWorkflow([Stage('b', None, ['a']), Stage('a', None)], store)
+            result.add_error("Out-of-order dependency accepted")
+        except ValueError:
+            pass
+        store.close()
+
+    return result
+
+
+def test_batch_resume_failed():
+    result = TestResult("Batch Resume Failed")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'checkpoints.db')
+        output_dir = os.path.join(tmp, 'reports')
+        store = CheckpointStore(path)
+        for i, scenario in enumerate(SCENARIOS.values()):
+            _run(store, f'AUD-{i}', scenario, output_dir if i else tmp)
+        # A worker crash leaves a run in 'running'
+        crashed = store.get_run('AUD-1')
+        store.begin_run('AUD-1', crashed['input_hash'], crashed['inputs'])
+        if store.stats() != {'complete': 1, 'failed': 1, 'running': 1}:
+            result.add_error(f"Unexpected run statuses: {store.stats()}")
+        store.close()
+
+        os.makedirs(output_dir)
+        store = CheckpointStore(path)
+        with contextlib.redirect_stdout(io.StringIO()):
+            resumed = resume_failed(store)
+        if sorted(r['audit_id'] for r in resumed) != ['AUD-1', 'AUD-2']:
+            result.add_error(f"Wrong audits resumed: {[r['audit_id'] for r in resumed]}")
+        if not all(r['status'] == 'complete' and r['pdf_path'] for r in resumed):
+            result.add_error("Resumed audits did not complete")
+        if store.stats() != {'complete': 3}:
+            result.add_error(f"Runs left unfinished: {store.stats()}")
+        store.close()
+
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            results = main(['--checkpoints', path, '--resume-failed'])
+        if results or "{'complete': 3}" not in out.getvalue():
+            result.add_error("CLI resume should find nothing left to do")
+
+    return result
+
+
+def run_all_tests():
+    print("=" * 70)
+    print("HIRING AUDIT - STAGE CHECKPOINTS TEST")
+    print("=" * 70)
+
+    results = [
+        test_resume_after_pdf_failure(),
+        test_input_hash_invalidation(),
+        test_batch_resume_failed()
+    ]
+    for test_result in results:
+        print(test_result)
+
+    failed = sum(1 for r in results if not r.passed)
+    print(f"\nPassed: {len(results) - failed}/{len(results)}")
+    return 0 if failed == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(run_all_tests())
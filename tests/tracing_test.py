@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Hiring Audit - Workflow Tracing Test
+====================================
+
+Validates backend/tracing.py: span nesting and traceparent propagation,
+the OTLP/JSON file export, one trace from webhook to email delivery and
+trace-level sampling overhead.
+
+Run: python tracing_test.py
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'backend'))
+
+from e2e_workflow_test import SCENARIOS, simulate_form_submission, run_e2e_workflow
+from email_delivery import SendGridStubServer
+from ingestion_queue import IngestionQueue
+from integration_test import TestResult
+from tracing import (
+    Tracer, InMemoryExporter, OTLPJsonFileExporter, load_spans, trace_breakdown,
+    parse_traceparent, STATUS_ERROR
+)
+
+
+def test_span_nesting_and_propagation():
+    result = TestResult("Span Nesting & Traceparent")
+
+    exporter = InMemoryExporter()
+    tracer = Tracer(exporter)
+    with tracer.start_span('root', {'audit.id': 'A'}) as root:
+        with tracer.start_span('child') as child:
+            pass
+        try:
+            with tracer.start_span('broken'):
+                raise ValueError('boom')
+        except ValueError:
+            pass
+    remote = tracer.start_span('remote', parent=root.traceparent)
+    remote.end()
+
+    if [s.name for s in exporter.spans] != ['child', 'broken', 'root', 'remote']:
+        result.add_error(f"Unexpected export order: {[s.name for s in exporter.spans]}")
+    if {s.trace_id for s in exporter.spans} != {root.trace_id}:
+        result.add_error("Spans do not share the trace id")
+    if child.parent_id != root.span_id or remote.parent_id != root.span_id or root.parent_id:
+        result.add_error("Parent links wrong")
+    broken = exporter.spans[1]
+    if broken.status != STATUS_ERROR or 'boom' not in broken.status_message:
+        result.add_error("Exception not recorded as span error")
+    if parse_traceparent(root.traceparent) != (root.trace_id, root.span_id, True):
+        result.add_error(f"traceparent round trip failed: {root.traceparent}")
+    if parse_traceparent('garbage') is not None or tracer.start_span('x', parent='garbage').parent_id:
+        result.add_error("Malformed traceparent not treated as a new trace")
+
+    otlp = root.to_otlp()
+    if len(otlp['traceId']) != 32 or len(otlp['spanId']) != 16 or 'parentSpanId' in otlp or \
+       otlp['attributes'] != [{'key': 'audit.id', 'value': {'stringValue': 'A'}}] or \
+       int(otlp['endTimeUnixNano']) < int(otlp['startTimeUnixNano']):
+        result.add_error(f"Not a valid OTLP span: {otlp}")
+
+    return result
+
+
+def test_webhook_to_email_trace():
+    result = TestResult("One Trace From Webhook To Email")
+
+    scenario = SCENARIOS['midsize_growing']
+    with tempfile.TemporaryDirectory() as tmp:
+        trace_path = os.path.join(tmp, 'traces.jsonl')
+        tracer = Tracer(OTLPJsonFileExporter(trace_path, batch_size=4))
+
+        queue = IngestionQueue(os.path.join(tmp, 'queue.db'), tracer=tracer)
+        payload = simulate_form_submission('AUD-T', scenario['company'], scenario['responses'])
+        queue.enqueue(payload)
+        claimed = queue.claim_batch()[0]
+        queue.close()
+        if not claimed.get('traceparent'):
+            result.add_error("Trace context not carried through the ingestion queue")
+
+        with SendGridStubServer() as stub, contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            run = run_e2e_workflow('AUD-T', scenario['company'], scenario['responses'], generate_pdf=True,
+                                   output_dir=tmp, email_api_url=stub.url, tracer=tracer,
+                                   traceparent=claimed.get('traceparent'))
+            elapsed = time.perf_counter() - start
+        tracer.close()
+        if run['status'] != 'complete' or len(stub.messages) != 1:
+            result.add_error(f"Workflow did not deliver the report: {run['status']}")
+
+        spans = load_spans(trace_path)
+        traces = trace_breakdown(spans)
+        if len(traces) != 1:
+            result.add_error(f"Expected one trace, got {len(traces)}")
+        trace = next(iter(traces.values()))
+        expected = {'webhook', 'workflow', 'submission', 'scoring', 'recommendations', 'report_data',
+                    'pdf', 'delivery', 'email.send_report', 'email.send'}
+        if set(trace['spans']) != expected:
+            result.add_error(f"Missing spans: {sorted(expected - set(trace['spans']))}")
+        if trace['root'] != 'webhook' or trace['errors']:
+            result.add_error(f"Trace should start at the webhook without errors: {trace}")
+        if trace['duration_ms'] < trace['spans']['pdf']:
+            result.add_error("End-to-end duration shorter than the PDF render")
+
+        print(f"   webhook -> email {trace['duration_ms']:.0f}ms: " +
+              ', '.join(f"{name} {ms:.1f}ms" for name, ms in sorted(trace['spans'].items(), key=lambda i: -i[1])[:4]))
+        test_webhook_to_email_trace.workflow_seconds = elapsed
+
+    return result
+
+
+def test_sampling_and_overhead():
+    result = TestResult("Sampling & Overhead")
+
+    exporter = InMemoryExporter()
+    tracer = Tracer(exporter, sample_rate=0.1)
+    roots = []
+    for _ in range(20000):
+        with tracer.start_span('workflow') as root:
+            with tracer.start_span('scoring'):
+                pass
+        roots.append(root.sampled)
+    share = sum(roots) / len(roots)
+    if not 0.08 < share < 0.12:
+        result.add_error(f"Sampled share {share:.3f} for a 0.1 sample rate")
+    if len(exporter.spans) != 2 * sum(roots):
+        result.add_error("Child spans did not follow the trace sampling decision")
+    if Tracer(InMemoryExporter(), sample_rate=0.0).start_span('x').sampled or \
+       Tracer(None).start_span('x').sampled:
+        result.add_error("Disabled tracer sampled a span")
+    try:
+        Tracer(exporter, sample_rate=1.5)
+        result.add_error("Invalid sample rate accepted")
+    except ValueError:
+        pass
+
+    # Cost of the ~10 spans of one audit at a 1% production rate vs the workflow itself
+    with tempfile.TemporaryDirectory() as tmp:
+        tracer = Tracer(OTLPJsonFileExporter(os.path.join(tmp, 'traces.jsonl')), sample_rate=0.01)
+        audits = 5000
+        start = time.perf_counter()
+        for _ in range(audits):
+            with tracer.start_span('workflow') as root:
+                for name in ('submission', 'scoring', 'recommendations', 'report_data', 'pdf'):
+                    with tracer.start_span(name) as span:
+                        span.set_attribute('audit.id', 'AUD-1')
+                with tracer.start_span('email.send_report'):
+                    with tracer.start_span('email.send'):
+                        pass
+        tracer.close()
+        per_audit = (time.perf_counter() - start) / audits
+
+    workflow = getattr(test_webhook_to_email_trace, 'workflow_seconds', 0.05)
+    overhead = per_audit / workflow
+    print(f"   tracing {per_audit * 1e6:.1f}µs per audit at 1% sampling = {overhead:.4%} of the workflow")
+    if overhead >= 0.01:
+        result.add_error(f"Tracing overhead {overhead:.2%} exceeds 1%")
+
+    return result
+
+
+def run_all_tests():
+    print("=" * 70)
+    print("HIRING AUDIT - WORKFLOW TRACING TEST")
+    print("=" * 70)
+
+    results = [
+        test_span_nesting_and_propagation(),
+        test_webhook_to_email_trace(),
+        test_sampling_and_overhead()
+    ]
+    for test_result in results:
+        print(test_result)
+
+    failed = sum(1 for r in results if not r.passed)
+    print(f"\nPassed: {len(results) - failed}/{len(results)}")
+    return 0 if failed == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(run_all_tests())